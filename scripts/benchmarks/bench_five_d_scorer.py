@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+FiveDScorer Benchmark - Academic Agent v2.3
+
+Vergleicht das Per-Paper Scoring (Python Loop, ein Dict pro Paper, volle
+Sortierung) mit dem spaltenweisen NumPy Scoring (argpartition Top-N) für
+10k-100k Kandidaten, wie sie aus Corpus/Snapshot Sources kommen.
+
+Gemessen wird mit vorberechneten Relevanz-Scores (der Keyword-Fallback
+ist in beiden Pfaden derselbe Python Code).
+
+Run:
+    PYTHONPATH=. python scripts/benchmarks/bench_five_d_scorer.py
+    PYTHONPATH=. python scripts/benchmarks/bench_five_d_scorer.py --sizes 10000 100000 --top-n 50
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.ranking.five_d_scorer import FiveDScorer, np
+from src.search.crossref_client import Paper
+
+_VENUES = [
+    "IEEE Transactions on Software Engineering", "ACM Computing Surveys", "Journal of Systems and Software",
+    "Empirical Software Engineering", "International Conference on DevOps", "Nature", None, "Tech Report",
+]
+
+
+def make_candidates(n: int, seed: int = 42) -> Tuple[List[Paper], Dict[str, float]]:
+    """n papers with realistic year/citation/venue spread + relevance scores"""
+    rng = random.Random(seed)
+    venues = _VENUES + [f"Workshop {i}" for i in range(200)]
+    papers = [
+        Paper(
+            doi=f"10.5555/bench.{i}",
+            title=f"Paper {i}",
+            authors=["A"],
+            year=rng.choice([None] + list(range(1990, 2026))),
+            citations=rng.choice([None, 0, int(rng.paretovariate(1.2))]),
+            venue=rng.choice(venues)
+        )
+        for i in range(n)
+    ]
+    relevance = {p.doi: rng.random() for p in papers}
+    return papers, relevance
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    """Median wall time in ms"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    """Run scorer benchmark"""
+    parser = argparse.ArgumentParser(description="FiveDScorer loop vs. vectorized")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 50_000, 100_000])
+    parser.add_argument("--top-n", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print("=" * 70)
+    print("FIVE-D SCORER BENCHMARK")
+    print("=" * 70)
+    if np is None:
+        print("⚠️  numpy not installed - only the loop path is available")
+        return
+
+    loop = FiveDScorer()
+    loop.VECTORIZE_MIN_PAPERS = sys.maxsize
+    vectorized = FiveDScorer()
+
+    print(f"{'papers':>8} {'loop ms':>10} {'vector ms':>10} {'vector top-N ms':>16} {'speedup':>8}")
+    for n in args.sizes:
+        papers, relevance = make_candidates(n)
+
+        expected = [item["paper"].doi for item in loop.score(papers, "q", relevance)[:args.top_n]]
+        actual = [item["paper"].doi for item in vectorized.score(papers, "q", relevance, top_n=args.top_n)]
+        assert actual == expected, "vectorized top-N differs from loop ranking"
+
+        loop_ms = _time(lambda papers=papers, relevance=relevance: loop.score(papers, "q", relevance), args.repeat)
+        full_ms = _time(
+            lambda papers=papers, relevance=relevance: vectorized.score(papers, "q", relevance), args.repeat
+        )
+        top_ms = _time(
+            lambda papers=papers, relevance=relevance: vectorized.score(papers, "q", relevance, top_n=args.top_n),
+            args.repeat
+        )
+
+        print(f"{n:>8} {loop_ms:>10.1f} {full_ms:>10.1f} {top_ms:>16.1f} {loop_ms / top_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
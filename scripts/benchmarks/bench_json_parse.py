@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+JSON Parse Benchmark - Academic Agent v2.3
+
+Misst Decode- und Parse-Zeit der API Clients für 1000-Zeilen Result Pages
+(Netzwerk bereits gecacht → JSON Parsing dominiert), jeweils stdlib json vs.
+utils.fast_json (orjson wenn installiert), sowie die Rekonstruktion der
+OpenAlex Abstracts (Sortierung aller (pos, word)-Paare vs. linear).
+
+Pages:
+- Default: synthetische Pages (1000 Works, realistische Feldgrößen, Seed fix)
+- --pages: aufgezeichnete API Responses, z.B.
+    curl "https://api.crossref.org/works?query=devops&rows=1000" > crossref.json
+    curl "https://api.openalex.org/works?search=devops&per-page=200" > openalex.json
+    curl "https://api.semanticscholar.org/graph/v1/paper/search?query=devops&limit=100&fields=..." > s2.json
+  Format wird an der Struktur erkannt (message.items / results / data).
+
+Run:
+    PYTHONPATH=. python scripts/benchmarks/bench_json_parse.py
+    PYTHONPATH=. python scripts/benchmarks/bench_json_parse.py --pages crossref.json openalex.json --repeat 20
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.search.crossref_client import CrossRefClient
+from src.search.openalex_client import OpenAlexClient
+from src.search.semantic_scholar_client import SemanticScholarClient
+from src.utils import fast_json
+
+
+# ============================================
+# Baseline: sort-based abstract reconstruction (vorherige Implementierung)
+# ============================================
+
+def rebuild_sorted(inverted_index: Dict[str, List[int]]) -> str:
+    """(pos, word) Liste aufbauen und sortieren (Referenz)"""
+    word_positions = []
+    for word, positions in inverted_index.items():
+        for pos in positions:
+            word_positions.append((pos, word))
+    word_positions.sort(key=lambda x: x[0])
+    return " ".join(word for _, word in word_positions)
+
+
+# ============================================
+# Synthetic Pages
+# ============================================
+
+_WORDS = [
+    "governance", "devops", "continuous", "delivery", "pipeline", "compliance", "framework",
+    "software", "engineering", "security", "automation", "the", "of", "and", "in", "a", "we",
+    "study", "results", "model", "approach", "organizations", "agile", "cloud", "deployment",
+]
+
+
+def _abstract_words(rng: random.Random, n: int = 200) -> List[str]:
+    return [rng.choice(_WORDS) for _ in range(n)]
+
+
+def _inverted(words: List[str]) -> Dict[str, List[int]]:
+    index: Dict[str, List[int]] = {}
+    for pos, word in enumerate(words):
+        index.setdefault(word, []).append(pos)
+    return index
+
+
+def synthetic_pages(rows: int = 1000, seed: int = 42) -> Dict[str, bytes]:
+    """One page per source, shaped like the real API responses"""
+    rng = random.Random(seed)
+    crossref, openalex, s2 = [], [], []
+
+    for i in range(rows):
+        doi = f"10.{1000 + i % 50}/bench.{i}"
+        title = " ".join(rng.choice(_WORDS) for _ in range(10)).title()
+        words = _abstract_words(rng)
+        authors = [(f"Given{j}", f"Family{rng.randint(0, 500)}") for j in range(rng.randint(1, 8))]
+        year = rng.randint(1995, 2025)
+        citations = rng.randint(0, 5000)
+        venue = f"Journal of {rng.choice(_WORDS).title()}"
+
+        crossref.append({
+            "DOI": doi, "title": [title], "URL": f"https://doi.org/{doi}",
+            "author": [{"given": g, "family": f, "sequence": "additional",
+                        "affiliation": [{"name": "University"}]} for g, f in authors],
+            "published": {"date-parts": [[year, 1, 1]]},
+            "abstract": "<jats:p>" + " ".join(words) + "</jats:p>",
+            "container-title": [venue], "is-referenced-by-count": citations,
+        })
+        openalex.append({
+            "id": f"https://openalex.org/W{i}", "doi": f"https://doi.org/{doi}", "title": title,
+            "authorships": [{"author_position": "middle",
+                             "author": {"id": f"https://openalex.org/A{j}", "display_name": f"{g} {f}"},
+                             "institutions": [{"id": "https://openalex.org/I1", "display_name": "University"}]}
+                            for j, (g, f) in enumerate(authors)],
+            "publication_year": year,
+            "abstract_inverted_index": _inverted(words),
+            "primary_location": {"source": {"id": "https://openalex.org/S1", "display_name": venue}},
+            "cited_by_count": citations,
+        })
+        s2.append({
+            "paperId": f"{i:040x}", "externalIds": {"DOI": doi}, "title": title,
+            "authors": [{"authorId": str(j), "name": f"{g} {f}"} for j, (g, f) in enumerate(authors)],
+            "year": year, "abstract": " ".join(words), "venue": venue,
+            "publicationDate": f"{year}-01-01", "citationCount": citations,
+            "url": f"https://www.semanticscholar.org/paper/{i:040x}",
+        })
+
+    return {
+        "crossref": json.dumps({"status": "ok", "message": {"items": crossref}}).encode(),
+        "openalex": json.dumps({"meta": {"count": rows}, "results": openalex}).encode(),
+        "semantic_scholar": json.dumps({"total": rows, "offset": 0, "data": s2}).encode(),
+    }
+
+
+def load_pages(paths: List[Path]) -> Dict[str, bytes]:
+    """Recorded pages, source detected from the response structure"""
+    pages = {}
+    for path in paths:
+        raw = path.read_bytes()
+        data = json.loads(raw)
+        if "message" in data:
+            pages[f"crossref ({path.name})"] = raw
+        elif "results" in data:
+            pages[f"openalex ({path.name})"] = raw
+        elif "data" in data:
+            pages[f"semantic_scholar ({path.name})"] = raw
+        else:
+            print(f"⚠️  {path}: unknown response format, skipped")
+    return pages
+
+
+# ============================================
+# Benchmarks
+# ============================================
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    """Median wall time in ms"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _parser_for(name: str) -> Tuple[Callable[[Any], List[Any]], Callable[[], None]]:
+    """(items → papers, close) for a page name"""
+    if name.startswith("crossref"):
+        client = CrossRefClient()
+        return (lambda data: [client._parse_work(w) for w in data["message"]["items"] if w.get("DOI")]), client.close
+    if name.startswith("openalex"):
+        client = OpenAlexClient()
+        return (lambda data: [client._parse_work(w) for w in data["results"]]), client.close
+    client = SemanticScholarClient()
+    return (lambda data: [client._parse_paper(p) for p in data["data"]]), client.close
+
+
+def bench_page(name: str, raw: bytes, repeat: int) -> None:
+    """Decode + parse one page with both decoders"""
+    parse, close = _parser_for(name)
+    data = json.loads(raw)
+    rows = len(parse(data))
+
+    decode_std = _time(lambda: json.loads(raw), repeat)
+    decode_fast = _time(lambda: fast_json.loads(raw), repeat)
+    parse_ms = _time(lambda: parse(data), repeat)
+    close()
+
+    print(f"\n{name}: {rows} rows, {len(raw) / 1024:.0f} KiB")
+    print(f"  decode json      {decode_std:8.2f} ms")
+    print(f"  decode {fast_json.JSON_BACKEND:<9} {decode_fast:8.2f} ms  ({decode_std / decode_fast:4.1f}x)")
+    print(f"  parse → Paper    {parse_ms:8.2f} ms")
+    print(f"  total            {decode_std + parse_ms:8.2f} ms → {decode_fast + parse_ms:8.2f} ms "
+          f"({rows / ((decode_fast + parse_ms) / 1000):,.0f} rows/s)")
+
+
+def bench_abstracts(raw: bytes, repeat: int) -> None:
+    """Sort-based vs. linear abstract reconstruction over an OpenAlex page"""
+    from src.search.openalex_client import rebuild_inverted_index
+
+    indexes = [w["abstract_inverted_index"] for w in json.loads(raw)["results"]
+               if w.get("abstract_inverted_index")]
+    assert all(rebuild_sorted(i) == rebuild_inverted_index(i) for i in indexes)
+
+    sorted_ms = _time(lambda: [rebuild_sorted(i) for i in indexes], repeat)
+    linear_ms = _time(lambda: [rebuild_inverted_index(i) for i in indexes], repeat)
+
+    print(f"\nOpenAlex abstract reconstruction ({len(indexes)} abstracts):")
+    print(f"  sort (pos, word)  {sorted_ms:8.2f} ms")
+    print(f"  linear slots      {linear_ms:8.2f} ms  ({sorted_ms / linear_ms:4.1f}x)")
+
+
+def main():
+    """Run parse benchmarks"""
+    parser = argparse.ArgumentParser(description="API response decode/parse benchmark")
+    parser.add_argument("--pages", nargs="+", type=Path, help="Recorded API response JSON files")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per synthetic page")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per measurement (median)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"JSON PARSE BENCHMARK (fast backend: {fast_json.JSON_BACKEND})")
+    print("=" * 70)
+
+    pages = load_pages(args.pages) if args.pages else synthetic_pages(args.rows)
+
+    for name, raw in pages.items():
+        bench_page(name, raw, args.repeat)
+
+    for name, raw in pages.items():
+        if name.startswith("openalex"):
+            bench_abstracts(raw, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+SearchEngine Load Benchmark - Academic Agent v2.3
+
+Misst Durchsatz und p50/p95 Latenz von SearchEngine.search, search_parallel,
+asearch und asearch_stream gegen den lokalen Stub Server (stub_server.py) -
+reproduzierbar, ohne Live-APIs.
+
+Setup:
+- StubServer im selben Prozess (oder --stub-url für einen externen Server)
+- Clients per rebase_urls() umgeleitet, kein Response/Result Cache
+- Rate Limiter der Clients standardmäßig neutralisiert (gemessen wird unser
+  Code, nicht das API-Budget); --keep-rate-limits für realistische Läufe
+- Circuit Breaker werden pro Szenario zurückgesetzt
+
+Run:
+    PYTHONPATH=. python scripts/benchmarks/bench_search_engine.py
+    PYTHONPATH=. python scripts/benchmarks/bench_search_engine.py --latency-ms 120 --jitter-ms 80 --ops 40 --concurrency 8
+    PYTHONPATH=. python scripts/benchmarks/bench_search_engine.py --cassette cassettes/devops.jsonl --rate-limit-rate 0.05
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_server import StubServer
+from src.search.search_engine import SearchEngine
+from src.utils.http_replay import Cassette, http_clients, rebase_urls
+from src.utils.rate_limiter import RateLimiter, AsyncRateLimiter
+from src.utils.retry import reset_circuit_breakers
+
+SCENARIOS = ("search", "search_parallel", "asearch", "asearch_stream")
+
+
+# ============================================
+# Results
+# ============================================
+
+@dataclass
+class ScenarioResult:
+    """Latencies of one scenario"""
+    name: str
+    wall_seconds: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list)
+    papers: List[int] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def ops(self) -> int:
+        return len(self.latencies_ms) + self.errors
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile in ms"""
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+        return ordered[index]
+
+    def row(self) -> str:
+        throughput = self.ops / self.wall_seconds if self.wall_seconds else 0.0
+        papers = statistics.mean(self.papers) if self.papers else 0.0
+        return (f"{self.name:<16} {self.ops:>5} {self.errors:>6} {throughput:>9.2f} "
+                f"{self.percentile(50):>9.1f} {self.percentile(95):>9.1f} "
+                f"{max(self.latencies_ms, default=0.0):>9.1f} {papers:>8.1f}")
+
+
+HEADER = (f"{'scenario':<16} {'ops':>5} {'errors':>6} {'ops/s':>9} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'papers':>8}")
+
+
+# ============================================
+# Engine Setup
+# ============================================
+
+def create_engine(base_url: str, sources: Optional[List[str]], keep_rate_limits: bool) -> SearchEngine:
+    """SearchEngine pointed at the stub server (no caches)"""
+    engine = SearchEngine(sources=sources, use_cache=False)
+    rebase_urls(engine, base_url)
+
+    if not keep_rate_limits:
+        for api_client in http_clients(engine):
+            api_client.rate_limiter = RateLimiter(requests_per_second=10_000)
+            api_client.async_rate_limiter = AsyncRateLimiter(requests_per_second=10_000)
+    return engine
+
+
+# ============================================
+# Scenarios
+# ============================================
+
+def run_sync(name: str, call: Callable[[str], list], queries: List[str], concurrency: int) -> ScenarioResult:
+    """Run a blocking search call for every query on `concurrency` threads"""
+    result = ScenarioResult(name)
+
+    def _one(query: str):
+        start = time.perf_counter()
+        try:
+            papers = call(query)
+        except Exception:
+            result.errors += 1
+            return
+        result.latencies_ms.append((time.perf_counter() - start) * 1000)
+        result.papers.append(len(papers))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(_one, queries))
+    result.wall_seconds = time.perf_counter() - start
+    return result
+
+
+async def run_async(
+    name: str,
+    call: Callable[[str], Awaitable[list]],
+    queries: List[str],
+    concurrency: int
+) -> ScenarioResult:
+    """Run an async search call for every query, at most `concurrency` at a time"""
+    result = ScenarioResult(name)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(query: str):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                papers = await call(query)
+            except Exception:
+                result.errors += 1
+                return
+            result.latencies_ms.append((time.perf_counter() - start) * 1000)
+            result.papers.append(len(papers))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one(query) for query in queries))
+    result.wall_seconds = time.perf_counter() - start
+    return result
+
+
+def run_scenario(name: str, engine: SearchEngine, queries: List[str], limit: int,
+                 concurrency: int) -> ScenarioResult:
+    """Dispatch one scenario"""
+    reset_circuit_breakers()
+
+    if name == "search":
+        return run_sync(name, lambda q: engine.search(q, limit=limit), queries, concurrency)
+    if name == "search_parallel":
+        return run_sync(name, lambda q: engine.search_parallel(q, limit=limit), queries, concurrency)
+
+    async def _stream(query: str) -> list:
+        dedup = engine.create_incremental_deduplicator()
+        async for _source, _papers in engine.asearch_stream(query, limit=limit, deduplicator=dedup):
+            pass
+        return dedup.merged()
+
+    async def _run() -> ScenarioResult:
+        call = (lambda q: engine.asearch(q, limit=limit)) if name == "asearch" else _stream
+        try:
+            return await run_async(name, call, queries, concurrency)
+        finally:
+            await engine.aclose()
+
+    return asyncio.run(_run())
+
+
+# ============================================
+# Main
+# ============================================
+
+def main():
+    """Run SearchEngine load benchmark"""
+    parser = argparse.ArgumentParser(description="SearchEngine throughput/latency benchmark (offline)")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--ops", type=int, default=20, help="Searches per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent searches")
+    parser.add_argument("--limit", type=int, default=25, help="Results per source")
+    parser.add_argument("--sources", nargs="+", choices=["crossref", "openalex", "semantic_scholar"])
+    parser.add_argument("--query", default="devops governance", help="Base query (suffixed per op)")
+    parser.add_argument("--stub-url", help="Use a running stub server instead of an in-process one")
+    parser.add_argument("--cassette", type=Path, help="Recorded responses for the in-process stub server")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=30.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--keep-rate-limits", action="store_true", help="Keep the clients' API rate limits")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger().setLevel(logging.CRITICAL)  # failed ops are counted, not logged
+
+    server = None
+    if not args.stub_url:
+        server = StubServer(
+            cassette=Cassette(args.cassette) if args.cassette else None,
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate
+        ).start()
+    base_url = args.stub_url or server.base_url
+
+    print("=" * 70)
+    print("SEARCH ENGINE BENCHMARK")
+    print("=" * 70)
+    print(f"Stub: {base_url}  latency={args.latency_ms}+{args.jitter_ms}ms  "
+          f"errors={args.error_rate:.0%}  429s={args.rate_limit_rate:.0%}")
+    print(f"Ops: {args.ops} per scenario, concurrency {args.concurrency}, limit {args.limit}\n")
+    print(HEADER)
+    print("-" * len(HEADER))
+
+    try:
+        for name in args.scenarios:
+            engine = create_engine(base_url, args.sources, args.keep_rate_limits)
+            queries = [f"{args.query} {name} {i}" for i in range(args.ops)]
+            print(run_scenario(name, engine, queries, args.limit, args.concurrency).row())
+            engine.close()
+    finally:
+        if server:
+            server.stop()
+            print(f"\nServer responses: {dict(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
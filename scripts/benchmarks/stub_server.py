@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Local API Stub Server - Academic Agent v2.3
+
+Lokaler HTTP Server für Offline-Benchmarks der Search/PDF Clients. Liefert
+aufgezeichnete Responses (Cassettes aus src/utils/http_replay.py) für
+CrossRef, OpenAlex, Semantic Scholar, Unpaywall und CORE; nicht aufgezeichnete
+Requests werden deterministisch synthetisch beantwortet.
+
+Routing: Clients werden per rebase_urls() umgeleitet, der erste Pfad-Teil
+ist der Original-Host:
+    http://127.0.0.1:8765/api.crossref.org/works?query=...
+
+Fault Injection:
+- --latency-ms / --jitter-ms: Antwortzeit pro Request
+- --error-rate: Anteil 503 Responses
+- --rate-limit-rate: Anteil 429 Responses (mit Retry-After)
+
+Run:
+    PYTHONPATH=. python scripts/benchmarks/stub_server.py --port 8765 --latency-ms 80
+    PYTHONPATH=. python scripts/benchmarks/stub_server.py --cassette cassettes/devops.jsonl --rate-limit-rate 0.05
+
+Usage (in-process):
+    with StubServer(latency_ms=50) as server:
+        rebase_urls(engine, server.base_url)
+        engine.search("DevOps Governance")
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.utils.http_replay import Cassette, request_key
+
+
+# ============================================
+# Synthetic Responses
+# ============================================
+
+_WORDS = [
+    "governance", "devops", "continuous", "delivery", "pipeline", "compliance", "framework",
+    "software", "engineering", "security", "automation", "study", "results", "model",
+    "approach", "organizations", "agile", "cloud", "deployment", "risk", "audit", "controls",
+]
+
+
+def _rng(*parts: str) -> random.Random:
+    seed = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+    return random.Random(int(seed[:16], 16))
+
+
+def _record(query: str, index: int) -> Dict[str, Any]:
+    """Source-neutral paper (DOIs overlap across sources → exercises dedup)"""
+    rng = _rng(query, str(index))
+    qhash = hashlib.sha1(query.lower().encode("utf-8")).hexdigest()[:8]
+    words = [rng.choice(_WORDS) for _ in range(120)]
+    return {
+        "doi": f"10.5555/{qhash}.{index}",
+        "title": f"{query} " + " ".join(rng.choice(_WORDS) for _ in range(6)),
+        "authors": [f"Author {rng.randint(1, 999)}" for _ in range(rng.randint(1, 5))],
+        "year": rng.randint(2000, 2025),
+        "abstract": " ".join(words),
+        "venue": f"Journal of {rng.choice(_WORDS).title()}",
+        "citations": rng.randint(0, 2000),
+    }
+
+
+def _record_for_doi(doi: str) -> Dict[str, Any]:
+    record = _record(doi, 0)
+    record["doi"] = doi
+    return record
+
+
+def _crossref(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "DOI": record["doi"], "title": [record["title"]], "URL": f"https://doi.org/{record['doi']}",
+        "author": [{"given": a.split()[0], "family": a.split()[-1]} for a in record["authors"]],
+        "published": {"date-parts": [[record["year"], 1, 1]]},
+        "abstract": f"<jats:p>{record['abstract']}</jats:p>",
+        "container-title": [record["venue"]], "is-referenced-by-count": record["citations"],
+    }
+
+
+def _openalex(record: Dict[str, Any]) -> Dict[str, Any]:
+    index: Dict[str, List[int]] = {}
+    for pos, word in enumerate(record["abstract"].split()):
+        index.setdefault(word, []).append(pos)
+    return {
+        "id": f"https://openalex.org/W{int(hashlib.sha1(record['doi'].encode('utf-8')).hexdigest()[:8], 16)}",
+        "doi": f"https://doi.org/{record['doi']}", "title": record["title"],
+        "authorships": [{"author": {"display_name": a}} for a in record["authors"]],
+        "publication_year": record["year"], "abstract_inverted_index": index,
+        "primary_location": {"source": {"display_name": record["venue"]}},
+        "cited_by_count": record["citations"],
+    }
+
+
+def _s2(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "paperId": hashlib.sha1(record["doi"].encode("utf-8")).hexdigest(),
+        "externalIds": {"DOI": record["doi"]}, "title": record["title"],
+        "authors": [{"name": a} for a in record["authors"]], "year": record["year"],
+        "abstract": record["abstract"], "venue": record["venue"],
+        "citationCount": record["citations"], "url": f"https://www.semanticscholar.org/doi/{record['doi']}",
+    }
+
+
+def _page_size(params: Dict[str, str], key: str, default: int = 20, maximum: int = 1000) -> int:
+    try:
+        return max(0, min(int(params.get(key, default)), maximum))
+    except ValueError:
+        return default
+
+
+def synthetic_response(host: str, path: str, params: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+    """(status, JSON payload) for an unrecorded request"""
+    if host == "api.crossref.org":
+        if path.startswith("/works/"):
+            return 200, {"status": "ok", "message": _crossref(_record_for_doi(path[len("/works/"):]))}
+        query = params.get("query", "")
+        rows = _page_size(params, "rows")
+        payload = {"items": [_crossref(_record(query, i)) for i in range(rows)]}
+        if "cursor" in params:
+            payload["next-cursor"] = f"{params['cursor']}+"
+        return 200, {"status": "ok", "message": payload}
+
+    if host == "api.openalex.org":
+        prefix = "/works/https://doi.org/"
+        if path.startswith(prefix):
+            return 200, _openalex(_record_for_doi(path[len(prefix):]))
+        doi_filter = next((part[4:] for part in params.get("filter", "").split(",")
+                           if part.startswith("doi:")), None)
+        if doi_filter:
+            return 200, {"meta": {}, "results": [_openalex(_record_for_doi(d)) for d in doi_filter.split("|")]}
+        query = params.get("search", "")
+        return 200, {"meta": {"next_cursor": None},
+                     "results": [_openalex(_record(query, i)) for i in range(_page_size(params, "per-page", 25, 200))]}
+
+    if host == "api.semanticscholar.org":
+        if path.endswith("/paper/batch"):
+            ids = json.loads(body or b"{}").get("ids", [])
+            return 200, [_s2(_record_for_doi(i.removeprefix("DOI:"))) for i in ids]
+        if "/paper/DOI:" in path:
+            return 200, _s2(_record_for_doi(path.split("/paper/DOI:", 1)[1]))
+        query = params.get("query", "")
+        if path.endswith("/paper/search/bulk"):
+            return 200, {"total": 1000, "data": [_s2(_record(query, i)) for i in range(1000)]}
+        limit = _page_size(params, "limit", 10, 100)
+        return 200, {"total": limit, "offset": 0, "data": [_s2(_record(query, i)) for i in range(limit)]}
+
+    if host == "api.unpaywall.org":
+        doi = path.removeprefix("/v2/")
+        return 200, {"doi": doi, "is_oa": True, "oa_status": "gold",
+                     "best_oa_location": {"url_for_pdf": f"https://example.org/{doi}.pdf",
+                                          "host_type": "publisher", "license": "cc-by"}}
+
+    if host == "api.core.ac.uk":
+        doi = params.get("q", "").removeprefix("doi:")
+        return 200, {"totalHits": 1, "results": [{"doi": doi, "downloadUrl": f"https://core.ac.uk/download/{doi}.pdf",
+                                                  "dataProvider": {"name": "Stub Repository"}}]}
+
+    return 404, {"error": f"unknown host {host}"}
+
+
+# ============================================
+# Stub Server
+# ============================================
+
+class StubServer:
+    """
+    Threaded local HTTP server with latency and fault injection
+
+    Responses come from an optional Cassette, otherwise synthetic_response().
+    """
+
+    def __init__(
+        self,
+        cassette: Optional[Cassette] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 42,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Args:
+            cassette: Recorded responses (default: synthetic only)
+            latency_ms: Base latency per request
+            jitter_ms: Uniform extra latency (0..jitter_ms)
+            error_rate: Fraction of requests answered with 503
+            rate_limit_rate: Fraction of requests answered with 429 + Retry-After
+            retry_after: Retry-After seconds for 429 responses
+            seed: Seed for latency/fault sampling (reproducible runs)
+            host: Bind address
+            port: Port (0 = ephemeral)
+        """
+        self.cassette = cassette
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.stats: Counter = Counter()
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def handle(self, method: str, raw_path: str, body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """Answer one request: (status, headers, body)"""
+        with self._lock:
+            delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+            roll = self._rng.random()
+        if delay:
+            time.sleep(delay / 1000)
+
+        if roll < self.rate_limit_rate:
+            self.stats[429] += 1
+            return 429, {"Retry-After": str(self.retry_after)}, b'{"message": "Too Many Requests"}'
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.stats[503] += 1
+            return 503, {}, b'{"message": "Service Unavailable"}'
+
+        parts = urlsplit(raw_path)
+        host, _, path = unquote(parts.path).lstrip("/").partition("/")
+        path = "/" + path
+
+        if self.cassette is not None:
+            url = f"https://{host}{path}" + (f"?{parts.query}" if parts.query else "")
+            entry = self.cassette.lookup(request_key(method, url, body))
+            if entry is not None:
+                self.stats["replayed"] += 1
+                self.stats[entry["status"]] += 1
+                return entry["status"], dict(entry.get("headers") or {}), Cassette.entry_content(entry)
+
+        status, payload = synthetic_response(host, path, dict(parse_qsl(parts.query)), body)
+        self.stats["synthetic"] += 1
+        self.stats[status] += 1
+        return status, {"Content-Type": "application/json"}, json.dumps(payload).encode("utf-8")
+
+
+def _make_handler(stub: StubServer):
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive (clients pool connections)
+
+        def _serve(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, content = stub.handle(self.command, self.path, body)
+
+            self.send_response(status)
+            for name, value in headers.items():
+                if name.lower() not in ("content-length", "transfer-encoding", "content-encoding"):
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = _serve
+        do_POST = _serve
+
+        def log_message(self, format, *args):
+            pass
+
+    return _Handler
+
+
+def main():
+    """Run stub server in the foreground"""
+    parser = argparse.ArgumentParser(description="Local API stub server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cassette", type=Path, help="Recorded responses (JSON Lines)")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+
+    server = StubServer(
+        cassette=Cassette(args.cassette) if args.cassette else None,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, retry_after=args.retry_after, port=args.port
+    )
+    print(f"Stub server on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(f"\nServed: {dict(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
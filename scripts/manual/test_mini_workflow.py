@@ -146,13 +146,9 @@ def main():
         # Sort by total score
         scored_results.sort(key=lambda x: x["scores"]["total"], reverse=True)
 
-        # Select top papers and attach scores
-        top_papers = []
-        for result in scored_results[:max_papers]:
-            paper = result["paper"]
-            paper.score = result["scores"]["total"]
-            paper.scores_detail = result["scores"]
-            top_papers.append(paper)
+        # Select top papers (scores stay in the result dicts - Paper has __slots__)
+        top_results = scored_results[:max_papers]
+        top_papers = [result["paper"] for result in top_results]
 
         logger.info(f"Ranked {len(scored_results)} papers, selected top {len(top_papers)}")
 
@@ -218,7 +214,8 @@ def main():
 
         # Generate simple citations for each paper
         papers_with_citations = []
-        for paper in top_papers:
+        for result in top_results:
+            paper = result["paper"]
             # Simple APA-style citation (without full formatter)
             authors_str = ", ".join(paper.authors[:3]) if paper.authors else "Unknown"
             if len(paper.authors) > 3:
@@ -234,7 +231,7 @@ def main():
                 "venue": paper.venue,
                 "citations": paper.citations,
                 "url": paper.url,
-                "score": paper.score,
+                "score": result["scores"]["total"],
                 "citation": simple_citation
             })
 
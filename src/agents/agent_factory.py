@@ -203,9 +203,14 @@ No additional explanation needed."""
                 - paper_index: Index in original list
                 - relevance_score: 0.0-1.0
                 - reasoning: Brief explanation
+                - fallback: True if the LLM result was unusable and the
+                  score is the BM25 fallback (not an LLM score)
         """
         # Limit papers to avoid token limits
         papers_to_score = papers[:max_papers]
+        if len(papers) > max_papers:
+            logger.warning(f"score_relevance: only the first {max_papers} of {len(papers)} papers are scored "
+                           f"(use score_papers() or RankingEngine cascade mode for all)")
 
         # Prepare papers for LLM
         papers_json = []
@@ -220,6 +225,7 @@ No additional explanation needed."""
 
         papers_str = json.dumps(papers_json, indent=2)
 
+        # Changing this prompt? Bump RELEVANCE_PROMPT_VERSION (src/ranking/relevance_cache.py)
         prompt = f"""Score the relevance of these academic papers to the research query.
 
 **Query:** "{user_query}"
@@ -282,6 +288,56 @@ Return ONLY valid JSON."""
             # Fallback: simple keyword-based scoring
             return self._simple_relevance_scoring(user_query, papers_to_score)
 
+    def score_papers(
+        self,
+        user_query: str,
+        papers: List[Any],
+        max_papers: int = 50
+    ) -> Dict[str, float]:
+        """
+        LLM relevance for Paper objects, in batches of max_papers (none dropped)
+
+        Signature matches RankingEngine(llm_scorer=...), e.g. for cascade mode:
+            RankingEngine(llm_scorer=AgentFactory().score_papers, cascade=True)
+
+        Args:
+            user_query: Research query
+            papers: Paper objects (src.search.crossref_client.Paper)
+            max_papers: Papers per LLM prompt
+
+        Returns:
+            Dict DOI → relevance_score (papers without DOI are skipped).
+            Batches that fell back to BM25 are skipped as well - they are no
+            LLM scores (must not end up in RelevanceScoreCache) and
+            RankingEngine already has its own lexical relevance for them.
+        """
+        scores: Dict[str, float] = {}
+
+        for start in range(0, len(papers), max_papers):
+            batch = papers[start:start + max_papers]
+            results = self.score_relevance(
+                user_query,
+                [
+                    {
+                        "title": paper.title or "",
+                        "abstract": paper.abstract or "",
+                        "year": paper.year,
+                        "authors": paper.authors or []
+                    }
+                    for paper in batch
+                ],
+                max_papers=max_papers
+            )
+
+            for result in results:
+                if result.get("fallback"):
+                    continue
+                index = result.get("paper_index")
+                if isinstance(index, int) and 0 <= index < len(batch) and batch[index].doi:
+                    scores[batch[index].doi] = float(result.get("relevance_score", 0.0))
+
+        return scores
+
     def _spawn_agent(
         self,
         agent_type: str,
@@ -492,29 +548,23 @@ Return ONLY valid JSON."""
         query: str,
         papers: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Fallback: Simple keyword-based relevance scoring"""
-        query_words = set(query.lower().split())
-        scores = []
-
-        for i, paper in enumerate(papers):
-            title = paper.get("title", "").lower()
-            abstract = paper.get("abstract", "").lower()
+        """Fallback: BM25 lexical relevance scoring (title + abstract)"""
+        from src.ranking.bm25_scorer import BM25Scorer
 
-            # Count keyword matches
-            title_matches = sum(1 for word in query_words if word in title)
-            abstract_matches = sum(1 for word in query_words if word in abstract)
-
-            # Simple scoring
-            score = (title_matches * 0.4 + abstract_matches * 0.2) / len(query_words)
-            score = min(score, 1.0)
+        scorer = BM25Scorer().fit(
+            [paper.get("title") or "" for paper in papers],
+            [paper.get("abstract") or "" for paper in papers]
+        )
 
-            scores.append({
+        return [
+            {
                 "paper_index": i,
                 "relevance_score": round(score, 2),
-                "reasoning": f"Keyword match: {title_matches} in title, {abstract_matches} in abstract"
-            })
-
-        return scores
+                "reasoning": "BM25 lexical match (title + abstract)",
+                "fallback": True
+            }
+            for i, score in enumerate(scorer.score(query))
+        ]
 
 
 # Testing
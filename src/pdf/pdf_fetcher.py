@@ -22,6 +22,8 @@ Features:
 - Progress-Tracking
 - Skip-Logik (nach Fehlversuchen)
 - Rate-Limiting zwischen Requests
+- Circuit Breaker: Unpaywall/CORE werden bei gehäuften Fehlern (5xx, 429,
+  Netzwerk) während des Cool-Downs übersprungen
 """
 
 import time
@@ -32,6 +34,7 @@ import re
 
 from src.pdf.unpaywall_client import UnpaywallClient
 from src.pdf.core_client import COREClient
+from src.utils.retry import get_circuit_breaker
 
 
 @dataclass
@@ -52,6 +55,12 @@ class PDFFetcher:
     Orchestrates PDF downloading with 3-step fallback chain
     """
 
+    # Strategies backed by an API (tracked by a per-source circuit breaker)
+    API_STRATEGIES = ("unpaywall", "core")
+
+    # Error prefixes that indicate an unhealthy API (not a missing PDF)
+    _SOURCE_FAILURE_PREFIXES = ("HTTP 5", "HTTP 429", "Request failed")
+
     def __init__(
         self,
         output_dir: Path,
@@ -139,6 +148,11 @@ class PDFFetcher:
         last_error = None
 
         for strategy in self.fallback_chain:
+            breaker = get_circuit_breaker(strategy) if strategy in self.API_STRATEGIES else None
+            if breaker is not None and not breaker.allow_request():
+                last_error = f"{strategy} skipped (circuit open)"
+                continue
+
             attempts += 1
 
             try:
@@ -152,6 +166,12 @@ class PDFFetcher:
                     print(f"⚠️ Unknown strategy: {strategy}")
                     continue
 
+                if breaker is not None:
+                    if self._is_source_failure(result.error):
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+
                 # Success!
                 if result.success:
                     self.stats["success"] += 1
@@ -170,6 +190,8 @@ class PDFFetcher:
 
             except Exception as e:
                 print(f"❌ Strategy {strategy} crashed: {e}")
+                if breaker is not None:
+                    breaker.record_failure()
                 last_error = str(e)
                 continue
 
@@ -183,6 +205,10 @@ class PDFFetcher:
             attempts=attempts
         )
 
+    def _is_source_failure(self, error: Optional[str]) -> bool:
+        """True if a strategy error means the API itself is failing"""
+        return bool(error) and error.startswith(self._SOURCE_FAILURE_PREFIXES)
+
     def _try_unpaywall(self, doi: str, output_path: Path) -> PDFResult:
         """Try Unpaywall API"""
         result = self.unpaywall_client.fetch(doi, output_path)
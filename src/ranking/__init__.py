@@ -3,16 +3,30 @@ Ranking Engine für Academic Agent v2.3+
 
 Module:
 - five_d_scorer.py: 5D-Scoring (Relevanz, Recency, Quality, Authority, Portfolio)
+- bm25_scorer.py: Lexikalische Relevanz (BM25 über Title + Abstract, ohne LLM)
+- embedding_scorer.py: CPU Embedding Relevanz (Hashed n-grams, Vektor-Cache pro DOI)
 - llm_relevance_scorer.py: LLM-basierte Relevanz (Haiku)
+- relevance_cache.py: Persistenter LLM Relevanz-Score Cache (Query, DOI, Model, Prompt)
+- citation_enricher.py: Fehlende Citation Counts (gebatchte DOI Lookups, Cache)
 - ranking_engine.py: Orchestrator
 """
 
 from src.ranking.five_d_scorer import FiveDScorer, score_papers
+from src.ranking.bm25_scorer import BM25Scorer, bm25_relevance
+from src.ranking.embedding_scorer import EmbeddingScorer
+from src.ranking.relevance_cache import RelevanceScoreCache
+from src.ranking.citation_enricher import CitationEnricher, enrich_citations
 from src.ranking.ranking_engine import RankingEngine, rank_papers
 
 __all__ = [
     "FiveDScorer",
     "score_papers",
+    "BM25Scorer",
+    "bm25_relevance",
+    "EmbeddingScorer",
+    "RelevanceScoreCache",
+    "CitationEnricher",
+    "enrich_citations",
     "RankingEngine",
     "rank_papers"
 ]
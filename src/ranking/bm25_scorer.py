@@ -0,0 +1,259 @@
+"""
+BM25 Lexical Relevance für Academic Agent v2.3+
+
+Relevanz ohne LLM Call: BM25 über Title und Abstract der Kandidaten.
+
+Features:
+- Tokenisierung einmal pro Kandidatenmenge (ganze Wörter - "ai" matcht
+  nicht mehr in "maintain")
+- Sparse Term Matrix pro Feld (Inverted Index: Term → Doc IDs + TF)
+- Vektorisiertes BM25 (NumPy, optional) - skaliert auf tausende Papers
+- IDF aus der Kandidatenmenge (Corpus Statistics werden bei fit() berechnet)
+- Normalisierte Scores (0-1): 1.0 = alle Query Terms einmal in einem Feld
+  durchschnittlicher Länge
+- Default relevance_scores Provider der RankingEngine
+
+Usage:
+    from src.ranking.bm25_scorer import BM25Scorer
+
+    scorer = BM25Scorer()
+    relevance = scorer.score_papers(papers, "DevOps Governance")  # DOI → score
+"""
+
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+import math
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.search.crossref_client import Paper
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Lowercase word tokens
+
+    Example:
+        tokenize("AI-driven DevOps: Maintaining CI/CD")
+        # → ["ai", "driven", "devops", "maintaining", "ci", "cd"]
+    """
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+# ============================================
+# Term Matrix
+# ============================================
+
+class _FieldIndex:
+    """
+    Sparse term matrix of one field (CSC: postings per term)
+
+    NumPy: Term IDs aller Tokens in einem Array, TF per np.unique über
+    (term, doc) - kein Python Code pro (Term, Doc) Paar.
+    """
+
+    def __init__(self, texts: Sequence[Optional[str]]):
+        self.num_docs = len(texts)
+        self.vocabulary: Dict[str, int] = defaultdict()
+        self.vocabulary.default_factory = self.vocabulary.__len__
+
+        term_ids: List[int] = []
+        lengths: List[int] = []
+        for text in texts:
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            term_ids.extend(map(self.vocabulary.__getitem__, tokens))
+
+        self.vocabulary = dict(self.vocabulary)
+        self.avg_length = (len(term_ids) / self.num_docs) if self.num_docs else 0.0
+
+        if np is not None:
+            n = max(self.num_docs, 1)
+            docs = np.repeat(np.arange(self.num_docs, dtype=np.int64), lengths)
+            keys, tf = np.unique(np.array(term_ids, dtype=np.int64) * n + docs, return_counts=True)
+            self.lengths = np.array(lengths, dtype=np.float64)
+            self.doc_ids = (keys % n).astype(np.intp)
+            self.tf = tf.astype(np.float64)
+            self.indptr = np.searchsorted(keys // n, np.arange(len(self.vocabulary) + 1))
+        else:
+            self.lengths = lengths
+            self._postings: Dict[int, Tuple[List[int], List[int]]] = {}
+            offset = 0
+            for doc_id, length in enumerate(lengths):
+                for term_id, tf in Counter(term_ids[offset:offset + length]).items():
+                    doc_list, tf_list = self._postings.setdefault(term_id, ([], []))
+                    doc_list.append(doc_id)
+                    tf_list.append(tf)
+                offset += length
+
+    def postings(self, term: str):
+        """(doc ids, term frequencies) of term, None if unseen"""
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            return None
+        if np is not None:
+            start, stop = self.indptr[term_id], self.indptr[term_id + 1]
+            return self.doc_ids[start:stop], self.tf[start:stop]
+        return self._postings[term_id]
+
+    def idf(self, term: str) -> float:
+        """BM25 IDF (always > 0; unseen terms get the maximum)"""
+        postings = self.postings(term)
+        df = len(postings[0]) if postings is not None else 0
+        return math.log(1.0 + (self.num_docs - df + 0.5) / (df + 0.5))
+
+
+# ============================================
+# BM25 Scorer
+# ============================================
+
+class BM25Scorer:
+    """
+    BM25 relevance over title + abstract of a candidate set
+
+    fit() baut die Term Matrizen, score() bewertet beliebig viele Queries
+    gegen dieselben Kandidaten.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        title_weight: float = 0.7,
+        abstract_weight: float = 0.3
+    ):
+        """
+        Initialize BM25 Scorer
+
+        Args:
+            k1: Term frequency saturation
+            b: Length normalization (0 = none, 1 = full)
+            title_weight: Weight of the title field
+            abstract_weight: Weight of the abstract field
+        """
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.abstract_weight = abstract_weight
+
+        self._fields: List[Tuple[_FieldIndex, float]] = []
+        self.num_docs = 0
+
+    def fit(
+        self,
+        titles: Sequence[Optional[str]],
+        abstracts: Optional[Sequence[Optional[str]]] = None
+    ) -> "BM25Scorer":
+        """
+        Tokenize candidates and build term matrices + corpus statistics
+
+        Args:
+            titles: Title per candidate
+            abstracts: Abstract per candidate (same order, None = titles only)
+
+        Returns:
+            self
+        """
+        self.num_docs = len(titles)
+        self._fields = [(_FieldIndex(titles), self.title_weight)]
+        if abstracts is not None:
+            self._fields.append((_FieldIndex(abstracts), self.abstract_weight))
+        return self
+
+    def score(self, query: str) -> List[float]:
+        """
+        Relevance (0-1) per fitted candidate, in fit() order
+
+        Empty query: neutral 0.5 for every candidate.
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return [0.5] * self.num_docs
+
+        total_weight = sum(weight for _, weight in self._fields) or 1.0
+
+        if np is not None:
+            scores = np.zeros(self.num_docs, dtype=np.float64)
+            for field, weight in self._fields:
+                scores += self._field_scores(field, terms) * (weight / total_weight)
+            return scores.tolist()
+
+        scores = [0.0] * self.num_docs
+        for field, weight in self._fields:
+            for doc_id, value in enumerate(self._field_scores(field, terms)):
+                scores[doc_id] += value * (weight / total_weight)
+        return scores
+
+    def _field_scores(self, field: _FieldIndex, terms: set):
+        """
+        Normalized BM25 of one field
+
+        Divided by the score of a document that contains every query term
+        once at average length (clipped to 1.0).
+        """
+        idf = {term: field.idf(term) for term in terms}
+        ideal = sum(idf.values())
+
+        if field.avg_length == 0 or ideal == 0:
+            return np.zeros(field.num_docs) if np is not None else [0.0] * field.num_docs
+
+        k1, b = self.k1, self.b
+
+        if np is not None:
+            norm = k1 * (1.0 - b + b * field.lengths / field.avg_length)
+            scores = np.zeros(field.num_docs, dtype=np.float64)
+            for term in terms:
+                postings = field.postings(term)
+                if postings is None:
+                    continue
+                doc_ids, tf = postings
+                scores[doc_ids] += idf[term] * tf * (k1 + 1.0) / (tf + norm[doc_ids])
+            return np.minimum(scores / ideal, 1.0)
+
+        scores = [0.0] * field.num_docs
+        for term in terms:
+            postings = field.postings(term)
+            if postings is None:
+                continue
+            for doc_id, tf in zip(*postings):
+                norm = k1 * (1.0 - b + b * field.lengths[doc_id] / field.avg_length)
+                scores[doc_id] += idf[term] * tf * (k1 + 1.0) / (tf + norm)
+        return [min(value / ideal, 1.0) for value in scores]
+
+    def score_papers(self, papers: List[Paper], query: str) -> Dict[str, float]:
+        """
+        Fit on papers and score query
+
+        Returns:
+            Dict DOI → relevance (papers without DOI are skipped),
+            usable as FiveDScorer relevance_scores
+        """
+        self.fit([p.title for p in papers], [p.abstract for p in papers])
+        scores = self.score(query)
+        logger.debug(f"BM25 scored {len(papers)} papers for '{query}'")
+        return {paper.doi: value for paper, value in zip(papers, scores) if paper.doi}
+
+
+# ============================================
+# Convenience Functions
+# ============================================
+
+def bm25_relevance(papers: List[Paper], query: str, **kwargs) -> Dict[str, float]:
+    """
+    Convenience function: DOI → BM25 relevance (0-1)
+
+    Example:
+        relevance = bm25_relevance(papers, "DevOps Governance")
+        scored = FiveDScorer().score(papers, "DevOps Governance", relevance_scores=relevance)
+    """
+    return BM25Scorer(**kwargs).score_papers(papers, query)
@@ -1,13 +1,347 @@
 """
-Citation Enricher — stub (not yet implemented)
+Citation Enricher für Academic Agent v2.3+
 
-Would enrich papers with additional citation counts from external sources.
-Currently a no-op placeholder.
+Ergänzt Citation Counts für Papers ohne (oder mit veralteten) Zahlen -
+vor allem DBIS Papers, die mit citations=None ankommen und im 5D-Scoring
+sonst den Quality-Floor (0.1) bekommen.
+
+Features:
+- Gebatchte DOI Lookups: Semantic Scholar (POST /paper/batch, 500 DOIs/Request)
+  + OpenAlex (filter=doi:a|b|c, 50 DOIs/Request), PRIORITY_BULK im Rate Limiter
+- Maximum über alle Sources (Sources zählen unterschiedlich vollständig)
+- Persistenter Cache mit mehrtägiger TTL (SQLite via utils.cache.Cache),
+  auch für DOIs die keine Source kennt
+- Begrenztes Request-Budget pro Run (max_requests pro Source) - unabhängig
+  davon, wie viele DBIS Papers ankommen; Papers ohne Count zuerst
+- Akzeptiert Paper-Objekte und DBIS-Dicts ({"doi", "citations"})
+
+Usage:
+    from src.ranking.citation_enricher import CitationEnricher, enrich_citations
+
+    papers = enrich_citations(papers)  # In-place, gibt papers zurück
+
+    enricher = CitationEnricher(max_requests=2, ttl_hours=72)
+    enricher.enrich(papers)
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Union
+from pathlib import Path
+import logging
+
+from src.search.crossref_client import Paper, normalize_doi
+from src.utils.cache import Cache
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+PaperLike = Union[Paper, Dict[str, Any]]
+
+
+# ============================================
+# Citation Enricher
+# ============================================
+
+class CitationEnricher:
+    """
+    Batched citation count lookup with persistent cache
+
+    Clients werden bei Bedarf erzeugt (oder von SearchEngine übernommen,
+    dann teilen sie Rate Limiter, Circuit Breaker und Response Cache).
+    """
+
+    DEFAULT_SOURCES = ("semantic_scholar", "openalex")
+
+    def __init__(
+        self,
+        sources: Optional[List[str]] = None,
+        max_requests: int = 4,
+        ttl_hours: int = 168,
+        cache_file: Optional[Path] = None,
+        max_size_mb: int = 20,
+        only_missing: bool = True,
+        cache: Optional[Cache] = None,
+        openalex_client=None,
+        s2_client=None
+    ):
+        """
+        Args:
+            sources: Lookup sources (default: semantic_scholar, openalex)
+            max_requests: Max DOI batch requests per source and enrich() call
+            ttl_hours: Cache TTL (default: 168 = 7 Tage)
+            cache_file: Cache DB Pfad (default: ~/.cache/academic_agent/citation_cache.db)
+            max_size_mb: Max Cache Größe in MB
+            only_missing: Only enrich papers with citations=None (default: True)
+            cache: Optional existierender Cache (überschreibt ttl/file/size)
+            openalex_client: Optional OpenAlexClient (default: eigener Client)
+            s2_client: Optional SemanticScholarClient (default: eigener Client)
+        """
+        self.sources = list(sources or self.DEFAULT_SOURCES)
+        self.max_requests = max_requests
+        self.only_missing = only_missing
+        self.cache = cache or Cache(
+            cache_file=cache_file or Path.home() / ".cache" / "academic_agent" / "citation_cache.db",
+            ttl_hours=ttl_hours,
+            max_size_mb=max_size_mb
+        )
+
+        self._clients = {"openalex": openalex_client, "semantic_scholar": s2_client}
+        self._owned_clients = []
+
+        # Stats
+        self.cache_hits = 0
+        self.fetched = 0
+        self.enriched = 0
+
+    def enrich(self, papers: List[PaperLike]) -> List[PaperLike]:
+        """
+        Enrich citation counts in place
+
+        Counts are only raised (max of existing and looked-up value).
+
+        Args:
+            papers: Paper objects or dicts with "doi"/"citations"
+
+        Returns:
+            The same list (for chaining)
+        """
+        targets: Dict[str, List[PaperLike]] = {}
+        for paper in papers:
+            if self.only_missing and _get(paper, "citations") is not None:
+                continue
+            doi = normalize_doi(_get(paper, "doi") or "")
+            if doi:
+                targets.setdefault(doi, []).append(paper)
+
+        if not targets:
+            return papers
+
+        # Papers without any count first - they gain most from the bounded budget
+        dois = sorted(targets, key=lambda d: any(_get(p, "citations") is not None for p in targets[d]))
+        counts = self.lookup(dois)
+
+        enriched = 0
+        for doi, count in counts.items():
+            if count is None:
+                continue
+            for paper in targets[doi]:
+                current = _get(paper, "citations")
+                if current is None or count > current:
+                    _set(paper, "citations", count)
+                    enriched += 1
+
+        self.enriched += enriched
+        logger.info(f"Citation enrichment: {enriched}/{sum(map(len, targets.values()))} papers updated")
+        return papers
+
+    def lookup(self, dois: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Citation counts for DOIs (cache first, then batched lookups)
+
+        DOIs beyond the request budget (or whose lookups failed everywhere)
+        are absent from the result; DOIs no source knows map to None (and
+        are cached as such only if every source answered).
+
+        Args:
+            dois: DOIs in priority order
+
+        Returns:
+            Dict normalized DOI -> max citation count across sources (or None)
+        """
+        counts: Dict[str, Optional[int]] = {}
+        pending = []
+
+        for doi in dict.fromkeys(normalize_doi(d) for d in dois):
+            if not doi:
+                continue
+            cached = self.cache.get(self._cache_key(doi))
+            if cached is not None:
+                counts[doi] = cached["citations"]
+                self.cache_hits += 1
+            else:
+                pending.append(doi)
+
+        if not pending:
+            return counts
+
+        found: Dict[str, int] = {}
+        attempted: Dict[str, int] = {}  # doi -> number of sources that looked it up
+        for source in self.sources:
+            client = self._client(source)
+            if client is None:
+                continue
+
+            # Budget: max_requests batches of the source's batch size
+            batch = pending[:self.max_requests * client.DOI_BATCH_SIZE]
+            failed: Set[str] = set()
+            try:
+                papers = client.get_by_dois(batch, failed=failed)
+            except Exception as e:
+                logger.warning(f"Citation lookup via {source} failed: {e}")
+                continue
+
+            if failed:
+                logger.warning(f"Citation lookup via {source}: {len(failed)} DOIs failed (not cached)")
+            for doi in batch:
+                if doi not in failed:
+                    attempted[doi] = attempted.get(doi, 0) + 1
+            for doi, paper in papers.items():
+                if paper.citations is not None:
+                    found[doi] = max(found.get(doi, 0), paper.citations)
+
+        # Cache only DOIs every source has answered (budget-limited or failed misses are not final)
+        active_sources = sum(1 for source in self.sources if self._clients.get(source) is not None)
+        for doi, seen in attempted.items():
+            count = found.get(doi)
+            counts[doi] = count
+            if seen >= active_sources:
+                self.cache.set(self._cache_key(doi), {"citations": count})
+
+        self.fetched += len(attempted)
+        if len(attempted) < len(pending):
+            logger.info(f"Citation enrichment: request budget reached, "
+                        f"{len(pending) - len(attempted)} DOIs skipped")
+        return counts
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lookup counters + underlying cache stats"""
+        return {
+            "cache_hits": self.cache_hits,
+            "fetched": self.fetched,
+            "enriched": self.enriched,
+            **self.cache.get_stats()
+        }
+
+    @staticmethod
+    def _cache_key(doi: str) -> str:
+        return f"citations:{doi}"
+
+    def _client(self, source: str):
+        """Client for source (created on first use)"""
+        if self._clients.get(source) is not None:
+            return self._clients[source]
+
+        if source == "openalex":
+            from src.search.openalex_client import OpenAlexClient
+            client = OpenAlexClient()
+        elif source == "semantic_scholar":
+            from src.search.semantic_scholar_client import SemanticScholarClient
+            client = SemanticScholarClient()
+        else:
+            logger.warning(f"Citation enrichment: unknown source '{source}'")
+            return None
+
+        self._clients[source] = client
+        self._owned_clients.append(client)
+        return client
+
+    def close(self):
+        """Close clients created by the enricher"""
+        for client in self._owned_clients:
+            client.close()
+        self._owned_clients = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _get(paper: PaperLike, field: str) -> Any:
+    if isinstance(paper, dict):
+        return paper.get(field)
+    return getattr(paper, field, None)
+
+
+def _set(paper: PaperLike, field: str, value: Any) -> None:
+    if isinstance(paper, dict):
+        paper[field] = value
+    else:
+        setattr(paper, field, value)
+
+
+# ============================================
+# Convenience Functions
+# ============================================
+
+def enrich_citations(
+    papers: List[PaperLike],
+    enricher: Optional[CitationEnricher] = None
+) -> List[PaperLike]:
+    """
+    Enrich missing citation counts (in place)
+
+    Args:
+        papers: Paper objects or DBIS dicts
+        enricher: Optional configured CitationEnricher (default: new one with defaults)
+
+    Returns:
+        The same list with citations filled in where a source knows the DOI
+    """
+    if enricher is not None:
+        return enricher.enrich(papers)
+    with CitationEnricher() as own:
+        return own.enrich(papers)
+
+
+def create_citation_enricher_from_config(
+    enricher_config,
+    openalex_client=None,
+    s2_client=None
+) -> Optional[CitationEnricher]:
+    """
+    Create CitationEnricher from CitationEnricherConfig
+
+    Args:
+        enricher_config: CitationEnricherConfig (api_config.citation_enricher)
+        openalex_client: Optional shared OpenAlexClient (e.g. SearchEngine.openalex_client)
+        s2_client: Optional shared SemanticScholarClient (e.g. SearchEngine.s2_client)
+
+    Returns:
+        CitationEnricher or None if disabled
+    """
+    if not enricher_config or not enricher_config.enabled:
+        return None
+
+    cache_file = Path(enricher_config.cache_file).expanduser() if enricher_config.cache_file else None
+    return CitationEnricher(
+        sources=enricher_config.sources,
+        max_requests=enricher_config.max_requests,
+        ttl_hours=enricher_config.ttl_hours,
+        cache_file=cache_file,
+        only_missing=enricher_config.only_missing,
+        openalex_client=openalex_client,
+        s2_client=s2_client
+    )
+
+
+# ============================================
+# CLI Test
+# ============================================
+
+if __name__ == "__main__":
+    """
+    Test Citation Enricher (live API)
+
+    Run:
+        python -m src.ranking.citation_enricher
+    """
+    import tempfile
+
+    print("Testing CitationEnricher...")
+
+    dbis_papers = [
+        {"doi": "10.1109/MS.2016.68", "title": "DevOps", "citations": None},
+        {"doi": "https://doi.org/10.1145/3133956.3134045", "title": "Example", "citations": None},
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with CitationEnricher(max_requests=1, cache_file=Path(tmp) / "citations.db") as enricher:
+            enricher.enrich(dbis_papers)
+            for paper in dbis_papers:
+                print(f"  {paper['doi']}: {paper['citations']} citations")
 
+            enricher.enrich([{"doi": "10.1109/MS.2016.68", "citations": None}])
+            print(f"  ✅ Stats: {enricher.get_stats()}")
 
-def enrich_citations(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Return papers unchanged (enrichment not implemented yet)."""
-    return papers
+    print("\n✅ All tests passed!")
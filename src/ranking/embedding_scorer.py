@@ -0,0 +1,507 @@
+"""
+Embedding Relevance (CPU) für Academic Agent v2.3+
+
+Semantische(re) Relevanz ohne GPU, Netzwerk oder LLM Call: Hashed
+Character n-gram Embeddings, pro DOI persistent gecached.
+
+Features:
+- HashingEmbedder: Wörter + Char n-grams (3-5) per CRC32 in `dim` Buckets
+  gehasht (signed), L2-normalisiert, float32 - robust gegen Flexion und
+  Komposita ("governance" ~ "governing", "DevOps" ~ "DevSecOps")
+- EmbeddingCache: memory-mapped float32 Matrix + DOI → Row Index (JSON),
+  Papers aus früheren Runs werden nie neu embedded - außer Title/Abstract
+  haben sich geändert (Content Digest pro Row, z.B. nach hydrate());
+  parallele Runs teilen den Cache über einen File Lock (fcntl)
+- EmbeddingScorer: Query vs. Kandidaten Cosine Similarity als ein
+  Matrix-Vektor Produkt; Backend für RankingEngine(relevance_scorer=...)
+
+Benötigt numpy.
+
+Usage:
+    from src.ranking.embedding_scorer import EmbeddingScorer
+    from src.ranking.ranking_engine import RankingEngine
+
+    engine = RankingEngine(relevance_scorer=EmbeddingScorer())
+    ranked = engine.rank(papers, "DevOps Governance", top_n=15)
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: nur Thread-Lock innerhalb des Prozesses
+    fcntl = None
+
+from src.search.crossref_client import Paper, normalize_doi
+from src.ranking.bm25_scorer import tokenize
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for embedding relevance (pip install numpy)")
+
+
+# ============================================
+# Hashing Embedder
+# ============================================
+
+class HashingEmbedder:
+    """
+    Hashed word + character n-gram embeddings (no model, no training)
+
+    Features (Buckets + Vorzeichen) werden einmal pro Token berechnet und in
+    flachen Arrays gehalten; embed() expandiert (Doc, Token, Count) Paare
+    vektorisiert in Blöcken von Docs.
+    """
+
+    # Expanded (doc, feature) entries per bincount block
+    CHUNK_FEATURES = 2_000_000
+
+    def __init__(self, dim: int = 512, ngram_min: int = 3, ngram_max: int = 5):
+        """
+        Args:
+            dim: Embedding dimension (hash buckets)
+            ngram_min: Smallest character n-gram
+            ngram_max: Largest character n-gram
+        """
+        _require_numpy()
+        self.dim = dim
+        self.ngram_min = ngram_min
+        self.ngram_max = ngram_max
+
+        self._vocabulary: Dict[str, int] = defaultdict()
+        self._vocabulary.default_factory = self._vocabulary.__len__
+        self._feature_ptr = np.zeros(1, dtype=np.intp)
+        self._feature_buckets = np.zeros(0, dtype=np.intp)
+        self._feature_weights = np.zeros(0, dtype=np.float64)
+
+    @property
+    def signature(self) -> str:
+        """Identifies the vector space (cached vectors are only valid for the same one)"""
+        return f"hashing-v1-{self.dim}-{self.ngram_min}-{self.ngram_max}"
+
+    def _grams(self, token: str) -> List[str]:
+        grams = [token]
+        padded = f"<{token}>"
+        for n in range(self.ngram_min, self.ngram_max + 1):
+            grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return grams
+
+    def _add_features(self) -> None:
+        """Compute features of tokens added to the vocabulary since the last call"""
+        known = len(self._feature_ptr) - 1
+        new_tokens = list(islice(self._vocabulary, known, None))
+        if not new_tokens:
+            return
+
+        grams = [self._grams(token) for token in new_tokens]
+        hashes = np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) for token_grams in grams for gram in token_grams),
+            dtype=np.uint32
+        )
+        lengths = np.fromiter(map(len, grams), dtype=np.intp, count=len(grams))
+        starts = self._feature_ptr[-1] + np.concatenate(([0], np.cumsum(lengths)))
+
+        weights = np.where(hashes & 0x80000000, -1.0, 1.0)
+        weights[starts[:-1] - self._feature_ptr[-1]] *= 2.0  # whole word counts more than each n-gram
+
+        self._feature_ptr = np.concatenate((self._feature_ptr, starts[1:]))
+        self._feature_buckets = np.concatenate((self._feature_buckets, (hashes % self.dim).astype(np.intp)))
+        self._feature_weights = np.concatenate((self._feature_weights, weights))
+
+    def embed(self, texts: Sequence[Optional[str]]) -> "np.ndarray":
+        """
+        Embed texts → (len(texts), dim) float32, rows L2-normalized
+
+        Empty texts give zero rows.
+        """
+        n = len(texts)
+        vectors = np.zeros((n, self.dim), dtype=np.float32)
+
+        token_ids: List[int] = []
+        lengths: List[int] = []
+        for text in texts:
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            token_ids.extend(map(self._vocabulary.__getitem__, tokens))
+        if not token_ids:
+            return vectors
+        self._add_features()
+
+        # (doc, token) pairs with counts, sorted by doc
+        vocabulary_size = len(self._vocabulary)
+        docs = np.repeat(np.arange(n, dtype=np.int64), lengths)
+        keys, counts = np.unique(docs * vocabulary_size + np.array(token_ids, dtype=np.int64), return_counts=True)
+        pair_docs, pair_tokens = keys // vocabulary_size, keys % vocabulary_size
+
+        feature_counts = np.diff(self._feature_ptr)[pair_tokens]
+        ends = np.cumsum(feature_counts)
+        block_starts = np.searchsorted(ends, np.arange(0, ends[-1], self.CHUNK_FEATURES), side="right")
+
+        for lo, hi in zip(block_starts, np.append(block_starts[1:], len(keys))):
+            if lo >= hi:
+                continue
+            sizes = feature_counts[lo:hi]
+            offsets = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            features = np.repeat(self._feature_ptr[pair_tokens[lo:hi]], sizes) + offsets
+
+            first_doc = pair_docs[lo]
+            rows = np.repeat(pair_docs[lo:hi] - first_doc, sizes)
+            block = np.bincount(
+                rows * self.dim + self._feature_buckets[features],
+                weights=self._feature_weights[features] * np.repeat(counts[lo:hi], sizes),
+                minlength=int(pair_docs[hi - 1] - first_doc + 1) * self.dim
+            )
+            vectors[first_doc:pair_docs[hi - 1] + 1] += block.reshape(-1, self.dim).astype(np.float32)
+
+        return _normalize_rows(vectors)
+
+
+def _normalize_rows(vectors: "np.ndarray") -> "np.ndarray":
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+# ============================================
+# Embedding Cache
+# ============================================
+
+class EmbeddingCache:
+    """
+    Persistent per-DOI vectors (memory-mapped float32 matrix + DOI → row index)
+
+    Files: <cache_file> (Matrix, wächst in Blöcken) und <cache_file>.json
+    (dim, Embedder Signatur, DOIs + Content Digests in Row-Reihenfolge).
+    Eine Row gilt nur für den Digest, mit dem sie geschrieben wurde; neuer
+    Inhalt überschreibt die Row der DOI. Thread-safe; prozessübergreifend
+    serialisiert ein File Lock (<cache_file>.lock) Laden und add(), add()
+    liest den Index unter dem Lock neu ein - neue DOIs bekommen Rows hinter
+    denen anderer Prozesse, eine Row gehört nie zwei DOIs. Ein Wechsel der
+    Signatur verwirft den Cache.
+    """
+
+    GROWTH_ROWS = 4096
+
+    def __init__(self, cache_file: Path, dim: int, signature: str):
+        """
+        Args:
+            cache_file: Matrix file (index: same path + ".json")
+            dim: Vector dimension
+            signature: Embedder signature (vector space identity)
+        """
+        _require_numpy()
+        self.cache_file = Path(cache_file)
+        self.index_file = self.cache_file.with_name(self.cache_file.name + ".json")
+        self.lock_file = self.cache_file.with_name(self.cache_file.name + ".lock")
+        self.dim = dim
+        self.signature = signature
+        self._lock = threading.Lock()
+
+        self._rows: Dict[str, int] = {}
+        self._digests: List[str] = []  # per row
+        self._matrix = None
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock across processes sharing cache_file"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_file, "a+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read_index(self) -> Optional[Tuple[Dict[str, int], List[str]]]:
+        """(DOI → row, digests) from disk, None if missing/unreadable/other embedder"""
+        if not (self.index_file.exists() and self.cache_file.exists()):
+            return None
+        try:
+            index = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Embedding cache unreadable, starting fresh: {e}")
+            return None
+
+        dois, digests = index.get("dois", []), index.get("digests")
+        if (index.get("dim") != self.dim or index.get("signature") != self.signature
+                or digests is None or len(digests) != len(dois)):
+            logger.info("Embedding cache built for a different embedder, starting fresh")
+            return None
+        return {doi: row for row, doi in enumerate(dois)}, list(digests)
+
+    def _load(self) -> None:
+        with self._file_lock():
+            index = self._read_index()
+            if index is None:
+                self._reset()
+                return
+            self._rows, self._digests = index
+            self._open(max(self.cache_file.stat().st_size // (4 * self.dim), len(self._rows)))
+            logger.info(f"Embedding cache loaded: {len(self._rows)} vectors from {self.cache_file}")
+
+    def _reset(self) -> None:
+        """Empty cache (call with the file lock held)"""
+        self._matrix = None
+        self._rows = {}
+        self._digests = []
+        with open(self.cache_file, "wb"):
+            pass
+        self._open(0)
+
+    def _open(self, capacity: int) -> None:
+        """(Re)map the matrix file with room for capacity rows"""
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+        capacity = max(capacity, 1)
+        if self.cache_file.stat().st_size < capacity * self.dim * 4:
+            with open(self.cache_file, "r+b") as f:
+                f.truncate(capacity * self.dim * 4)
+        self._matrix = np.memmap(self.cache_file, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def rows(self, dois: Sequence[str], digests: Sequence[str]) -> List[Optional[int]]:
+        """Row per DOI (None = not cached or cached for other content)"""
+        with self._lock:
+            rows = [self._rows.get(doi) for doi in dois]
+            return [
+                row if row is not None and self._digests[row] == digest else None
+                for row, digest in zip(rows, digests)
+            ]
+
+    def vectors(self, rows: Sequence[int]) -> "np.ndarray":
+        """Copy of the given rows"""
+        with self._lock:
+            return np.asarray(self._matrix[np.asarray(rows, dtype=np.intp)])
+
+    def add(self, dois: Sequence[str], digests: Sequence[str], vectors: "np.ndarray") -> List[int]:
+        """Store vectors with their content digests (already cached DOIs are overwritten), returns their rows"""
+        with self._lock, self._file_lock():
+            # Rows other processes added since our last read
+            index = self._read_index()
+            if index is None:
+                self._reset()
+            else:
+                self._rows, self._digests = index
+
+            rows = []
+            for doi, digest in zip(dois, digests):
+                if doi not in self._rows:
+                    self._rows[doi] = len(self._rows)
+                    self._digests.append(digest)
+                else:
+                    self._digests[self._rows[doi]] = digest
+                rows.append(self._rows[doi])
+
+            if len(self._rows) > self._matrix.shape[0]:
+                self._open(len(self._rows) + self.GROWTH_ROWS)
+
+            self._matrix[np.asarray(rows, dtype=np.intp)] = vectors
+            self._matrix.flush()
+            self._write_index()
+            return rows
+
+    def _write_index(self) -> None:
+        """Atomic index update (matrix rows are written first)"""
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        tmp_file.write_text(json.dumps({
+            "dim": self.dim,
+            "signature": self.signature,
+            "dois": list(self._rows),
+            "digests": self._digests
+        }), encoding="utf-8")
+        os.replace(tmp_file, self.index_file)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._matrix is not None:
+                self._matrix.flush()
+                self._matrix = None
+
+
+# ============================================
+# Embedding Scorer
+# ============================================
+
+class EmbeddingScorer:
+    """
+    Cosine relevance between query and paper embeddings
+
+    Drop-in relevance_scores Provider (gleiche Schnittstelle wie BM25Scorer).
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[HashingEmbedder] = None,
+        cache_file: Optional[Path] = None,
+        use_cache: bool = True,
+        title_weight: float = 0.6,
+        abstract_weight: float = 0.4
+    ):
+        """
+        Initialize Embedding Scorer
+
+        Args:
+            embedder: Embedder (default: HashingEmbedder(dim=512))
+            cache_file: Vector cache (default: ~/.cache/academic_agent/embeddings.f32)
+            use_cache: Persist vectors per DOI
+            title_weight: Weight of the title vector in the paper vector
+            abstract_weight: Weight of the abstract vector in the paper vector
+        """
+        self.embedder = embedder or HashingEmbedder()
+        self.title_weight = title_weight
+        self.abstract_weight = abstract_weight
+
+        self.cache: Optional[EmbeddingCache] = None
+        if use_cache:
+            self.cache = EmbeddingCache(
+                cache_file or Path.home() / ".cache" / "academic_agent" / "embeddings.f32",
+                dim=self.embedder.dim,
+                signature=self.embedder.signature
+            )
+
+        self.cache_hits = 0
+        self.embedded = 0
+
+    def embed_papers(self, papers: Sequence[Paper]) -> "np.ndarray":
+        """Paper vectors (weighted title + abstract, L2-normalized), no cache"""
+        titles = self.embedder.embed([p.title for p in papers])
+        abstracts = self.embedder.embed([p.abstract for p in papers])
+        self.embedded += len(papers)
+        return _normalize_rows(titles * self.title_weight + abstracts * self.abstract_weight)
+
+    def _content_digest(self, paper: Paper) -> str:
+        """Digest of everything the paper vector depends on (title, abstract, weights)"""
+        content = f"{self.title_weight}\0{self.abstract_weight}\0{paper.title or ''}\0{paper.abstract or ''}"
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+
+    def paper_vectors(self, papers: Sequence[Paper]) -> "np.ndarray":
+        """
+        Paper vectors, cached per DOI + content digest
+
+        Papers without DOI are embedded every time; a DOI whose title or
+        abstract changed (e.g. hydrated after a metadata-only search) is
+        embedded again and its row overwritten.
+        """
+        if self.cache is None:
+            return self.embed_papers(papers)
+
+        dois = [normalize_doi(p.doi) for p in papers]
+        digests = [self._content_digest(p) for p in papers]
+        rows = self.cache.rows(dois, digests)
+        missing = [i for i, row in enumerate(rows) if row is None]
+        self.cache_hits += len(papers) - len(missing)
+
+        if not missing:
+            return self.cache.vectors(rows)
+
+        vectors = np.empty((len(papers), self.embedder.dim), dtype=np.float32)
+        new_vectors = self.embed_papers([papers[i] for i in missing])
+        vectors[missing] = new_vectors
+
+        cacheable = [j for j, i in enumerate(missing) if dois[i]]
+        if cacheable:
+            # First occurrence wins for duplicate DOIs within one batch
+            first = {dois[missing[j]]: j for j in reversed(cacheable)}
+            self.cache.add(
+                list(first), [digests[missing[j]] for j in first.values()], new_vectors[list(first.values())]
+            )
+
+        cached = [i for i, row in enumerate(rows) if row is not None]
+        if cached:
+            vectors[cached] = self.cache.vectors([rows[i] for i in cached])
+        return vectors
+
+    def score(self, papers: Sequence[Paper], query: str) -> List[float]:
+        """
+        Relevance (0-1) per paper: cosine similarity clipped at 0
+
+        Empty query: neutral 0.5 for every paper.
+        """
+        query_vector = self.embedder.embed([query])[0]
+        if not query_vector.any():
+            return [0.5] * len(papers)
+
+        similarity = self.paper_vectors(papers) @ query_vector
+        return np.clip(similarity, 0.0, 1.0).astype(np.float64).tolist()
+
+    def score_papers(self, papers: List[Paper], query: str) -> Dict[str, float]:
+        """
+        Returns:
+            Dict DOI → relevance (papers without DOI are skipped),
+            usable as FiveDScorer relevance_scores
+        """
+        scores = self.score(papers, query)
+        logger.debug(f"Embedding scored {len(papers)} papers for '{query}' "
+                     f"({self.cache_hits} cache hits, {self.embedded} embedded so far)")
+        return {paper.doi: value for paper, value in zip(papers, scores) if paper.doi}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "cache_hits": self.cache_hits,
+            "embedded": self.embedded,
+            "cached_vectors": len(self.cache) if self.cache else 0
+        }
+
+    def close(self) -> None:
+        if self.cache:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# ============================================
+# Factory
+# ============================================
+
+def create_embedding_scorer_from_config(embedding_config) -> Optional[EmbeddingScorer]:
+    """
+    Create EmbeddingScorer from EmbeddingRelevanceConfig
+
+    Args:
+        embedding_config: EmbeddingRelevanceConfig (api_config.embedding_relevance)
+
+    Returns:
+        EmbeddingScorer or None if disabled (or numpy missing)
+    """
+    if not embedding_config or not embedding_config.enabled:
+        return None
+    if np is None:
+        logger.warning("Embedding relevance enabled but numpy is not installed, using BM25")
+        return None
+
+    cache_file = Path(embedding_config.cache_file).expanduser() if embedding_config.cache_file else None
+    return EmbeddingScorer(
+        embedder=HashingEmbedder(dim=embedding_config.dim),
+        cache_file=cache_file,
+        use_cache=embedding_config.use_cache
+    )
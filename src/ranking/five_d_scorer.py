@@ -13,6 +13,8 @@ Features:
 - Citation-Count Integration
 - Research Mode Integration
 - Normalized scores (0-1)
+- Vectorized Scoring (NumPy, optional): Spalten für Year/Citations/Venue/Relevanz,
+  Top-N via argpartition für 10k-100k Kandidaten (Corpus/Snapshot)
 
 Usage:
     from src.ranking.five_d_scorer import FiveDScorer
@@ -21,12 +23,19 @@ Usage:
     scored_papers = scorer.score(papers, query="DevOps Governance")
 """
 
-from typing import List, Dict, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 import logging
 import math
+from operator import attrgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from src.search.crossref_client import Paper
+from src.ranking.bm25_scorer import tokenize
 
 # Setup Logging
 logger = logging.getLogger(__name__)
@@ -42,6 +51,15 @@ class FiveDScorer:
     
     Scores papers on 5 dimensions with configurable weights
     """
+
+    # Ab dieser Kandidatenzahl wird spaltenweise (NumPy) gescored
+    VECTORIZE_MIN_PAPERS = 256
+
+    # High-reputation venues (heuristic)
+    HIGH_REP_VENUE_KEYWORDS = (
+        "ieee", "acm", "springer", "nature", "science",
+        "transactions", "journal", "conference", "symposium"
+    )
     
     def __init__(
         self,
@@ -85,7 +103,8 @@ class FiveDScorer:
         self,
         papers: List[Paper],
         query: str,
-        relevance_scores: Optional[Dict[str, float]] = None
+        relevance_scores: Optional[Dict[str, float]] = None,
+        top_n: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Score papers using 5D method
@@ -94,14 +113,23 @@ class FiveDScorer:
             papers: List of papers to score
             query: Research query (for relevance scoring)
             relevance_scores: Optional pre-computed relevance scores (DOI -> score)
+            top_n: Only return the N best papers (default: all)
         
         Returns:
             List of dicts with paper + scores
         """
-        if not papers:
+        if not papers or top_n == 0:
             return []
         
         logger.info(f"Scoring {len(papers)} papers...")
+
+        if np is not None and len(papers) >= self.VECTORIZE_MIN_PAPERS:
+            scored_papers = self._score_vectorized(papers, query, relevance_scores, top_n)
+            if self.apply_portfolio_balance:
+                scored_papers = self._apply_portfolio_balance(scored_papers)
+            logger.info(f"Scored {len(papers)} papers vectorized "
+                        f"(top score: {scored_papers[0]['scores']['total']:.3f})")
+            return scored_papers
         
         scored_papers = []
         
@@ -133,6 +161,8 @@ class FiveDScorer:
         
         # Sort by total score (descending)
         scored_papers.sort(key=lambda x: x["scores"]["total"], reverse=True)
+        if top_n is not None:
+            scored_papers = scored_papers[:top_n]
         
         # Apply portfolio balance (optional)
         if self.apply_portfolio_balance:
@@ -151,31 +181,28 @@ class FiveDScorer:
         """
         Score relevance (0-1)
         
-        Uses pre-computed LLM scores if available, else keyword matching
+        Uses pre-computed scores (LLM/BM25) if available, else keyword matching
+        (whole words - "ai" does not match "maintain")
         """
         # Use pre-computed if available
         if precomputed and paper.doi in precomputed:
             return precomputed[paper.doi]
         
         # Fallback: Keyword matching
-        query_lower = query.lower().strip()
-        if not query_lower:
+        query_terms = set(tokenize(query))
+        if not query_terms:
             # No query provided: return neutral score (not 0.0)
             return 0.5
 
-        query_terms = set(query_lower.split())
-
         # Check title
-        title_lower = (paper.title or "").lower()
-        title_matches = sum(1 for term in query_terms if term in title_lower)
-        title_score = min(title_matches / len(query_terms), 1.0) if query_terms else 0.0
+        title_matches = len(query_terms.intersection(tokenize(paper.title)))
+        title_score = min(title_matches / len(query_terms), 1.0)
 
         # Check abstract (if available)
         abstract_score = 0.0
         if paper.abstract:
-            abstract_lower = paper.abstract.lower()
-            abstract_matches = sum(1 for term in query_terms if term in abstract_lower)
-            abstract_score = min(abstract_matches / len(query_terms), 1.0) if query_terms else 0.0
+            abstract_matches = len(query_terms.intersection(tokenize(paper.abstract)))
+            abstract_score = min(abstract_matches / len(query_terms), 1.0)
 
         # Weighted: Title 0.7, Abstract 0.3
         relevance = title_score * 0.7 + abstract_score * 0.3
@@ -188,11 +215,15 @@ class FiveDScorer:
         
         Uses exponential decay: newer papers score higher
         """
-        if not paper.year:
+        return self._year_recency(paper.year)
+
+    def _year_recency(self, year: Optional[int]) -> float:
+        """Recency of a publication year (shared by per-paper and vectorized scoring)"""
+        if not year:
             return 0.5  # Unknown year: neutral score
         
         # Years ago
-        years_ago = self.max_year - paper.year
+        years_ago = self.max_year - year
         
         # Exponential decay (half-life: 5 years)
         recency = math.exp(-years_ago / 5.0)
@@ -205,7 +236,11 @@ class FiveDScorer:
         
         Based on citations (log-scaled)
         """
-        citations = paper.citations or 0
+        return self._citation_quality(paper.citations)
+
+    def _citation_quality(self, citations: Optional[int]) -> float:
+        """Quality of a citation count (shared by per-paper and vectorized scoring)"""
+        citations = citations or 0
         
         if citations == 0:
             return 0.1  # Minimum score for uncited papers
@@ -222,21 +257,108 @@ class FiveDScorer:
         Based on venue (journal/conference reputation)
         For now: Simple heuristic based on venue name
         """
-        if not paper.venue:
+        return self._venue_authority(paper.venue)
+
+    def _venue_authority(self, venue: Optional[str]) -> float:
+        """Authority of a venue name (shared by per-paper and vectorized scoring)"""
+        if not venue:
             return 0.5  # Unknown venue: neutral score
         
-        venue_lower = paper.venue.lower()
-        
-        # High-reputation venues (heuristic)
-        high_rep_keywords = [
-            "ieee", "acm", "springer", "nature", "science",
-            "transactions", "journal", "conference", "symposium"
-        ]
+        venue_lower = venue.lower()
         
-        matches = sum(1 for keyword in high_rep_keywords if keyword in venue_lower)
+        matches = sum(1 for keyword in self.HIGH_REP_VENUE_KEYWORDS if keyword in venue_lower)
         authority = min(matches / 3.0, 1.0)  # Saturate at 3 matches
         
         return max(authority, 0.3)  # Minimum 0.3 for any venue
+
+    # ============================================
+    # Vectorized Scoring (NumPy)
+    # ============================================
+
+    def _score_vectorized(
+        self,
+        papers: List[Paper],
+        query: str,
+        precomputed: Optional[Dict[str, float]],
+        top_n: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Columnar scoring - same formulas and ordering as the per-paper loop
+
+        Dicts are only built for the returned (top-N) papers.
+        """
+        relevance = self._relevance_column(papers, query, precomputed)
+
+        # Recency, quality, authority: scalar formulas once per distinct year,
+        # citation count and venue (math.exp/log - bit-identical to the loop,
+        # np.exp/np.log may differ in the last ulp and flip near-ties)
+        recency = self._distinct_column(list(map(attrgetter("year"), papers)), self._year_recency)
+        quality = self._distinct_column(list(map(attrgetter("citations"), papers)), self._citation_quality)
+        authority = self._distinct_column(list(map(attrgetter("venue"), papers)), self._venue_authority)
+
+        total = (
+            relevance * self.relevance_weight +
+            recency * self.recency_weight +
+            quality * self.quality_weight +
+            authority * self.authority_weight
+        )
+
+        order = self._top_indices(total, top_n)
+
+        return [
+            {
+                "paper": papers[i],
+                "scores": {
+                    "relevance": float(relevance[i]),
+                    "recency": float(recency[i]),
+                    "quality": float(quality[i]),
+                    "authority": float(authority[i]),
+                    "total": float(total[i])
+                }
+            }
+            for i in order
+        ]
+
+    @staticmethod
+    def _distinct_column(values: List[Any], score: Callable[[Any], float]):
+        """score(value) once per distinct value, broadcast to one float per paper"""
+        index = {value: i for i, value in enumerate(dict.fromkeys(values))}
+        column = np.array([score(value) for value in index], dtype=np.float64)
+        return column[np.array([index[value] for value in values], dtype=np.intp)]
+
+    def _relevance_column(
+        self,
+        papers: List[Paper],
+        query: str,
+        precomputed: Optional[Dict[str, float]]
+    ) -> "np.ndarray":
+        """Relevance per paper (pre-computed scores, else keyword fallback)"""
+        precomputed = precomputed or {}
+        relevance = np.array([precomputed.get(doi) for doi in map(attrgetter("doi"), papers)], dtype=np.float64)
+
+        for i in np.flatnonzero(np.isnan(relevance)):
+            relevance[i] = self._score_relevance(papers[i], query, None)
+        return relevance
+
+    @staticmethod
+    def _top_indices(total: "np.ndarray", top_n: Optional[int]) -> "np.ndarray":
+        """
+        Indices by descending total, ties in input order (like list.sort)
+
+        Top-N: argpartition selects the N best in O(n), only those are sorted.
+        """
+        n = len(total)
+        if top_n is None or top_n >= n:
+            return np.argsort(-total, kind="stable")
+        if top_n <= 0:
+            return np.array([], dtype=np.intp)
+
+        # Threshold = N-th best total; ties at the threshold keep input order
+        threshold = total[np.argpartition(-total, top_n - 1)[top_n - 1]]
+        above = np.flatnonzero(total > threshold)
+        at = np.flatnonzero(total == threshold)[:top_n - len(above)]
+        selected = np.concatenate([above, at])
+        return selected[np.lexsort((selected, -total[selected]))]
     
     def _apply_portfolio_balance(self, scored_papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
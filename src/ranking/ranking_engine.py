@@ -7,7 +7,13 @@ Features:
 - Top-N Selection
 - Research Mode Integration
 - Batch Processing
-- Fallback zu Keyword-Scoring
+- BM25 Relevanz als Default (ohne LLM Scores bzw. für Papers ohne LLM Score)
+- Optional: CPU Embedding Relevanz (EmbeddingScorer, Vektor-Cache pro DOI)
+- Optional: Cascade - günstiger Scorer rankt alle Kandidaten, nur das unsichere
+  Band (z.B. Rang 10-80) geht an den LLM Scorer
+- Optional: Persistenter LLM Score Cache (Query, DOI, Model, Prompt Version) -
+  nur Cache Misses gehen an das LLM
+- Optional: Citation Enrichment vor dem Scoring (fehlende Counts, z.B. DBIS Papers)
 
 Usage:
     from src.ranking.ranking_engine import RankingEngine
@@ -16,11 +22,15 @@ Usage:
     ranked_papers = engine.rank(papers, query="DevOps Governance", top_n=15)
 """
 
-from typing import List, Dict, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 
 from src.search.crossref_client import Paper
 from src.ranking.five_d_scorer import FiveDScorer
+from src.ranking.bm25_scorer import BM25Scorer
+from src.ranking.citation_enricher import CitationEnricher, create_citation_enricher_from_config
+from src.ranking.embedding_scorer import create_embedding_scorer_from_config
+from src.ranking.relevance_cache import RelevanceScoreCache, create_relevance_cache_from_config
 # Note: LLM relevance scoring is now done by llm_relevance_scorer Agent (v2.0)
 # This module only handles score merging and orchestration
 
@@ -41,18 +51,47 @@ class RankingEngine:
     
     def __init__(
         self,
-        mode: str = "standard"
+        mode: str = "standard",
+        citation_enricher: Optional[CitationEnricher] = None,
+        relevance_scorer: Optional[Any] = None,
+        lexical_relevance: bool = True,
+        llm_scorer: Optional[Callable[[str, List[Paper]], Dict[str, float]]] = None,
+        cascade: bool = False,
+        cascade_band: Tuple[int, int] = (10, 80),
+        relevance_cache: Optional[RelevanceScoreCache] = None
     ):
         """
         Initialize Ranking Engine
 
         Args:
             mode: Research mode (quick/standard/deep) for weight configuration
+            citation_enricher: Optional CitationEnricher - fills missing citation
+                               counts before scoring (quality dimension)
+            relevance_scorer: Relevance provider with score_papers(papers, query) → {doi: score}
+                              (default: BM25Scorer(), e.g. EmbeddingScorer())
+            lexical_relevance: False = keyword fallback of FiveDScorer only
+            llm_scorer: LLM relevance callable (query, papers) → {doi: score},
+                        e.g. AgentFactory().score_papers
+            cascade: Only send the uncertain band of the cheap ranking to llm_scorer
+            cascade_band: Rank range [start, end) of the cheap ranking sent to the LLM;
+                          ranks above stay in place, ranks below keep the cheap order
+            relevance_cache: Optional persistent LLM score cache - stores given and
+                             fresh LLM scores, only misses are sent to llm_scorer
 
         Note: In v2.0, LLM relevance scoring is handled by llm_relevance_scorer Agent.
         This module only does 5D scoring and score merging.
         """
         self.mode = mode
+        self.citation_enricher = citation_enricher
+        self.relevance_scorer = relevance_scorer or (BM25Scorer() if lexical_relevance else None)
+        self.llm_scorer = llm_scorer
+        self.cascade = cascade
+        self.cascade_band = cascade_band
+        self.cascade_stats: Dict[str, int] = {}
+        self.relevance_cache = relevance_cache
+
+        if cascade and llm_scorer is None:
+            logger.warning("Cascade ranking enabled without llm_scorer, using cheap scores only")
 
         # Initialize 5D scorer
         self.five_d_scorer = FiveDScorer()
@@ -85,16 +124,8 @@ class RankingEngine:
 
         logger.info(f"Ranking {len(papers)} papers (mode: {self.mode})...")
 
-        # Step 1: Get scoring weights
-        weights = self._get_weights(self.mode)
-
-        # Step 2: 5D-Scoring (merges LLM scores if provided)
-        self.five_d_scorer = FiveDScorer(**weights)
-        scored_papers = self.five_d_scorer.score(
-            papers,
-            query,
-            relevance_scores=llm_scores
-        )
+        # Step 1+2: Weights + 5D-Scoring (merges LLM scores if provided)
+        scored_papers = self._score(papers, query, llm_scores, top_n)
 
         # Step 3: Extract ranked papers
         ranked_papers = [item["paper"] for item in scored_papers]
@@ -131,23 +162,153 @@ class RankingEngine:
 
         logger.info(f"Ranking {len(papers)} papers with scores...")
 
-        # Get weights
+        # 5D-Scoring
+        scored_papers = self._score(papers, query, llm_scores, top_n)
+
+        # Top-N
+        if top_n:
+            scored_papers = scored_papers[:top_n]
+
+        return scored_papers
+    
+    def _score(
+        self,
+        papers: List[Paper],
+        query: str,
+        llm_scores: Optional[Dict[str, float]],
+        top_n: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """5D-Scoring with the mode's weights (+ cascade re-ranking if enabled)"""
         weights = self._get_weights(self.mode)
+        self._enrich_citations(papers)
 
-        # 5D-Scoring
         self.five_d_scorer = FiveDScorer(**weights)
+        llm_scores = self._cached_llm_scores(papers, query, llm_scores)
+
+        if self.llm_scorer and not self.cascade:
+            missing = [paper for paper in papers if paper.doi not in llm_scores]
+            if missing:
+                llm_scores = {**llm_scores, **self._score_with_llm(query, missing)}
+
+        relevance = self._relevance_scores(papers, query, llm_scores)
+
+        if not (self.cascade and self.llm_scorer):
+            return self.five_d_scorer.score(papers, query, relevance_scores=relevance, top_n=top_n or None)
+
+        # Cascade: the band must be complete even if fewer papers are requested
+        band_end = self.cascade_band[1]
         scored_papers = self.five_d_scorer.score(
             papers,
             query,
-            relevance_scores=llm_scores
+            relevance_scores=relevance,
+            top_n=max(top_n, band_end) if top_n else None
         )
+        return self._rerank_band(scored_papers, query, relevance, llm_scores)
 
-        # Top-N
-        if top_n:
-            scored_papers = scored_papers[:top_n]
+    def _rerank_band(
+        self,
+        scored_papers: List[Dict[str, Any]],
+        query: str,
+        relevance: Optional[Dict[str, float]],
+        llm_scores: Optional[Dict[str, float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        LLM-score the uncertain band of the cheap ranking and re-rank it
+
+        Papers with a given LLM score are not sent again. If the LLM scorer
+        fails, the cheap ranking is kept.
+        """
+        start, end = self.cascade_band
+        band = scored_papers[start:end]
+        to_score = [item["paper"] for item in band if not (llm_scores and item["paper"].doi in llm_scores)]
+
+        self.cascade_stats = {"candidates": len(scored_papers), "band": len(band), "sent_to_llm": len(to_score)}
+        if not to_score:
+            return scored_papers
+
+        band_scores = self._score_with_llm(query, to_score)
+        if not band_scores:
+            return scored_papers
+
+        logger.info(f"Cascade: {len(to_score)} of {len(scored_papers)} papers scored by LLM "
+                    f"(ranks {start + 1}-{start + len(band)})")
+
+        rescored = self.five_d_scorer.score(
+            [item["paper"] for item in band],
+            query,
+            relevance_scores={**(relevance or {}), **band_scores}
+        )
+        return scored_papers[:start] + rescored + scored_papers[end:]
+
+    def _cached_llm_scores(
+        self,
+        papers: List[Paper],
+        query: str,
+        llm_scores: Optional[Dict[str, float]]
+    ) -> Dict[str, float]:
+        """Store given LLM scores, add cached ones for the remaining papers"""
+        llm_scores = dict(llm_scores or {})
+        if not self.relevance_cache:
+            return llm_scores
+
+        try:
+            self.relevance_cache.set_many(query, llm_scores)
+            cached = self.relevance_cache.get_many(
+                query, [paper.doi for paper in papers if paper.doi not in llm_scores]
+            )
+        except Exception as e:
+            logger.warning(f"Relevance cache unavailable: {e}")
+            return llm_scores
+
+        if cached:
+            logger.info(f"Relevance cache: {len(cached)} of {len(papers)} papers already LLM-scored")
+        return {**cached, **llm_scores}
+
+    def _score_with_llm(self, query: str, papers: List[Paper]) -> Dict[str, float]:
+        """
+        Ask llm_scorer for papers and cache the result ({} on failure)
+
+        llm_scorer returns LLM scores only (AgentFactory.score_papers drops
+        its BM25 fallback), papers without a score keep the cheap relevance.
+        """
+        try:
+            scores = self.llm_scorer(query, papers) or {}
+        except Exception as e:
+            logger.warning(f"LLM relevance scoring failed, keeping cheap scores: {e}")
+            return {}
+
+        if self.relevance_cache and scores:
+            try:
+                self.relevance_cache.set_many(query, scores)
+            except Exception as e:
+                logger.warning(f"Could not store LLM scores in relevance cache: {e}")
+        return scores
+
+    def _relevance_scores(
+        self,
+        papers: List[Paper],
+        query: str,
+        llm_scores: Optional[Dict[str, float]]
+    ) -> Optional[Dict[str, float]]:
+        """Lexical/embedding relevance for all papers, LLM scores take precedence"""
+        if not self.relevance_scorer:
+            return llm_scores
+        if llm_scores and all(paper.doi in llm_scores for paper in papers):
+            return llm_scores
+
+        relevance = self.relevance_scorer.score_papers(papers, query)
+        relevance.update(llm_scores or {})
+        return relevance
+
+    def _enrich_citations(self, papers: List[Paper]) -> None:
+        """Fill missing citation counts (no-op without enricher, never fails ranking)"""
+        if not self.citation_enricher:
+            return
+        try:
+            self.citation_enricher.enrich(papers)
+        except Exception as e:
+            logger.warning(f"Citation enrichment failed, scoring with existing counts: {e}")
 
-        return scored_papers
-    
     def _get_weights(self, mode: str) -> Dict[str, float]:
         """
         Get scoring weights based on research mode
@@ -237,6 +398,16 @@ def main():
     parser.add_argument('--mode', choices=['quick', 'standard', 'deep'], default='standard',
                         help='Research mode (affects weights)')
     parser.add_argument('--top', type=int, help='Return only top N papers')
+    parser.add_argument('--relevance', choices=['bm25', 'embedding'],
+                        help='Relevance backend for papers without LLM score '
+                             '(default: embedding if api_config.embedding_relevance.enabled, else bm25)')
+    parser.add_argument('--score-cache', action='store_true',
+                        help='Store/reuse LLM relevance scores even if api_config.relevance_cache is disabled')
+    parser.add_argument('--no-score-cache', action='store_true',
+                        help='Do not store/reuse LLM relevance scores (api_config.relevance_cache)')
+    parser.add_argument('--model', default='haiku', help='Model that produced --llm-scores (score cache key)')
+    parser.add_argument('--no-enrich', action='store_true',
+                        help='Skip citation enrichment (api_config.citation_enricher) of papers without counts')
     parser.add_argument('--output', help='Output JSON file path (default: stdout)')
     parser.add_argument('--test', action='store_true', help='Run tests instead')
 
@@ -247,6 +418,8 @@ def main():
         _run_tests()
         return
 
+    citation_enricher = None
+    relevance_scorer = None
     try:
         # Load papers from JSON
         with open(args.papers, 'r') as f:
@@ -264,7 +437,7 @@ def main():
                 abstract=p.get('abstract', ''),
                 authors=p.get('authors', []),
                 year=p.get('year', 2020),
-                citations=p.get('citations', 0),
+                citations=p.get('citations'),  # None → citation enrichment
                 venue=p.get('venue', ''),
                 source_api=p.get('source_api', 'unknown'),
                 url=p.get('url', '')
@@ -283,7 +456,24 @@ def main():
                     llm_scores[paper_id] = item['relevance_score']
 
         # Initialize ranking engine
-        engine = RankingEngine(mode=args.mode)
+        from src.utils.config import load_config
+        api_config, _ = load_config()
+
+        if args.relevance != 'bm25':
+            embedding_config = api_config.embedding_relevance
+            if args.relevance == 'embedding':
+                embedding_config = embedding_config.model_copy(update={"enabled": True})
+            relevance_scorer = create_embedding_scorer_from_config(embedding_config)
+        relevance_cache = None
+        if not args.no_score_cache:
+            cache_config = api_config.relevance_cache
+            if args.score_cache:
+                cache_config = cache_config.model_copy(update={"enabled": True})
+            relevance_cache = create_relevance_cache_from_config(cache_config, model=args.model)
+        if not args.no_enrich:
+            citation_enricher = create_citation_enricher_from_config(api_config.citation_enricher)
+        engine = RankingEngine(mode=args.mode, relevance_scorer=relevance_scorer,
+                               relevance_cache=relevance_cache, citation_enricher=citation_enricher)
 
         # Rank papers with scores
         scored_papers = engine.rank_with_scores(
@@ -338,6 +528,11 @@ def main():
         else:
             print(json.dumps(error), file=sys.stderr)
         sys.exit(1)
+    finally:
+        if citation_enricher:
+            citation_enricher.close()
+        if relevance_scorer:
+            relevance_scorer.close()
 
 
 def _run_tests():
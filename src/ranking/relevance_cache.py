@@ -0,0 +1,158 @@
+"""
+LLM Relevance Score Cache für Academic Agent v2.3+
+
+Persistiert LLM Relevanz-Scores (AgentFactory.score_relevance, llm_relevance_scorer
+Agent) run-übergreifend - Reruns und Verfeinerungen derselben Query kosten
+fast keine LLM Zeit mehr.
+
+Features:
+- Key: (normalisierter Query Hash, DOI, Model, Prompt Version)
+- Query Normalisierung: Kleinschreibung, ganze Wörter, Whitespace/Satzzeichen egal
+- Neue Prompt Version bzw. anderes Model → eigener Key-Raum (keine stale Scores)
+- SQLite Cache mit TTL (utils.cache.Cache)
+- Wird von RankingEngine.rank konsultiert, nur Misses gehen an das LLM
+
+Usage:
+    from src.ranking.relevance_cache import RelevanceScoreCache
+
+    cache = RelevanceScoreCache(model="haiku")
+    engine = RankingEngine(llm_scorer=AgentFactory().score_papers, relevance_cache=cache)
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+import hashlib
+import logging
+
+from src.search.crossref_client import normalize_doi
+from src.ranking.bm25_scorer import tokenize
+from src.utils.cache import Cache
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+# Bump when the relevance scoring prompt changes (invalidates cached scores)
+RELEVANCE_PROMPT_VERSION = "v1"
+
+
+def normalize_query(query: str) -> str:
+    """
+    Example:
+        normalize_query("  DevOps-Governance? ")  # → "devops governance"
+    """
+    return " ".join(tokenize(query))
+
+
+def query_hash(query: str) -> str:
+    """Short hash of the normalized query"""
+    return hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()[:16]
+
+
+# ============================================
+# Relevance Score Cache
+# ============================================
+
+class RelevanceScoreCache:
+    """
+    Persistent LLM relevance scores per (query, DOI, model, prompt version)
+    """
+
+    def __init__(
+        self,
+        model: str = "haiku",
+        prompt_version: str = RELEVANCE_PROMPT_VERSION,
+        ttl_hours: int = 720,
+        cache_file: Optional[Path] = None,
+        max_size_mb: int = 20,
+        cache: Optional[Cache] = None
+    ):
+        """
+        Args:
+            model: Model that produced the scores (part of the key)
+            prompt_version: Scoring prompt version (part of the key)
+            ttl_hours: Cache TTL (default: 720 = 30 Tage)
+            cache_file: Cache DB Pfad (default: ~/.cache/academic_agent/relevance_cache.db)
+            max_size_mb: Max Cache Größe in MB
+            cache: Optional existierender Cache (überschreibt ttl/file/size)
+        """
+        self.model = model
+        self.prompt_version = prompt_version
+        self.cache = cache or Cache(
+            cache_file=cache_file or Path.home() / ".cache" / "academic_agent" / "relevance_cache.db",
+            ttl_hours=ttl_hours,
+            max_size_mb=max_size_mb
+        )
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    def _key(self, query_digest: str, doi: str) -> str:
+        return f"relevance:{self.model}:{self.prompt_version}:{query_digest}:{normalize_doi(doi)}"
+
+    def get_many(self, query: str, dois: Iterable[str]) -> Dict[str, float]:
+        """
+        Cached scores for query
+
+        Returns:
+            Dict DOI → score (only hits; keys as passed in)
+        """
+        digest = query_hash(query)
+        scores: Dict[str, float] = {}
+
+        for doi in dois:
+            if not doi or doi in scores:
+                continue
+            score = self.cache.get(self._key(digest, doi))
+            if score is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                scores[doi] = float(score)
+
+        return scores
+
+    def set_many(self, query: str, scores: Dict[str, float]) -> None:
+        """Store scores (DOI → score) for query"""
+        digest = query_hash(query)
+        for doi, score in scores.items():
+            if doi and score is not None:
+                self.cache.set(self._key(digest, doi), float(score))
+                self.stored += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters + underlying cache stats"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stored": self.stored,
+            **self.cache.get_stats()
+        }
+
+
+# ============================================
+# Factory
+# ============================================
+
+def create_relevance_cache_from_config(cache_config, model: str = "haiku") -> Optional[RelevanceScoreCache]:
+    """
+    Create RelevanceScoreCache from RelevanceCacheConfig
+
+    Args:
+        cache_config: RelevanceCacheConfig (api_config.relevance_cache)
+        model: Model that produces the scores (e.g. AgentFactory.preferred_model)
+
+    Returns:
+        RelevanceScoreCache or None if disabled
+    """
+    if not cache_config or not cache_config.enabled:
+        return None
+
+    cache_file = Path(cache_config.cache_file).expanduser() if cache_config.cache_file else None
+    return RelevanceScoreCache(
+        model=model,
+        prompt_version=cache_config.prompt_version or RELEVANCE_PROMPT_VERSION,
+        ttl_hours=cache_config.ttl_hours,
+        cache_file=cache_file
+    )
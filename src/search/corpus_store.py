@@ -0,0 +1,414 @@
+"""
+Lokaler Paper-Corpus für Academic Agent v2.3+
+
+Persistenter, run-übergreifender Store für alle gesehenen Papers:
+- Upsert per DOI (Metadaten werden ergänzt, nie mit leeren Werten überschrieben)
+- SQLite FTS5 Index über Title + Abstract (BM25 Ranking)
+- Schneller DOI Lookup (Primary Key)
+- Thread-safe (eine Connection pro Operation + Lock, wie utils.cache.Cache)
+
+Jeder Run schreibt seine Kandidaten in eine eigene runs/{timestamp}/session.db -
+der Corpus macht Papers aus früheren Runs wieder abfragbar. SearchEngine nutzt
+ihn als lokale Source "corpus" (Millisekunden statt API Round Trip).
+
+Usage:
+    from src.search.corpus_store import CorpusStore
+
+    corpus = CorpusStore()  # ~/.cache/academic_agent/corpus.db
+    corpus.upsert(papers)
+    hits = corpus.search("DevOps Governance", limit=20)
+    paper = corpus.get_by_doi("10.1109/MS.2022.1234567")
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional
+
+from src.search.crossref_client import Paper, normalize_doi
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# CorpusStore
+# ============================================
+
+class CorpusStore:
+    """
+    SQLite Corpus mit FTS5 Volltextindex
+
+    Schema:
+    - papers: eine Zeile pro normalisierter DOI
+    - papers_fts: FTS5 External-Content-Index über title + abstract,
+      per Trigger synchron mit papers gehalten
+    """
+
+    # Boolesche Operatoren der generierten Queries (→ FTS5 AND/OR/NOT),
+    # NEAR wird wie ein Stoppwort entfernt
+    _FTS_KEYWORDS = {"and", "or", "not", "near"}
+    _TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+    _QUERY_TOKEN_PATTERN = re.compile(r'"[^"]*"?|[()]|[^\s()"]+')
+
+    def __init__(self, db_file: Optional[Path] = None, busy_timeout: float = 60.0):
+        """
+        Args:
+            db_file: Corpus DB Pfad (default: ~/.cache/academic_agent/corpus.db)
+            busy_timeout: Sekunden, die auf Schreib-Locks anderer Prozesse gewartet wird
+        """
+        self.db_file = Path(db_file) if db_file else Path.home() / ".cache" / "academic_agent" / "corpus.db"
+        self.busy_timeout = busy_timeout
+        self.lock = Lock()
+
+        # Create corpus directory
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Initialize DB
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Neue Connection (pro Operation, thread-safe)"""
+        conn = sqlite3.connect(str(self.db_file), timeout=self.busy_timeout)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self) -> None:
+        """Initialisiert Tabellen, FTS5 Index und Sync-Trigger"""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS papers (
+                    doi TEXT PRIMARY KEY,
+                    title TEXT NOT NULL DEFAULT '',
+                    authors TEXT NOT NULL DEFAULT '[]',
+                    year INTEGER,
+                    abstract TEXT,
+                    venue TEXT,
+                    source_api TEXT,
+                    url TEXT,
+                    citations INTEGER,
+                    first_seen INTEGER NOT NULL,
+                    last_seen INTEGER NOT NULL
+                );
+
+                CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+                    title, abstract,
+                    content='papers', content_rowid='rowid',
+                    tokenize='porter unicode61'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN
+                    INSERT INTO papers_fts(rowid, title, abstract)
+                    VALUES (new.rowid, new.title, COALESCE(new.abstract, ''));
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN
+                    INSERT INTO papers_fts(papers_fts, rowid, title, abstract)
+                    VALUES ('delete', old.rowid, old.title, COALESCE(old.abstract, ''));
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE OF title, abstract ON papers BEGIN
+                    INSERT INTO papers_fts(papers_fts, rowid, title, abstract)
+                    VALUES ('delete', old.rowid, old.title, COALESCE(old.abstract, ''));
+                    INSERT INTO papers_fts(rowid, title, abstract)
+                    VALUES (new.rowid, new.title, COALESCE(new.abstract, ''));
+                END;
+            """)
+            conn.commit()
+
+    # ============================================
+    # Write
+    # ============================================
+
+    def upsert(self, papers: List[Paper]) -> int:
+        """
+        Insert or merge papers (keyed by normalized DOI)
+
+        Existing rows keep their values unless the new paper fills an empty
+        field; citations keep the max. Papers without DOI are skipped.
+
+        Args:
+            papers: Papers from any source
+
+        Returns:
+            Number of papers written
+        """
+        now = int(time.time())
+        rows = []
+        for paper in papers:
+            doi = normalize_doi(paper.doi)
+            if not doi:
+                continue
+            rows.append((
+                doi,
+                paper.title or "",
+                json.dumps(paper.authors or [], ensure_ascii=False),
+                paper.year,
+                paper.abstract or None,
+                paper.venue or None,
+                paper.source_api,
+                paper.url or None,
+                paper.citations,
+                now,
+                now,
+            ))
+
+        if not rows:
+            return 0
+
+        with self.lock:
+            with self._connect() as conn:
+                conn.executemany("""
+                    INSERT INTO papers (doi, title, authors, year, abstract, venue,
+                                        source_api, url, citations, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(doi) DO UPDATE SET
+                        title = CASE WHEN papers.title = '' THEN excluded.title ELSE papers.title END,
+                        authors = CASE WHEN papers.authors = '[]' THEN excluded.authors ELSE papers.authors END,
+                        year = COALESCE(papers.year, excluded.year),
+                        abstract = COALESCE(papers.abstract, excluded.abstract),
+                        venue = COALESCE(papers.venue, excluded.venue),
+                        url = COALESCE(papers.url, excluded.url),
+                        citations = MAX(COALESCE(papers.citations, 0), COALESCE(excluded.citations, 0)),
+                        last_seen = excluded.last_seen
+                """, rows)
+                conn.commit()
+
+        logger.debug(f"CorpusStore: upserted {len(rows)} papers")
+        return len(rows)
+
+    # ============================================
+    # Read
+    # ============================================
+
+    def search(self, query: str, limit: int = 50) -> List[Paper]:
+        """
+        Full-text search over title + abstract (BM25, title weighted higher)
+
+        Args:
+            query: Free-text or boolean query (AND/OR/NOT, parentheses and
+                   quoted phrases are honoured, adjacent terms are ANDed)
+            limit: Max results
+
+        Returns:
+            List of Paper objects (best match first)
+        """
+        match = self._build_match_query(query)
+        if not match:
+            return []
+
+        with self.lock:
+            with self._connect() as conn:
+                rows = conn.execute("""
+                    SELECT papers.* FROM papers_fts
+                    JOIN papers ON papers.rowid = papers_fts.rowid
+                    WHERE papers_fts MATCH ?
+                    ORDER BY bm25(papers_fts, 2.0, 1.0)
+                    LIMIT ?
+                """, (match, limit)).fetchall()
+
+        return [self._row_to_paper(row) for row in rows]
+
+    def get_by_doi(self, doi: str) -> Optional[Paper]:
+        """
+        Get paper by DOI
+
+        Args:
+            doi: DOI (any casing/prefix)
+
+        Returns:
+            Paper or None if not in corpus
+        """
+        return self.get_by_dois([doi]).get(normalize_doi(doi))
+
+    def get_by_dois(self, dois: List[str]) -> Dict[str, Paper]:
+        """
+        Get many papers by DOI
+
+        Args:
+            dois: List of DOIs
+
+        Returns:
+            Dict mapping normalized DOI to Paper (unknown DOIs are absent)
+        """
+        wanted = [doi for doi in dict.fromkeys(normalize_doi(d) for d in dois) if doi]
+        results: Dict[str, Paper] = {}
+
+        with self.lock:
+            with self._connect() as conn:
+                # SQLite default max variables: 999
+                for i in range(0, len(wanted), 500):
+                    batch = wanted[i:i + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT * FROM papers WHERE doi IN ({placeholders})", batch
+                    ).fetchall()
+                    for row in rows:
+                        results[row["doi"]] = self._row_to_paper(row)
+
+        return results
+
+    def count(self) -> int:
+        """Number of papers in corpus"""
+        with self.lock:
+            with self._connect() as conn:
+                return conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def _build_match_query(self, query: str) -> str:
+        """
+        Convert a user/boolean query into a safe FTS5 MATCH expression
+
+        AND/OR/NOT (any case) and parentheses keep their meaning, only terms
+        and phrases are quoted; adjacent terms are ANDed. Malformed input
+        (dangling operators, unbalanced parentheses, punctuation) is
+        repaired instead of raising an FTS5 syntax error.
+
+        Example:
+            '"DevOps" AND ("governance" OR "compliance")'
+            # → '"devops" AND ("governance" OR "compliance")'
+        """
+        tokens = self._QUERY_TOKEN_PATTERN.findall(query or "")
+        pos = 0
+
+        def peek() -> Optional[str]:
+            return tokens[pos].upper() if pos < len(tokens) else None
+
+        def parse_or() -> str:
+            nonlocal pos
+            parts = [parse_and()]
+            while peek() == "OR":
+                pos += 1
+                parts.append(parse_and())
+            return " OR ".join(part for part in parts if part)
+
+        def parse_and() -> str:
+            nonlocal pos
+            items: List[str] = []
+            while peek() not in (None, ")", "OR"):
+                if peek() == "AND":
+                    pos += 1
+                elif peek() == "NOT":
+                    pos += 1
+                    operand = parse_primary()
+                    # FTS5 NOT is binary - a leading NOT cannot be expressed
+                    if items and operand:
+                        items[-1] = f"{items[-1]} NOT {operand}"
+                else:
+                    operand = parse_primary()
+                    if operand:
+                        items.append(operand)
+            return " AND ".join(items)
+
+        def parse_primary() -> str:
+            nonlocal pos
+            if peek() is None:
+                return ""
+            token = tokens[pos]
+            pos += 1
+            if token == "(":
+                group = parse_or()
+                if peek() == ")":
+                    pos += 1
+                return f"({group})" if " " in group and not self._is_phrase(group) else group
+            if token == ")":
+                return ""
+            terms = self._TOKEN_PATTERN.findall(token.strip('"').lower())
+            if not token.startswith('"'):
+                terms = [term for term in terms if term not in self._FTS_KEYWORDS]
+            return f'"{" ".join(terms)}"' if terms else ""
+
+        parts = []
+        while pos < len(tokens):
+            part = parse_or()
+            if part:
+                parts.append(part)
+            if peek() == ")":
+                pos += 1  # stray closing parenthesis
+        if len(parts) > 1:
+            return " AND ".join(f"({part})" for part in parts)
+        return parts[0] if parts else ""
+
+    @staticmethod
+    def _is_phrase(expression: str) -> bool:
+        """True if expression is a single quoted phrase"""
+        return expression.startswith('"') and expression.count('"') == 2 and expression.endswith('"')
+
+    def _row_to_paper(self, row: sqlite3.Row) -> Paper:
+        """Convert DB row to Paper"""
+        return Paper(
+            doi=row["doi"],
+            title=row["title"],
+            authors=json.loads(row["authors"]),
+            year=row["year"],
+            abstract=row["abstract"],
+            venue=row["venue"],
+            source_api=row["source_api"] or "corpus",
+            url=row["url"],
+            citations=row["citations"]
+        )
+
+
+# ============================================
+# Factory
+# ============================================
+
+def create_corpus_store_from_config(corpus_config) -> Optional[CorpusStore]:
+    """
+    Create CorpusStore from CorpusConfig
+
+    Args:
+        corpus_config: CorpusConfig (api_config.corpus)
+
+    Returns:
+        CorpusStore or None if disabled
+    """
+    if not corpus_config or not corpus_config.enabled:
+        return None
+
+    db_file = Path(corpus_config.db_file).expanduser() if corpus_config.db_file else None
+    return CorpusStore(db_file=db_file)
+
+
+# ============================================
+# CLI Test
+# ============================================
+
+if __name__ == "__main__":
+    """
+    Test CorpusStore
+
+    Run:
+        python -m src.search.corpus_store
+    """
+    import tempfile
+
+    print("Testing CorpusStore...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = CorpusStore(db_file=Path(tmp) / "corpus.db")
+
+        corpus.upsert([
+            Paper(doi="10.1234/a", title="DevOps Governance Frameworks", authors=["A"],
+                  abstract="Governance of continuous delivery pipelines", citations=10),
+            Paper(doi="10.1234/b", title="Machine Learning Ethics", authors=["B"], citations=5),
+        ])
+        corpus.upsert([Paper(doi="10.1234/B", title="Machine Learning Ethics", authors=["B"],
+                             abstract="Ethical issues", citations=8)])
+
+        print(f"  Papers: {corpus.count()}")
+        assert corpus.count() == 2
+
+        hits = corpus.search("governance pipelines")
+        print(f"  Search 'governance pipelines': {[p.doi for p in hits]}")
+        assert [p.doi for p in hits] == ["10.1234/a"]
+
+        paper = corpus.get_by_doi("https://doi.org/10.1234/B")
+        assert paper.abstract == "Ethical issues" and paper.citations == 8
+        print("  ✅ Upsert merge + DOI lookup works")
+
+    print("\n✅ All tests passed!")
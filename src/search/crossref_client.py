@@ -8,6 +8,12 @@ Features:
 - Optional: Email für "polite" Header
 - Rate Limiting: 50 req/s
 - Retry bei 429/5xx Errors
+- Async API (asearch/aget_by_doi) mit gepooltem httpx.AsyncClient
+- Optional: Persistenter Response Cache (ResponseCache)
+- Deep Pagination via cursor=* (search_iter, streamt Papers Seite für Seite)
+- Batch DOI Lookup (get_by_dois, filter=doi:... mit bis zu 50 DOIs pro Request)
+- Metadata-only Suche (metadata_only: ohne Abstract/Autoren, Hydration via get_by_dois)
+- Kompaktes Paper Model (__slots__, interned Strings, raw_data nur auf Wunsch + komprimiert)
 - 150M+ Papers verfügbar
 
 Standard-Modus:
@@ -19,26 +25,57 @@ Enhanced-Modus:
     papers = client.search("DevOps Governance", limit=20)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Set
 from datetime import datetime
+import asyncio
 import logging
+import re
+import sys
+import zlib
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential
 
-from src.utils.rate_limiter import RateLimiter
-from src.utils.retry import RateLimitError, ServerError, raise_for_status_with_retry
+from src.utils.rate_limiter import RateLimiter, AsyncRateLimiter, PRIORITY_BULK, PRIORITY_INTERACTIVE
+from src.utils.http_pool import AsyncClientPool
+from src.utils.cache import ResponseCache
+from src.utils.fast_json import dumps, loads, response_json
+from src.utils.retry import (
+    RateLimitError, ServerError, raise_for_status_with_retry, wait_retry_after,
+    retry_if_source_healthy, get_circuit_breaker
+)
 
 # Setup Logging
 logger = logging.getLogger(__name__)
 
+# CrossRef abstracts are JATS XML fragments
+_XML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
 
 # ============================================
 # Data Models
 # ============================================
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern short repeated strings (venues, author names) - None/"" unchanged"""
+    return sys.intern(value) if isinstance(value, str) and value else value
+
+
 class Paper:
-    """Paper Data Model"""
+    """
+    Paper Data Model
+
+    Kompakt für große Result-Sets:
+    - __slots__ statt per-Instance __dict__
+    - Venue + Author-Namen werden interned (wiederholen sich über Queries)
+    - raw_data wird nur gehalten wenn übergeben (Clients: keep_raw_data=True)
+      und dann zlib-komprimiert gespeichert, Dekompression erst beim Zugriff
+    """
+
+    __slots__ = (
+        "doi", "title", "authors", "year", "abstract", "venue", "source_api",
+        "url", "citations", "source", "source_type", "_raw_compressed"
+    )
 
     def __init__(
         self,
@@ -55,14 +92,35 @@ class Paper:
     ):
         self.doi = doi
         self.title = title
-        self.authors = authors
+        self.authors = [_intern(author) for author in authors] if authors else authors
         self.year = year
         self.abstract = abstract
-        self.venue = venue
-        self.source_api = source_api
+        self.venue = _intern(venue)
+        self.source_api = _intern(source_api)
         self.url = url
         self.citations = citations
-        self.raw_data = raw_data or {}
+
+        # Set by SearchEngine (api/dbis annotation)
+        self.source: Optional[str] = None
+        self.source_type: Optional[str] = None
+
+        self._raw_compressed: Optional[bytes] = None
+        self.raw_data = raw_data
+
+    @property
+    def raw_data(self) -> Dict[str, Any]:
+        """Original API JSON (decompressed on access, {} if not retained)"""
+        if self._raw_compressed is None:
+            return {}
+        return loads(zlib.decompress(self._raw_compressed))
+
+    @raw_data.setter
+    def raw_data(self, value: Optional[Dict[str, Any]]) -> None:
+        if value:
+            payload = dumps(value)
+            self._raw_compressed = zlib.compress(payload.encode("utf-8"))
+        else:
+            self._raw_compressed = None
 
     def __repr__(self):
         return f"Paper(doi='{self.doi}', title='{self.title[:50]}...', year={self.year})"
@@ -82,6 +140,26 @@ class Paper:
         }
 
 
+def normalize_doi(doi: Optional[str]) -> str:
+    """
+    Normalize DOI for lookups and comparison
+
+    Args:
+        doi: DOI string (may include https://doi.org/ or doi: prefix)
+
+    Returns:
+        Lowercase bare DOI ("" if empty)
+    """
+    if not doi:
+        return ""
+
+    doi = doi.strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            doi = doi[len(prefix):]
+    return doi.strip()
+
+
 # ============================================
 # CrossRef API Client
 # ============================================
@@ -104,12 +182,20 @@ class CrossRefClient:
     """
 
     BASE_URL = "https://api.crossref.org"
+    SEARCH_ENDPOINT = "/works"
+    WORK_FIELDS = "DOI,title,author,published,abstract,container-title,URL,is-referenced-by-count"
+    METADATA_FIELDS = "DOI,title,published,container-title,URL,is-referenced-by-count"
+    DOI_BATCH_SIZE = 50  # DOIs per filter=doi:... request (URL length)
 
     def __init__(
         self,
         email: Optional[str] = None,
         rate_limit: float = 50.0,  # 50 req/s (Standard + Enhanced gleich)
-        timeout: int = 30
+        timeout: int = 30,
+        cache: Optional[ResponseCache] = None,
+        keep_raw_data: bool = False,
+        adaptive: bool = True,
+        max_rate: Optional[float] = None
     ):
         """
         Initialize CrossRef Client
@@ -118,12 +204,24 @@ class CrossRefClient:
             email: Optional email for polite User-Agent (empfohlen aber nicht erforderlich)
             rate_limit: Requests per second (default: 50)
             timeout: Request timeout in seconds (default: 30)
+            cache: Optional ResponseCache for search/get_by_doi responses
+            keep_raw_data: Retain the API JSON on Paper.raw_data (compressed, default: False)
+            adaptive: AIMD rate adaptation to 429/Retry-After/X-RateLimit-* (default: True)
+            max_rate: Upper rate bound in adaptive mode (default: base rate)
         """
         self.email = email
         self.timeout = timeout
+        self.cache = cache
+        self.keep_raw_data = keep_raw_data
 
         # Rate Limiter (50 req/s)
-        self.rate_limiter = RateLimiter(requests_per_second=rate_limit)
+        self.rate_limiter = RateLimiter(requests_per_second=rate_limit, adaptive=adaptive, max_rate=max_rate)
+        self.async_rate_limiter = AsyncRateLimiter(
+            requests_per_second=rate_limit, adaptive=adaptive, max_rate=max_rate
+        )
+
+        # Circuit Breaker (prozessweit pro Source geteilt, siehe SearchEngine/PDFFetcher)
+        self.circuit_breaker = get_circuit_breaker("crossref")
 
         # HTTP Client
         headers = {
@@ -132,6 +230,9 @@ class CrossRefClient:
         }
         self.client = httpx.Client(headers=headers, timeout=timeout)
 
+        # Async HTTP Client (lazy, HTTP/2 + Keep-Alive)
+        self._async_pool = AsyncClientPool(headers=headers, timeout=timeout)
+
         logger.info(f"CrossRef Client initialized (email={'set' if email else 'anonymous'})")
 
     def _build_user_agent(self) -> str:
@@ -146,15 +247,17 @@ class CrossRefClient:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=1, max=10),
-        retry=retry_if_exception_type((RateLimitError, ServerError)),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
         reraise=True
     )
     def search(
         self,
         query: str,
         limit: int = 20,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        metadata_only: bool = False
     ) -> List[Paper]:
         """
         Search CrossRef API
@@ -163,6 +266,10 @@ class CrossRefClient:
             query: Search query (supports Boolean: AND, OR, NOT)
             limit: Max results (default: 20, max: 1000)
             filters: Optional filters (e.g., {"type": "journal-article", "from-pub-date": "2020"})
+            use_cache: Read from response cache (default: True). False bypasses
+                       the lookup but still refreshes the cached entry.
+            metadata_only: Skip abstracts/authors (lightweight first phase,
+                           see SearchEngine.hydrate)
 
         Returns:
             List of Paper objects
@@ -175,77 +282,395 @@ class CrossRefClient:
                 filters={"type": "journal-article", "from-pub-date": "2020"}
             )
         """
+        # Build Request
+        params = self._build_search_params(query, limit, filters, metadata_only)
+
+        # Cache Lookup (hit skips rate limiter + network)
+        if use_cache and self.cache:
+            cached = self.cache.get(self.SEARCH_ENDPOINT, params)
+            if cached is not None:
+                logger.debug(f"CrossRef cache hit: query='{query}'")
+                return self._parse_search_response(cached, query, limit)
+
         # Rate Limiting
+        self.circuit_breaker.before_call()
         self.rate_limiter.acquire()
 
+        logger.debug(f"CrossRef search: query='{query}', limit={limit}")
+
+        try:
+            # API Call
+            response = self.client.get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+            raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+            data = response_json(response)
+            if self.cache:
+                self.cache.set(self.SEARCH_ENDPOINT, params, data)
+
+            return self._parse_search_response(data, query, limit)
+
+        except httpx.TimeoutException as e:
+            logger.error(f"CrossRef timeout: {e}")
+            self.circuit_breaker.record_failure()
+            return []
+        except Exception as e:
+            logger.error(f"CrossRef search failed: {e}")
+            raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    async def asearch(
+        self,
+        query: str,
+        limit: int = 20,
+        filters: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        metadata_only: bool = False
+    ) -> List[Paper]:
+        """
+        Search CrossRef API (async)
+
+        Same semantics as search(), but uses the pooled httpx.AsyncClient
+        and the AsyncRateLimiter.
+
+        Example:
+            papers = await client.asearch("DevOps AND governance", limit=15)
+        """
         # Build Request
+        params = self._build_search_params(query, limit, filters, metadata_only)
+
+        # Cache Lookup (hit skips rate limiter + network)
+        if use_cache and self.cache:
+            cached = await asyncio.to_thread(self.cache.get, self.SEARCH_ENDPOINT, params)
+            if cached is not None:
+                logger.debug(f"CrossRef cache hit: query='{query}'")
+                return self._parse_search_response(cached, query, limit)
+
+        # Rate Limiting
+        self.circuit_breaker.before_call()
+        await self.async_rate_limiter.acquire()
+
+        logger.debug(f"CrossRef async search: query='{query}', limit={limit}")
+
+        try:
+            # API Call
+            response = await self._async_pool.get().get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+            raise_for_status_with_retry(response, self.async_rate_limiter, self.circuit_breaker)
+
+            data = response_json(response)
+            if self.cache:
+                await asyncio.to_thread(self.cache.set, self.SEARCH_ENDPOINT, params, data)
+
+            return self._parse_search_response(data, query, limit)
+
+        except httpx.TimeoutException as e:
+            logger.error(f"CrossRef timeout: {e}")
+            self.circuit_breaker.record_failure()
+            return []
+        except Exception as e:
+            logger.error(f"CrossRef search failed: {e}")
+            raise
+
+    def search_iter(
+        self,
+        query: str,
+        max_results: int = 1000,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 1000,
+        metadata_only: bool = False
+    ) -> Iterator[Paper]:
+        """
+        Stream search results page by page (cursor-based deep paging)
+
+        Follows CrossRef's cursor=* / next-cursor protocol, so results beyond
+        the 1000-row limit of a single request are reachable. Papers are
+        yielded as each page arrives; only one page is held in memory.
+
+        Args:
+            query: Search query
+            max_results: Max papers to yield in total (default: 1000)
+            filters: Optional filters (see search())
+            page_size: Rows per request (default/max: 1000)
+            metadata_only: Skip abstracts/authors (see search())
+
+        Yields:
+            Paper objects
+
+        Example:
+            for paper in client.search_iter("DevOps governance", max_results=5000):
+                process(paper)
+        """
+        page_size = max(1, min(page_size, 1000))  # CrossRef max: 1000
+        params = self._build_search_params(query, page_size, filters, metadata_only)
+        params["cursor"] = "*"
+
+        yielded = 0
+        while yielded < max_results:
+            params["rows"] = min(page_size, max_results - yielded)
+
+            try:
+                data = self._fetch_page(params)
+            except httpx.TimeoutException as e:
+                logger.error(f"CrossRef timeout during pagination: {e}")
+                self.circuit_breaker.record_failure()
+                return
+
+            message = data.get("message", {})
+            items = message.get("items", [])
+
+            for work in items:
+                if not work.get("DOI"):
+                    continue
+                yield self._parse_work(work)
+                yielded += 1
+                if yielded >= max_results:
+                    return
+
+            next_cursor = message.get("next-cursor")
+            if not next_cursor or len(items) < params["rows"]:
+                break
+            params["cursor"] = next_cursor
+
+        logger.info(f"CrossRef pagination yielded {yielded} papers for query: '{query}'")
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    def _fetch_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one /works page (rate limited, retried on 429/5xx)"""
+        self.circuit_breaker.before_call()
+        self.rate_limiter.acquire()
+
+        response = self.client.get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+        raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+        return response_json(response)
+
+    def _build_search_params(
+        self,
+        query: str,
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+        metadata_only: bool = False
+    ) -> Dict[str, Any]:
+        """Build query parameters for /works search"""
         params = {
             "query": query,
             "rows": min(limit, 1000),  # CrossRef max: 1000
-            "select": "DOI,title,author,published,abstract,container-title,URL,is-referenced-by-count"
+            "select": self.METADATA_FIELDS if metadata_only else self.WORK_FIELDS
         }
 
         # Apply Filters
         if filters:
             params.update(filters)
 
-        logger.debug(f"CrossRef search: query='{query}', limit={limit}")
+        return params
+
+    def _parse_search_response(self, data: Dict[str, Any], query: str, limit: int) -> List[Paper]:
+        """Parse /works search response to Paper objects"""
+        items = data.get("message", {}).get("items", [])
+        papers = [self._parse_work(work) for work in items if work.get("DOI")]
+
+        logger.info(f"CrossRef found {len(papers)} papers for query: '{query}'")
+        return papers[:limit]  # Ensure limit
+
+    def get_by_doi(self, doi: str, use_cache: bool = True) -> Optional[Paper]:
+        """
+        Get single paper by DOI
+
+        Args:
+            doi: Paper DOI (e.g., "10.1109/MS.2022.1234567")
+            use_cache: Read from response cache (default: True)
+
+        Returns:
+            Paper object or None if not found
+        """
+        # Normalize DOI
+        doi = normalize_doi(doi)
+        endpoint = f"/works/{doi}"
+
+        # Cache Lookup
+        if use_cache and self.cache:
+            cached = self.cache.get(endpoint)
+            if cached is not None:
+                return self._parse_work(cached.get("message", {}))
+
+        logger.debug(f"CrossRef get_by_doi: {doi}")
 
         try:
-            # API Call
-            response = self.client.get(f"{self.BASE_URL}/works", params=params)
-            raise_for_status_with_retry(response)
+            # Rate Limiting
+            self.circuit_breaker.before_call()
+            self.rate_limiter.acquire(priority=PRIORITY_INTERACTIVE)
 
-            data = response.json()
+            response = self.client.get(f"{self.BASE_URL}{endpoint}")
 
-            # Parse Results
-            items = data.get("message", {}).get("items", [])
-            papers = [self._parse_work(work) for work in items if work.get("DOI")]
+            if response.status_code == 404:
+                logger.warning(f"DOI not found: {doi}")
+                return None
 
-            logger.info(f"CrossRef found {len(papers)} papers for query: '{query}'")
-            return papers[:limit]  # Ensure limit
+            raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+            data = response_json(response)
+            if self.cache:
+                self.cache.set(endpoint, None, data)
+
+            work = data.get("message", {})
+            return self._parse_work(work)
 
         except httpx.TimeoutException as e:
-            logger.error(f"CrossRef timeout: {e}")
-            return []
+            logger.error(f"CrossRef get_by_doi timeout for {doi}: {e}")
+            self.circuit_breaker.record_failure()
+            return None
         except Exception as e:
-            logger.error(f"CrossRef search failed: {e}")
-            raise
+            logger.error(f"CrossRef get_by_doi failed: {e}")
+            return None
 
-    def get_by_doi(self, doi: str) -> Optional[Paper]:
+    async def aget_by_doi(self, doi: str, use_cache: bool = True) -> Optional[Paper]:
         """
-        Get single paper by DOI
+        Get single paper by DOI (async)
 
         Args:
             doi: Paper DOI (e.g., "10.1109/MS.2022.1234567")
+            use_cache: Read from response cache (default: True)
 
         Returns:
             Paper object or None if not found
         """
-        # Rate Limiting
-        self.rate_limiter.acquire()
-
         # Normalize DOI
-        doi = doi.strip().lower()
+        doi = normalize_doi(doi)
+        endpoint = f"/works/{doi}"
 
-        logger.debug(f"CrossRef get_by_doi: {doi}")
+        # Cache Lookup
+        if use_cache and self.cache:
+            cached = await asyncio.to_thread(self.cache.get, endpoint)
+            if cached is not None:
+                return self._parse_work(cached.get("message", {}))
+
+        logger.debug(f"CrossRef async get_by_doi: {doi}")
 
         try:
-            response = self.client.get(f"{self.BASE_URL}/works/{doi}")
+            # Rate Limiting
+            self.circuit_breaker.before_call()
+            await self.async_rate_limiter.acquire(priority=PRIORITY_INTERACTIVE)
+
+            response = await self._async_pool.get().get(f"{self.BASE_URL}{endpoint}")
 
             if response.status_code == 404:
                 logger.warning(f"DOI not found: {doi}")
                 return None
 
-            raise_for_status_with_retry(response)
+            raise_for_status_with_retry(response, self.async_rate_limiter, self.circuit_breaker)
+
+            data = response_json(response)
+            if self.cache:
+                await asyncio.to_thread(self.cache.set, endpoint, None, data)
 
-            work = response.json().get("message", {})
+            work = data.get("message", {})
             return self._parse_work(work)
 
+        except httpx.TimeoutException as e:
+            logger.error(f"CrossRef get_by_doi timeout for {doi}: {e}")
+            self.circuit_breaker.record_failure()
+            return None
         except Exception as e:
             logger.error(f"CrossRef get_by_doi failed: {e}")
             return None
 
+    def get_by_dois(
+        self,
+        dois: List[str],
+        use_cache: bool = True,
+        failed: Optional[Set[str]] = None
+    ) -> Dict[str, Paper]:
+        """
+        Get many papers by DOI with batched requests
+
+        Uses filter=doi:a,doi:b,... with up to DOI_BATCH_SIZE DOIs per
+        request instead of one round trip per DOI. Cached DOIs are served
+        without a request; fetched works are written back to the cache
+        under the same key get_by_doi() uses.
+
+        Args:
+            dois: List of DOIs (duplicates and prefixes are normalized)
+            use_cache: Read from response cache (default: True)
+            failed: Optional set that receives the DOIs of failed batch
+                    requests (absent because of an error, not unknown)
+
+        Returns:
+            Dict mapping normalized DOI to Paper (unresolved DOIs are absent)
+
+        Example:
+            papers = client.get_by_dois(["10.1109/MS.2022.1234567", "10.1145/3456789"])
+        """
+        results: Dict[str, Paper] = {}
+        pending = []
+
+        for doi in dict.fromkeys(normalize_doi(d) for d in dois):
+            if not doi:
+                continue
+            if use_cache and self.cache:
+                cached = self.cache.get(f"/works/{doi}")
+                if cached is not None:
+                    results[doi] = self._parse_work(cached.get("message", {}))
+                    continue
+            pending.append(doi)
+
+        for i in range(0, len(pending), self.DOI_BATCH_SIZE):
+            batch = pending[i:i + self.DOI_BATCH_SIZE]
+            try:
+                works = self._fetch_doi_batch(batch)
+            except httpx.TimeoutException as e:
+                logger.error(f"CrossRef get_by_dois batch timeout: {e}")
+                self.circuit_breaker.record_failure()
+                if failed is not None:
+                    failed.update(batch)
+                continue
+            except Exception as e:
+                logger.error(f"CrossRef get_by_dois batch failed: {e}")
+                if failed is not None:
+                    failed.update(batch)
+                continue
+
+            for work in works:
+                doi = normalize_doi(work.get("DOI"))
+                if doi not in batch:
+                    continue
+                results[doi] = self._parse_work(work)
+                if self.cache:
+                    self.cache.set(f"/works/{doi}", None, {"message": work})
+
+        logger.info(f"CrossRef get_by_dois: {len(results)} papers resolved "
+                    f"({len(pending)} DOIs fetched)")
+        return results
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    def _fetch_doi_batch(self, dois: List[str]) -> List[Dict[str, Any]]:
+        """Fetch works for a batch of normalized DOIs (one request)"""
+        self.circuit_breaker.before_call()
+        self.rate_limiter.acquire(priority=PRIORITY_BULK)
+
+        params = {
+            "filter": ",".join(f"doi:{doi}" for doi in dois),
+            "rows": len(dois),
+            "select": self.WORK_FIELDS
+        }
+        response = self.client.get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+        raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+        return response_json(response).get("message", {}).get("items", [])
+
     def _parse_work(self, work: Dict[str, Any]) -> Paper:
         """
         Parse CrossRef work item to Paper object
@@ -305,18 +730,21 @@ class CrossRefClient:
             source_api="crossref",
             url=url,
             citations=citations,
-            raw_data=work
+            raw_data=work if self.keep_raw_data else None
         )
 
     def _strip_xml_tags(self, text: str) -> str:
         """Strip XML/HTML tags from text"""
-        import re
-        return re.sub(r'<[^>]+>', '', text)
+        return _XML_TAG_PATTERN.sub('', text)
 
     def close(self):
         """Close HTTP client"""
         self.client.close()
 
+    async def aclose(self):
+        """Close async HTTP client pool"""
+        await self._async_pool.aclose()
+
     def __enter__(self):
         """Context manager entry"""
         return self
@@ -325,6 +753,14 @@ class CrossRefClient:
         """Context manager exit"""
         self.close()
 
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
+
 
 # ============================================
 # Convenience Functions
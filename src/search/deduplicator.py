@@ -8,24 +8,168 @@ Features:
 - Title-Similarity Fallback (wenn DOI fehlt)
 - Metadaten-Merge (beste Qualität behalten)
 - Fuzzy String Matching
+- Indexierte Title-Deduplizierung (verlustfreies q-gram Filtering statt O(n²) Vergleiche)
+- Inkrementelle Deduplizierung (IncrementalDeduplicator.add/merged) für Streaming
 
 Usage:
     from src.search.deduplicator import Deduplicator
 
     deduplicator = Deduplicator()
     unique_papers = deduplicator.deduplicate(papers)
+
+    # Inkrementell (Sources einfalten sobald sie fertig sind)
+    incremental = IncrementalDeduplicator()
+    new_papers = incremental.add(crossref_papers)
+    new_papers = incremental.add(openalex_papers)
+    unique_papers = incremental.merged()
 """
 
 from typing import List, Dict, Set, Optional
 import logging
-from collections import defaultdict
+import math
+import string
+from collections import Counter, defaultdict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from fuzzywuzzy import fuzz
+from fuzzywuzzy import utils as fuzz_utils
 from src.search.crossref_client import Paper
 
 # Setup Logging
 logger = logging.getLogger(__name__)
 
+# Translation table for _normalize_title (built once)
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+# ============================================
+# Title Index (q-gram Filter)
+# ============================================
+
+class _TitleIndex:
+    """
+    Inverted q-gram index over titles for lossless candidate generation
+
+    Titel werden wie bei fuzz.token_sort_ratio verarbeitet (full_process +
+    sortierte Tokens). fuzz.ratio ist (für beide fuzzywuzzy Backends) durch
+    2 * LCS / (len_a + len_b) beschränkt; ratio >= r bedeutet also höchstens
+    k = (1 - r) * (len_a + len_b) Einfüge-/Löschoperationen. Zerlegt man die
+    Anfrage in k + 1 Stücke, bleibt mindestens ein Stück unverändert und
+    kommt wörtlich im Duplikat vor (Pigeonhole). Pro Stück wird nur das
+    seltenste q-gram abgefragt - kein ähnlicher Titel wird übersehen.
+    Zu kurze Anfragen prüfen alle Titel (exakter Fallback).
+
+    Kandidaten werden danach mit oberen Schranken für LCS gefiltert
+    (Länge, gemeinsame Zeichen; NumPy vektorisiert, optional).
+    """
+
+    MAX_Q = 3
+
+    def __init__(self):
+        self._sorted_titles: List[str] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        # Character histograms (LCS upper bound), code points bucketed mod 128
+        if np is not None:
+            self._lengths = np.zeros(64, dtype=np.int32)
+            self._char_counts = np.zeros((64, 128), dtype=np.int32)
+        else:
+            self._char_counts: List[Counter] = []
+
+    def __len__(self) -> int:
+        return len(self._sorted_titles)
+
+    @staticmethod
+    def sort_title(title: str) -> str:
+        """Process + sort tokens exactly like fuzz.token_sort_ratio"""
+        return " ".join(sorted(fuzz_utils.full_process(title, force_ascii=True).split()))
+
+    @staticmethod
+    def _histogram(sorted_title: str):
+        codepoints = np.frombuffer(sorted_title.encode("utf-32-le"), dtype=np.uint32)
+        return np.bincount(codepoints & 127, minlength=128)
+
+    def candidates(self, sorted_title: str, min_ratio: float) -> List[int]:
+        """
+        Ids of indexed titles whose fuzz.ratio with sorted_title may reach min_ratio
+
+        Args:
+            sorted_title: Title processed with sort_title()
+            min_ratio: Lower bound of the unrounded ratio (0-1)
+
+        Returns:
+            Candidate ids in insertion order (superset of all matches)
+        """
+        length = len(sorted_title)
+        pieces = length + 1
+        if min_ratio > 0:
+            max_other = math.floor(length * (2 - min_ratio) / min_ratio + 1e-9)
+            pieces = math.floor((1 - min_ratio) * (length + max_other) + 1e-9) + 1
+
+        if pieces > length:
+            ids = range(len(self._sorted_titles))
+        else:
+            ids: Set[int] = set()
+            bounds = [i * length // pieces for i in range(pieces + 1)]
+            for start, stop in zip(bounds, bounds[1:]):
+                piece = sorted_title[start:stop]
+                q = min(self.MAX_Q, len(piece))
+                grams = {piece[i:i + q] for i in range(len(piece) - q + 1)}
+                if not all(gram in self._postings for gram in grams):
+                    continue  # piece occurs in no indexed title
+                ids.update(self._postings[min(grams, key=lambda gram: len(self._postings[gram]))])
+
+        if not ids:
+            return []
+
+        # ratio <= 2 * LCS / (len_a + len_b), LCS <= min(len) and <= shared characters
+        # (bucket minima never undercount shared characters)
+        if np is not None:
+            ids = np.fromiter(ids, dtype=np.intp, count=len(ids))
+            ids.sort()
+            totals = self._lengths[ids] + length
+            ids = ids[2 * np.minimum(self._lengths[ids], length) >= min_ratio * totals]
+            shared = np.minimum(self._char_counts[ids], self._histogram(sorted_title)).sum(axis=1)
+            return ids[2 * shared >= min_ratio * (self._lengths[ids] + length)].tolist()
+
+        counts = Counter(sorted_title)
+        return [
+            title_id for title_id in sorted(ids)
+            if 2 * sum((counts & self._char_counts[title_id]).values())
+            >= min_ratio * (length + len(self._sorted_titles[title_id]))
+        ]
+
+    def sorted_title(self, title_id: int) -> str:
+        """Sorted title for id"""
+        return self._sorted_titles[title_id]
+
+    def add(self, sorted_title: str) -> int:
+        """Index sorted title, returns its id"""
+        title_id = len(self._sorted_titles)
+        self._sorted_titles.append(sorted_title)
+
+        if np is not None:
+            if title_id == len(self._lengths):
+                self._lengths = np.concatenate([self._lengths, np.zeros_like(self._lengths)])
+                self._char_counts = np.concatenate([self._char_counts, np.zeros_like(self._char_counts)])
+            self._lengths[title_id] = len(sorted_title)
+            self._char_counts[title_id] = self._histogram(sorted_title)
+        else:
+            self._char_counts.append(Counter(sorted_title))
+
+        grams = {
+            sorted_title[i:i + q]
+            for q in range(1, self.MAX_Q + 1)
+            for i in range(len(sorted_title) - q + 1)
+        }
+        for gram in grams:
+            self._postings[gram].append(title_id)
+        return title_id
+
 
 # ============================================
 # Deduplicator
@@ -100,12 +244,13 @@ class Deduplicator:
             papers: List of papers
 
         Returns:
-            Dict mapping DOI to list of papers
+            Dict mapping DOI to list of papers (papers without DOI get
+            their own group each, keyed "no-doi:<position>")
         """
         groups = defaultdict(list)
 
-        for paper in papers:
-            normalized_doi = self._normalize_doi(paper.doi)
+        for position, paper in enumerate(papers):
+            normalized_doi = self._normalize_doi(paper.doi) or f"no-doi:{position}"
             groups[normalized_doi].append(paper)
 
         return dict(groups)
@@ -196,28 +341,57 @@ class Deduplicator:
             return []
 
         unique_papers = []
-        seen_titles: List[str] = []
+        index = _TitleIndex()
 
         for paper in papers:
             # Normalize title
             normalized_title = self._normalize_title(paper.title)
 
-            # Check if similar title already seen
-            is_duplicate = False
-            for seen_title in seen_titles:
-                similarity = self._title_similarity(normalized_title, seen_title)
-                if similarity >= self.title_similarity_threshold:
-                    is_duplicate = True
-                    logger.debug(f"Title duplicate found: '{paper.title[:50]}...' "
-                               f"(similarity: {similarity:.2f})")
-                    break
-
-            if not is_duplicate:
+            # Check if similar title already seen (only index candidates are scored)
+            if self._find_title_duplicate(index, normalized_title) is None:
                 unique_papers.append(paper)
-                seen_titles.append(normalized_title)
+                self._index_title(index, normalized_title)
 
         return unique_papers
 
+    def _index_title(self, index: _TitleIndex, normalized_title: str) -> None:
+        """Add normalized title to index (empty titles never match, skip)"""
+        if normalized_title:
+            index.add(_TitleIndex.sort_title(normalized_title))
+
+    def _find_title_duplicate(self, index: _TitleIndex, normalized_title: str) -> Optional[int]:
+        """
+        Find an indexed title similar to normalized_title
+
+        Equivalent to _title_similarity() >= threshold (threshold > 0) against
+        every indexed title, first match in insertion order: the index returns
+        a superset of all matches, pruned only by upper bounds of fuzz.ratio.
+
+        Args:
+            index: Title index of already kept papers
+            normalized_title: Normalized title of the new paper
+
+        Returns:
+            Id of the first similar indexed title, None if unique
+        """
+        if not normalized_title:
+            return None  # empty titles never match (similarity 0)
+
+        sorted_title = _TitleIndex.sort_title(normalized_title)
+
+        # fuzz.ratio is rounded to int percent: unrounded ratio >= threshold - 0.005
+        min_bound = self.title_similarity_threshold - 0.005 - 1e-9
+
+        for title_id in index.candidates(sorted_title, min_bound):
+            other = index.sorted_title(title_id)
+            similarity = fuzz.ratio(sorted_title, other) / 100.0
+            if similarity >= self.title_similarity_threshold:
+                logger.debug(f"Title duplicate found: '{normalized_title[:50]}...' "
+                             f"(similarity: {similarity:.2f})")
+                return title_id
+
+        return None
+
     def _normalize_title(self, title: str) -> str:
         """
         Normalize title for comparison
@@ -235,8 +409,7 @@ class Deduplicator:
         title = title.lower()
 
         # Remove punctuation
-        import string
-        title = title.translate(str.maketrans("", "", string.punctuation))
+        title = title.translate(_PUNCTUATION_TABLE)
 
         # Remove extra whitespace
         title = " ".join(title.split())
@@ -266,6 +439,124 @@ class Deduplicator:
         return score / 100.0
 
 
+# ============================================
+# Incremental Deduplicator
+# ============================================
+
+class IncrementalDeduplicator(Deduplicator):
+    """
+    Stateful deduplicator for merge-as-you-go pipelines
+
+    Hält DOI-Map und Title-Index über mehrere add() Aufrufe, damit Sources
+    eingefaltet werden können, sobald sie fertig sind - ohne das gesamte Set
+    bei jedem Merge neu zu deduplizieren.
+
+    Semantik wie Deduplicator.deduplicate():
+    - Gleiche DOI → Metadaten-Merge (prefer_source bestimmt das Basis-Paper)
+    - Ähnlicher Titel → Duplikat, das zuerst gesehene Paper bleibt
+      (dessen DOI wird als Alias registriert)
+    - Papers ohne DOI werden nur per Titel dedupliziert
+
+    Usage:
+        incremental = IncrementalDeduplicator()
+        for source_papers in results_as_completed:
+            new_papers = incremental.add(source_papers)  # start downstream work
+        unique_papers = incremental.merged()
+    """
+
+    def __init__(
+        self,
+        title_similarity_threshold: float = 0.85,
+        prefer_source: Optional[List[str]] = None
+    ):
+        """
+        Initialize IncrementalDeduplicator
+
+        Args:
+            title_similarity_threshold: Min similarity score for title matching (0-1)
+            prefer_source: Source preference order (e.g., ["crossref", "openalex", "semantic_scholar"])
+        """
+        super().__init__(
+            title_similarity_threshold=title_similarity_threshold,
+            prefer_source=prefer_source
+        )
+        self._unique: List[Paper] = []
+        self._slot_by_doi: Dict[str, int] = {}
+        self._slot_by_title: List[int] = []  # title id → slot
+        self._index = _TitleIndex()
+
+    def __len__(self) -> int:
+        return len(self._unique)
+
+    def add(self, papers: List[Paper]) -> List[Paper]:
+        """
+        Fold papers into the deduplicated set
+
+        Args:
+            papers: New papers (e.g. results of one source)
+
+        Returns:
+            Papers that were not seen before (DOI or title) - duplicates are
+            merged into the existing entries and not returned
+        """
+        new_papers = []
+
+        for paper in papers:
+            doi = self._normalize_doi(paper.doi)
+
+            # 1. Known DOI → merge metadata
+            if doi and doi in self._slot_by_doi:
+                self._merge_into(self._slot_by_doi[doi], paper)
+                continue
+
+            # 2. Similar title → duplicate of existing paper
+            normalized_title = self._normalize_title(paper.title)
+            title_id = self._find_title_duplicate(self._index, normalized_title)
+            if title_id is not None:
+                if doi:
+                    self._slot_by_doi[doi] = self._slot_by_title[title_id]
+                continue
+
+            # 3. New unique paper
+            slot = len(self._unique)
+            self._unique.append(paper)
+            if doi:
+                self._slot_by_doi[doi] = slot
+            self._index_paper_title(slot, normalized_title)
+            new_papers.append(paper)
+
+        logger.debug(f"IncrementalDeduplicator: +{len(new_papers)} new of {len(papers)} "
+                     f"({len(self._unique)} unique total)")
+        return new_papers
+
+    def merged(self) -> List[Paper]:
+        """
+        Current deduplicated view
+
+        Returns:
+            List of unique papers (in first-seen order)
+        """
+        return list(self._unique)
+
+    def _merge_into(self, slot: int, paper: Paper) -> None:
+        """Merge paper into slot (representative may change by source preference)"""
+        existing = self._unique[slot]
+        merged = self._merge_papers([existing, paper])
+
+        if merged is not existing:
+            self._unique[slot] = merged
+            normalized_title = self._normalize_title(merged.title)
+            if normalized_title != self._normalize_title(existing.title):
+                self._index_paper_title(slot, normalized_title)
+
+    def _index_paper_title(self, slot: int, normalized_title: str) -> None:
+        """Index title of the paper in slot"""
+        before = len(self._index)
+        self._index_title(self._index, normalized_title)
+        if len(self._index) > before:
+            self._slot_by_title.append(slot)
+
+
 # ============================================
 # Convenience Functions
 # ============================================
@@ -362,4 +653,19 @@ if __name__ == "__main__":
     # Fuzzy matching might merge the first two
     print(f"  ✅ Fuzzy matching works (unique: {len(unique)})")
 
+    # Test 5: Incremental deduplication
+    print("\n5. Testing incremental deduplication...")
+    incremental = IncrementalDeduplicator()
+    new1 = incremental.add([
+        Paper(doi="10.1234/a", title="DevOps Governance", authors=["A"], source_api="openalex"),
+        Paper(doi=None, title="Paper Without DOI", authors=["B"], source_api="openalex"),
+    ])
+    new2 = incremental.add([
+        Paper(doi="10.1234/A", title="DevOps Governance", authors=["A"], source_api="crossref"),
+        Paper(doi=None, title="Another Paper Without DOI", authors=["C"], source_api="crossref"),
+    ])
+    print(f"  New: {len(new1)} + {len(new2)}, merged: {len(incremental.merged())}")
+    assert len(incremental.merged()) == 3, "Should have 3 unique papers"
+    print("  ✅ Incremental deduplication works")
+
     print("\n✅ All tests passed!")
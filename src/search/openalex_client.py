@@ -8,6 +8,12 @@ Features:
 - Optional: Email für unbegrenzte Requests (EMPFOHLEN!)
 - Rate Limiting: 1 req/s (anonym) oder 10 req/s (mit Email)
 - Citation-Counts included (für 5D-Scoring!)
+- Async API (asearch/aget_by_doi) mit gepooltem httpx.AsyncClient
+- Optional: Persistenter Response Cache (schont das 100 req/Tag Limit!)
+- Deep Pagination via cursor=* (search_iter, streamt Papers Seite für Seite)
+- Batch DOI Lookup (get_by_dois, filter=doi:a|b|c mit bis zu 50 DOIs pro Request)
+- Abstract-Rekonstruktion aus abstract_inverted_index in linearer Zeit
+- Metadata-only Suche (metadata_only: ohne abstract_inverted_index/Authorships)
 - 250M+ Works verfügbar
 
 Standard-Modus (Anonymous):
@@ -19,21 +25,70 @@ Enhanced-Modus (Empfohlen!):
     papers = client.search("DevOps Governance", limit=20)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Set
 from datetime import datetime
+import asyncio
 import logging
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
-from src.utils.rate_limiter import RateLimiter
-from src.utils.retry import RateLimitError, ServerError, raise_for_status_with_retry
-from src.search.crossref_client import Paper  # Reuse Paper model
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from src.utils.rate_limiter import RateLimiter, AsyncRateLimiter, PRIORITY_BULK, PRIORITY_INTERACTIVE
+from src.utils.http_pool import AsyncClientPool
+from src.utils.cache import ResponseCache
+from src.utils.fast_json import response_json
+from src.utils.retry import (
+    RateLimitError, ServerError, raise_for_status_with_retry, wait_retry_after,
+    retry_if_source_healthy, get_circuit_breaker
+)
+from src.search.crossref_client import Paper, normalize_doi  # Reuse Paper model
 
 # Setup Logging
 logger = logging.getLogger(__name__)
 
 
+# ============================================
+# Abstract Reconstruction
+# ============================================
+
+def rebuild_inverted_index(inverted_index: Dict[str, List[int]]) -> str:
+    """
+    Rebuild text from an OpenAlex abstract_inverted_index in linear time
+
+    Positions are dense (0..n-1), so words are placed into a slot list
+    instead of sorting all (position, word) pairs. Sparse, negative or
+    duplicate positions (malformed records) fall back to sorting.
+
+    Args:
+        inverted_index: {"word": [positions]}
+
+    Returns:
+        Words joined by single spaces in position order
+    """
+    count = 0
+    max_pos = -1
+    min_pos = 0
+    for positions in inverted_index.values():
+        count += len(positions)
+        for pos in positions:
+            if pos > max_pos:
+                max_pos = pos
+            elif pos < min_pos:
+                min_pos = pos
+
+    if min_pos >= 0 and max_pos < 2 * count + 16:
+        slots: List[Optional[str]] = [None] * (max_pos + 1)
+        for word, positions in inverted_index.items():
+            for pos in positions:
+                slots[pos] = word
+        words = [word for word in slots if word is not None]
+        if len(words) == count:  # no position was used twice
+            return " ".join(words)
+
+    pairs = sorted((pos, word) for word, positions in inverted_index.items() for pos in positions)
+    return " ".join(word for _, word in pairs)
+
+
 # ============================================
 # OpenAlex API Client
 # ============================================
@@ -56,11 +111,19 @@ class OpenAlexClient:
     """
 
     BASE_URL = "https://api.openalex.org"
+    SEARCH_ENDPOINT = "/works"
+    WORK_FIELDS = "id,doi,title,authorships,publication_year,abstract_inverted_index,primary_location,cited_by_count"
+    METADATA_FIELDS = "id,doi,title,publication_year,primary_location,cited_by_count"
+    DOI_BATCH_SIZE = 50  # OpenAlex: max 50 values per OR-filter
 
     def __init__(
         self,
         email: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        cache: Optional[ResponseCache] = None,
+        keep_raw_data: bool = False,
+        adaptive: bool = True,
+        max_rate: Optional[float] = None
     ):
         """
         Initialize OpenAlex Client
@@ -68,20 +131,35 @@ class OpenAlexClient:
         Args:
             email: Optional email for unlimited requests (EMPFOHLEN!)
             timeout: Request timeout in seconds (default: 30)
+            cache: Optional ResponseCache for search/get_by_doi responses
+            keep_raw_data: Retain the API JSON on Paper.raw_data (compressed, default: False)
+            adaptive: AIMD rate adaptation to 429/Retry-After/X-RateLimit-* (default: True)
+            max_rate: Upper rate bound in adaptive mode (default: base rate)
         """
         self.email = email
         self.timeout = timeout
+        self.cache = cache
+        self.keep_raw_data = keep_raw_data
 
         # Rate Limiter
         # Anonymous: 1 req/s + 100 daily limit
         # With Email: 10 req/s, unbegrenzt
         if email:
-            self.rate_limiter = RateLimiter(requests_per_second=10)
+            self.rate_limiter = RateLimiter(requests_per_second=10, adaptive=adaptive, max_rate=max_rate)
+            self.async_rate_limiter = AsyncRateLimiter(requests_per_second=10, adaptive=adaptive, max_rate=max_rate)
             logger.info(f"OpenAlex Client: Enhanced Mode (email set, unlimited requests)")
         else:
-            self.rate_limiter = RateLimiter(requests_per_second=1, daily_limit=100)
+            self.rate_limiter = RateLimiter(
+                requests_per_second=1, daily_limit=100, adaptive=adaptive, max_rate=max_rate
+            )
+            self.async_rate_limiter = AsyncRateLimiter(
+                requests_per_second=1, daily_limit=100, adaptive=adaptive, max_rate=max_rate
+            )
             logger.info(f"OpenAlex Client: Standard Mode (anonymous, 100 req/day)")
 
+        # Circuit Breaker (prozessweit pro Source geteilt, siehe SearchEngine/PDFFetcher)
+        self.circuit_breaker = get_circuit_breaker("openalex")
+
         # HTTP Client
         headers = {
             "User-Agent": self._build_user_agent(),
@@ -89,6 +167,9 @@ class OpenAlexClient:
         }
         self.client = httpx.Client(headers=headers, timeout=timeout)
 
+        # Async HTTP Client (lazy, HTTP/2 + Keep-Alive)
+        self._async_pool = AsyncClientPool(headers=headers, timeout=timeout)
+
     def _build_user_agent(self) -> str:
         """Build User-Agent header"""
         base = "AcademicAgentV2/1.0"
@@ -109,8 +190,8 @@ class OpenAlexClient:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=1, max=10),
-        retry=retry_if_exception_type((RateLimitError, ServerError)),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
         reraise=True
     )
     def search(
@@ -118,7 +199,9 @@ class OpenAlexClient:
         query: str,
         limit: int = 20,
         filters: Optional[Dict[str, Any]] = None,
-        field_filter: Optional[str] = None
+        field_filter: Optional[str] = None,
+        use_cache: bool = True,
+        metadata_only: bool = False
     ) -> List[Paper]:
         """
         Search OpenAlex API
@@ -130,6 +213,10 @@ class OpenAlexClient:
             field_filter: Optional OpenAlex field-of-study filter string, e.g.
                           OpenAlexClient.FIELD_FILTERS["computer_science"].
                           Reduces irrelevant papers by ~50% (I-08 fix).
+            use_cache: Read from response cache (default: True). False bypasses
+                       the lookup but still refreshes the cached entry.
+            metadata_only: Skip abstracts/authors (lightweight first phase,
+                           see SearchEngine.hydrate)
 
         Returns:
             List of Paper objects
@@ -138,14 +225,191 @@ class OpenAlexClient:
             papers = client.search("IT governance framework", limit=20,
                                    field_filter=OpenAlexClient.FIELD_FILTERS["computer_science"])
         """
+        # Build Request
+        params = self._build_search_params(query, limit, filters, field_filter, metadata_only)
+
+        # Cache Lookup (hit skips rate limiter + network)
+        if use_cache and self.cache:
+            cached = self.cache.get(self.SEARCH_ENDPOINT, params)
+            if cached is not None:
+                logger.debug(f"OpenAlex cache hit: query='{query}'")
+                return self._parse_search_response(cached, query, limit)
+
         # Rate Limiting
+        self.circuit_breaker.before_call()
         self.rate_limiter.acquire()
 
+        logger.debug(f"OpenAlex search: query='{query}', limit={limit}, filters={params['filter']}")
+
+        try:
+            # API Call
+            response = self.client.get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+            raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+            data = response_json(response)
+            if self.cache:
+                self.cache.set(self.SEARCH_ENDPOINT, params, data)
+
+            return self._parse_search_response(data, query, limit)
+
+        except httpx.TimeoutException as e:
+            logger.error(f"OpenAlex timeout: {e}")
+            self.circuit_breaker.record_failure()
+            return []
+        except Exception as e:
+            logger.error(f"OpenAlex search failed: {e}")
+            raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    async def asearch(
+        self,
+        query: str,
+        limit: int = 20,
+        filters: Optional[Dict[str, Any]] = None,
+        field_filter: Optional[str] = None,
+        use_cache: bool = True,
+        metadata_only: bool = False
+    ) -> List[Paper]:
+        """
+        Search OpenAlex API (async)
+
+        Same semantics as search(), but uses the pooled httpx.AsyncClient
+        and the AsyncRateLimiter.
+
+        Example:
+            papers = await client.asearch("IT governance framework", limit=20)
+        """
         # Build Request
+        params = self._build_search_params(query, limit, filters, field_filter, metadata_only)
+
+        # Cache Lookup (hit skips rate limiter + network)
+        if use_cache and self.cache:
+            cached = await asyncio.to_thread(self.cache.get, self.SEARCH_ENDPOINT, params)
+            if cached is not None:
+                logger.debug(f"OpenAlex cache hit: query='{query}'")
+                return self._parse_search_response(cached, query, limit)
+
+        # Rate Limiting
+        self.circuit_breaker.before_call()
+        await self.async_rate_limiter.acquire()
+
+        logger.debug(f"OpenAlex async search: query='{query}', limit={limit}, filters={params['filter']}")
+
+        try:
+            # API Call
+            response = await self._async_pool.get().get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+            raise_for_status_with_retry(response, self.async_rate_limiter, self.circuit_breaker)
+
+            data = response_json(response)
+            if self.cache:
+                await asyncio.to_thread(self.cache.set, self.SEARCH_ENDPOINT, params, data)
+
+            return self._parse_search_response(data, query, limit)
+
+        except httpx.TimeoutException as e:
+            logger.error(f"OpenAlex timeout: {e}")
+            self.circuit_breaker.record_failure()
+            return []
+        except Exception as e:
+            logger.error(f"OpenAlex search failed: {e}")
+            raise
+
+    def search_iter(
+        self,
+        query: str,
+        max_results: int = 1000,
+        filters: Optional[Dict[str, Any]] = None,
+        field_filter: Optional[str] = None,
+        page_size: int = 200,
+        metadata_only: bool = False
+    ) -> Iterator[Paper]:
+        """
+        Stream search results page by page (cursor-based deep paging)
+
+        Follows OpenAlex's cursor=* / meta.next_cursor protocol. Papers are
+        yielded as each page arrives; only one page is held in memory.
+        Note: every page counts against the anonymous daily limit.
+
+        Args:
+            query: Search query
+            max_results: Max papers to yield in total (default: 1000)
+            filters: Optional extra filters (see search())
+            field_filter: Optional field-of-study filter (see search())
+            page_size: Results per request (default/max: 200)
+            metadata_only: Skip abstracts/authors (see search())
+
+        Yields:
+            Paper objects (only papers with DOI)
+
+        Example:
+            for paper in client.search_iter("IT governance", max_results=2000):
+                process(paper)
+        """
+        page_size = max(1, min(page_size, 200))  # OpenAlex max: 200
+        params = self._build_search_params(query, page_size, filters, field_filter, metadata_only)
+        params["cursor"] = "*"
+
+        yielded = 0
+        while yielded < max_results:
+            try:
+                data = self._fetch_page(params)
+            except httpx.TimeoutException as e:
+                logger.error(f"OpenAlex timeout during pagination: {e}")
+                self.circuit_breaker.record_failure()
+                return
+
+            results = data.get("results", [])
+
+            for work in results:
+                paper = self._parse_work(work)
+                if not (paper and paper.doi):
+                    continue
+                yield paper
+                yielded += 1
+                if yielded >= max_results:
+                    return
+
+            next_cursor = (data.get("meta") or {}).get("next_cursor")
+            if not next_cursor or len(results) < params["per-page"]:
+                break
+            params["cursor"] = next_cursor
+
+        logger.info(f"OpenAlex pagination yielded {yielded} papers for query: '{query}'")
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    def _fetch_page(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one /works page (rate limited, retried on 429/5xx)"""
+        self.circuit_breaker.before_call()
+        self.rate_limiter.acquire()
+
+        response = self.client.get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+        raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+        return response_json(response)
+
+    def _build_search_params(
+        self,
+        query: str,
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+        field_filter: Optional[str] = None,
+        metadata_only: bool = False
+    ) -> Dict[str, Any]:
+        """Build query parameters for /works search"""
         params = {
             "search": query,
             "per-page": min(limit, 200),  # OpenAlex max: 200
-            "select": "id,doi,title,authorships,publication_year,abstract_inverted_index,primary_location,cited_by_count"
+            "select": self.METADATA_FIELDS if metadata_only else self.WORK_FIELDS
         }
 
         # I-08 fix: always add type:article filter to reduce books/datasets/noise
@@ -162,69 +426,212 @@ class OpenAlexClient:
             filter_parts.append(field_filter)
 
         params["filter"] = ",".join(filter_parts)
+        return params
 
-        logger.debug(f"OpenAlex search: query='{query}', limit={limit}, filters={params['filter']}")
+    def _parse_search_response(self, data: Dict[str, Any], query: str, limit: int) -> List[Paper]:
+        """Parse /works search response to Paper objects"""
+        results = data.get("results", [])
+        papers = []
+        for work in results:
+            paper = self._parse_work(work)
+            if paper and paper.doi:  # Only include if DOI exists
+                papers.append(paper)
+
+        logger.info(f"OpenAlex found {len(papers)} papers for query: '{query}'")
+        return papers[:limit]  # Ensure limit
+
+    def get_by_doi(self, doi: str, use_cache: bool = True) -> Optional[Paper]:
+        """
+        Get single paper by DOI
+
+        Args:
+            doi: Paper DOI (e.g., "10.1109/MS.2022.1234567")
+            use_cache: Read from response cache (default: True)
+
+        Returns:
+            Paper object or None if not found
+        """
+        # Normalize DOI
+        doi = normalize_doi(doi)
+        doi_url = f"https://doi.org/{doi}"
+        endpoint = f"/works/{doi_url}"
+
+        # Cache Lookup
+        if use_cache and self.cache:
+            cached = self.cache.get(endpoint)
+            if cached is not None:
+                return self._parse_work(cached)
+
+        logger.debug(f"OpenAlex get_by_doi: {doi}")
 
         try:
-            # API Call
-            response = self.client.get(f"{self.BASE_URL}/works", params=params)
-            raise_for_status_with_retry(response)
+            # Rate Limiting
+            self.circuit_breaker.before_call()
+            self.rate_limiter.acquire(priority=PRIORITY_INTERACTIVE)
 
-            data = response.json()
+            response = self.client.get(f"{self.BASE_URL}{endpoint}")
 
-            # Parse Results
-            results = data.get("results", [])
-            papers = []
-            for work in results:
-                paper = self._parse_work(work)
-                if paper and paper.doi:  # Only include if DOI exists
-                    papers.append(paper)
+            if response.status_code == 404:
+                logger.warning(f"DOI not found: {doi}")
+                return None
+
+            raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+            work = response_json(response)
+            if self.cache:
+                self.cache.set(endpoint, None, work)
 
-            logger.info(f"OpenAlex found {len(papers)} papers for query: '{query}'")
-            return papers[:limit]  # Ensure limit
+            return self._parse_work(work)
 
         except httpx.TimeoutException as e:
-            logger.error(f"OpenAlex timeout: {e}")
-            return []
+            logger.error(f"OpenAlex get_by_doi timeout for {doi}: {e}")
+            self.circuit_breaker.record_failure()
+            return None
         except Exception as e:
-            logger.error(f"OpenAlex search failed: {e}")
-            raise
+            logger.error(f"OpenAlex get_by_doi failed: {e}")
+            return None
 
-    def get_by_doi(self, doi: str) -> Optional[Paper]:
+    async def aget_by_doi(self, doi: str, use_cache: bool = True) -> Optional[Paper]:
         """
-        Get single paper by DOI
+        Get single paper by DOI (async)
 
         Args:
             doi: Paper DOI (e.g., "10.1109/MS.2022.1234567")
+            use_cache: Read from response cache (default: True)
 
         Returns:
             Paper object or None if not found
         """
-        # Rate Limiting
-        self.rate_limiter.acquire()
-
         # Normalize DOI
-        doi = doi.strip().lower()
+        doi = normalize_doi(doi)
         doi_url = f"https://doi.org/{doi}"
+        endpoint = f"/works/{doi_url}"
 
-        logger.debug(f"OpenAlex get_by_doi: {doi}")
+        # Cache Lookup
+        if use_cache and self.cache:
+            cached = await asyncio.to_thread(self.cache.get, endpoint)
+            if cached is not None:
+                return self._parse_work(cached)
+
+        logger.debug(f"OpenAlex async get_by_doi: {doi}")
 
         try:
-            response = self.client.get(f"{self.BASE_URL}/works/{doi_url}")
+            # Rate Limiting
+            self.circuit_breaker.before_call()
+            await self.async_rate_limiter.acquire(priority=PRIORITY_INTERACTIVE)
+
+            response = await self._async_pool.get().get(f"{self.BASE_URL}{endpoint}")
 
             if response.status_code == 404:
                 logger.warning(f"DOI not found: {doi}")
                 return None
 
-            raise_for_status_with_retry(response)
+            raise_for_status_with_retry(response, self.async_rate_limiter, self.circuit_breaker)
+
+            work = response_json(response)
+            if self.cache:
+                await asyncio.to_thread(self.cache.set, endpoint, None, work)
 
-            work = response.json()
             return self._parse_work(work)
 
+        except httpx.TimeoutException as e:
+            logger.error(f"OpenAlex get_by_doi timeout for {doi}: {e}")
+            self.circuit_breaker.record_failure()
+            return None
         except Exception as e:
             logger.error(f"OpenAlex get_by_doi failed: {e}")
             return None
 
+    def get_by_dois(
+        self,
+        dois: List[str],
+        use_cache: bool = True,
+        failed: Optional[Set[str]] = None
+    ) -> Dict[str, Paper]:
+        """
+        Get many papers by DOI with batched requests
+
+        Uses filter=doi:a|b|c with up to DOI_BATCH_SIZE DOIs per request
+        instead of one round trip per DOI (important for the anonymous
+        100 req/day budget). Cached DOIs are served without a request.
+
+        Args:
+            dois: List of DOIs (duplicates and prefixes are normalized)
+            use_cache: Read from response cache (default: True)
+            failed: Optional set that receives the DOIs of failed batch
+                    requests (absent because of an error, not unknown)
+
+        Returns:
+            Dict mapping normalized DOI to Paper (unresolved DOIs are absent)
+
+        Example:
+            papers = client.get_by_dois(["10.1109/MS.2022.1234567", "10.1145/3456789"])
+        """
+        results: Dict[str, Paper] = {}
+        pending = []
+
+        for doi in dict.fromkeys(normalize_doi(d) for d in dois):
+            if not doi:
+                continue
+            if use_cache and self.cache:
+                cached = self.cache.get(f"/works/https://doi.org/{doi}")
+                if cached is not None:
+                    paper = self._parse_work(cached)
+                    if paper:
+                        results[doi] = paper
+                        continue
+            pending.append(doi)
+
+        for i in range(0, len(pending), self.DOI_BATCH_SIZE):
+            batch = pending[i:i + self.DOI_BATCH_SIZE]
+            try:
+                works = self._fetch_doi_batch(batch)
+            except httpx.TimeoutException as e:
+                logger.error(f"OpenAlex get_by_dois batch timeout: {e}")
+                self.circuit_breaker.record_failure()
+                if failed is not None:
+                    failed.update(batch)
+                continue
+            except Exception as e:
+                logger.error(f"OpenAlex get_by_dois batch failed: {e}")
+                if failed is not None:
+                    failed.update(batch)
+                continue
+
+            for work in works:
+                paper = self._parse_work(work)
+                if not paper:
+                    continue
+                doi = normalize_doi(paper.doi)
+                results[doi] = paper
+                if self.cache:
+                    self.cache.set(f"/works/https://doi.org/{doi}", None, work)
+
+        logger.info(f"OpenAlex get_by_dois: {len(results)} papers resolved "
+                    f"({len(pending)} DOIs fetched)")
+        return results
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    def _fetch_doi_batch(self, dois: List[str]) -> List[Dict[str, Any]]:
+        """Fetch works for a batch of normalized DOIs (one request)"""
+        self.circuit_breaker.before_call()
+        self.rate_limiter.acquire(priority=PRIORITY_BULK)
+
+        params = {
+            "filter": "doi:" + "|".join(dois),
+            "per-page": len(dois),
+            "select": self.WORK_FIELDS
+        }
+        response = self.client.get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+        raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+        return response_json(response).get("results", [])
+
     def _parse_work(self, work: Dict[str, Any]) -> Optional[Paper]:
         """
         Parse OpenAlex work item to Paper object
@@ -284,7 +691,7 @@ class OpenAlexClient:
             source_api="openalex",
             url=url,
             citations=citations,
-            raw_data=work
+            raw_data=work if self.keep_raw_data else None
         )
 
     def _reconstruct_abstract(self, inverted_index: Optional[Dict[str, List[int]]]) -> Optional[str]:
@@ -305,17 +712,7 @@ class OpenAlexClient:
             return None
 
         try:
-            # Create position -> word mapping
-            word_positions = []
-            for word, positions in inverted_index.items():
-                for pos in positions:
-                    word_positions.append((pos, word))
-
-            # Sort by position
-            word_positions.sort(key=lambda x: x[0])
-
-            # Join words
-            abstract = " ".join(word for _, word in word_positions)
+            abstract = rebuild_inverted_index(inverted_index)
 
             # Truncate if too long
             if len(abstract) > 5000:
@@ -331,6 +728,10 @@ class OpenAlexClient:
         """Close HTTP client"""
         self.client.close()
 
+    async def aclose(self):
+        """Close async HTTP client pool"""
+        await self._async_pool.aclose()
+
     def __enter__(self):
         """Context manager entry"""
         return self
@@ -339,6 +740,14 @@ class OpenAlexClient:
         """Context manager exit"""
         self.close()
 
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
+
 
 # ============================================
 # Convenience Functions
@@ -0,0 +1,254 @@
+"""
+Query Result Cache für Academic Agent v2.3+
+
+Semantischer Cache über den fertigen (deduplizierten, sortierten) Paper-Listen
+von SearchEngine - eine Ebene über dem HTTP ResponseCache der Clients.
+
+Features:
+- Key = (normalisierte Query, Sources, Limit, Filter, Field Filter, metadata_only)
+- Stale-While-Revalidate: nach soft_ttl wird das Ergebnis trotzdem sofort
+  geliefert, SearchEngine aktualisiert es im Hintergrund
+- Hard TTL: danach gilt der Eintrag als Miss (Suche läuft synchron)
+- Persistent (SQLite via utils.cache.Cache) - Ergebnisse aus früheren Runs
+  stehen sofort zur Verfügung (Web UI, Quick Mode)
+
+Usage:
+    from src.search.result_cache import QueryResultCache
+
+    cache = QueryResultCache(soft_ttl_minutes=60, ttl_hours=168)
+    key = cache.make_key("DevOps Governance", ["crossref", "openalex"], limit=20)
+    cache.set(key, papers)
+    entry = cache.get(key)  # CachedResult(papers, age_seconds, stale) oder None
+"""
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.search.crossref_client import Paper
+from src.utils.cache import Cache
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResult:
+    """Cached search result"""
+    papers: List[Paper]
+    age_seconds: float
+    stale: bool  # older than soft TTL → caller should revalidate
+
+
+# ============================================
+# QueryResultCache
+# ============================================
+
+class QueryResultCache:
+    """
+    Persistent cache of SearchEngine results with stale-while-revalidate
+
+    Werte werden als JSON gespeichert (Paper.to_dict + source/source_type);
+    jeder get() liefert neue Paper-Objekte, Aufrufer können sie frei mutieren.
+    """
+
+    # Boolean operators keep their case (OpenAlex/CrossRef treat "AND" != "and")
+    _OPERATORS = {"AND", "OR", "NOT"}
+
+    def __init__(
+        self,
+        soft_ttl_minutes: float = 60,
+        ttl_hours: int = 168,
+        cache_file: Optional[Path] = None,
+        max_size_mb: int = 50,
+        cache: Optional[Cache] = None
+    ):
+        """
+        Args:
+            soft_ttl_minutes: Ab diesem Alter wird im Hintergrund aktualisiert
+            ttl_hours: Hard TTL - ältere Einträge werden verworfen
+            cache_file: Cache DB Pfad (default: ~/.cache/academic_agent/result_cache.db)
+            max_size_mb: Max Cache Größe in MB
+            cache: Optional existierender Cache (überschreibt ttl/file/size)
+        """
+        self.soft_ttl_seconds = soft_ttl_minutes * 60
+        self.cache = cache or Cache(
+            cache_file=cache_file or Path.home() / ".cache" / "academic_agent" / "result_cache.db",
+            ttl_hours=ttl_hours,
+            max_size_mb=max_size_mb
+        )
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def normalize_query(cls, query: str) -> str:
+        """Whitespace collapsed, lowercase (except boolean operators)"""
+        return " ".join(
+            token if token in cls._OPERATORS else token.lower()
+            for token in (query or "").split()
+        )
+
+    def make_key(
+        self,
+        query: str,
+        sources: List[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+        field_filter: Optional[str] = None,
+        metadata_only: bool = False
+    ) -> str:
+        """
+        Build cache key
+
+        Args:
+            query: Search query (normalized here)
+            sources: Searched sources (order does not matter)
+            limit: Result limit
+            filters: Per-source API filters
+            field_filter: OpenAlex field-of-study filter
+            metadata_only: Result of a metadata-only (two-phase) search
+
+        Returns:
+            Key im Format "results:<sha256>"
+        """
+        payload = json.dumps(
+            {
+                "query": self.normalize_query(query),
+                "sources": sorted(set(sources)),
+                "limit": limit,
+                "filters": filters or {},
+                "field_filter": field_filter or None,
+                "metadata_only": metadata_only,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return "results:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """
+        Get cached result
+
+        Returns:
+            CachedResult (stale=True nach soft TTL) oder None (Miss/Expired)
+        """
+        value = self.cache.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        age = max(0.0, time.time() - value["stored_at"])
+        stale = age > self.soft_ttl_seconds
+        if stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+
+        return CachedResult(
+            papers=[self._dict_to_paper(item) for item in value["papers"]],
+            age_seconds=age,
+            stale=stale
+        )
+
+    def set(self, key: str, papers: List[Paper]) -> None:
+        """Store result list (replaces existing entry, resets its age)"""
+        self.cache.set(key, {
+            "stored_at": time.time(),
+            "papers": [self._paper_to_dict(paper) for paper in papers],
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters + underlying cache stats"""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            **self.cache.get_stats()
+        }
+
+    @staticmethod
+    def _paper_to_dict(paper: Paper) -> Dict[str, Any]:
+        data = paper.to_dict()
+        data["source"] = paper.source
+        data["source_type"] = paper.source_type
+        return data
+
+    @staticmethod
+    def _dict_to_paper(data: Dict[str, Any]) -> Paper:
+        paper = Paper(
+            doi=data["doi"],
+            title=data["title"],
+            authors=data.get("authors") or [],
+            year=data.get("year"),
+            abstract=data.get("abstract"),
+            venue=data.get("venue"),
+            source_api=data.get("source_api") or "crossref",
+            url=data.get("url"),
+            citations=data.get("citations")
+        )
+        paper.source = data.get("source")
+        paper.source_type = data.get("source_type")
+        return paper
+
+
+# ============================================
+# Factory
+# ============================================
+
+def create_result_cache_from_config(result_cache_config) -> Optional[QueryResultCache]:
+    """
+    Create QueryResultCache from ResultCacheConfig
+
+    Args:
+        result_cache_config: ResultCacheConfig (api_config.result_cache)
+
+    Returns:
+        QueryResultCache or None if disabled
+    """
+    if not result_cache_config or not result_cache_config.enabled:
+        return None
+
+    cache_file = Path(result_cache_config.cache_file).expanduser() if result_cache_config.cache_file else None
+    return QueryResultCache(
+        soft_ttl_minutes=result_cache_config.soft_ttl_minutes,
+        ttl_hours=result_cache_config.ttl_hours,
+        cache_file=cache_file,
+        max_size_mb=result_cache_config.max_size_mb
+    )
+
+
+# ============================================
+# CLI Test
+# ============================================
+
+if __name__ == "__main__":
+    """
+    Test QueryResultCache
+
+    Run:
+        python -m src.search.result_cache
+    """
+    import tempfile
+
+    print("Testing QueryResultCache...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = QueryResultCache(soft_ttl_minutes=0, cache_file=Path(tmp) / "results.db")
+
+        key = cache.make_key("DevOps  Governance", ["openalex", "crossref"], limit=20)
+        assert key == cache.make_key("devops governance", ["crossref", "openalex"], limit=20)
+        assert key != cache.make_key("devops governance", ["crossref"], limit=20)
+        print("  ✅ Key normalization works")
+
+        cache.set(key, [Paper(doi="10.1234/a", title="DevOps Governance", authors=["A"], citations=3)])
+        entry = cache.get(key)
+        assert entry.papers[0].doi == "10.1234/a" and entry.stale
+        print(f"  ✅ Round trip works (age {entry.age_seconds:.3f}s, stale={entry.stale})")
+
+    print("\n✅ All tests passed!")
@@ -9,6 +9,22 @@ Orchestriert Multi-API Paper-Suche + DBIS Search:
 
 Features:
 - Multi-Source Search (parallel via asyncio)
+- Async-native Pfad (asearch) mit gepoolten httpx.AsyncClients (HTTP/2, Keep-Alive)
+- Multi-Query Batch Search (search_many): alle (Query, Source)-Paare parallel, eine Deduplizierung
+- Persistenter API Response Cache (TTL pro Source aus api_config.yaml)
+- Batch DOI Lookup (get_by_dois): gebatchte Requests, fehlende Felder aus weiteren Sources
+- Streaming (asearch_stream): Sources werden eingefaltet sobald sie fertig sind
+- Lokaler Corpus (Source "corpus"): run-übergreifender SQLite FTS5 Store,
+  optional vor (oder statt) den Netzwerk-Sources
+- Offline Index (Source "offline"): aus OpenAlex/CrossRef Snapshots (snapshot_loader)
+- Optional prozessübergreifende Rate Limits (shared_rate_limits in api_config.yaml)
+- Circuit Breaker pro Source: kranke Sources werden während des Cool-Downs übersprungen
+- Two-Phase Search: metadata_only (ohne Abstracts/Autoren) + hydrate() für die Top-K
+  nach dem Vorab-Ranking (gebatchte DOI Lookups)
+- Query Result Cache (result_cache in api_config.yaml): fertige Ergebnisse pro
+  (Query, Sources, Limit, Filter) sofort, Stale-While-Revalidate im Hintergrund
+- Semantic Scholar Bulk Search: limit > s2_bulk_search.min_limit nutzt
+  /paper/search/bulk (1000 Papers pro Request) - hunderte S2 Kandidaten für Deep Research
 - Hybrid Mode: APIs + DBIS (v2.2)
 - Source Annotation (api/dbis)
 - Automatic Deduplication
@@ -28,18 +44,29 @@ Usage:
     api_config, _ = load_config()
     engine = SearchEngine(api_config=api_config)
     papers = engine.search("DevOps Governance", limit=20)
+
+    # Async (z.B. innerhalb eines Event Loops)
+    async with SearchEngine() as engine:
+        papers = await engine.asearch("DevOps Governance", limit=20)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union, AsyncIterator, Callable, Awaitable
 import logging
 import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
-from src.search.crossref_client import CrossRefClient, Paper
+from src.search.crossref_client import CrossRefClient, Paper, normalize_doi
 from src.search.openalex_client import OpenAlexClient
 from src.search.semantic_scholar_client import SemanticScholarClient
-from src.search.deduplicator import Deduplicator
-from src.utils.config import APIConfig
+from src.search.deduplicator import Deduplicator, IncrementalDeduplicator
+from src.search.corpus_store import CorpusStore, create_corpus_store_from_config
+from src.search.snapshot_loader import create_offline_index_from_config
+from src.search.result_cache import QueryResultCache, create_result_cache_from_config
+from src.utils.config import APIConfig, S2BulkSearchConfig
+from src.utils.cache import create_response_cache_from_config
+from src.utils.shared_rate_limiter import create_shared_bucket_store_from_config, share_client_rate_limiters
+from src.utils.retry import APIError, CircuitBreaker, configure_circuit_breakers
 
 # Setup Logging
 logger = logging.getLogger(__name__)
@@ -61,10 +88,20 @@ class SearchEngine:
         papers = engine.search("DevOps Governance", limit=20)
     """
 
+    # Sources answered from local SQLite indexes (no network, not recorded in corpus)
+    LOCAL_SOURCES = ("corpus", "offline")
+
     def __init__(
         self,
         api_config: Optional[APIConfig] = None,
-        sources: Optional[List[str]] = None
+        sources: Optional[List[str]] = None,
+        use_cache: bool = True,
+        keep_raw_data: bool = False,
+        corpus_store: Optional[CorpusStore] = None,
+        corpus_min_results: Optional[int] = None,
+        offline_index: Optional[CorpusStore] = None,
+        result_cache: Optional[QueryResultCache] = None,
+        s2_bulk_search: Optional[S2BulkSearchConfig] = None
     ):
         """
         Initialize SearchEngine
@@ -72,6 +109,18 @@ class SearchEngine:
         Args:
             api_config: Optional APIConfig object (from config loader)
             sources: Optional list of sources to use (default: all)
+            use_cache: Enable the API response cache configured in api_config.cache
+                       (default: True, no effect without api_config)
+            keep_raw_data: Retain raw API JSON on each Paper (compressed, default: False)
+            corpus_store: Optional local CorpusStore (default: from api_config.corpus)
+            corpus_min_results: Skip network sources when the corpus returns at
+                                least this many hits (default: api_config.corpus.min_results)
+            offline_index: Optional snapshot index for source "offline"
+                           (default: from api_config.offline)
+            result_cache: Optional QueryResultCache for search/search_parallel/asearch
+                          (default: from api_config.result_cache, disabled by use_cache=False)
+            s2_bulk_search: Semantic Scholar bulk search settings
+                            (default: from api_config.s2_bulk_search)
         """
         # Load config if not provided
         if api_config:
@@ -81,8 +130,50 @@ class SearchEngine:
             logger.info("SearchEngine: Using default config (no API keys)")
             self.api_config = None
 
-        # Sources to use
-        self.sources = sources or ["crossref", "openalex", "semantic_scholar"]
+        self.use_cache = use_cache
+        self.keep_raw_data = keep_raw_data
+
+        # Local corpus (cross-run paper store)
+        if corpus_store is None and self.api_config:
+            corpus_store = create_corpus_store_from_config(self.api_config.corpus)
+        self.corpus_store = corpus_store
+        if corpus_min_results is None and self.api_config:
+            corpus_min_results = self.api_config.corpus.min_results
+        self.corpus_min_results = corpus_min_results
+
+        # Offline snapshot index
+        if offline_index is None and self.api_config:
+            offline_index = create_offline_index_from_config(self.api_config.offline)
+        self.offline_index = offline_index
+
+        # Query result cache (stale-while-revalidate)
+        if result_cache is None and self.use_cache and self.api_config:
+            try:
+                result_cache = create_result_cache_from_config(self.api_config.result_cache)
+            except Exception as e:
+                logger.warning(f"Result cache unavailable: {e}")
+        self.result_cache = result_cache
+        self._refreshing: set = set()  # cache keys with a background refresh in flight
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_tasks: set = set()
+
+        # Semantic Scholar bulk search (high-yield mode for large limits)
+        if s2_bulk_search is None:
+            s2_bulk_search = self.api_config.s2_bulk_search if self.api_config else S2BulkSearchConfig()
+        self.s2_bulk_search = s2_bulk_search
+
+        # Sources to use (local sources first - answer in milliseconds)
+        default_sources = ["crossref", "openalex", "semantic_scholar"]
+        if self.offline_index:
+            default_sources = ["offline"] + default_sources
+        if self.corpus_store:
+            default_sources = ["corpus"] + default_sources
+        self.sources = sources or default_sources
+
+        # Circuit breaker thresholds (shared per source, see utils.retry)
+        if self.api_config:
+            configure_circuit_breakers(self.api_config.retry)
 
         # Initialize API clients
         self._init_clients()
@@ -99,21 +190,93 @@ class SearchEngine:
         if self.api_config:
             crossref_email = self.api_config.api_keys.crossref_email
 
-        self.crossref_client = CrossRefClient(email=crossref_email)
+        self.crossref_client = CrossRefClient(
+            email=crossref_email,
+            cache=self._create_cache("crossref"),
+            keep_raw_data=self.keep_raw_data,
+            **self._rate_limit_options("crossref")
+        )
 
         # OpenAlex
         openalex_email = None
         if self.api_config:
             openalex_email = self.api_config.api_keys.openalex_email
 
-        self.openalex_client = OpenAlexClient(email=openalex_email)
+        self.openalex_client = OpenAlexClient(
+            email=openalex_email,
+            cache=self._create_cache("openalex"),
+            keep_raw_data=self.keep_raw_data,
+            **self._rate_limit_options("openalex")
+        )
 
         # Semantic Scholar
         s2_key = None
         if self.api_config:
             s2_key = self.api_config.api_keys.semantic_scholar_api_key
 
-        self.s2_client = SemanticScholarClient(api_key=s2_key)
+        self.s2_client = SemanticScholarClient(
+            api_key=s2_key,
+            cache=self._create_cache("semantic_scholar"),
+            keep_raw_data=self.keep_raw_data,
+            **self._rate_limit_options("semantic_scholar")
+        )
+
+        # Cross-process rate limits (one shared bucket per source)
+        if self.api_config:
+            store = create_shared_bucket_store_from_config(self.api_config.shared_rate_limits)
+            if store:
+                share_client_rate_limiters(self.crossref_client, "crossref", store)
+                share_client_rate_limiters(self.openalex_client, "openalex", store)
+                share_client_rate_limiters(self.s2_client, "semantic_scholar", store)
+                logger.info(f"SearchEngine: shared rate limits via {store.state_file}")
+
+    def _rate_limit_options(self, source: str) -> Dict[str, Any]:
+        """adaptive/max_rate client kwargs from api_config.rate_limits (client defaults without config)"""
+        rate_config = self.api_config.rate_limits.get(source) if self.api_config else None
+        if rate_config is None:
+            return {}
+        return {"adaptive": rate_config.adaptive, "max_rate": rate_config.max_requests_per_second}
+
+    def _circuit_breaker_for(self, source: str) -> Optional[CircuitBreaker]:
+        """Circuit breaker of a network source (None for local/unknown sources)"""
+        if source in self.LOCAL_SOURCES:
+            return None
+        return getattr(self._client_for(source), "circuit_breaker", None)
+
+    def _healthy_sources(self, sources: List[str]) -> List[str]:
+        """Drop sources whose circuit is open (cool-down after repeated failures)"""
+        healthy = []
+        for source in sources:
+            breaker = self._circuit_breaker_for(source)
+            if breaker is not None and breaker.state == CircuitBreaker.OPEN:
+                logger.warning(f"  {source}: skipped (circuit open, "
+                               f"{breaker.remaining_cooldown():.0f}s cool-down left)")
+                continue
+            healthy.append(source)
+        return healthy
+
+    def _record_source_failure(self, source: str, error: BaseException) -> None:
+        """
+        Count timeouts/network errors against the source's circuit breaker
+
+        HTTP errors (APIError) are already recorded by the client.
+        """
+        if isinstance(error, APIError):
+            return
+        breaker = self._circuit_breaker_for(source)
+        if breaker is not None:
+            breaker.record_failure()
+
+    def _create_cache(self, source: str):
+        """Create response cache for source (None if disabled or no config)"""
+        if not (self.use_cache and self.api_config):
+            return None
+
+        try:
+            return create_response_cache_from_config(self.api_config.cache, source)
+        except Exception as e:
+            logger.warning(f"Response cache for {source} unavailable: {e}")
+            return None
 
     def _get_mode(self) -> str:
         """Get current mode (standard or enhanced)"""
@@ -126,7 +289,10 @@ class SearchEngine:
         query: str,
         limit: int = 50,
         sources: Optional[List[str]] = None,
-        deduplicate: bool = True
+        deduplicate: bool = True,
+        filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        field_filter: Optional[str] = None,
+        metadata_only: bool = False
     ) -> List[Paper]:
         """
         Search for papers across multiple APIs
@@ -136,6 +302,15 @@ class SearchEngine:
             limit: Max results (default: 50)
             sources: Optional override of sources (default: use instance sources)
             deduplicate: Whether to deduplicate results (default: True)
+            filters: Optional API filters per source, e.g.
+                     {"openalex": {"from_publication_date": "2020-01-01"}}
+                     Semantic Scholar filters apply to bulk search (limit >
+                     s2_bulk_search.min_limit), e.g. {"semantic_scholar":
+                     {"year": "2019-", "fieldsOfStudy": "Computer Science"}}
+            field_filter: Optional OpenAlex field-of-study filter
+                          (see OpenAlexClient.FIELD_FILTERS)
+            metadata_only: Fetch only ids, titles, years, venues and citations
+                           (lightweight first phase, see hydrate())
 
         Returns:
             List of Paper objects (deduplicated and sorted by relevance)
@@ -146,25 +321,48 @@ class SearchEngine:
         """
         sources = sources or self.sources
 
+        if deduplicate and self.result_cache:
+            return self._cached_search(
+                query, limit, sources, filters, field_filter, metadata_only,
+                lambda: self._search(
+                    query, limit, sources, deduplicate, filters, field_filter, metadata_only
+                )
+            )
+        return self._search(query, limit, sources, deduplicate, filters, field_filter, metadata_only)
+
+    def _search(
+        self,
+        query: str,
+        limit: int,
+        sources: List[str],
+        deduplicate: bool,
+        filters: Optional[Dict[str, Dict[str, Any]]],
+        field_filter: Optional[str],
+        metadata_only: bool
+    ) -> List[Paper]:
+        """Sequential search without result cache (see search())"""
         logger.info(f"SearchEngine: Searching '{query}' across {len(sources)} sources (limit: {limit})")
 
+        # Local corpus first (may make network sources unnecessary)
+        all_papers, sources = self._corpus_prefetch(query, limit, sources)
+        sources = self._healthy_sources(sources)
+
         # Search each source
-        all_papers = []
         per_source_limit = limit  # Each source can return up to limit
 
         for source in sources:
             try:
-                source_papers = self._search_source(source, query, per_source_limit)
-                # Annotate with source (v2.2)
-                for paper in source_papers:
-                    if not hasattr(paper, 'source'):
-                        paper.source = source
-                    if not hasattr(paper, 'source_type'):
-                        paper.source_type = 'api'  # API papers (not DBIS)
+                source_papers = self._search_source(
+                    source, query, per_source_limit,
+                    filters=filters, field_filter=field_filter, metadata_only=metadata_only
+                )
+                self._annotate_source(source_papers, source)
+                self._record_in_corpus(source_papers, source)
                 all_papers.extend(source_papers)
                 logger.info(f"  {source}: {len(source_papers)} papers")
             except Exception as e:
                 logger.error(f"  {source}: Failed - {e}")
+                self._record_source_failure(source, e)
                 # Continue with other sources
 
         logger.info(f"SearchEngine: Total {len(all_papers)} papers before deduplication")
@@ -184,33 +382,129 @@ class SearchEngine:
         # Return up to limit
         return all_papers[:limit]
 
-    def _search_source(self, source: str, query: str, limit: int) -> List[Paper]:
+    def _annotate_source(self, papers: List[Paper], source: str) -> None:
+        """Annotate papers with source (v2.2)"""
+        for paper in papers:
+            if not paper.source:
+                paper.source = source
+            if not paper.source_type:
+                paper.source_type = 'api'  # API papers (not DBIS)
+
+    def _corpus_prefetch(
+        self,
+        query: str,
+        limit: int,
+        sources: List[str]
+    ) -> Tuple[List[Paper], List[str]]:
+        """
+        Query the local corpus before network sources
+
+        Args:
+            query: Search query
+            limit: Max results
+            sources: Requested sources
+
+        Returns:
+            (corpus papers, remaining sources) - remaining is empty when the
+            corpus returned at least corpus_min_results hits
+        """
+        if "corpus" not in sources or not self.corpus_store:
+            return [], sources
+
+        remaining = [source for source in sources if source != "corpus"]
+        try:
+            corpus_papers = self._search_source("corpus", query, limit)
+        except Exception as e:
+            logger.error(f"  corpus: Failed - {e}")
+            return [], remaining
+
+        self._annotate_source(corpus_papers, "corpus")
+        logger.info(f"  corpus: {len(corpus_papers)} papers")
+
+        if self.corpus_min_results and len(corpus_papers) >= self.corpus_min_results:
+            logger.info(f"SearchEngine: {len(corpus_papers)} corpus hits >= {self.corpus_min_results}, "
+                        f"skipping network sources")
+            remaining = []
+
+        return corpus_papers, remaining
+
+    def _record_in_corpus(self, papers: List[Paper], source: str) -> None:
+        """Upsert network results into the local corpus (never fails the search)"""
+        if not self.corpus_store or source in self.LOCAL_SOURCES or not papers:
+            return
+        try:
+            self.corpus_store.upsert(papers)
+        except Exception as e:
+            logger.warning(f"CorpusStore upsert failed: {e}")
+
+    def _search_source(
+        self,
+        source: str,
+        query: str,
+        limit: int,
+        filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        field_filter: Optional[str] = None,
+        metadata_only: bool = False
+    ) -> List[Paper]:
         """
         Search single source
 
         Args:
-            source: Source name ("crossref", "openalex", "semantic_scholar")
+            source: Source name ("corpus", "offline", "crossref", "openalex", "semantic_scholar")
             query: Search query
             limit: Max results
+            filters: Optional API filters per source (local sources ignore them)
+            field_filter: Optional OpenAlex field-of-study filter
+            metadata_only: Fetch only ids, titles, years, venues and citations
+                           (lightweight first phase, see hydrate())
 
         Returns:
             List of Paper objects
         """
-        if source == "crossref":
-            return self.crossref_client.search(query, limit=limit)
+        source_filters = (filters or {}).get(source)
+        if source in self.LOCAL_SOURCES:
+            store = self._client_for(source)
+            if not store:
+                logger.warning(f"Source '{source}' requested but no local index configured")
+                return []
+            return store.search(query, limit=limit)
+        elif source == "crossref":
+            return self.crossref_client.search(
+                query, limit=limit, filters=source_filters, metadata_only=metadata_only
+            )
         elif source == "openalex":
-            return self.openalex_client.search(query, limit=limit)
+            return self.openalex_client.search(
+                query, limit=limit, filters=source_filters, field_filter=field_filter,
+                metadata_only=metadata_only
+            )
         elif source == "semantic_scholar":
-            return self.s2_client.search(query, limit=limit)
+            if self._use_s2_bulk(limit):
+                return self.s2_client.search_bulk(
+                    query, limit=limit, metadata_only=metadata_only, **self._s2_bulk_kwargs(source_filters)
+                )
+            return self.s2_client.search(query, limit=limit, metadata_only=metadata_only)
         else:
             logger.warning(f"Unknown source: {source}")
             return []
 
+    def _use_s2_bulk(self, limit: int) -> bool:
+        """Bulk search when more S2 candidates are wanted than one /paper/search call returns"""
+        return bool(self.s2_bulk_search and self.s2_bulk_search.enabled
+                    and limit > self.s2_bulk_search.min_limit)
+
+    def _s2_bulk_kwargs(self, source_filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Bulk search arguments: filters["semantic_scholar"] + configured default sort"""
+        filters = dict(source_filters or {})
+        return {"filters": filters, "sort": filters.pop("sort", None) or self.s2_bulk_search.sort}
+
     def search_parallel(
         self,
         query: str,
         limit: int = 50,
-        sources: Optional[List[str]] = None
+        sources: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        field_filter: Optional[str] = None,
+        metadata_only: bool = False
     ) -> List[Paper]:
         """
         Search multiple sources in parallel (faster!)
@@ -221,30 +515,60 @@ class SearchEngine:
             query: Search query
             limit: Max results
             sources: Optional override of sources
+            filters: Optional API filters per source (see search())
+            field_filter: Optional OpenAlex field-of-study filter
+            metadata_only: Fetch only ids, titles, years, venues and citations
+                           (lightweight first phase, see hydrate())
 
         Returns:
             List of Paper objects (deduplicated)
         """
         sources = sources or self.sources
 
+        if self.result_cache:
+            return self._cached_search(
+                query, limit, sources, filters, field_filter, metadata_only,
+                lambda: self._search_parallel(query, limit, sources, filters, field_filter, metadata_only)
+            )
+        return self._search_parallel(query, limit, sources, filters, field_filter, metadata_only)
+
+    def _search_parallel(
+        self,
+        query: str,
+        limit: int,
+        sources: List[str],
+        filters: Optional[Dict[str, Dict[str, Any]]],
+        field_filter: Optional[str],
+        metadata_only: bool
+    ) -> List[Paper]:
+        """Parallel search without result cache (see search_parallel())"""
         logger.info(f"SearchEngine: Parallel search '{query}' across {len(sources)} sources")
 
+        # Local corpus first (may make network sources unnecessary)
+        all_papers, sources = self._corpus_prefetch(query, limit, sources)
+        sources = self._healthy_sources(sources)
+
         # Parallel search
-        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        with ThreadPoolExecutor(max_workers=max(1, len(sources))) as executor:
             futures = []
             for source in sources:
-                future = executor.submit(self._search_source, source, query, limit)
+                future = executor.submit(
+                    self._search_source, source, query, limit,
+                    filters=filters, field_filter=field_filter, metadata_only=metadata_only
+                )
                 futures.append((source, future))
 
             # Collect results
-            all_papers = []
             for source, future in futures:
                 try:
                     source_papers = future.result(timeout=30)
+                    self._annotate_source(source_papers, source)
+                    self._record_in_corpus(source_papers, source)
                     all_papers.extend(source_papers)
                     logger.info(f"  {source}: {len(source_papers)} papers")
                 except Exception as e:
                     logger.error(f"  {source}: Failed - {e}")
+                    self._record_source_failure(source, e)
 
         logger.info(f"SearchEngine: Total {len(all_papers)} papers before deduplication")
 
@@ -261,11 +585,599 @@ class SearchEngine:
 
         return all_papers[:limit]
 
+    async def asearch(
+        self,
+        query: str,
+        limit: int = 50,
+        sources: Optional[List[str]] = None,
+        deduplicate: bool = True,
+        timeout: float = 30.0,
+        filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        field_filter: Optional[str] = None,
+        metadata_only: bool = False
+    ) -> List[Paper]:
+        """
+        Search multiple sources concurrently (async-native)
+
+        All sources run as coroutines on the current event loop. Each client
+        keeps a long-lived httpx.AsyncClient (HTTP/2, keep-alive) and its own
+        AsyncRateLimiter, so no threads are spawned per call.
+
+        Args:
+            query: Search query
+            limit: Max results
+            sources: Optional override of sources
+            deduplicate: Whether to deduplicate results (default: True)
+            timeout: Per-source timeout in seconds (default: 30)
+            filters: Optional API filters per source (see search())
+            field_filter: Optional OpenAlex field-of-study filter
+            metadata_only: Fetch only ids, titles, years, venues and citations
+                           (lightweight first phase, see hydrate())
+
+        Returns:
+            List of Paper objects (deduplicated and sorted by citations)
+
+        Example:
+            papers = await engine.asearch("DevOps Governance", limit=20)
+        """
+        sources = sources or self.sources
+
+        if deduplicate and self.result_cache:
+            return await self._acached_search(
+                query, limit, sources, filters, field_filter, metadata_only,
+                lambda: self._asearch(
+                    query, limit, sources, deduplicate, timeout, filters, field_filter, metadata_only
+                )
+            )
+        return await self._asearch(
+            query, limit, sources, deduplicate, timeout, filters, field_filter, metadata_only
+        )
+
+    async def _asearch(
+        self,
+        query: str,
+        limit: int,
+        sources: List[str],
+        deduplicate: bool,
+        timeout: float,
+        filters: Optional[Dict[str, Dict[str, Any]]],
+        field_filter: Optional[str],
+        metadata_only: bool
+    ) -> List[Paper]:
+        """Async search without result cache (see asearch())"""
+        logger.info(f"SearchEngine: Async search '{query}' across {len(sources)} sources (limit: {limit})")
+
+        deduplicator = self.create_incremental_deduplicator() if deduplicate else None
+
+        # Local corpus first (may make network sources unnecessary)
+        all_papers, sources = await asyncio.to_thread(self._corpus_prefetch, query, limit, sources)
+        if deduplicator is not None:
+            all_papers = deduplicator.add(all_papers)
+
+        async for _, papers in self.asearch_stream(
+            query, limit=limit, sources=sources, timeout=timeout, deduplicator=deduplicator,
+            filters=filters, field_filter=field_filter, metadata_only=metadata_only
+        ):
+            all_papers.extend(papers)
+
+        if deduplicator is not None:
+            all_papers = deduplicator.merged()  # includes metadata merged after first yield
+            logger.info(f"SearchEngine: {len(all_papers)} unique papers after deduplication")
+
+        # Sort by citations
+        all_papers = sorted(
+            all_papers,
+            key=lambda p: p.citations or 0,
+            reverse=True
+        )
+
+        return all_papers[:limit]
+
+    async def asearch_stream(
+        self,
+        query: str,
+        limit: int = 50,
+        sources: Optional[List[str]] = None,
+        timeout: float = 30.0,
+        deduplicator: Optional[IncrementalDeduplicator] = None,
+        filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        field_filter: Optional[str] = None,
+        metadata_only: bool = False
+    ) -> AsyncIterator[Tuple[str, List[Paper]]]:
+        """
+        Search sources concurrently and yield results as each source completes
+
+        With a deduplicator, each source is folded in on completion and only
+        papers not seen before are yielded - downstream stages can start on
+        them without re-deduplicating the whole set. Call
+        deduplicator.merged() at the end for the final view.
+
+        Args:
+            query: Search query
+            limit: Max results per source
+            sources: Optional override of sources
+            timeout: Per-source timeout in seconds (default: 30)
+            deduplicator: Optional IncrementalDeduplicator (None = raw results)
+            filters: Optional API filters per source (see search())
+            field_filter: Optional OpenAlex field-of-study filter
+            metadata_only: Fetch only ids, titles, years, venues and citations
+                           (lightweight first phase, see hydrate())
+
+        Yields:
+            (source, papers) tuples in completion order (failed sources are skipped)
+
+        Example:
+            dedup = engine.create_incremental_deduplicator()
+            async for source, new_papers in engine.asearch_stream("DevOps", deduplicator=dedup):
+                start_pdf_downloads(new_papers)
+            papers = dedup.merged()
+        """
+        sources = self._healthy_sources(self.sources if sources is None else sources)
+
+        async def _run(source: str) -> Tuple[str, Any]:
+            try:
+                result = await asyncio.wait_for(
+                    self._asearch_source(
+                        source, query, limit,
+                        filters=filters, field_filter=field_filter, metadata_only=metadata_only
+                    ),
+                    timeout=timeout
+                )
+            except Exception as e:
+                return source, e
+            return source, result
+
+        for future in asyncio.as_completed([_run(source) for source in sources]):
+            source, result = await future
+            if isinstance(result, BaseException):
+                logger.error(f"  {source}: Failed - {result!r}")
+                self._record_source_failure(source, result)
+                continue
+
+            self._annotate_source(result, source)
+            await asyncio.to_thread(self._record_in_corpus, result, source)
+            papers = deduplicator.add(result) if deduplicator is not None else result
+            logger.info(f"  {source}: {len(result)} papers ({len(papers)} new)")
+            yield source, papers
+
+    # ============================================
+    # Query Result Cache (stale-while-revalidate)
+    # ============================================
+
+    def _cached_search(
+        self,
+        query: str,
+        limit: int,
+        sources: List[str],
+        filters: Optional[Dict[str, Dict[str, Any]]],
+        field_filter: Optional[str],
+        metadata_only: bool,
+        run: Callable[[], List[Paper]]
+    ) -> List[Paper]:
+        """
+        Serve from the result cache, refresh stale entries in a background thread
+
+        Args:
+            run: Uncached search for this key (also used for the refresh)
+        """
+        key = self.result_cache.make_key(query, sources, limit, filters, field_filter, metadata_only)
+        entry = self._get_cached_result(key)
+        if entry is not None:
+            if entry.stale and self._claim_refresh(key):
+                if self._refresh_executor is None:
+                    self._refresh_executor = ThreadPoolExecutor(
+                        max_workers=2, thread_name_prefix="result-cache-refresh"
+                    )
+                self._refresh_executor.submit(self._refresh_result, key, run)
+            logger.info(f"SearchEngine: '{query}' served from result cache "
+                        f"({len(entry.papers)} papers, age {entry.age_seconds:.0f}s"
+                        f"{', refreshing' if entry.stale else ''})")
+            return entry.papers
+
+        papers = run()
+        self._store_result(key, papers)
+        return papers
+
+    async def _acached_search(
+        self,
+        query: str,
+        limit: int,
+        sources: List[str],
+        filters: Optional[Dict[str, Dict[str, Any]]],
+        field_filter: Optional[str],
+        metadata_only: bool,
+        run: Callable[[], Awaitable[List[Paper]]]
+    ) -> List[Paper]:
+        """Async variant of _cached_search (refresh runs as a task on the current loop)"""
+        key = self.result_cache.make_key(query, sources, limit, filters, field_filter, metadata_only)
+        entry = await asyncio.to_thread(self._get_cached_result, key)
+        if entry is not None:
+            if entry.stale and self._claim_refresh(key):
+                task = asyncio.create_task(self._arefresh_result(key, run))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            logger.info(f"SearchEngine: '{query}' served from result cache "
+                        f"({len(entry.papers)} papers, age {entry.age_seconds:.0f}s"
+                        f"{', refreshing' if entry.stale else ''})")
+            return entry.papers
+
+        papers = await run()
+        await asyncio.to_thread(self._store_result, key, papers)
+        return papers
+
+    def _get_cached_result(self, key: str):
+        """Result cache lookup (cache errors count as miss)"""
+        try:
+            return self.result_cache.get(key)
+        except Exception as e:
+            logger.warning(f"Result cache lookup failed: {e}")
+            return None
+
+    def _store_result(self, key: str, papers: List[Paper]) -> None:
+        """Store a search result (never fails the search; empty results are not cached)"""
+        if not papers:
+            return
+        try:
+            self.result_cache.set(key, papers)
+        except Exception as e:
+            logger.warning(f"Result cache store failed: {e}")
+
+    def _claim_refresh(self, key: str) -> bool:
+        """True if no refresh for key is in flight (marks it as in flight)"""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _refresh_result(self, key: str, run: Callable[[], List[Paper]]) -> None:
+        """Background revalidation of a stale cache entry"""
+        try:
+            self._store_result(key, run())
+        except Exception as e:
+            logger.warning(f"Result cache refresh failed: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    async def _arefresh_result(self, key: str, run: Callable[[], Awaitable[List[Paper]]]) -> None:
+        """Background revalidation of a stale cache entry (async)"""
+        try:
+            papers = await run()
+            await asyncio.to_thread(self._store_result, key, papers)
+        except Exception as e:
+            logger.warning(f"Result cache refresh failed: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def create_incremental_deduplicator(self) -> IncrementalDeduplicator:
+        """Create IncrementalDeduplicator with the engine's dedup settings"""
+        return IncrementalDeduplicator(
+            title_similarity_threshold=self.deduplicator.title_similarity_threshold,
+            prefer_source=self.deduplicator.prefer_source
+        )
+
+    async def _asearch_source(
+        self,
+        source: str,
+        query: str,
+        limit: int,
+        filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        field_filter: Optional[str] = None,
+        metadata_only: bool = False
+    ) -> List[Paper]:
+        """
+        Search single source (async)
+
+        Args:
+            source: Source name ("corpus", "offline", "crossref", "openalex", "semantic_scholar")
+            query: Search query
+            limit: Max results
+            filters: Optional API filters per source (local sources ignore them)
+            field_filter: Optional OpenAlex field-of-study filter
+            metadata_only: Fetch only ids, titles, years, venues and citations
+                           (lightweight first phase, see hydrate())
+
+        Returns:
+            List of Paper objects
+        """
+        source_filters = (filters or {}).get(source)
+        if source in self.LOCAL_SOURCES:
+            return await asyncio.to_thread(self._search_source, source, query, limit)
+        elif source == "crossref":
+            return await self.crossref_client.asearch(
+                query, limit=limit, filters=source_filters, metadata_only=metadata_only
+            )
+        elif source == "openalex":
+            return await self.openalex_client.asearch(
+                query, limit=limit, filters=source_filters, field_filter=field_filter,
+                metadata_only=metadata_only
+            )
+        elif source == "semantic_scholar":
+            if self._use_s2_bulk(limit):
+                return await self.s2_client.asearch_bulk(
+                    query, limit=limit, metadata_only=metadata_only, **self._s2_bulk_kwargs(source_filters)
+                )
+            return await self.s2_client.asearch(query, limit=limit, metadata_only=metadata_only)
+        else:
+            logger.warning(f"Unknown source: {source}")
+            return []
+
+    def search_many(
+        self,
+        queries_by_source: Dict[str, Union[str, List[str]]],
+        limit: int = 50,
+        max_results: Optional[int] = None,
+        timeout: float = 30.0
+    ) -> List[Paper]:
+        """
+        Run many queries across many sources in one batch
+
+        Every (query, source) pair runs concurrently on one event loop.
+        Pairs for the same source share that source's client and rate
+        limiter, so politeness limits still hold. The union of all results
+        is deduplicated once at the end.
+
+        Args:
+            queries_by_source: Dict mapping source to query or list of queries
+                               (e.g. output of QueryGenerator.generate())
+            limit: Max results per (query, source) pair
+            max_results: Optional cap on the merged result (default: all unique papers)
+            timeout: Per-pair timeout in seconds (default: 30)
+
+        Returns:
+            List of Paper objects (deduplicated and sorted by citations)
+
+        Example:
+            queries = generator.generate("DevOps Governance")
+            papers = engine.search_many(queries, limit=25)
+            papers = engine.search_many({"crossref": ["q1", "q2"], "openalex": "q3"})
+        """
+        async def _run():
+            try:
+                return await self.asearch_many(
+                    queries_by_source, limit=limit, max_results=max_results, timeout=timeout
+                )
+            finally:
+                # Async pools are bound to this loop - close them before it ends
+                await self.aclose()
+
+        return asyncio.run(_run())
+
+    async def asearch_many(
+        self,
+        queries_by_source: Dict[str, Union[str, List[str]]],
+        limit: int = 50,
+        max_results: Optional[int] = None,
+        timeout: float = 30.0
+    ) -> List[Paper]:
+        """
+        Async version of search_many() for callers with a running event loop
+
+        Args:
+            queries_by_source: Dict mapping source to query or list of queries
+            limit: Max results per (query, source) pair
+            max_results: Optional cap on the merged result
+            timeout: Per-pair timeout in seconds
+
+        Returns:
+            List of Paper objects (deduplicated and sorted by citations)
+        """
+        healthy = set(self._healthy_sources(list(queries_by_source)))
+        pairs = [(source, query) for source, query in self._expand_query_pairs(queries_by_source)
+                 if source in healthy]
+
+        logger.info(f"SearchEngine: Batch search with {len(pairs)} (query, source) pairs "
+                    f"across {len({source for source, _ in pairs})} sources")
+
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self._asearch_source(source, query, limit), timeout=timeout)
+              for source, query in pairs),
+            return_exceptions=True
+        )
+
+        # Collect results
+        all_papers = []
+        for (source, query), result in zip(pairs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"  {source} '{query}': Failed - {result!r}")
+                self._record_source_failure(source, result)
+                continue
+            self._annotate_source(result, source)
+            await asyncio.to_thread(self._record_in_corpus, result, source)
+            all_papers.extend(result)
+            logger.info(f"  {source} '{query}': {len(result)} papers")
+
+        logger.info(f"SearchEngine: Total {len(all_papers)} papers before deduplication")
+
+        # Deduplicate once over the union
+        all_papers = self.deduplicator.deduplicate(all_papers)
+        logger.info(f"SearchEngine: {len(all_papers)} unique papers after deduplication")
+
+        # Sort by citations
+        all_papers = sorted(
+            all_papers,
+            key=lambda p: p.citations or 0,
+            reverse=True
+        )
+
+        if max_results is not None:
+            all_papers = all_papers[:max_results]
+
+        return all_papers
+
+    def _expand_query_pairs(
+        self,
+        queries_by_source: Dict[str, Union[str, List[str]]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Expand {source: query | [queries]} into unique (source, query) pairs
+
+        Empty queries and repeated queries per source are dropped.
+        """
+        pairs = []
+        seen = set()
+
+        for source, queries in queries_by_source.items():
+            if isinstance(queries, str):
+                queries = [queries]
+            for query in queries:
+                query = (query or "").strip()
+                if not query or (source, query) in seen:
+                    continue
+                seen.add((source, query))
+                pairs.append((source, query))
+
+        return pairs
+
+    def get_by_dois(
+        self,
+        dois: List[str],
+        sources: Optional[List[str]] = None,
+        fill_missing_fields: bool = True
+    ) -> Dict[str, Paper]:
+        """
+        Resolve many DOIs with batched requests across sources
+
+        Sources are queried in order (default: local corpus / offline index if
+        configured → OpenAlex → Semantic Scholar → CrossRef). Each source only gets the DOIs that are still unresolved
+        or - with fill_missing_fields - whose paper still lacks an abstract.
+        Missing fields (abstract, venue, year, url, authors) are filled from
+        later sources, citations take the max across sources.
+
+        Args:
+            dois: List of DOIs
+            sources: Source order (default: openalex, semantic_scholar, crossref)
+            fill_missing_fields: Query later sources for papers without abstract
+
+        Returns:
+            Dict mapping normalized DOI to Paper (unresolved DOIs are absent)
+
+        Example:
+            papers = engine.get_by_dois(["10.1109/MS.2022.1234567", "10.1145/3456789"])
+            paper = papers.get("10.1109/ms.2022.1234567")
+        """
+        default_sources = ["openalex", "semantic_scholar", "crossref"]
+        if self.offline_index:
+            default_sources = ["offline"] + default_sources
+        if self.corpus_store:
+            default_sources = ["corpus"] + default_sources
+        sources = self._healthy_sources(sources or default_sources)
+        wanted = [doi for doi in dict.fromkeys(normalize_doi(d) for d in dois) if doi]
+        results: Dict[str, Paper] = {}
+
+        for source in sources:
+            client = self._client_for(source)
+            if client is None:
+                continue
+
+            pending = [
+                doi for doi in wanted
+                if doi not in results or (fill_missing_fields and not results[doi].abstract)
+            ]
+            if not pending:
+                break
+
+            try:
+                found = client.get_by_dois(pending)
+            except Exception as e:
+                logger.error(f"get_by_dois failed for {source}: {e}")
+                self._record_source_failure(source, e)
+                continue
+
+            self._annotate_source(list(found.values()), source)
+            self._record_in_corpus(list(found.values()), source)
+            for doi, paper in found.items():
+                if doi in results:
+                    self._fill_missing_fields(results[doi], paper)
+                else:
+                    results[doi] = paper
+
+        logger.info(f"get_by_dois: {len(results)}/{len(wanted)} DOIs resolved")
+        return results
+
+    def hydrate(
+        self,
+        papers: List[Paper],
+        top_k: Optional[int] = None,
+        sources: Optional[List[str]] = None
+    ) -> List[Paper]:
+        """
+        Second phase of a two-phase search: fetch abstracts/authors for the top-K
+
+        Papers from a metadata_only search carry no abstract or authors. After
+        a preliminary ranking (titles, years, citations) only the surviving
+        candidates are hydrated with batched DOI lookups (get_by_dois).
+
+        Args:
+            papers: Papers in preliminary rank order (hydrated in place)
+            top_k: Hydrate only the first top_k papers (default: all)
+            sources: Source order for the lookups (default: see get_by_dois)
+
+        Returns:
+            The same list (papers[:top_k] hydrated where the sources had data)
+
+        Example:
+            candidates = engine.search("DevOps", limit=200, metadata_only=True)
+            shortlist = FiveDScorer().score(candidates, query="DevOps")[:40]
+            engine.hydrate([item["paper"] for item in shortlist])
+        """
+        candidates = papers[:top_k] if top_k is not None else papers
+        missing = [p for p in candidates if p.doi and not (p.abstract and p.authors)]
+        if not missing:
+            return papers
+
+        found = self.get_by_dois([p.doi for p in missing], sources=sources)
+        hydrated = 0
+        for paper in missing:
+            other = found.get(normalize_doi(paper.doi))
+            if other is not None:
+                self._fill_missing_fields(paper, other)
+                hydrated += 1
+
+        logger.info(f"SearchEngine: hydrated {hydrated}/{len(missing)} papers")
+        return papers
+
+    async def ahydrate(
+        self,
+        papers: List[Paper],
+        top_k: Optional[int] = None,
+        sources: Optional[List[str]] = None
+    ) -> List[Paper]:
+        """Async variant of hydrate() (batched lookups run in a worker thread)"""
+        return await asyncio.to_thread(self.hydrate, papers, top_k, sources)
+
+    def _client_for(self, source: str):
+        """Return API client for source name (None if unknown)"""
+        clients = {
+            "corpus": self.corpus_store,
+            "offline": self.offline_index,
+            "crossref": self.crossref_client,
+            "openalex": self.openalex_client,
+            "semantic_scholar": self.s2_client,
+        }
+        client = clients.get(source)
+        if client is None and source not in clients:
+            logger.warning(f"Unknown source: {source}")
+        return client
+
+    @staticmethod
+    def _fill_missing_fields(target: Paper, other: Paper) -> None:
+        """Fill empty fields of target from other, keep max citations"""
+        for field in ("abstract", "venue", "year", "url", "authors"):
+            if not getattr(target, field) and getattr(other, field):
+                setattr(target, field, getattr(other, field))
+
+        if other.citations is not None:
+            target.citations = max(target.citations or 0, other.citations)
+
     def merge_with_dbis_papers(
         self,
         api_papers: List[Paper],
         dbis_papers: List[Dict],
-        deduplicate: bool = True
+        deduplicate: bool = True,
+        deduplicator: Optional[IncrementalDeduplicator] = None
     ) -> List[Paper]:
         """
         Merge API papers with DBIS papers (v2.2)
@@ -274,6 +1186,9 @@ class SearchEngine:
             api_papers: Papers from APIs (CrossRef, OpenAlex, S2)
             dbis_papers: Papers from DBIS search (dicts from agent)
             deduplicate: Remove duplicates (default: True)
+            deduplicator: Optional IncrementalDeduplicator that already holds
+                          the API papers (e.g. from asearch_stream) - only the
+                          DBIS papers are folded in, api_papers is not re-deduplicated
 
         Returns:
             Combined list of papers with source annotation
@@ -297,6 +1212,13 @@ class SearchEngine:
             paper.source_type = 'dbis'
             dbis_paper_objects.append(paper)
 
+        # Incremental: API papers are already deduplicated in the deduplicator
+        if deduplicate and deduplicator is not None:
+            new_papers = deduplicator.add(dbis_paper_objects)
+            logger.info(f"Merged {len(dbis_paper_objects)} DBIS papers incrementally "
+                        f"({len(new_papers)} new, {len(deduplicator)} unique)")
+            return deduplicator.merged()
+
         # Merge
         all_papers = api_papers + dbis_paper_objects
         logger.info(f"Merged {len(api_papers)} API papers + {len(dbis_paper_objects)} DBIS papers")
@@ -309,11 +1231,22 @@ class SearchEngine:
         return all_papers
 
     def close(self):
-        """Close all API clients"""
+        """Close all API clients (waits for running background cache refreshes)"""
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=True, cancel_futures=True)
+            self._refresh_executor = None
         self.crossref_client.close()
         self.openalex_client.close()
         self.s2_client.close()
 
+    async def aclose(self):
+        """Close all async HTTP client pools (waits for pending cache refresh tasks)"""
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+        await self.crossref_client.aclose()
+        await self.openalex_client.aclose()
+        await self.s2_client.aclose()
+
     def __enter__(self):
         """Context manager entry"""
         return self
@@ -322,6 +1255,15 @@ class SearchEngine:
         """Context manager exit"""
         self.close()
 
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
+        self.close()
+
 
 # ============================================
 # Convenience Functions
@@ -361,13 +1303,18 @@ def main():
     Usage:
         python -m src.search.search_engine --query "DevOps Governance" --mode standard --output results.json
         python -m src.search.search_engine --query "AI Ethics" --limit 10 --sources crossref openalex
+        python -m src.search.search_engine --queries-file queries.json --mode deep
     """
     import argparse
     import json
     import sys
 
     parser = argparse.ArgumentParser(description="Academic Search Engine - Multi-API Search")
-    parser.add_argument('--query', required=True, help='Search query')
+    query_group = parser.add_mutually_exclusive_group(required=True)
+    query_group.add_argument('--query', help='Search query')
+    query_group.add_argument('--queries-file',
+                             help='JSON file mapping source to query or list of queries '
+                                  '(runs all pairs as one batch via search_many)')
     parser.add_argument('--mode', choices=['quick', 'standard', 'deep'], default='standard',
                         help='Research mode (determines limit)')
     parser.add_argument('--limit', type=int, help='Max number of papers (overrides mode)')
@@ -375,6 +1322,11 @@ def main():
                         help='API sources to search (default: all)')
     parser.add_argument('--output', help='Output JSON file path (default: stdout)')
     parser.add_argument('--parallel', action='store_true', help='Use parallel search (faster)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Use async-native search (pooled HTTP/2 clients)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the API response cache')
+    parser.add_argument('--hydrate-top-k', type=int, default=None,
+                        help='Two-phase search: fetch metadata only, then abstracts for the top K papers')
     parser.add_argument('--test', action='store_true', help='Run tests instead of search')
 
     args = parser.parse_args()
@@ -384,6 +1336,16 @@ def main():
         _run_tests()
         return
 
+    queries_by_source = None
+    if args.queries_file:
+        with open(args.queries_file) as f:
+            queries_by_source = json.load(f)
+        if args.sources:
+            queries_by_source = {
+                source: queries for source, queries in queries_by_source.items()
+                if source in args.sources
+            }
+
     # Determine limit from mode
     mode_limits = {
         'quick': 15,
@@ -393,20 +1355,47 @@ def main():
     limit = args.limit or mode_limits.get(args.mode, 25)
 
     try:
-        # Initialize search engine
-        engine = SearchEngine()
+        # Initialize search engine (config enables API keys + response cache)
+        try:
+            from src.utils.config import ConfigLoader
+            api_config = ConfigLoader().load_api_config()
+        except Exception as e:
+            print(f"Config not loaded ({e}), using defaults", file=sys.stderr)
+            api_config = None
+
+        engine = SearchEngine(api_config=api_config, use_cache=not args.no_cache)
 
         # Perform search — always use parallel to enforce per-source timeouts
         # Sequential search() has no timeout guard; search_parallel() uses future.result(timeout=30)
-        papers = engine.search_parallel(args.query, limit=limit, sources=args.sources)
+        two_phase = args.hydrate_top_k is not None
+        if queries_by_source is not None:
+            papers = engine.search_many(queries_by_source, limit=limit)
+        elif args.use_async:
+            async def _run_async():
+                async with engine:
+                    found = await engine.asearch(
+                        args.query, limit=limit, sources=args.sources, metadata_only=two_phase
+                    )
+                    if two_phase:
+                        await engine.ahydrate(found, top_k=args.hydrate_top_k)
+                    return found
+
+            papers = asyncio.run(_run_async())
+        else:
+            papers = engine.search_parallel(
+                args.query, limit=limit, sources=args.sources, metadata_only=two_phase
+            )
+            if two_phase:
+                engine.hydrate(papers, top_k=args.hydrate_top_k)
 
         # Convert to JSON-serializable format
         results = {
-            "query": args.query,
+            "query": args.query if queries_by_source is None else queries_by_source,
             "mode": args.mode,
             "total_found": len(papers),
             "limit": limit,
-            "sources": args.sources or ["crossref", "openalex", "semantic_scholar"],
+            "sources": (args.sources or ["crossref", "openalex", "semantic_scholar"]
+                        if queries_by_source is None else list(queries_by_source)),
             "papers": [
                 {
                     "doi": p.doi,
@@ -481,6 +1470,16 @@ def _run_tests():
         papers = engine.search("AI Ethics", limit=5)
         print(f"✅ Found {len(papers)} papers via context manager")
 
+    # Test 5: Async search
+    print("\n5. Testing async search...")
+
+    async def _async_test():
+        async with SearchEngine() as engine:
+            return await engine.asearch("DevOps Governance", limit=10)
+
+    papers = asyncio.run(_async_test())
+    print(f"✅ Found {len(papers)} unique papers (async)")
+
     print("\n✅ All tests passed!")
     print(f"\n💡 TIP: Use search_parallel() for faster results!")
 
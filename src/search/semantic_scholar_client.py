@@ -8,6 +8,13 @@ Features:
 - Optional: API-Key für 1 req/s (schneller)
 - Semantic Search (Natural Language)
 - Citation-Counts included
+- Async API (asearch/aget_by_doi) mit gepooltem httpx.AsyncClient
+- Optional: Persistenter Response Cache (ResponseCache)
+- Deep Pagination via offset/next (search_iter, streamt Papers Seite für Seite)
+- Batch DOI Lookup (get_by_dois, POST /paper/batch mit bis zu 500 IDs pro Request)
+- Metadata-only Suche (metadata_only: ohne Abstract/Autoren, Hydration via get_by_dois)
+- Bulk Search (search_bulk/asearch_bulk, /paper/search/bulk: 1000 Papers pro Request,
+  Continuation Tokens, Sortierung, Year/Field-of-Study Filter - Deep Research)
 - 200M+ Papers verfügbar
 
 Standard-Modus (Anonymous):
@@ -19,19 +26,45 @@ Enhanced-Modus (Optional):
     papers = client.search("DevOps Governance", limit=20)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Set
+import asyncio
 import logging
+import re
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-
-from src.utils.rate_limiter import RateLimiter
-from src.utils.retry import RateLimitError, ServerError, raise_for_status_with_retry
-from src.search.crossref_client import Paper
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from src.utils.rate_limiter import RateLimiter, AsyncRateLimiter, PRIORITY_BULK, PRIORITY_INTERACTIVE
+from src.utils.http_pool import AsyncClientPool
+from src.utils.cache import ResponseCache
+from src.utils.fast_json import response_json
+from src.utils.retry import (
+    RateLimitError, ServerError, raise_for_status_with_retry, wait_retry_after,
+    retry_if_source_healthy, get_circuit_breaker
+)
+from src.search.crossref_client import Paper, normalize_doi
 
 # Setup Logging
 logger = logging.getLogger(__name__)
 
+# Boolean operators → /paper/search/bulk syntax (+ AND, | OR, - NOT)
+_BULK_NOT_PATTERN = re.compile(r'\bNOT\s+')
+_BULK_AND_PATTERN = re.compile(r'\s+AND\s+')
+_BULK_OR_PATTERN = re.compile(r'\s+OR\s+')
+
+
+def to_bulk_query(query: str) -> str:
+    """
+    Translate AND/OR/NOT queries (Query Generator) to bulk search syntax
+
+    Example:
+        to_bulk_query('DevOps AND (governance OR compliance) NOT survey')
+        # → 'DevOps + (governance | compliance) -survey'
+    """
+    query = _BULK_NOT_PATTERN.sub("-", query)
+    query = _BULK_AND_PATTERN.sub(" + ", query)
+    return _BULK_OR_PATTERN.sub(" | ", query)
+
 
 # ============================================
 # Semantic Scholar API Client
@@ -55,11 +88,23 @@ class SemanticScholarClient:
     """
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    SEARCH_ENDPOINT = "/paper/search"
+    DOI_FIELDS = "paperId,externalIds,title,authors,year,abstract,venue,citationCount,url"
+    METADATA_FIELDS = ["paperId", "externalIds", "title", "year", "venue", "citationCount", "url"]
+    MAX_SEARCH_OFFSET = 1000  # /paper/search: offset + limit <= 1000
+    DOI_BATCH_SIZE = 500  # POST /paper/batch: max 500 IDs
+    BULK_SEARCH_ENDPOINT = "/paper/search/bulk"
+    BULK_PAGE_SIZE = 1000  # /paper/search/bulk: 1000 papers per request (fixed)
+    BULK_SORT_FIELDS = ("paperId", "publicationDate", "citationCount")
 
     def __init__(
         self,
         api_key: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        cache: Optional[ResponseCache] = None,
+        keep_raw_data: bool = False,
+        adaptive: bool = True,
+        max_rate: Optional[float] = None
     ):
         """
         Initialize Semantic Scholar Client
@@ -67,20 +112,32 @@ class SemanticScholarClient:
         Args:
             api_key: Optional API key for 1 req/s (ohne: 100 req/5min)
             timeout: Request timeout in seconds (default: 30)
+            cache: Optional ResponseCache for search/get_by_doi responses
+            keep_raw_data: Retain the API JSON on Paper.raw_data (compressed, default: False)
+            adaptive: AIMD rate adaptation to 429/Retry-After/X-RateLimit-* (default: True)
+            max_rate: Upper rate bound in adaptive mode (default: base rate)
         """
         self.api_key = api_key
         self.timeout = timeout
+        self.cache = cache
+        self.keep_raw_data = keep_raw_data
 
         # Rate Limiter
         # Anonymous: 0.33 req/s (100 req/5min)
         # With Key: 1 req/s
         if api_key:
-            self.rate_limiter = RateLimiter(requests_per_second=1)
+            self.rate_limiter = RateLimiter(requests_per_second=1, adaptive=adaptive, max_rate=max_rate)
+            self.async_rate_limiter = AsyncRateLimiter(requests_per_second=1, adaptive=adaptive, max_rate=max_rate)
             logger.info(f"Semantic Scholar: Enhanced Mode (API key set)")
         else:
-            self.rate_limiter = RateLimiter(requests_per_second=0.33)  # ~100 req/5min
+            # ~100 req/5min
+            self.rate_limiter = RateLimiter(requests_per_second=0.33, adaptive=adaptive, max_rate=max_rate)
+            self.async_rate_limiter = AsyncRateLimiter(requests_per_second=0.33, adaptive=adaptive, max_rate=max_rate)
             logger.info(f"Semantic Scholar: Standard Mode (anonymous)")
 
+        # Circuit Breaker (prozessweit pro Source geteilt, siehe SearchEngine/PDFFetcher)
+        self.circuit_breaker = get_circuit_breaker("semantic_scholar")
+
         # HTTP Client
         headers = {
             "User-Agent": "AcademicAgentV2/1.0",
@@ -94,17 +151,25 @@ class SemanticScholarClient:
             timeout=httpx.Timeout(timeout, connect=10.0)
         )
 
+        # Async HTTP Client (lazy, HTTP/2 + Keep-Alive)
+        self._async_pool = AsyncClientPool(
+            headers=headers,
+            timeout=httpx.Timeout(timeout, connect=10.0)
+        )
+
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=1, max=10),
-        retry=retry_if_exception_type((RateLimitError, ServerError)),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
         reraise=True
     )
     def search(
         self,
         query: str,
         limit: int = 20,
-        fields: Optional[List[str]] = None
+        fields: Optional[List[str]] = None,
+        use_cache: bool = True,
+        metadata_only: bool = False
     ) -> List[Paper]:
         """
         Search Semantic Scholar API
@@ -113,6 +178,10 @@ class SemanticScholarClient:
             query: Search query (natural language or keywords)
             limit: Max results (default: 20, max: 100)
             fields: Optional fields to retrieve (default: all relevant fields)
+            use_cache: Read from response cache (default: True). False bypasses
+                       the lookup but still refreshes the cached entry.
+            metadata_only: Skip abstracts/authors (lightweight first phase,
+                           see SearchEngine.hydrate)
 
         Returns:
             List of Paper objects
@@ -121,89 +190,607 @@ class SemanticScholarClient:
             papers = client.search("DevOps governance", limit=15)
             papers = client.search("machine learning ethics", limit=20)
         """
+        # Build Request
+        params = self._build_search_params(query, limit, fields, metadata_only)
+
+        # Cache Lookup (hit skips rate limiter + network)
+        if use_cache and self.cache:
+            cached = self.cache.get(self.SEARCH_ENDPOINT, params)
+            if cached is not None:
+                logger.debug(f"Semantic Scholar cache hit: query='{query}'")
+                return self._parse_search_response(cached, query, limit)
+
         # Rate Limiting
+        self.circuit_breaker.before_call()
         self.rate_limiter.acquire()
 
+        logger.debug(f"Semantic Scholar search: query='{query}', limit={limit}")
+
+        try:
+            # API Call
+            response = self.client.get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+            raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+            data = response_json(response)
+            if self.cache:
+                self.cache.set(self.SEARCH_ENDPOINT, params, data)
+
+            return self._parse_search_response(data, query, limit)
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Semantic Scholar timeout: {e}")
+            self.circuit_breaker.record_failure()
+            return []
+        except Exception as e:
+            logger.error(f"Semantic Scholar search failed: {e}")
+            raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    async def asearch(
+        self,
+        query: str,
+        limit: int = 20,
+        fields: Optional[List[str]] = None,
+        use_cache: bool = True,
+        metadata_only: bool = False
+    ) -> List[Paper]:
+        """
+        Search Semantic Scholar API (async)
+
+        Same semantics as search(), but uses the pooled httpx.AsyncClient
+        and the AsyncRateLimiter.
+
+        Example:
+            papers = await client.asearch("DevOps governance", limit=15)
+        """
+        # Build Request
+        params = self._build_search_params(query, limit, fields, metadata_only)
+
+        # Cache Lookup (hit skips rate limiter + network)
+        if use_cache and self.cache:
+            cached = await asyncio.to_thread(self.cache.get, self.SEARCH_ENDPOINT, params)
+            if cached is not None:
+                logger.debug(f"Semantic Scholar cache hit: query='{query}'")
+                return self._parse_search_response(cached, query, limit)
+
+        # Rate Limiting
+        self.circuit_breaker.before_call()
+        await self.async_rate_limiter.acquire()
+
+        logger.debug(f"Semantic Scholar async search: query='{query}', limit={limit}")
+
+        try:
+            # API Call
+            response = await self._async_pool.get().get(f"{self.BASE_URL}{self.SEARCH_ENDPOINT}", params=params)
+            raise_for_status_with_retry(response, self.async_rate_limiter, self.circuit_breaker)
+
+            data = response_json(response)
+            if self.cache:
+                await asyncio.to_thread(self.cache.set, self.SEARCH_ENDPOINT, params, data)
+
+            return self._parse_search_response(data, query, limit)
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Semantic Scholar timeout: {e}")
+            self.circuit_breaker.record_failure()
+            return []
+        except Exception as e:
+            logger.error(f"Semantic Scholar search failed: {e}")
+            raise
+
+    def search_iter(
+        self,
+        query: str,
+        max_results: int = 1000,
+        fields: Optional[List[str]] = None,
+        page_size: int = 100,
+        metadata_only: bool = False
+    ) -> Iterator[Paper]:
+        """
+        Stream search results page by page (offset-based paging)
+
+        Follows the offset/next fields of /paper/search. S2 serves at most
+        the first 1000 relevance-ranked results this way. Papers are yielded
+        as each page arrives; only one page is held in memory.
+
+        Args:
+            query: Search query
+            max_results: Max papers to yield in total (default: 1000)
+            fields: Optional fields to retrieve (see search())
+            page_size: Results per request (default/max: 100)
+            metadata_only: Skip abstracts/authors (see search())
+
+        Yields:
+            Paper objects (only papers with DOI)
+
+        Example:
+            for paper in client.search_iter("machine learning ethics", max_results=500):
+                process(paper)
+        """
+        page_size = max(1, min(page_size, 100))  # S2 max: 100
+        params = self._build_search_params(query, page_size, fields, metadata_only)
+        params["offset"] = 0
+
+        yielded = 0
+        while yielded < max_results and params["offset"] < self.MAX_SEARCH_OFFSET:
+            # offset + limit must stay within the relevance search window
+            params["limit"] = min(page_size, self.MAX_SEARCH_OFFSET - params["offset"])
+
+            try:
+                data = self._fetch_page(params)
+            except httpx.TimeoutException as e:
+                logger.error(f"Semantic Scholar timeout during pagination: {e}")
+                self.circuit_breaker.record_failure()
+                return
+
+            papers_data = data.get("data", [])
+
+            for paper_data in papers_data:
+                paper = self._parse_paper(paper_data)
+                if not paper:
+                    continue
+                yield paper
+                yielded += 1
+                if yielded >= max_results:
+                    return
+
+            next_offset = data.get("next")
+            if next_offset is None or not papers_data:
+                break
+            params["offset"] = next_offset
+
+        logger.info(f"Semantic Scholar pagination yielded {yielded} papers for query: '{query}'")
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    def _fetch_page(self, params: Dict[str, Any], endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch one search page (rate limited, retried on 429/5xx)"""
+        self.circuit_breaker.before_call()
+        self.rate_limiter.acquire()
+
+        response = self.client.get(f"{self.BASE_URL}{endpoint or self.SEARCH_ENDPOINT}", params=params)
+        raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+        return response_json(response)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    async def _afetch_page(self, params: Dict[str, Any], endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch one search page (async, rate limited, retried on 429/5xx)"""
+        self.circuit_breaker.before_call()
+        await self.async_rate_limiter.acquire()
+
+        response = await self._async_pool.get().get(
+            f"{self.BASE_URL}{endpoint or self.SEARCH_ENDPOINT}", params=params
+        )
+        raise_for_status_with_retry(response, self.async_rate_limiter, self.circuit_breaker)
+
+        return response_json(response)
+
+    # ============================================
+    # Bulk Search (/paper/search/bulk)
+    # ============================================
+
+    def search_bulk_iter(
+        self,
+        query: str,
+        max_results: int = 1000,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None,
+        year: Optional[str] = None,
+        fields_of_study: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        metadata_only: bool = False,
+        use_cache: bool = True
+    ) -> Iterator[Paper]:
+        """
+        Stream results of /paper/search/bulk (continuation tokens)
+
+        Bulk Search liefert bis zu 1000 Papers pro Request (statt 100) und
+        ist nicht auf die ersten 1000 Treffer begrenzt - bei 0.33 req/s die
+        ergiebigste Quelle für Deep Research. Ergebnisse sind NICHT nach
+        Relevanz sortiert (ohne sort: paperId-Reihenfolge), Ranking übernimmt
+        der Scorer.
+
+        Args:
+            query: Search query (AND/OR/NOT werden in Bulk-Syntax +/|/- übersetzt)
+            max_results: Max papers to yield in total (default: 1000)
+            filters: Optional raw bulk parameters, e.g.
+                     {"publicationTypes": ["JournalArticle"], "minCitationCount": 10,
+                      "sort": "citationCount:desc"}
+            sort: "<paperId|publicationDate|citationCount>[:asc|:desc]"
+            year: Year or range ("2020", "2019-2023", "2018-", "-2015")
+            fields_of_study: e.g. ["Computer Science", "Business"]
+            fields: Optional fields to retrieve (see search())
+            metadata_only: Skip abstracts/authors (see search())
+            use_cache: Read pages from response cache (default: True)
+
+        Yields:
+            Paper objects (only papers with DOI)
+
+        Raises:
+            ValueError: Invalid sort option
+
+        Example:
+            for paper in client.search_bulk_iter("devops + governance", max_results=3000,
+                                                 year="2018-", sort="citationCount:desc"):
+                process(paper)
+        """
+        params = self._build_bulk_params(query, filters, sort, year, fields_of_study, fields, metadata_only)
+
+        yielded = 0
+        while yielded < max_results:
+            cached = self._get_cached_page(params, use_cache)
+            try:
+                data = cached if cached is not None else self._fetch_page(params, self.BULK_SEARCH_ENDPOINT)
+            except httpx.TimeoutException as e:
+                logger.error(f"Semantic Scholar timeout during bulk search: {e}")
+                self.circuit_breaker.record_failure()
+                return
+            if cached is None and self.cache:
+                self.cache.set(self.BULK_SEARCH_ENDPOINT, params, data)
+
+            papers_data = data.get("data") or []
+            for paper_data in papers_data:
+                paper = self._parse_paper(paper_data)
+                if not paper:
+                    continue
+                yield paper
+                yielded += 1
+                if yielded >= max_results:
+                    return
+
+            token = data.get("token")
+            if not token or not papers_data:
+                break
+            params["token"] = token
+
+        logger.info(f"Semantic Scholar bulk search yielded {yielded} papers for query: '{query}'")
+
+    def search_bulk(self, query: str, limit: int = 1000, **kwargs) -> List[Paper]:
+        """
+        Bulk search as list (see search_bulk_iter for arguments)
+
+        Example:
+            papers = client.search_bulk("devops governance", limit=500, year="2019-")
+        """
+        return list(self.search_bulk_iter(query, max_results=limit, **kwargs))
+
+    async def asearch_bulk(
+        self,
+        query: str,
+        limit: int = 1000,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None,
+        year: Optional[str] = None,
+        fields_of_study: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        metadata_only: bool = False,
+        use_cache: bool = True
+    ) -> List[Paper]:
+        """
+        Bulk search (async, same semantics as search_bulk)
+
+        Example:
+            papers = await client.asearch_bulk("devops governance", limit=500)
+        """
+        params = self._build_bulk_params(query, filters, sort, year, fields_of_study, fields, metadata_only)
+
+        papers: List[Paper] = []
+        while len(papers) < limit:
+            cached = await asyncio.to_thread(self._get_cached_page, params, use_cache)
+            try:
+                data = cached if cached is not None else await self._afetch_page(params, self.BULK_SEARCH_ENDPOINT)
+            except httpx.TimeoutException as e:
+                logger.error(f"Semantic Scholar timeout during bulk search: {e}")
+                self.circuit_breaker.record_failure()
+                break
+            if cached is None and self.cache:
+                await asyncio.to_thread(self.cache.set, self.BULK_SEARCH_ENDPOINT, params, data)
+
+            papers_data = data.get("data") or []
+            for paper_data in papers_data:
+                paper = self._parse_paper(paper_data)
+                if paper:
+                    papers.append(paper)
+
+            token = data.get("token")
+            if not token or not papers_data:
+                break
+            params["token"] = token
+
+        logger.info(f"Semantic Scholar bulk search found {len(papers)} papers for query: '{query}'")
+        return papers[:limit]
+
+    def _get_cached_page(self, params: Dict[str, Any], use_cache: bool) -> Optional[Dict[str, Any]]:
+        """Cached bulk page (None on miss or without cache)"""
+        if not (use_cache and self.cache):
+            return None
+        return self.cache.get(self.BULK_SEARCH_ENDPOINT, params)
+
+    def _build_bulk_params(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None,
+        year: Optional[str] = None,
+        fields_of_study: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        metadata_only: bool = False
+    ) -> Dict[str, Any]:
+        """Build query parameters for /paper/search/bulk"""
+        params = self._build_search_params(query, self.BULK_PAGE_SIZE, fields, metadata_only)
+        params.pop("limit")  # bulk pages are fixed at 1000
+        params["query"] = to_bulk_query(query)
+
+        filters = dict(filters or {})
+        sort = sort or filters.pop("sort", None)
+        if year:
+            filters["year"] = year
+        if fields_of_study:
+            filters["fieldsOfStudy"] = fields_of_study
+
+        for key, value in filters.items():
+            if value is None:
+                continue
+            params[key] = ",".join(value) if isinstance(value, (list, tuple)) else str(value)
+
+        if sort:
+            sort_field, _, order = sort.partition(":")
+            if sort_field not in self.BULK_SORT_FIELDS or order not in ("", "asc", "desc"):
+                raise ValueError(
+                    f"Invalid sort '{sort}' (expected <{'|'.join(self.BULK_SORT_FIELDS)}>[:asc|:desc])"
+                )
+            params["sort"] = sort
+
+        return params
+
+    def _build_search_params(
+        self,
+        query: str,
+        limit: int,
+        fields: Optional[List[str]] = None,
+        metadata_only: bool = False
+    ) -> Dict[str, Any]:
+        """Build query parameters for /paper/search"""
         # Default fields
-        if not fields:
+        if not fields and metadata_only:
+            fields = self.METADATA_FIELDS
+        elif not fields:
             fields = [
                 "paperId", "externalIds", "title", "authors", "year",
                 "abstract", "venue", "publicationDate", "citationCount", "url"
             ]
 
-        # Build Request
-        params = {
+        return {
             "query": query,
             "limit": min(limit, 100),  # S2 max: 100
             "fields": ",".join(fields)
         }
 
-        logger.debug(f"Semantic Scholar search: query='{query}', limit={limit}")
+    def _parse_search_response(self, data: Dict[str, Any], query: str, limit: int) -> List[Paper]:
+        """Parse /paper/search response to Paper objects"""
+        papers_data = data.get("data", [])
+        papers = []
+        for paper_data in papers_data:
+            paper = self._parse_paper(paper_data)
+            if paper:
+                papers.append(paper)
+
+        logger.info(f"Semantic Scholar found {len(papers)} papers for query: '{query}'")
+        return papers[:limit]
+
+    def get_by_doi(self, doi: str, use_cache: bool = True) -> Optional[Paper]:
+        """
+        Get single paper by DOI
+
+        Args:
+            doi: Paper DOI (e.g., "10.1109/MS.2022.1234567")
+            use_cache: Read from response cache (default: True)
+
+        Returns:
+            Paper object or None if not found
+        """
+        # Normalize DOI
+        doi = normalize_doi(doi)
+
+        # S2 uses DOI as external ID
+        endpoint = f"/paper/DOI:{doi}"
+        params = {"fields": self.DOI_FIELDS}
+
+        # Cache Lookup
+        if use_cache and self.cache:
+            cached = self.cache.get(endpoint, params)
+            if cached is not None:
+                return self._parse_paper(cached)
+
+        logger.debug(f"Semantic Scholar get_by_doi: {doi}")
 
         try:
-            # API Call
-            response = self.client.get(f"{self.BASE_URL}/paper/search", params=params)
-            raise_for_status_with_retry(response)
+            # Rate Limiting
+            self.circuit_breaker.before_call()
+            self.rate_limiter.acquire(priority=PRIORITY_INTERACTIVE)
 
-            data = response.json()
+            response = self.client.get(f"{self.BASE_URL}{endpoint}", params=params)
 
-            # Parse Results
-            papers_data = data.get("data", [])
-            papers = []
-            for paper_data in papers_data:
-                paper = self._parse_paper(paper_data)
-                if paper:
-                    papers.append(paper)
+            if response.status_code == 404:
+                logger.warning(f"DOI not found: {doi}")
+                return None
 
-            logger.info(f"Semantic Scholar found {len(papers)} papers for query: '{query}'")
-            return papers[:limit]
+            raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+            paper_data = response_json(response)
+            if self.cache:
+                self.cache.set(endpoint, params, paper_data)
+
+            return self._parse_paper(paper_data)
 
         except httpx.TimeoutException as e:
-            logger.error(f"Semantic Scholar timeout: {e}")
-            return []
+            logger.error(f"Semantic Scholar get_by_doi timeout for {doi}: {e}")
+            self.circuit_breaker.record_failure()
+            return None
         except Exception as e:
-            logger.error(f"Semantic Scholar search failed: {e}")
-            raise
+            logger.error(f"Semantic Scholar get_by_doi failed: {e}")
+            return None
 
-    def get_by_doi(self, doi: str) -> Optional[Paper]:
+    async def aget_by_doi(self, doi: str, use_cache: bool = True) -> Optional[Paper]:
         """
-        Get single paper by DOI
+        Get single paper by DOI (async)
 
         Args:
             doi: Paper DOI (e.g., "10.1109/MS.2022.1234567")
+            use_cache: Read from response cache (default: True)
 
         Returns:
             Paper object or None if not found
         """
-        # Rate Limiting
-        self.rate_limiter.acquire()
-
         # Normalize DOI
-        doi = doi.strip()
+        doi = normalize_doi(doi)
 
-        logger.debug(f"Semantic Scholar get_by_doi: {doi}")
+        # S2 uses DOI as external ID
+        endpoint = f"/paper/DOI:{doi}"
+        params = {"fields": self.DOI_FIELDS}
+
+        # Cache Lookup
+        if use_cache and self.cache:
+            cached = await asyncio.to_thread(self.cache.get, endpoint, params)
+            if cached is not None:
+                return self._parse_paper(cached)
+
+        logger.debug(f"Semantic Scholar async get_by_doi: {doi}")
 
         try:
-            # S2 uses DOI as external ID
-            fields = "paperId,externalIds,title,authors,year,abstract,venue,citationCount,url"
-            response = self.client.get(f"{self.BASE_URL}/paper/DOI:{doi}", params={"fields": fields})
+            # Rate Limiting
+            self.circuit_breaker.before_call()
+            await self.async_rate_limiter.acquire(priority=PRIORITY_INTERACTIVE)
+
+            response = await self._async_pool.get().get(f"{self.BASE_URL}{endpoint}", params=params)
 
             if response.status_code == 404:
                 logger.warning(f"DOI not found: {doi}")
                 return None
 
-            raise_for_status_with_retry(response)
+            raise_for_status_with_retry(response, self.async_rate_limiter, self.circuit_breaker)
+
+            paper_data = response_json(response)
+            if self.cache:
+                await asyncio.to_thread(self.cache.set, endpoint, params, paper_data)
 
-            paper_data = response.json()
             return self._parse_paper(paper_data)
 
         except httpx.TimeoutException as e:
             logger.error(f"Semantic Scholar get_by_doi timeout for {doi}: {e}")
+            self.circuit_breaker.record_failure()
             return None
         except Exception as e:
             logger.error(f"Semantic Scholar get_by_doi failed: {e}")
             return None
 
+    def get_by_dois(
+        self,
+        dois: List[str],
+        use_cache: bool = True,
+        failed: Optional[Set[str]] = None
+    ) -> Dict[str, Paper]:
+        """
+        Get many papers by DOI with batched requests
+
+        Uses POST /paper/batch with up to DOI_BATCH_SIZE IDs per request
+        instead of one round trip per DOI (3s each at anonymous speed).
+        Cached DOIs are served without a request.
+
+        Args:
+            dois: List of DOIs (duplicates and prefixes are normalized)
+            use_cache: Read from response cache (default: True)
+            failed: Optional set that receives the DOIs of failed batch
+                    requests (absent because of an error, not unknown)
+
+        Returns:
+            Dict mapping normalized DOI to Paper (unresolved DOIs are absent)
+
+        Example:
+            papers = client.get_by_dois(["10.1109/MS.2022.1234567", "10.1145/3456789"])
+        """
+        results: Dict[str, Paper] = {}
+        pending = []
+        params = {"fields": self.DOI_FIELDS}
+
+        for doi in dict.fromkeys(normalize_doi(d) for d in dois):
+            if not doi:
+                continue
+            if use_cache and self.cache:
+                cached = self.cache.get(f"/paper/DOI:{doi}", params)
+                if cached is not None:
+                    paper = self._parse_paper(cached)
+                    if paper:
+                        results[doi] = paper
+                        continue
+            pending.append(doi)
+
+        for i in range(0, len(pending), self.DOI_BATCH_SIZE):
+            batch = pending[i:i + self.DOI_BATCH_SIZE]
+            try:
+                items = self._fetch_doi_batch(batch)
+            except httpx.TimeoutException as e:
+                logger.error(f"Semantic Scholar get_by_dois batch timeout: {e}")
+                self.circuit_breaker.record_failure()
+                if failed is not None:
+                    failed.update(batch)
+                continue
+            except Exception as e:
+                logger.error(f"Semantic Scholar get_by_dois batch failed: {e}")
+                if failed is not None:
+                    failed.update(batch)
+                continue
+
+            # Response is aligned with the requested IDs (null = not found)
+            for doi, paper_data in zip(batch, items):
+                if not paper_data:
+                    continue
+                paper = self._parse_paper(paper_data)
+                if not paper:
+                    continue
+                results[doi] = paper
+                if self.cache:
+                    self.cache.set(f"/paper/DOI:{doi}", params, paper_data)
+
+        logger.info(f"Semantic Scholar get_by_dois: {len(results)} papers resolved "
+                    f"({len(pending)} DOIs fetched)")
+        return results
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)),
+        retry=retry_if_source_healthy((RateLimitError, ServerError)),
+        reraise=True
+    )
+    def _fetch_doi_batch(self, dois: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Fetch papers for a batch of normalized DOIs (one request)"""
+        self.circuit_breaker.before_call()
+        self.rate_limiter.acquire(priority=PRIORITY_BULK)
+
+        response = self.client.post(
+            f"{self.BASE_URL}/paper/batch",
+            params={"fields": self.DOI_FIELDS},
+            json={"ids": [f"DOI:{doi}" for doi in dois]}
+        )
+        raise_for_status_with_retry(response, self.rate_limiter, self.circuit_breaker)
+
+        return response_json(response)
+
     def _parse_paper(self, paper_data: Dict[str, Any]) -> Optional[Paper]:
         """
         Parse Semantic Scholar paper to Paper object
@@ -257,13 +844,17 @@ class SemanticScholarClient:
             source_api="semantic_scholar",
             url=url,
             citations=citations,
-            raw_data=paper_data
+            raw_data=paper_data if self.keep_raw_data else None
         )
 
     def close(self):
         """Close HTTP client"""
         self.client.close()
 
+    async def aclose(self):
+        """Close async HTTP client pool"""
+        await self._async_pool.aclose()
+
     def __enter__(self):
         """Context manager entry"""
         return self
@@ -272,6 +863,14 @@ class SemanticScholarClient:
         """Context manager exit"""
         self.close()
 
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
+
 
 # ============================================
 # Convenience Functions
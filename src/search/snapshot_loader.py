@@ -0,0 +1,277 @@
+"""
+Snapshot Loader für Academic Agent v2.3+
+
+Lädt OpenAlex Works Snapshots bzw. CrossRef Public Data Files (JSONL.gz
+Shards) in einen lokalen Offline-Index - für air-gapped Betrieb und
+High-Volume Recherchen ohne API Rate Limits.
+
+Features:
+- Streaming: Shards werden Zeile für Zeile gelesen (gzip), nie komplett geladen
+- Gleiches Paper-Format wie die API Clients (OpenAlexClient/CrossRefClient._parse_work)
+- Paralleles Ingest über Shards (ProcessPool, ein Shard pro Worker)
+- Bounded Memory: pro Worker max. batch_size Papers im Speicher
+- On-Disk Index: SQLite FTS5 (CorpusStore-Format), Upsert per DOI
+- SearchEngine Source "offline"
+
+Formate:
+- openalex: eine Work pro Zeile (openalex-snapshot/data/works/**/part_*.gz)
+- crossref: eine Work pro Zeile (.jsonl.gz) oder {"items": [...]} pro Zeile/Datei (.json.gz)
+
+Usage:
+    from src.search.snapshot_loader import SnapshotLoader
+
+    loader = SnapshotLoader("openalex", index_file=Path("offline_index.db"))
+    stats = loader.ingest(sorted(Path("works").rglob("*.gz")))
+
+CLI:
+    python -m src.search.snapshot_loader --format openalex --index offline_index.db works/*.gz
+"""
+
+import gzip
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.search.corpus_store import CorpusStore
+from src.utils.fast_json import loads
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMATS = ("openalex", "crossref")
+
+
+# ============================================
+# Reading
+# ============================================
+
+def iter_snapshot_works(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream work records from a snapshot shard
+
+    Args:
+        path: .gz (or plain) JSON lines file
+
+    Yields:
+        Work dicts (CrossRef {"items": [...]} containers are unpacked)
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"{path}:{line_no}: invalid JSON skipped ({e})")
+                continue
+
+            if isinstance(record, dict) and isinstance(record.get("items"), list):
+                yield from record["items"]
+            elif isinstance(record, dict):
+                yield record
+
+
+def _create_parser(snapshot_format: str):
+    """Parser with the same output as the API clients (no network used)"""
+    if snapshot_format == "openalex":
+        from src.search.openalex_client import OpenAlexClient
+        return OpenAlexClient()
+    if snapshot_format == "crossref":
+        from src.search.crossref_client import CrossRefClient
+        return CrossRefClient()
+    raise ValueError(f"Unknown snapshot format: {snapshot_format} (expected one of {SNAPSHOT_FORMATS})")
+
+
+# ============================================
+# Worker
+# ============================================
+
+def _ingest_shard(args: Tuple[str, str, str, int]) -> Dict[str, Any]:
+    """
+    Ingest one shard into the index (runs in a worker process)
+
+    Args:
+        args: (shard path, snapshot format, index file, batch size)
+
+    Returns:
+        Stats dict for this shard
+    """
+    shard, snapshot_format, index_file, batch_size = args
+
+    parser = _create_parser(snapshot_format)
+    index = CorpusStore(db_file=Path(index_file))
+    stats = {"shard": shard, "works": 0, "papers": 0, "skipped": 0}
+
+    batch = []
+    try:
+        for work in iter_snapshot_works(Path(shard)):
+            stats["works"] += 1
+            try:
+                paper = parser._parse_work(work)
+            except Exception as e:
+                logger.debug(f"{shard}: parse error ({e})")
+                paper = None
+
+            if paper is None or not paper.doi:
+                stats["skipped"] += 1
+                continue
+
+            batch.append(paper)
+            if len(batch) >= batch_size:
+                stats["papers"] += index.upsert(batch)
+                batch = []
+
+        if batch:
+            stats["papers"] += index.upsert(batch)
+    finally:
+        parser.close()
+
+    return stats
+
+
+# ============================================
+# SnapshotLoader
+# ============================================
+
+class SnapshotLoader:
+    """
+    Parallel, memory-bounded snapshot ingestion into an offline index
+
+    Jeder Worker-Prozess parst einen Shard und schreibt Batches direkt in
+    den SQLite Index (WAL, Schreiber warten per busy_timeout aufeinander).
+    """
+
+    def __init__(
+        self,
+        snapshot_format: str,
+        index_file: Optional[Path] = None,
+        batch_size: int = 2000,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Args:
+            snapshot_format: "openalex" oder "crossref"
+            index_file: Offline Index Pfad (default: ~/.cache/academic_agent/offline_index.db)
+            batch_size: Papers pro Upsert (bestimmt Speicherbedarf pro Worker)
+            max_workers: Parallele Worker-Prozesse (default: CPU-Anzahl)
+        """
+        if snapshot_format not in SNAPSHOT_FORMATS:
+            raise ValueError(f"Unknown snapshot format: {snapshot_format} (expected one of {SNAPSHOT_FORMATS})")
+
+        self.snapshot_format = snapshot_format
+        self.index_file = Path(index_file) if index_file else default_offline_index_file()
+        self.batch_size = batch_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def ingest(self, shards: List[Path]) -> Dict[str, int]:
+        """
+        Ingest shards into the offline index
+
+        Args:
+            shards: Snapshot shard files
+
+        Returns:
+            Totals: {"shards", "works", "papers", "skipped", "failed"}
+        """
+        # Create schema once before workers start writing
+        CorpusStore(db_file=self.index_file)
+
+        totals = {"shards": len(shards), "works": 0, "papers": 0, "skipped": 0, "failed": 0}
+        jobs = [(str(shard), self.snapshot_format, str(self.index_file), self.batch_size) for shard in shards]
+
+        logger.info(f"SnapshotLoader: ingesting {len(jobs)} {self.snapshot_format} shards "
+                    f"with {self.max_workers} workers → {self.index_file}")
+
+        if self.max_workers <= 1:
+            results = []
+            for job in jobs:
+                try:
+                    results.append(_ingest_shard(job))
+                except Exception as e:
+                    logger.error(f"SnapshotLoader: shard {job[0]} failed: {e}")
+                    totals["failed"] += 1
+        else:
+            results = []
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {pool.submit(_ingest_shard, job): job[0] for job in jobs}
+                for future in as_completed(futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        logger.error(f"SnapshotLoader: shard {futures[future]} failed: {e}")
+                        totals["failed"] += 1
+
+        for stats in results:
+            logger.info(f"  {stats['shard']}: {stats['papers']} papers ({stats['skipped']} skipped)")
+            for key in ("works", "papers", "skipped"):
+                totals[key] += stats[key]
+
+        logger.info(f"SnapshotLoader: {totals['papers']} papers from {totals['works']} works "
+                    f"({totals['failed']} shards failed)")
+        return totals
+
+
+# ============================================
+# Factory
+# ============================================
+
+def default_offline_index_file() -> Path:
+    """Default offline index location"""
+    return Path.home() / ".cache" / "academic_agent" / "offline_index.db"
+
+
+def create_offline_index_from_config(offline_config) -> Optional[CorpusStore]:
+    """
+    Open the offline index from OfflineIndexConfig
+
+    Args:
+        offline_config: OfflineIndexConfig (api_config.offline)
+
+    Returns:
+        CorpusStore over the offline index, or None if disabled
+    """
+    if not offline_config or not offline_config.enabled:
+        return None
+
+    index_file = Path(offline_config.index_file).expanduser() if offline_config.index_file else default_offline_index_file()
+    return CorpusStore(db_file=index_file)
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main():
+    """CLI: ingest snapshot shards into the offline index"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ingest OpenAlex/CrossRef snapshot shards into an offline index")
+    parser.add_argument("shards", nargs="+", type=Path, help="Snapshot shard files (.gz)")
+    parser.add_argument("--format", required=True, choices=SNAPSHOT_FORMATS, dest="snapshot_format")
+    parser.add_argument("--index", type=Path, default=None, help="Index file (default: ~/.cache/academic_agent/offline_index.db)")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Papers per upsert batch")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    loader = SnapshotLoader(
+        args.snapshot_format,
+        index_file=args.index,
+        batch_size=args.batch_size,
+        max_workers=args.workers
+    )
+    totals = loader.ingest(args.shards)
+
+    print(f"\n✅ Ingested {totals['papers']} papers from {totals['shards']} shards "
+          f"({totals['skipped']} skipped, {totals['failed']} failed) → {loader.index_file}")
+
+
+if __name__ == "__main__":
+    main()
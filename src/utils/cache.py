@@ -6,19 +6,29 @@ Features:
 - LRU Eviction
 - Thread-safe
 - Async Support
+- ResponseCache: HTTP Response Cache für API Clients (Key = normalisierte Endpoint + Params)
+- Schnelles (De-)Serialisieren über utils.fast_json (orjson wenn installiert)
 
 Usage:
     cache = Cache(ttl_hours=24, max_size_mb=100)
     cache.set("key", {"data": "value"})
     result = cache.get("key")  # Returns {"data": "value"} or None
+
+    # API Response Cache (pro Source)
+    response_cache = ResponseCache("crossref", ttl_hours=168)
+    response_cache.set("/works", {"query": "DevOps"}, data)
+    data = response_cache.get("/works", {"QUERY": " DevOps  "})  # gleicher Key (Whitespace, Param-Namen)
 """
 
+import hashlib
 import json
 import sqlite3
 import time
 from pathlib import Path
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, Dict, Optional
+
+from src.utils.fast_json import dumps, loads
 
 
 class Cache:
@@ -99,7 +109,7 @@ class Cache:
                 )
                 conn.commit()
 
-                return json.loads(value_json)
+                return loads(value_json)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -109,7 +119,7 @@ class Cache:
             key: Cache key
             value: Value (JSON-serializable)
         """
-        value_json = json.dumps(value)
+        value_json = dumps(value)
         size_bytes = len(value_json.encode('utf-8'))
         now = int(time.time())
 
@@ -182,6 +192,122 @@ class Cache:
                 }
 
 
+class ResponseCache:
+    """
+    HTTP Response Cache für API Clients
+
+    Speichert dekodierte JSON-Responses in einem Cache (SQLite), namespaced
+    pro Source. Keys werden aus (source, endpoint, params) gebildet; Params
+    werden normalisiert, damit gleichwertige Requests denselben Key ergeben.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        ttl_hours: int = 24,
+        cache_file: Optional[Path] = None,
+        max_size_mb: int = 100,
+        cache: Optional[Cache] = None
+    ):
+        """
+        Args:
+            source: Source-Name (z.B. "crossref") - Namespace für Keys
+            ttl_hours: Time-To-Live in Stunden für diese Source
+            cache_file: Cache DB Pfad (default: siehe Cache)
+            max_size_mb: Max Cache Größe in MB
+            cache: Optional existierender Cache (überschreibt ttl/file/size)
+        """
+        self.source = source
+        self.cache = cache or Cache(
+            cache_file=cache_file,
+            ttl_hours=ttl_hours,
+            max_size_mb=max_size_mb
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize_value(value: Any) -> Any:
+        """Normalisiert Param-Werte (Whitespace, Typen)"""
+        if isinstance(value, str):
+            return " ".join(value.split())
+        if isinstance(value, (list, tuple)):
+            return [ResponseCache._normalize_value(v) for v in value]
+        if isinstance(value, (int, float, bool)) or value is None:
+            return value
+        return str(value)
+
+    def make_key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Erstellt normalisierten Cache Key
+
+        Args:
+            endpoint: API Endpoint (z.B. "/works")
+            params: Query Params
+
+        Returns:
+            Key im Format "<source>:<sha256>"
+        """
+        normalized = {
+            str(k).strip().lower(): self._normalize_value(v)
+            for k, v in (params or {}).items()
+            if v is not None
+        }
+        payload = json.dumps(
+            {"endpoint": endpoint.rstrip("/"), "params": normalized},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{self.source}:{digest}"
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Get cached response
+
+        Returns:
+            Dekodierte JSON-Response oder None (Miss/Expired)
+        """
+        value = self.cache.get(self.make_key(endpoint, params))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, endpoint: str, params: Optional[Dict[str, Any]], value: Any) -> None:
+        """Speichert dekodierte JSON-Response"""
+        self.cache.set(self.make_key(endpoint, params), value)
+
+
+def create_response_cache_from_config(cache_config, source: str) -> Optional[ResponseCache]:
+    """
+    Erstellt ResponseCache aus Config
+
+    Args:
+        cache_config: CacheConfig (aus api_config.yaml)
+        source: Source-Name (z.B. "crossref", "openalex", "semantic_scholar")
+
+    Returns:
+        ResponseCache instance oder None wenn Caching deaktiviert
+    """
+    if not cache_config.enabled:
+        return None
+
+    if cache_config.backend != "sqlite":
+        raise ValueError(f"Unsupported cache backend: {cache_config.backend}")
+
+    ttl_hours = cache_config.ttl_hours_per_source.get(source, cache_config.ttl_hours)
+    cache_file = Path(cache_config.cache_file).expanduser() if cache_config.cache_file else None
+
+    return ResponseCache(
+        source=source,
+        ttl_hours=ttl_hours,
+        cache_file=cache_file,
+        max_size_mb=cache_config.max_size_mb
+    )
+
+
 if __name__ == "__main__":
     """Test Cache"""
     import tempfile
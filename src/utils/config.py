@@ -61,6 +61,14 @@ class RateLimitConfig(BaseModel):
     requests_per_second: float = Field(gt=0)
     mode: str = Field(default="anonymous")  # "anonymous" | "polite" | "authenticated"
     daily_limit: Optional[int] = None
+    adaptive: bool = False  # AIMD nach Server-Feedback (429, Retry-After, X-RateLimit-*)
+    max_requests_per_second: Optional[float] = Field(default=None, gt=0)  # Obergrenze im Adaptive Mode
+
+
+class SharedRateLimitConfig(BaseModel):
+    """Prozessübergreifende Rate Limits (src/utils/shared_rate_limiter.py)"""
+    enabled: bool = False
+    state_file: Optional[str] = None  # default: ~/.cache/academic_agent/rate_limits.db
 
 
 class TimeoutConfig(BaseModel):
@@ -75,14 +83,76 @@ class RetryConfig(BaseModel):
     max_attempts: int = Field(default=3, gt=0)
     backoff_factor: float = Field(default=2.0, gt=0)
     retry_on_status_codes: List[int] = Field(default=[429, 500, 502, 503, 504])
+    # Circuit Breaker pro Source (src/utils/retry.py)
+    circuit_failure_threshold: float = Field(default=0.5, gt=0, le=1)
+    circuit_min_calls: int = Field(default=5, gt=0)
+    circuit_cooldown_seconds: float = Field(default=60.0, gt=0)
+    retry_budget_ratio: float = Field(default=0.2, ge=0)  # Retries pro Call (Budget)
 
 
 class CacheConfig(BaseModel):
     """Cache Konfiguration"""
     enabled: bool = True
     ttl_hours: int = Field(default=24, gt=0)
+    ttl_hours_per_source: Dict[str, int] = Field(default_factory=dict)
     backend: str = "sqlite"
     max_size_mb: int = Field(default=100, gt=0)
+    cache_file: Optional[str] = None  # default: ~/.cache/academic_agent/api_cache.db
+
+
+class ResultCacheConfig(BaseModel):
+    """Query Result Cache (SearchEngine, stale-while-revalidate)"""
+    enabled: bool = False
+    soft_ttl_minutes: float = Field(default=60, ge=0)  # danach Refresh im Hintergrund
+    ttl_hours: int = Field(default=168, gt=0)  # danach Miss (synchrone Suche)
+    max_size_mb: int = Field(default=50, gt=0)
+    cache_file: Optional[str] = None  # default: ~/.cache/academic_agent/result_cache.db
+
+
+class S2BulkSearchConfig(BaseModel):
+    """Semantic Scholar /paper/search/bulk (SearchEngine, Deep Research)"""
+    enabled: bool = True
+    min_limit: int = Field(default=100, gt=0)  # Bulk Search ab limit > min_limit (/paper/search max: 100)
+    sort: Optional[str] = "citationCount:desc"  # Bulk ist nicht relevanz-sortiert; None = paperId
+
+
+class CitationEnricherConfig(BaseModel):
+    """Citation Enricher (src/ranking/citation_enricher.py, v.a. DBIS Papers)"""
+    enabled: bool = True
+    sources: List[str] = ["semantic_scholar", "openalex"]
+    max_requests: int = Field(default=4, ge=0)  # DOI Batch Requests pro Source und Run
+    ttl_hours: int = Field(default=168, gt=0)  # Citation Counts ändern sich langsam
+    only_missing: bool = True  # nur Papers mit citations=None
+    cache_file: Optional[str] = None  # default: ~/.cache/academic_agent/citation_cache.db
+
+
+class EmbeddingRelevanceConfig(BaseModel):
+    """CPU Embedding Relevanz (src/ranking/embedding_scorer.py, statt BM25)"""
+    enabled: bool = False
+    dim: int = Field(default=512, gt=0)  # Hash Buckets pro Vektor
+    use_cache: bool = True  # Vektoren pro DOI persistent (memory-mapped)
+    cache_file: Optional[str] = None  # default: ~/.cache/academic_agent/embeddings.f32
+
+
+class RelevanceCacheConfig(BaseModel):
+    """LLM Relevanz-Score Cache (src/ranking/relevance_cache.py)"""
+    enabled: bool = True
+    ttl_hours: int = Field(default=720, gt=0)  # Scores für (Query, DOI) ändern sich nicht
+    prompt_version: Optional[str] = None  # default: RELEVANCE_PROMPT_VERSION
+    cache_file: Optional[str] = None  # default: ~/.cache/academic_agent/relevance_cache.db
+
+
+class CorpusConfig(BaseModel):
+    """Lokaler Paper-Corpus (run-übergreifend, SQLite FTS5)"""
+    enabled: bool = False
+    db_file: Optional[str] = None  # default: ~/.cache/academic_agent/corpus.db
+    min_results: Optional[int] = Field(default=None, gt=0)  # Corpus-Treffer ab denen APIs übersprungen werden
+
+
+class OfflineIndexConfig(BaseModel):
+    """Offline Index aus OpenAlex/CrossRef Snapshots (src/search/snapshot_loader.py)"""
+    enabled: bool = False
+    index_file: Optional[str] = None  # default: ~/.cache/academic_agent/offline_index.db
 
 
 class FallbackConfig(BaseModel):
@@ -101,6 +171,14 @@ class APIConfig(BaseModel):
     retry: RetryConfig
     cache: CacheConfig
     fallbacks: FallbackConfig
+    result_cache: ResultCacheConfig = Field(default_factory=ResultCacheConfig)
+    s2_bulk_search: S2BulkSearchConfig = Field(default_factory=S2BulkSearchConfig)
+    citation_enricher: CitationEnricherConfig = Field(default_factory=CitationEnricherConfig)
+    embedding_relevance: EmbeddingRelevanceConfig = Field(default_factory=EmbeddingRelevanceConfig)
+    relevance_cache: RelevanceCacheConfig = Field(default_factory=RelevanceCacheConfig)
+    corpus: CorpusConfig = Field(default_factory=CorpusConfig)
+    offline: OfflineIndexConfig = Field(default_factory=OfflineIndexConfig)
+    shared_rate_limits: SharedRateLimitConfig = Field(default_factory=SharedRateLimitConfig)
 
     @property
     def mode(self) -> str:
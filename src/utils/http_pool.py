@@ -0,0 +1,125 @@
+"""
+Async HTTP Connection Pool für Academic Agent v2.3+
+
+Langlebiger httpx.AsyncClient pro API-Source:
+- HTTP/2 (wenn `h2` installiert ist, sonst HTTP/1.1)
+- Keep-Alive Connection Pooling
+- Lazy Creation (erst beim ersten async Request)
+- Rebind bei neuem Event Loop (z.B. mehrfaches asyncio.run())
+
+Usage:
+    pool = AsyncClientPool(headers={"User-Agent": "AcademicAgentV2/1.0"}, timeout=30)
+    client = pool.get()
+    response = await client.get("https://api.crossref.org/works", params={...})
+    await pool.aclose()
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    """Prüft ob HTTP/2 Support (Package `h2`) installiert ist"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class AsyncClientPool:
+    """
+    Verwaltet einen langlebigen httpx.AsyncClient
+
+    Ein AsyncClient ist an den Event Loop gebunden, in dem seine Connections
+    geöffnet wurden. Der Pool erstellt den Client daher lazy und ersetzt ihn,
+    wenn get() aus einem anderen Event Loop aufgerufen wird.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Union[float, httpx.Timeout] = 30,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            headers: Default Headers für alle Requests
+            timeout: Request Timeout (Sekunden oder httpx.Timeout)
+            max_connections: Max gleichzeitige Connections
+            max_keepalive_connections: Max offene Idle-Connections
+            keepalive_expiry: Idle-Timeout für Keep-Alive Connections (Sekunden)
+            http2: HTTP/2 nutzen wenn verfügbar (default: True)
+            transport: Optional custom Transport (z.B. httpx.MockTransport für Tests)
+        """
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and http2_available()
+        self.transport = transport
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        if http2 and not self.http2:
+            logger.debug("AsyncClientPool: h2 not installed, falling back to HTTP/1.1")
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Erstellt neuen AsyncClient mit Pool-Settings"""
+        kwargs: Dict[str, Any] = {
+            "headers": self.headers,
+            "timeout": self.timeout,
+            "limits": self.limits,
+            "http2": self.http2
+        }
+        if self.transport is not None:
+            kwargs["transport"] = self.transport
+        return httpx.AsyncClient(**kwargs)
+
+    def get(self) -> httpx.AsyncClient:
+        """
+        Gibt den AsyncClient für den aktuellen Event Loop zurück
+
+        Muss aus einer Coroutine heraus aufgerufen werden.
+
+        Returns:
+            httpx.AsyncClient (wiederverwendet, solange der Loop gleich bleibt)
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                # Connections gehören zum alten Loop - nicht mehr nutzbar
+                logger.debug("AsyncClientPool: event loop changed, recreating client")
+            self._client = self._create_client()
+            self._loop = loop
+
+        return self._client
+
+    async def aclose(self) -> None:
+        """Schließt den AsyncClient (falls im aktuellen Loop offen)"""
+        if self._client is None:
+            return
+
+        client, self._client = self._client, None
+        loop, self._loop = self._loop, None
+
+        if client.is_closed:
+            return
+
+        try:
+            if loop is asyncio.get_running_loop():
+                await client.aclose()
+        except RuntimeError as e:
+            logger.debug(f"AsyncClientPool: could not close client cleanly: {e}")
@@ -0,0 +1,375 @@
+"""
+HTTP Record/Replay für Academic Agent v2.3+
+
+Reproduzierbare Benchmarks und Tests ohne Live-APIs: httpx Transports, die
+Responses in einer Cassette (JSON Lines) aufzeichnen bzw. daraus abspielen.
+
+Features:
+- RecordingTransport: leitet an den echten Transport weiter und zeichnet auf
+- ReplayTransport: spielt aufgezeichnete Responses ab (sync + async),
+  mehrfach aufgezeichnete Requests in Reihenfolge (letzte wiederholt sich)
+- Kanonischer Request Key: Methode + Host + Pfad + sortierte Query Params
+  (+ Body Hash für POST, z.B. S2 /paper/batch)
+- install_transport(): tauscht den Transport aller API Clients eines
+  SearchEngine/PDFFetcher (oder eines einzelnen Clients) aus
+- rebase_urls(): leitet Clients auf einen lokalen Stub Server um
+  (scripts/benchmarks/stub_server.py, liest dieselben Cassettes)
+
+Usage:
+    from src.utils.http_replay import Cassette, RecordingTransport, ReplayTransport, install_transport
+
+    # Aufnehmen (Live APIs)
+    engine = SearchEngine(use_cache=False)
+    install_transport(engine, RecordingTransport(Cassette("cassettes/devops.jsonl")))
+    engine.search("DevOps Governance", limit=20)
+
+    # Abspielen (offline)
+    engine = SearchEngine(use_cache=False)
+    install_transport(engine, ReplayTransport("cassettes/devops.jsonl"))
+    engine.search("DevOps Governance", limit=20)
+
+CLI:
+    python -m src.utils.http_replay --record cassettes/devops.jsonl --query "DevOps Governance"
+    python -m src.utils.http_replay --list cassettes/devops.jsonl
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+import httpx
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping (content decoding already happened)
+_KEPT_HEADERS = ("content-type", "retry-after", "x-ratelimit-", "x-rate-limit-")
+
+# API client attributes of SearchEngine / PDFFetcher
+_CLIENT_ATTRIBUTES = ("crossref_client", "openalex_client", "s2_client", "unpaywall_client", "core_client")
+
+
+class CassetteMiss(httpx.TransportError):
+    """Request has no recording (strict replay)"""
+
+
+def request_key(method: str, url: Union[httpx.URL, str], body: bytes = b"") -> str:
+    """
+    Canonical key of a request
+
+    Example:
+        request_key("GET", "https://api.crossref.org/works?rows=20&query=devops")
+        # → "GET api.crossref.org/works?query=devops&rows=20"
+    """
+    url = httpx.URL(url) if isinstance(url, str) else url
+    query = urlencode(sorted(parse_qsl(url.query.decode("ascii"), keep_blank_values=True)))
+
+    key = f"{method.upper()} {url.host}{url.path}"
+    if query:
+        key += f"?{query}"
+    if body:
+        key += f" #{hashlib.sha256(body).hexdigest()[:16]}"
+    return key
+
+
+def _request_body(request: httpx.Request) -> bytes:
+    try:
+        return request.content
+    except httpx.RequestNotRead:
+        return request.read()
+
+
+# ============================================
+# Cassette
+# ============================================
+
+class Cassette:
+    """
+    Recorded responses (JSON Lines, one interaction per line)
+
+    Thread-safe; neue Aufnahmen werden sofort an die Datei angehängt.
+    """
+
+    def __init__(self, path: Optional[Union[Path, str]] = None):
+        """
+        Args:
+            path: Cassette file (None = in-memory only)
+        """
+        self.path = Path(path) if path else None
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries.setdefault(entry["key"], []).append(entry)
+            logger.info(f"Cassette loaded: {len(self)} interactions from {self.path}")
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def keys(self) -> List[str]:
+        return list(self._entries)
+
+    def add(self, key: str, status_code: int, headers: Dict[str, str], content: bytes) -> None:
+        """Record one interaction"""
+        entry: Dict[str, Any] = {
+            "key": key,
+            "status": status_code,
+            "headers": {
+                name: value for name, value in headers.items()
+                if name.lower().startswith(_KEPT_HEADERS)
+            },
+        }
+        try:
+            entry["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_b64"] = base64.b64encode(content).decode("ascii")
+
+        with self._lock:
+            self._entries.setdefault(key, []).append(entry)
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Next recording for key (in recording order, the last one repeats)"""
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            return entries[min(index, len(entries) - 1)]
+
+    @staticmethod
+    def entry_content(entry: Dict[str, Any]) -> bytes:
+        if "body_b64" in entry:
+            return base64.b64decode(entry["body_b64"])
+        return entry.get("body", "").encode("utf-8")
+
+
+# ============================================
+# Transports
+# ============================================
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Serve responses from a Cassette (no network)
+
+    Usable as sync and async transport (httpx.Client / AsyncClientPool).
+    """
+
+    def __init__(self, cassette: Union[Cassette, Path, str], strict: bool = True):
+        """
+        Args:
+            cassette: Cassette or path to a cassette file
+            strict: Raise CassetteMiss for unrecorded requests
+                    (False: answer 404 {"error": "not recorded"})
+        """
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self.strict = strict
+        self.hits = 0
+        self.misses = 0
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request.method, request.url, _request_body(request))
+        entry = self.cassette.lookup(key)
+
+        if entry is None:
+            self.misses += 1
+            if self.strict:
+                raise CassetteMiss(f"No recording for {key}", request=request)
+            return httpx.Response(404, json={"error": "not recorded", "key": key}, request=request)
+
+        self.hits += 1
+        return httpx.Response(
+            entry["status"],
+            headers=entry.get("headers") or {},
+            content=Cassette.entry_content(entry),
+            request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Forward to the real transport and record every response
+
+    Die inneren Transports werden von allen Clients/Event Loops geteilt und
+    beim Schließen einzelner Clients nicht geschlossen.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[Cassette, Path, str],
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            cassette: Cassette or path to a cassette file (appended to)
+            transport: Sync transport to forward to (default: httpx.HTTPTransport)
+            async_transport: Async transport to forward to (default: httpx.AsyncHTTPTransport)
+        """
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self._transport = transport
+        self._async_transport = async_transport
+
+    def _record(self, request: httpx.Request, response: httpx.Response, content: bytes) -> httpx.Response:
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower().startswith(_KEPT_HEADERS)
+        }
+        self.cassette.add(
+            request_key(request.method, request.url, _request_body(request)),
+            response.status_code, headers, content
+        )
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        response = self._transport.handle_request(request)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        return self._record(request, response, content)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._async_transport is None:
+            self._async_transport = httpx.AsyncHTTPTransport()
+        response = await self._async_transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(request, response, content)
+
+    def close(self) -> None:
+        """Shared across clients - see class docstring"""
+
+    async def aclose(self) -> None:
+        """Shared across clients - see class docstring"""
+
+
+# ============================================
+# Client Helpers
+# ============================================
+
+def http_clients(target: Any) -> List[Any]:
+    """
+    API clients of a SearchEngine/PDFFetcher, or [target] for a single client
+    """
+    if hasattr(target, "BASE_URL") and isinstance(getattr(target, "client", None), httpx.Client):
+        return [target]
+    return [
+        getattr(target, attribute) for attribute in _CLIENT_ATTRIBUTES
+        if getattr(target, attribute, None) is not None
+    ]
+
+
+def install_transport(
+    target: Any,
+    transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport]
+) -> None:
+    """
+    Route all HTTP traffic of target's API clients through transport
+
+    Must be called before the first async request (pooled AsyncClients are
+    created lazily with the new transport).
+
+    Args:
+        target: SearchEngine, PDFFetcher or a single API client
+        transport: e.g. ReplayTransport / RecordingTransport
+    """
+    for api_client in http_clients(target):
+        old = api_client.client
+        api_client.client = httpx.Client(headers=old.headers, timeout=old.timeout, transport=transport)
+        old.close()
+
+        pool = getattr(api_client, "_async_pool", None)
+        if pool is not None:
+            pool.transport = transport
+            pool._client = None
+            pool._loop = None
+
+
+def rebase_urls(target: Any, base_url: str) -> None:
+    """
+    Point API clients at a stub server
+
+    https://api.crossref.org/works → {base_url}/api.crossref.org/works
+
+    Args:
+        target: SearchEngine, PDFFetcher or a single API client
+        base_url: Stub server URL, e.g. "http://127.0.0.1:8765"
+    """
+    for api_client in http_clients(target):
+        original = urlparse(type(api_client).BASE_URL)
+        api_client.BASE_URL = f"{base_url.rstrip('/')}/{original.netloc}{original.path}"
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main():
+    """Record a search into a cassette or list a cassette"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="HTTP record/replay cassettes")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--record", type=Path, help="Cassette file to append recordings to")
+    group.add_argument("--list", type=Path, help="List recorded requests of a cassette")
+    parser.add_argument("--query", action="append", help="Search query (repeatable)")
+    parser.add_argument("--limit", type=int, default=25, help="Results per source")
+    parser.add_argument("--sources", nargs="+", default=None, help="Sources (default: all APIs)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Also record asearch()")
+    args = parser.parse_args()
+
+    if args.list:
+        cassette = Cassette(args.list)
+        for key in cassette.keys():
+            print(key)
+        print(f"\n{len(cassette)} interactions, {len(cassette.keys())} distinct requests")
+        return
+
+    import asyncio
+    from src.search.search_engine import SearchEngine
+
+    if not args.query:
+        parser.error("--record requires at least one --query")
+
+    cassette = Cassette(args.record)
+    engine = SearchEngine(sources=args.sources, use_cache=False)
+    install_transport(engine, RecordingTransport(cassette))
+
+    for query in args.query:
+        papers = engine.search_parallel(query, limit=args.limit)
+        print(f"search_parallel('{query}'): {len(papers)} papers")
+        if args.use_async:
+            papers = asyncio.run(engine.asearch(query, limit=args.limit))
+            print(f"asearch('{query}'): {len(papers)} papers")
+
+    engine.close()
+    print(f"\n✅ {len(cassette)} interactions in {args.record}")
+
+
+if __name__ == "__main__":
+    main()
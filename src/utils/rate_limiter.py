@@ -5,6 +5,11 @@ Sliding Window Token-Bucket Rate Limiter
 - Thread-safe
 - Async-Support
 - Adaptive Limits (Standard vs Enhanced Mode)
+- Adaptive Mode (AIMD): Rate folgt Server-Feedback (429, Retry-After,
+  X-RateLimit-Remaining/Reset), Pausen exakt so lang wie vom Server verlangt
+- Exaktes Scheduling ohne Polling: Warteschlange (FIFO je Priorität), nur der
+  Kopf der Schlange wartet mit berechneter Weckzeit (Condition bzw. Future + call_later)
+- Prioritätsklassen: PRIORITY_INTERACTIVE < PRIORITY_DEFAULT < PRIORITY_BULK
 
 Usage:
     # Sync
@@ -14,15 +19,227 @@ Usage:
     # Async
     async_limiter = AsyncRateLimiter(requests_per_second=10)
     await async_limiter.acquire()
+
+    # Bulk-Enrichment lässt interaktive Lookups vor
+    limiter.acquire(priority=PRIORITY_BULK)
+
+    # Adaptive (Feedback via retry.raise_for_status_with_retry)
+    limiter = RateLimiter(requests_per_second=10, adaptive=True)
+    raise_for_status_with_retry(response, limiter)
 """
 
 import asyncio
+import heapq
+import itertools
+import logging
 import time
-from threading import Lock
-from typing import Optional
+from contextlib import nullcontext
+from threading import Condition, Lock
+from typing import Any, Dict, List, Optional
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+# Prioritätsklassen (kleiner = früher bedient, FIFO innerhalb einer Klasse)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 5
+PRIORITY_BULK = 10
+
+
+# ============================================
+# Waiter Queue
+# ============================================
+
+class _Waiter:
+    """Eintrag in der Warteschlange (sortiert nach Priorität, dann Ankunft)"""
+
+    __slots__ = ("priority", "seq", "tokens", "signal")
+
+    def __init__(self, priority: int, seq: int, tokens: int, signal: Any):
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+        self.signal = signal  # threading.Condition (sync) oder asyncio.Future (async)
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+# ============================================
+# Adaptive Rate Control (AIMD)
+# ============================================
 
+class _TokenBucketMixin:
+    """
+    Gemeinsamer Token-Bucket State + Server-Feedback (Sync + Async)
 
-class RateLimiter:
+    - pause(): Bucket leeren, erster Token exakt nach Ablauf der Pause
+      (gilt auch im nicht-adaptiven Modus - Retry-After wird immer respektiert)
+    - on_success(): additive increase bis max_rate / Header-Budget
+    - on_throttle(): multiplicative decrease bis min_rate (+ Pause)
+    - update_from_headers(): Rate an X-RateLimit-Remaining/Reset Budget anpassen
+    """
+
+    def _init_adaptive(
+        self,
+        adaptive: bool,
+        min_rate: Optional[float],
+        max_rate: Optional[float],
+        increase_step: Optional[float],
+        decrease_factor: float
+    ) -> None:
+        self.adaptive = adaptive
+        self.base_rate = self.rate
+        self.min_rate = min_rate if min_rate is not None else self.rate / 10
+        self.max_rate = max_rate if max_rate is not None else self.rate
+        self.increase_step = increase_step if increase_step is not None else self.max_rate / 20
+        self.decrease_factor = decrease_factor
+
+        # Header Budget (remaining / seconds until reset), gültig bis budget_until
+        self.budget_rate: Optional[float] = None
+        self.budget_until = 0.0
+        self.paused_until = 0.0
+
+    def _feedback_lock(self):
+        """Lock für Feedback-Updates (sync: threading.Lock)"""
+        return self.lock
+
+    def _refill_tokens(self, now: float) -> None:
+        """Refills tokens basierend auf verstrichener Zeit (nicht während Pause)"""
+        if now <= self.last_update:
+            return
+        elapsed = now - self.last_update
+        new_tokens = elapsed * self.rate
+        self.tokens = min(self.burst_size, self.tokens + new_tokens)
+        self.last_update = now
+
+    def _seconds_until(self, tokens: int, now: float) -> float:
+        """Exakte Zeit bis tokens verfügbar sind (inkl. laufender Pause)"""
+        if self.tokens >= tokens and now >= self.last_update:
+            return 0.0
+        return max(0.0, self.last_update - now) + max(0.0, tokens - self.tokens) / self.rate
+
+    def _check_daily_limit(self, now: float) -> None:
+        """Raises ValueError wenn daily_limit erreicht"""
+        self._reset_daily_if_needed(now)
+        if self.daily_limit and self.daily_count >= self.daily_limit:
+            raise ValueError(
+                f"Daily limit reached ({self.daily_limit}). "
+                f"Resets at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.daily_reset_time))}"
+            )
+
+    def _reset_daily_if_needed(self, now: float) -> None:
+        """Reset daily count wenn 24h vergangen"""
+        if now >= self.daily_reset_time:
+            self.daily_count = 0
+            self.daily_reset_time = now + 86400
+
+    def _take(self, tokens: int) -> None:
+        self.tokens -= tokens
+        self.daily_count += tokens
+
+    def _ceiling(self, now: float) -> float:
+        """Aktuelle Obergrenze: max_rate, ggf. durch Header-Budget gesenkt"""
+        if self.budget_rate is not None and now < self.budget_until:
+            return min(self.max_rate, self.budget_rate)
+        return self.max_rate
+
+    def _set_rate(self, rate: float) -> None:
+        self.rate = max(self.min_rate, min(self.max_rate, rate))
+
+    def pause(self, seconds: float) -> None:
+        """
+        Keine Tokens bis now + seconds (z.B. Retry-After)
+
+        Nach der Pause ist genau ein Token verfügbar, danach gilt wieder die Rate.
+        """
+        if seconds is None or seconds <= 0:
+            return
+
+        with self._feedback_lock():
+            now = time.time()
+            resume_at = now + seconds
+            if resume_at <= self.paused_until:
+                return
+            self.paused_until = resume_at
+            self.tokens = 0.0
+            # Refill startet so, dass bei resume_at genau 1 Token bereitliegt
+            self.last_update = resume_at - 1.0 / self.rate
+
+        logger.info(f"Rate limiter paused for {seconds:.1f}s")
+
+    def on_success(self) -> None:
+        """Additive increase nach erfolgreichem Request"""
+        if not self.adaptive:
+            return
+
+        with self._feedback_lock():
+            now = time.time()
+            self._refill_tokens(now)
+            ceiling = self._ceiling(now)
+            if self.rate < ceiling:
+                self.rate = min(ceiling, self.rate + self.increase_step)
+                self._wake_head()
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Multiplicative decrease nach 429
+
+        Args:
+            retry_after: Vom Server verlangte Pause (Sekunden)
+        """
+        if self.adaptive:
+            with self._feedback_lock():
+                self._refill_tokens(time.time())
+                self._set_rate(self.rate * self.decrease_factor)
+            logger.info(f"Rate limiter throttled → {self.rate:.2f} req/s")
+
+        self.pause(retry_after)
+
+    def update_from_headers(self, info: Dict[str, Any]) -> None:
+        """
+        Rate an das vom Server gemeldete Budget anpassen
+
+        Args:
+            info: Ergebnis von retry.parse_rate_limit_headers
+                  (remaining, reset_after, limit, interval)
+        """
+        if not info:
+            return
+
+        remaining = info.get("remaining")
+        reset_after = info.get("reset_after")
+
+        # Budget aufgebraucht → Pause bis Reset (auch nicht-adaptiv)
+        if remaining is not None and remaining <= 0 and reset_after:
+            self.pause(reset_after)
+            return
+
+        if not self.adaptive:
+            return
+
+        budget = None
+        budget_until = 0.0
+        now = time.time()
+        if remaining is not None and reset_after:
+            budget = remaining / reset_after
+            budget_until = now + reset_after
+        elif info.get("limit") and info.get("interval"):
+            budget = info["limit"] / info["interval"]
+            budget_until = now + max(info["interval"], 60.0)
+
+        if budget is None:
+            return
+
+        with self._feedback_lock():
+            self._refill_tokens(now)
+            self.budget_rate = budget
+            self.budget_until = budget_until
+            if self.rate > self._ceiling(now):
+                self._set_rate(self._ceiling(now))
+
+
+class RateLimiter(_TokenBucketMixin):
     """
     Thread-safe Sliding Window Rate Limiter (Sync)
 
@@ -33,16 +250,26 @@ class RateLimiter:
         self,
         requests_per_second: float,
         burst_size: Optional[int] = None,
-        daily_limit: Optional[int] = None
+        daily_limit: Optional[int] = None,
+        adaptive: bool = False,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase_step: Optional[float] = None,
+        decrease_factor: float = 0.5
     ):
         """
         Args:
             requests_per_second: Max Requests pro Sekunde
-            burst_size: Max Burst Size (default: requests_per_second)
+            burst_size: Max Burst Size (default: requests_per_second, min. 1)
             daily_limit: Optional tägliches Limit (für OpenAlex Anonymous)
+            adaptive: Rate per AIMD an Server-Feedback anpassen
+            min_rate: Untergrenze im Adaptive Mode (default: requests_per_second / 10)
+            max_rate: Obergrenze im Adaptive Mode (default: requests_per_second)
+            increase_step: Additive Increase pro Erfolg (default: max_rate / 20)
+            decrease_factor: Multiplicative Decrease pro 429 (default: 0.5)
         """
         self.rate = requests_per_second
-        self.burst_size = burst_size or int(requests_per_second)
+        self.burst_size = burst_size or max(1, int(requests_per_second))
         self.daily_limit = daily_limit
 
         # Token Bucket State
@@ -50,30 +277,33 @@ class RateLimiter:
         self.last_update = time.time()
         self.lock = Lock()
 
+        # Warteschlange (Heap nach Priorität, dann Ankunft)
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+
         # Daily Limit Tracking
         self.daily_count = 0
         self.daily_reset_time = time.time() + 86400  # +24h
 
-    def _refill_tokens(self, now: float) -> None:
-        """Refills tokens basierend auf verstrichener Zeit"""
-        elapsed = now - self.last_update
-        new_tokens = elapsed * self.rate
-        self.tokens = min(self.burst_size, self.tokens + new_tokens)
-        self.last_update = now
-
-    def _reset_daily_if_needed(self, now: float) -> None:
-        """Reset daily count wenn 24h vergangen"""
-        if now >= self.daily_reset_time:
-            self.daily_count = 0
-            self.daily_reset_time = now + 86400
+        self._init_adaptive(adaptive, min_rate, max_rate, increase_step, decrease_factor)
 
-    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+    def acquire(
+        self,
+        tokens: int = 1,
+        timeout: Optional[float] = None,
+        priority: int = PRIORITY_DEFAULT
+    ) -> bool:
         """
         Acquire tokens (blockiert bis verfügbar)
 
+        Wartende Threads stehen in einer Warteschlange (Priorität, dann FIFO).
+        Nur der Kopf wartet mit exakt berechneter Weckzeit auf seine Tokens,
+        alle anderen schlafen bis sie Kopf werden - kein Polling.
+
         Args:
             tokens: Anzahl Tokens (default: 1)
             timeout: Max Wartezeit in Sekunden (None = unbegrenzt)
+            priority: Prioritätsklasse (PRIORITY_INTERACTIVE/DEFAULT/BULK)
 
         Returns:
             True wenn erfolgreich, False bei Timeout
@@ -81,40 +311,66 @@ class RateLimiter:
         Raises:
             ValueError: Wenn daily_limit erreicht
         """
-        start_time = time.time()
-
-        while True:
-            with self.lock:
-                now = time.time()
-
-                # Daily Limit Check
-                self._reset_daily_if_needed(now)
-                if self.daily_limit and self.daily_count >= self.daily_limit:
-                    raise ValueError(
-                        f"Daily limit reached ({self.daily_limit}). "
-                        f"Resets at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.daily_reset_time))}"
-                    )
-
-                # Refill Tokens
-                self._refill_tokens(now)
-
-                # Acquire wenn genug Tokens
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
-                    self.daily_count += tokens
-                    return True
+        deadline = time.time() + timeout if timeout else None
+
+        with self.lock:
+            now = time.time()
+            self._check_daily_limit(now)
+            self._refill_tokens(now)
 
-            # Timeout Check
-            if timeout and (time.time() - start_time) >= timeout:
-                return False
+            # Fast Path: keine Warteschlange, genug Tokens
+            if not self._waiters and self.tokens >= tokens:
+                self._take(tokens)
+                return True
 
-            # Wait kurz bevor nächster Versuch
-            time.sleep(0.01)  # 10ms
+            waiter = _Waiter(priority, next(self._sequence), tokens, Condition(self.lock))
+            heapq.heappush(self._waiters, waiter)
+
+            try:
+                while True:
+                    now = time.time()
+                    if self._waiters[0] is waiter:
+                        self._check_daily_limit(now)
+                        self._refill_tokens(now)
+                        wait = self._seconds_until(tokens, now)
+                        if wait == 0.0:
+                            self._take(tokens)
+                            return True
+                    else:
+                        wait = None  # bis wir Kopf der Schlange sind
+
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            return False
+                        wait = remaining if wait is None else min(wait, remaining)
+
+                    waiter.signal.wait(wait)
+            finally:
+                self._remove_waiter(waiter)
+
+    def _remove_waiter(self, waiter: _Waiter) -> None:
+        """Waiter entfernen und neuen Kopf der Schlange wecken (Lock gehalten)"""
+        if self._waiters and self._waiters[0] is waiter:
+            heapq.heappop(self._waiters)
+        elif waiter in self._waiters:
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+
+        if self._waiters:
+            self._waiters[0].signal.notify()
+
+    def _wake_head(self) -> None:
+        """Kopf neu rechnen lassen (Rate/Pause geändert, Lock gehalten)"""
+        if self._waiters:
+            self._waiters[0].signal.notify()
 
     def try_acquire(self, tokens: int = 1) -> bool:
         """
         Versucht tokens zu acquiren (non-blocking)
 
+        Überholt keine wartenden Threads.
+
         Returns:
             True wenn erfolgreich, False sonst
         """
@@ -123,14 +379,14 @@ class RateLimiter:
             self._reset_daily_if_needed(now)
             self._refill_tokens(now)
 
-            if self.tokens >= tokens:
+            if not self._waiters and self.tokens >= tokens:
                 self.tokens -= tokens
                 if self.daily_limit:
                     self.daily_count += tokens
                 return True
             return False
 
-    def wait_if_needed(self, tokens: int = 1) -> None:
+    def wait_if_needed(self, tokens: int = 1, priority: int = PRIORITY_DEFAULT) -> None:
         """
         Waits if rate limit would be exceeded (alias for acquire).
 
@@ -139,11 +395,12 @@ class RateLimiter:
 
         Args:
             tokens: Number of tokens to acquire (default: 1)
+            priority: Priority class (PRIORITY_INTERACTIVE/DEFAULT/BULK)
 
         Raises:
             ValueError: If daily limit is reached
         """
-        self.acquire(tokens=tokens)
+        self.acquire(tokens=tokens, priority=priority)
 
     def get_wait_time(self, tokens: int = 1) -> float:
         """
@@ -155,12 +412,7 @@ class RateLimiter:
         with self.lock:
             now = time.time()
             self._refill_tokens(now)
-
-            if self.tokens >= tokens:
-                return 0.0
-
-            needed = tokens - self.tokens
-            return needed / self.rate
+            return self._seconds_until(tokens, now)
 
     def reset(self) -> None:
         """Reset State (für Testing)"""
@@ -169,29 +421,43 @@ class RateLimiter:
             self.last_update = time.time()
             self.daily_count = 0
             self.daily_reset_time = time.time() + 86400
+            self.rate = self.base_rate
+            self.budget_rate = None
+            self.paused_until = 0.0
 
 
-class AsyncRateLimiter:
+class AsyncRateLimiter(_TokenBucketMixin):
     """
     Async-kompatible Version des Rate Limiters
 
-    Nutzt asyncio.Lock statt threading.Lock
+    Läuft vollständig im Event Loop: State-Änderungen sind synchron (atomar),
+    Wartende bekommen Futures statt Polling mit asyncio.sleep
     """
 
     def __init__(
         self,
         requests_per_second: float,
         burst_size: Optional[int] = None,
-        daily_limit: Optional[int] = None
+        daily_limit: Optional[int] = None,
+        adaptive: bool = False,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase_step: Optional[float] = None,
+        decrease_factor: float = 0.5
     ):
         """
         Args:
             requests_per_second: Max Requests pro Sekunde
-            burst_size: Max Burst Size (default: requests_per_second)
+            burst_size: Max Burst Size (default: requests_per_second, min. 1)
             daily_limit: Optional tägliches Limit
+            adaptive: Rate per AIMD an Server-Feedback anpassen (siehe RateLimiter)
+            min_rate: Untergrenze im Adaptive Mode
+            max_rate: Obergrenze im Adaptive Mode
+            increase_step: Additive Increase pro Erfolg
+            decrease_factor: Multiplicative Decrease pro 429
         """
         self.rate = requests_per_second
-        self.burst_size = burst_size or int(requests_per_second)
+        self.burst_size = burst_size or max(1, int(requests_per_second))
         self.daily_limit = daily_limit
 
         # Token Bucket State
@@ -199,79 +465,122 @@ class AsyncRateLimiter:
         self.last_update = time.time()
         self.lock = asyncio.Lock()
 
+        # Warteschlange (Heap nach Priorität, dann Ankunft) + Timer für den Kopf
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
         # Daily Limit Tracking
         self.daily_count = 0
         self.daily_reset_time = time.time() + 86400
 
-    def _refill_tokens(self, now: float) -> None:
-        """Refills tokens basierend auf verstrichener Zeit"""
-        elapsed = now - self.last_update
-        new_tokens = elapsed * self.rate
-        self.tokens = min(self.burst_size, self.tokens + new_tokens)
-        self.last_update = now
+        self._init_adaptive(adaptive, min_rate, max_rate, increase_step, decrease_factor)
 
-    def _reset_daily_if_needed(self, now: float) -> None:
-        """Reset daily count wenn 24h vergangen"""
-        if now >= self.daily_reset_time:
-            self.daily_count = 0
-            self.daily_reset_time = now + 86400
+    def _feedback_lock(self):
+        """Feedback-Updates sind synchron (kein await) → atomar im Event Loop"""
+        return nullcontext()
 
-    async def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+    async def acquire(
+        self,
+        tokens: int = 1,
+        timeout: Optional[float] = None,
+        priority: int = PRIORITY_DEFAULT
+    ) -> bool:
         """
         Acquire tokens (async)
 
+        Wartende Coroutines bekommen ein Future in der Warteschlange
+        (Priorität, dann FIFO). Ein einzelner call_later-Timer weckt genau
+        den Kopf der Schlange, wenn seine Tokens verfügbar sind.
+
         Args:
             tokens: Anzahl Tokens
             timeout: Max Wartezeit
+            priority: Prioritätsklasse (PRIORITY_INTERACTIVE/DEFAULT/BULK)
 
         Returns:
             True wenn erfolgreich, False bei Timeout
+
+        Raises:
+            ValueError: Wenn daily_limit erreicht
         """
-        start_time = time.time()
-
-        while True:
-            async with self.lock:
-                now = time.time()
-
-                # Daily Limit Check
-                self._reset_daily_if_needed(now)
-                if self.daily_limit and self.daily_count >= self.daily_limit:
-                    raise ValueError(
-                        f"Daily limit reached ({self.daily_limit}). "
-                        f"Resets at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.daily_reset_time))}"
-                    )
-
-                # Refill Tokens
-                self._refill_tokens(now)
-
-                # Acquire wenn genug Tokens
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
-                    self.daily_count += tokens
-                    return True
+        now = time.time()
+        self._check_daily_limit(now)
+        self._refill_tokens(now)
+
+        # Fast Path: keine Warteschlange, genug Tokens
+        if not self._waiters and self.tokens >= tokens:
+            self._take(tokens)
+            return True
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, next(self._sequence), tokens, loop.create_future())
+        heapq.heappush(self._waiters, waiter)
+        self._schedule_head()
+
+        try:
+            return await asyncio.wait_for(waiter.signal, timeout or None)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._schedule_head()
 
-            # Timeout Check
-            if timeout and (time.time() - start_time) >= timeout:
-                return False
+    def _schedule_head(self) -> None:
+        """
+        Bediene den Kopf der Schlange oder plane exakte Weckzeit
 
-            # Wait kurz (async)
-            await asyncio.sleep(0.01)
+        Läuft im Event Loop (aus acquire oder als call_later Callback).
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiters:
+            head = self._waiters[0]
+            if head.signal.done():  # Timeout/Cancel
+                heapq.heappop(self._waiters)
+                continue
 
-    async def try_acquire(self, tokens: int = 1) -> bool:
-        """Non-blocking acquire (async)"""
-        async with self.lock:
             now = time.time()
-            self._reset_daily_if_needed(now)
+            try:
+                self._check_daily_limit(now)
+            except ValueError as e:
+                heapq.heappop(self._waiters)
+                head.signal.set_exception(e)
+                continue
+
             self._refill_tokens(now)
+            wait = self._seconds_until(head.tokens, now)
+            if wait > 0.0:
+                self._timer = head.signal.get_loop().call_later(wait, self._schedule_head)
+                return
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                if self.daily_limit:
-                    self.daily_count += tokens
-                return True
-            return False
+            heapq.heappop(self._waiters)
+            self._take(head.tokens)
+            head.signal.set_result(True)
 
-    async def wait_if_needed(self, tokens: int = 1) -> None:
+    def _wake_head(self) -> None:
+        """Kopf neu planen (Rate/Pause geändert)"""
+        if self._waiters:
+            self._schedule_head()
+
+    async def try_acquire(self, tokens: int = 1) -> bool:
+        """Non-blocking acquire (async, überholt keine Wartenden)"""
+        now = time.time()
+        self._reset_daily_if_needed(now)
+        self._refill_tokens(now)
+
+        if not self._waiters and self.tokens >= tokens:
+            self.tokens -= tokens
+            if self.daily_limit:
+                self.daily_count += tokens
+            return True
+        return False
+
+    async def wait_if_needed(self, tokens: int = 1, priority: int = PRIORITY_DEFAULT) -> None:
         """
         Waits if rate limit would be exceeded (async alias for acquire).
 
@@ -280,23 +589,24 @@ class AsyncRateLimiter:
 
         Args:
             tokens: Number of tokens to acquire (default: 1)
+            priority: Priority class (PRIORITY_INTERACTIVE/DEFAULT/BULK)
 
         Raises:
             ValueError: If daily limit is reached
         """
-        await self.acquire(tokens=tokens)
+        await self.acquire(tokens=tokens, priority=priority)
 
     def get_wait_time(self, tokens: int = 1) -> float:
-        """Berechnet Wartezeit (sync, weil Lock nicht benötigt wird für Estimation)"""
+        """Berechnet Wartezeit (ohne State zu verändern)"""
         now = time.time()
-        elapsed = now - self.last_update
+        elapsed = max(0.0, now - self.last_update)
         current_tokens = min(self.burst_size, self.tokens + elapsed * self.rate)
 
-        if current_tokens >= tokens:
+        if current_tokens >= tokens and now >= self.last_update:
             return 0.0
 
         needed = tokens - current_tokens
-        return needed / self.rate
+        return max(0.0, self.last_update - now) + needed / self.rate
 
 
 # ============================================
@@ -319,7 +629,9 @@ def create_rate_limiter_from_config(
     """
     return RateLimiter(
         requests_per_second=config["requests_per_second"],
-        daily_limit=config.get("daily_limit")
+        daily_limit=config.get("daily_limit"),
+        adaptive=config.get("adaptive", False),
+        max_rate=config.get("max_requests_per_second")
     )
 
 
@@ -339,7 +651,9 @@ def create_async_rate_limiter_from_config(
     """
     return AsyncRateLimiter(
         requests_per_second=config["requests_per_second"],
-        daily_limit=config.get("daily_limit")
+        daily_limit=config.get("daily_limit"),
+        adaptive=config.get("adaptive", False),
+        max_rate=config.get("max_requests_per_second")
     )
 
 
@@ -367,3 +681,11 @@ if __name__ == "__main__":
     elapsed = time.time() - start
     print(f"\n✅ 10 requests in {elapsed:.3f}s")
     print(f"Rate: {10/elapsed:.1f} req/s (expected: 50 req/s)")
+
+    # Test: Adaptive Mode (AIMD + Retry-After)
+    adaptive = RateLimiter(requests_per_second=10, adaptive=True)
+    adaptive.on_throttle(retry_after=0.5)
+    print(f"\nAfter 429: {adaptive.rate:.1f} req/s, wait {adaptive.get_wait_time():.2f}s")
+    for _ in range(20):
+        adaptive.on_success()
+    print(f"After 20 successes: {adaptive.rate:.1f} req/s")
@@ -6,6 +6,8 @@ Nutzt tenacity für robuste Retry-Mechanik:
 - Retry bei spezifischen Status Codes
 - Max Attempts
 - Async Support
+- Retry-After / X-RateLimit-* Header → exakte Pausen + adaptiver Rate Limiter
+- Circuit Breaker + Retry Budget pro Source (fail fast während Cool-Down)
 
 Usage:
     # Decorator
@@ -17,10 +19,18 @@ Usage:
 
     # Manual
     result = retry_api_call(lambda: api.search(...))
+
+    # Circuit Breaker (pro Source, prozessweit geteilt)
+    breaker = get_circuit_breaker("semantic_scholar")
+    breaker.before_call()  # CircuitOpenError während Cool-Down
 """
 
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Any, Callable, Optional, TypeVar
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
 
 from tenacity import (
     retry,
@@ -30,6 +40,8 @@ from tenacity import (
     before_sleep_log,
     RetryError
 )
+from tenacity.retry import retry_base
+from tenacity.wait import wait_base
 import logging
 
 # Setup Logging
@@ -45,7 +57,15 @@ T = TypeVar('T')
 
 class APIError(Exception):
     """Base API Error"""
-    pass
+
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Error message
+            retry_after: Vom Server verlangte Wartezeit in Sekunden (Retry-After)
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class RateLimitError(APIError):
@@ -63,6 +83,285 @@ class TemporaryError(APIError):
     pass
 
 
+class CircuitOpenError(APIError):
+    """Source im Cool-Down (Circuit offen) - Call wurde nicht ausgeführt"""
+    pass
+
+
+# ============================================
+# Circuit Breaker + Retry Budget
+# ============================================
+
+class CircuitBreaker:
+    """
+    Circuit Breaker mit Retry Budget für eine Source
+
+    States:
+    - closed: Calls laufen normal, Outcomes im Sliding Window (window_seconds)
+    - open: Failure-Rate >= failure_threshold (bei >= min_calls Outcomes) →
+      alle Calls scheitern sofort mit CircuitOpenError, bis cooldown abgelaufen
+    - half_open: ein Probe-Call; Erfolg → closed, Fehler → wieder open
+
+    Retry Budget: jeder Outcome zahlt retry_ratio Tokens ein (max.
+    max_retry_tokens), jeder Retry kostet einen Token. Retries bleiben so auf
+    ~retry_ratio der Calls begrenzt, statt jeden Fehler zu verdreifachen.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        min_calls: int = 5,
+        window_seconds: float = 60.0,
+        cooldown: float = 60.0,
+        retry_ratio: float = 0.2,
+        max_retry_tokens: float = 10.0
+    ):
+        """
+        Args:
+            name: Source Name (für Logs)
+            failure_threshold: Failure-Rate ab der der Circuit öffnet (0-1)
+            min_calls: Min. Outcomes im Window bevor die Rate zählt
+            window_seconds: Sliding Window für Outcomes
+            cooldown: Sekunden fail fast, bevor ein Probe-Call erlaubt wird
+            retry_ratio: Retry-Tokens pro Outcome
+            max_retry_tokens: Max. angesparte Retries
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.cooldown = cooldown
+        self.retry_ratio = retry_ratio
+        self.max_retry_tokens = max_retry_tokens
+
+        self.lock = Lock()
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._retry_tokens = max_retry_tokens
+
+    @property
+    def state(self) -> str:
+        """Aktueller State (open wird nach cooldown zu half_open)"""
+        with self.lock:
+            return self._current_state(time.time())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.cooldown:
+            self._state = self.HALF_OPEN
+            self._probe_started = None
+        return self._state
+
+    def remaining_cooldown(self) -> float:
+        """Sekunden bis ein Probe-Call erlaubt ist (0 wenn nicht open)"""
+        with self.lock:
+            if self._current_state(time.time()) != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.cooldown - time.time())
+
+    def allow_request(self) -> bool:
+        """
+        Darf ein Call laufen?
+
+        half_open: nur ein Probe-Call gleichzeitig (bleibt er ohne Outcome,
+        wird nach cooldown ein neuer erlaubt).
+        """
+        with self.lock:
+            now = time.time()
+            state = self._current_state(now)
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN:
+                if self._probe_started is None or now - self._probe_started >= self.cooldown:
+                    self._probe_started = now
+                    return True
+            return False
+
+    def before_call(self) -> None:
+        """
+        Vor jedem Call aufrufen
+
+        Raises:
+            CircuitOpenError: Wenn der Circuit offen ist (fail fast)
+        """
+        if not self.allow_request():
+            retry_after = self.remaining_cooldown()
+            raise CircuitOpenError(
+                f"{self.name}: circuit open, failing fast ({retry_after:.0f}s cool-down left)",
+                retry_after=retry_after
+            )
+
+    def record_success(self) -> None:
+        """Erfolgreicher Call (Source gesund)"""
+        with self.lock:
+            now = time.time()
+            self._record(now, True)
+            if self._current_state(now) == self.HALF_OPEN:
+                logger.info(f"Circuit breaker '{self.name}': probe succeeded, closing circuit")
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Fehlgeschlagener Call (429, 5xx, Timeout, Netzwerkfehler)"""
+        with self.lock:
+            now = time.time()
+            self._record(now, False)
+            state = self._current_state(now)
+
+            if state == self.HALF_OPEN:
+                self._open(now, "probe failed")
+            elif state == self.CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = sum(1 for _, ok in self._outcomes if not ok)
+                if failures / len(self._outcomes) >= self.failure_threshold:
+                    self._open(now, f"{failures}/{len(self._outcomes)} calls failed")
+
+    def allow_retry(self) -> bool:
+        """Retry erlaubt? (Circuit closed + Retry Budget übrig, verbraucht einen Token)"""
+        with self.lock:
+            if self._current_state(time.time()) != self.CLOSED:
+                return False
+            if self._retry_tokens < 1.0:
+                logger.warning(f"Circuit breaker '{self.name}': retry budget exhausted")
+                return False
+            self._retry_tokens -= 1.0
+            return True
+
+    def reset(self) -> None:
+        """Reset State (für Testing)"""
+        with self.lock:
+            self._outcomes.clear()
+            self._state = self.CLOSED
+            self._probe_started = None
+            self._retry_tokens = self.max_retry_tokens
+
+    def _record(self, now: float, ok: bool) -> None:
+        """Outcome speichern, alte Outcomes verwerfen, Retry Budget auffüllen"""
+        self._outcomes.append((now, ok))
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+        self._retry_tokens = min(self.max_retry_tokens, self._retry_tokens + self.retry_ratio)
+
+    def _open(self, now: float, reason: str) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probe_started = None
+        logger.warning(f"Circuit breaker '{self.name}': open for {self.cooldown:.0f}s ({reason})")
+
+
+# Prozessweite Registry: alle Clients/Orchestratoren einer Source teilen einen Breaker
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breaker_defaults: Dict[str, Any] = {}
+_circuit_breakers_lock = Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Circuit Breaker für eine Source (prozessweit geteilt)
+
+    Args:
+        name: Source Name (z.B. "semantic_scholar", "core")
+
+    Returns:
+        CircuitBreaker (wird beim ersten Aufruf mit den Defaults erstellt)
+    """
+    with _circuit_breakers_lock:
+        if name not in _circuit_breakers:
+            _circuit_breakers[name] = CircuitBreaker(name, **_circuit_breaker_defaults)
+        return _circuit_breakers[name]
+
+
+def configure_circuit_breakers(retry_config) -> None:
+    """
+    Defaults für Circuit Breaker aus RetryConfig setzen
+
+    Gilt für neue und bereits erstellte Breaker.
+
+    Args:
+        retry_config: RetryConfig (api_config.retry)
+    """
+    defaults = {
+        "failure_threshold": retry_config.circuit_failure_threshold,
+        "min_calls": retry_config.circuit_min_calls,
+        "cooldown": retry_config.circuit_cooldown_seconds,
+        "retry_ratio": retry_config.retry_budget_ratio,
+    }
+    with _circuit_breakers_lock:
+        _circuit_breaker_defaults.update(defaults)
+        for breaker in _circuit_breakers.values():
+            for key, value in defaults.items():
+                setattr(breaker, key, value)
+
+
+def reset_circuit_breakers() -> None:
+    """Alle Circuit Breaker schließen (für Testing)"""
+    with _circuit_breakers_lock:
+        for breaker in _circuit_breakers.values():
+            breaker.reset()
+
+
+# ============================================
+# Wait / Retry Strategies
+# ============================================
+
+class wait_retry_after(wait_base):
+    """
+    Tenacity wait: Retry-After der Exception, sonst Fallback-Strategie
+
+    Wartet exakt so lange wie vom Server verlangt (gedeckelt durch max_wait,
+    den Rest übernimmt die Pause im Rate Limiter beim nächsten acquire).
+
+    Example:
+        @retry(wait=wait_retry_after(wait_exponential(multiplier=2, min=1, max=10)))
+    """
+
+    def __init__(self, fallback: wait_base, max_wait: float = 60.0):
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state) -> float:
+        outcome = retry_state.outcome
+        exception = outcome.exception() if outcome is not None and outcome.failed else None
+        retry_after = getattr(exception, "retry_after", None)
+
+        if retry_after is not None:
+            return min(max(0.0, retry_after), self.max_wait)
+        return self.fallback(retry_state)
+
+
+class retry_if_source_healthy(retry_base):
+    """
+    Tenacity retry: bei exception_types, solange die Source gesund ist
+
+    Für Methoden von API Clients mit circuit_breaker Attribut: kein Retry
+    wenn der Circuit offen ist oder das Retry Budget aufgebraucht ist.
+    Ohne circuit_breaker verhält es sich wie retry_if_exception_type.
+
+    Example:
+        @retry(retry=retry_if_source_healthy((RateLimitError, ServerError)))
+        def search(self, query): ...
+    """
+
+    def __init__(self, exception_types):
+        self.exception_types = exception_types
+
+    def __call__(self, retry_state) -> bool:
+        outcome = retry_state.outcome
+        if outcome is None or not outcome.failed:
+            return False
+        if not isinstance(outcome.exception(), self.exception_types):
+            return False
+
+        breaker = getattr(retry_state.args[0], "circuit_breaker", None) if retry_state.args else None
+        return breaker is None or breaker.allow_retry()
+
+
 # ============================================
 # Retry Decorators
 # ============================================
@@ -98,11 +397,11 @@ def retry_on_api_error(
     """
     return retry(
         stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(
+        wait=wait_retry_after(wait_exponential(
             multiplier=backoff_factor,
             min=min_wait,
             max=max_wait
-        ),
+        )),
         retry=retry_if_exception_type((
             RateLimitError,
             ServerError,
@@ -260,24 +559,140 @@ def should_retry_status_code(status_code: int) -> bool:
     return status_code in RETRYABLE_CODES
 
 
-def raise_for_status_with_retry(response) -> None:
+def _header_number(value: Any) -> Optional[float]:
+    """Header-Wert als Zahl ("1s" → 1.0), None wenn nicht parsebar"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, str):
+        return None
+    value = value.strip().split(",")[0].strip().rstrip("s")
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_retry_after(value: Any, now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse Retry-After Header (Sekunden oder HTTP-Date)
+
+    Args:
+        value: Header-Wert, z.B. "120" oder "Wed, 21 Oct 2026 07:28:00 GMT"
+        now: Referenzzeit (default: time.time())
+
+    Returns:
+        Wartezeit in Sekunden (>= 0) oder None
+    """
+    seconds = _header_number(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        retry_at = parsedate_to_datetime(value.strip()).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at - (now if now is not None else time.time()))
+
+
+def parse_rate_limit_headers(headers: Any, now: Optional[float] = None) -> Dict[str, float]:
+    """
+    Parse Rate-Limit Header (X-RateLimit-*, RateLimit-*, X-Rate-Limit-*)
+
+    Unterstützt:
+    - X-RateLimit-Remaining / RateLimit-Remaining
+    - X-RateLimit-Reset / RateLimit-Reset (Sekunden bis Reset oder Unix-Timestamp)
+    - X-RateLimit-Limit / X-Rate-Limit-Limit + X-Rate-Limit-Interval (CrossRef, z.B. "1s")
+    - Retry-After
+
+    Args:
+        headers: Response Headers (case-insensitive Mapping, z.B. httpx.Headers)
+        now: Referenzzeit (default: time.time())
+
+    Returns:
+        Dict mit remaining, reset_after, limit, interval, retry_after (nur gefundene Keys)
+    """
+    if headers is None or not hasattr(headers, "get"):
+        return {}
+
+    now = now if now is not None else time.time()
+
+    def _first(*names):
+        for name in names:
+            value = _header_number(headers.get(name))
+            if value is not None:
+                return value
+        return None
+
+    info: Dict[str, float] = {}
+
+    remaining = _first("X-RateLimit-Remaining", "RateLimit-Remaining", "X-Rate-Limit-Remaining")
+    if remaining is not None:
+        info["remaining"] = remaining
+
+    reset = _first("X-RateLimit-Reset", "RateLimit-Reset", "X-Rate-Limit-Reset")
+    if reset is not None:
+        # Große Werte sind Unix-Timestamps, kleine Sekunden bis Reset
+        info["reset_after"] = max(0.0, reset - now) if reset > 1e9 else reset
+
+    limit = _first("X-RateLimit-Limit", "RateLimit-Limit", "X-Rate-Limit-Limit")
+    if limit is not None:
+        info["limit"] = limit
+
+    interval = _first("X-Rate-Limit-Interval", "X-RateLimit-Interval")
+    if interval is not None and interval > 0:
+        info["interval"] = interval
+
+    retry_after = parse_retry_after(headers.get("Retry-After"), now=now)
+    if retry_after is not None:
+        info["retry_after"] = retry_after
+
+    return info
+
+
+def raise_for_status_with_retry(response, rate_limiter=None, circuit_breaker=None) -> None:
     """
     Raise Exception basierend auf Status Code
 
+    Mit rate_limiter (RateLimiter/AsyncRateLimiter) werden die Rate-Limit
+    Header als Feedback weitergegeben: Erfolg → additive increase, 429 →
+    multiplicative decrease, Retry-After/aufgebrauchtes Budget → Pause.
+    Mit circuit_breaker zählen 429/5xx als Fehler, alles andere als Erfolg
+    (4xx sind Client-Fehler, die Source ist gesund).
+
     Args:
-        response: requests.Response object
+        response: requests.Response / httpx.Response object
+        rate_limiter: Optional Limiter der Quelle (adaptive=True für AIMD)
+        circuit_breaker: Optional CircuitBreaker der Quelle
 
     Raises:
-        RateLimitError: Bei 429
-        ServerError: Bei 5xx
+        RateLimitError: Bei 429 (retry_after gesetzt wenn Header vorhanden)
+        ServerError: Bei 5xx (retry_after gesetzt wenn Header vorhanden)
         HTTPError: Bei anderen Errors
     """
+    info = parse_rate_limit_headers(getattr(response, "headers", None))
+    retry_after = info.get("retry_after")
+
+    if circuit_breaker is not None:
+        if response.status_code == 429 or 500 <= response.status_code < 600:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+
     if response.status_code == 429:
-        raise RateLimitError(f"Rate limit exceeded: {response.text}")
+        if rate_limiter is not None:
+            rate_limiter.on_throttle(retry_after)
+        raise RateLimitError(f"Rate limit exceeded: {response.text}", retry_after=retry_after)
     elif 500 <= response.status_code < 600:
-        raise ServerError(f"Server error ({response.status_code}): {response.text}")
+        if rate_limiter is not None and retry_after is not None:
+            rate_limiter.pause(retry_after)
+        raise ServerError(f"Server error ({response.status_code}): {response.text}", retry_after=retry_after)
     else:
         response.raise_for_status()
+        if rate_limiter is not None:
+            rate_limiter.update_from_headers(info)
+            rate_limiter.on_success()
 
 
 # ============================================
@@ -0,0 +1,554 @@
+"""
+Shared (Cross-Process) Rate Limiter für Academic Agent v2.3+
+
+Token Buckets und Daily Quotas in einer SQLite-Datei, damit parallel
+laufende Prozesse (Coordinator-Steps, mehrere Recherchen) sich ein Limit
+pro Source teilen statt jeweils mit vollem Bucket zu starten.
+
+Features:
+- Drop-in für RateLimiter/AsyncRateLimiter (acquire, try_acquire, wait_if_needed, get_wait_time, reset)
+- Ein Bucket pro Name (z.B. "openalex"), geteilt von Sync + Async Limiter und allen Prozessen
+- Daily Limit prozessübergreifend (OpenAlex anonymous: 100 req/Tag)
+- Atomare Updates per BEGIN IMMEDIATE (SQLite WAL, busy_timeout)
+- Exakte Wartezeiten statt Polling (Wartezeit aus Bucket-State berechnet)
+- Retry-After Pausen gelten für alle Prozesse (Adaptive Mode wie RateLimiter)
+
+Usage:
+    from src.utils.shared_rate_limiter import SharedRateLimiter
+
+    limiter = SharedRateLimiter("openalex", requests_per_second=1, daily_limit=100)
+    limiter.acquire()
+
+    # Bestehenden Limiter eines Clients ersetzen
+    client.rate_limiter = SharedRateLimiter.from_limiter("openalex", client.rate_limiter)
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from src.utils.rate_limiter import PRIORITY_DEFAULT, AsyncRateLimiter, RateLimiter
+
+# Setup Logging
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# Shared Bucket Store
+# ============================================
+
+class SharedBucketStore:
+    """
+    SQLite-backed Token Bucket State
+
+    Eine Zeile pro Bucket: tokens, last_update, daily_count, daily_reset_time,
+    paused_until. Jede Operation ist eine eigene IMMEDIATE-Transaktion, d.h.
+    Refill + Entnahme sind atomar über alle Prozesse.
+    """
+
+    def __init__(self, state_file: Optional[Path] = None, busy_timeout: float = 30.0):
+        """
+        Args:
+            state_file: State DB Pfad (default: ~/.cache/academic_agent/rate_limits.db)
+            busy_timeout: Sekunden, die auf Schreib-Locks anderer Prozesse gewartet wird
+        """
+        self.state_file = Path(state_file) if state_file else default_state_file()
+        self.busy_timeout = busy_timeout
+        self.lock = Lock()
+
+        # Create state directory
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Initialize DB
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Neue Connection (pro Operation, autocommit - Transaktionen explizit)"""
+        return sqlite3.connect(str(self.state_file), timeout=self.busy_timeout, isolation_level=None)
+
+    def _init_db(self) -> None:
+        """Initialisiert Bucket-Tabelle"""
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    last_update REAL NOT NULL,
+                    daily_count INTEGER NOT NULL DEFAULT 0,
+                    daily_reset_time REAL NOT NULL,
+                    paused_until REAL NOT NULL DEFAULT 0
+                )
+            """)
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _bucket(self, name: str, burst_size: int, now: float):
+        """
+        Bucket-State in einer IMMEDIATE-Transaktion laden und zurückschreiben
+
+        Yields:
+            Mutable state dict (wird bei Erfolg gespeichert)
+        """
+        with self.lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT tokens, last_update, daily_count, daily_reset_time, paused_until "
+                    "FROM buckets WHERE name = ?", (name,)
+                ).fetchone()
+
+                if row:
+                    state = dict(zip(
+                        ("tokens", "last_update", "daily_count", "daily_reset_time", "paused_until"), row
+                    ))
+                else:
+                    state = {
+                        "tokens": float(burst_size),
+                        "last_update": now,
+                        "daily_count": 0,
+                        "daily_reset_time": now + 86400,
+                        "paused_until": 0.0,
+                    }
+
+                yield state
+
+                conn.execute("""
+                    INSERT OR REPLACE INTO buckets
+                        (name, tokens, last_update, daily_count, daily_reset_time, paused_until)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (name, state["tokens"], state["last_update"], state["daily_count"],
+                      state["daily_reset_time"], state["paused_until"]))
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _refill(state: Dict[str, Any], rate: float, burst_size: int, now: float) -> None:
+        """Refill wie RateLimiter._refill_tokens (last_update in der Zukunft = Pause)"""
+        if now >= state["daily_reset_time"]:
+            state["daily_count"] = 0
+            state["daily_reset_time"] = now + 86400
+        if now <= state["last_update"]:
+            return
+        state["tokens"] = min(burst_size, state["tokens"] + (now - state["last_update"]) * rate)
+        state["last_update"] = now
+
+    @staticmethod
+    def _wait_time(state: Dict[str, Any], tokens: int, rate: float, now: float) -> float:
+        """Sekunden bis tokens verfügbar sind"""
+        if state["tokens"] >= tokens and now >= state["last_update"]:
+            return 0.0
+        return max(0.0, state["last_update"] - now) + max(0.0, tokens - state["tokens"]) / rate
+
+    def take(
+        self,
+        name: str,
+        tokens: int,
+        rate: float,
+        burst_size: int,
+        daily_limit: Optional[int] = None
+    ) -> float:
+        """
+        Tokens entnehmen, wenn verfügbar
+
+        Args:
+            name: Bucket Name
+            tokens: Anzahl Tokens
+            rate: Refill-Rate (req/s) des aufrufenden Limiters
+            burst_size: Bucket-Kapazität
+            daily_limit: Optional tägliches Limit (über alle Prozesse)
+
+        Returns:
+            0.0 wenn entnommen, sonst Wartezeit in Sekunden
+
+        Raises:
+            ValueError: Wenn daily_limit erreicht
+        """
+        now = time.time()
+        with self._bucket(name, burst_size, now) as state:
+            self._refill(state, rate, burst_size, now)
+
+            if daily_limit and state["daily_count"] >= daily_limit:
+                raise ValueError(
+                    f"Daily limit reached ({daily_limit}) for '{name}'. "
+                    f"Resets at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(state['daily_reset_time']))}"
+                )
+
+            wait = self._wait_time(state, tokens, rate, now)
+            if wait == 0.0:
+                state["tokens"] -= tokens
+                state["daily_count"] += tokens
+            return wait
+
+    def wait_time(self, name: str, tokens: int, rate: float, burst_size: int) -> float:
+        """Wartezeit bis tokens verfügbar (ohne Entnahme)"""
+        now = time.time()
+        with self._bucket(name, burst_size, now) as state:
+            self._refill(state, rate, burst_size, now)
+            return self._wait_time(state, tokens, rate, now)
+
+    def pause(self, name: str, seconds: float, rate: float, burst_size: int) -> None:
+        """Keine Tokens bis now + seconds (für alle Prozesse)"""
+        now = time.time()
+        resume_at = now + seconds
+        with self._bucket(name, burst_size, now) as state:
+            if resume_at <= state["paused_until"]:
+                return
+            state["paused_until"] = resume_at
+            state["tokens"] = 0.0
+            state["last_update"] = resume_at - 1.0 / rate
+
+    def daily_count(self, name: str) -> int:
+        """Requests im aktuellen 24h-Fenster (über alle Prozesse)"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT daily_count, daily_reset_time FROM buckets WHERE name = ?", (name,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if not row or time.time() >= row[1]:
+            return 0
+        return row[0]
+
+    def reset(self, name: str) -> None:
+        """Bucket löschen (für Testing)"""
+        with self.lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM buckets WHERE name = ?", (name,))
+            finally:
+                conn.close()
+
+
+# ============================================
+# Shared Limiters
+# ============================================
+
+class _SharedBucketMixin:
+    """Gemeinsame Delegation an SharedBucketStore (Sync + Async)"""
+
+    def _init_shared(self, name: str, state_file: Optional[Path], store: Optional[SharedBucketStore]) -> None:
+        self.name = name
+        self.store = store or SharedBucketStore(state_file)
+
+    @classmethod
+    def from_limiter(
+        cls,
+        name: str,
+        limiter,
+        state_file: Optional[Path] = None,
+        store: Optional[SharedBucketStore] = None
+    ):
+        """
+        Shared Limiter mit den Einstellungen eines bestehenden Limiters
+
+        Args:
+            name: Bucket Name (z.B. Source "openalex")
+            limiter: RateLimiter/AsyncRateLimiter, dessen Rate/Burst/Daily Limit übernommen wird
+            state_file: State DB Pfad (default: ~/.cache/academic_agent/rate_limits.db)
+            store: Optional bestehender SharedBucketStore
+        """
+        return cls(
+            name,
+            requests_per_second=limiter.base_rate,
+            burst_size=limiter.burst_size,
+            daily_limit=limiter.daily_limit,
+            state_file=state_file,
+            store=store,
+            adaptive=limiter.adaptive,
+            min_rate=limiter.min_rate,
+            max_rate=limiter.max_rate,
+            increase_step=limiter.increase_step,
+            decrease_factor=limiter.decrease_factor
+        )
+
+    def pause(self, seconds: float) -> None:
+        """Pause für alle Prozesse (z.B. Retry-After)"""
+        if seconds is None or seconds <= 0:
+            return
+        self.paused_until = max(self.paused_until, time.time() + seconds)
+        self.store.pause(self.name, seconds, self.rate, self.burst_size)
+        logger.info(f"Shared rate limiter '{self.name}' paused for {seconds:.1f}s")
+
+    def get_wait_time(self, tokens: int = 1) -> float:
+        """Wartezeit bis tokens verfügbar (geteilter State)"""
+        return self.store.wait_time(self.name, tokens, self.rate, self.burst_size)
+
+    def daily_usage(self) -> int:
+        """Requests im aktuellen 24h-Fenster über alle Prozesse"""
+        return self.store.daily_count(self.name)
+
+    def _try_take(self, tokens: int) -> bool:
+        """Non-blocking Entnahme (daily_limit erreicht → False)"""
+        try:
+            return self.store.take(self.name, tokens, self.rate, self.burst_size, self.daily_limit) == 0.0
+        except ValueError:
+            return False
+
+
+class SharedRateLimiter(_SharedBucketMixin, RateLimiter):
+    """
+    Cross-Process Rate Limiter (Sync), Drop-in für RateLimiter
+
+    Alle Limiter mit gleichem name und gleicher State-Datei teilen sich
+    einen Token Bucket und ein Daily Limit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: float,
+        burst_size: Optional[int] = None,
+        daily_limit: Optional[int] = None,
+        state_file: Optional[Path] = None,
+        store: Optional[SharedBucketStore] = None,
+        **adaptive_kwargs
+    ):
+        """
+        Args:
+            name: Bucket Name (z.B. "openalex")
+            requests_per_second: Max Requests pro Sekunde
+            burst_size: Max Burst Size (default: requests_per_second, min. 1)
+            daily_limit: Optional tägliches Limit (prozessübergreifend)
+            state_file: State DB Pfad (default: ~/.cache/academic_agent/rate_limits.db)
+            store: Optional bestehender SharedBucketStore
+            **adaptive_kwargs: adaptive, min_rate, max_rate, ... (siehe RateLimiter)
+        """
+        super().__init__(requests_per_second, burst_size, daily_limit, **adaptive_kwargs)
+        self._init_shared(name, state_file, store)
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None, priority: int = PRIORITY_DEFAULT) -> bool:
+        """
+        Acquire tokens (blockiert bis verfügbar, schläft exakt die Wartezeit)
+
+        priority wird für API-Kompatibilität akzeptiert, zwischen Prozessen
+        gibt es keine Warteschlange.
+
+        Returns:
+            True wenn erfolgreich, False bei Timeout
+
+        Raises:
+            ValueError: Wenn daily_limit erreicht
+        """
+        start_time = time.time()
+
+        while True:
+            wait = self.store.take(self.name, tokens, self.rate, self.burst_size, self.daily_limit)
+            if wait == 0.0:
+                return True
+
+            if timeout is not None and (time.time() - start_time) + wait > timeout:
+                return False
+
+            time.sleep(wait)
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Versucht tokens zu acquiren (non-blocking)"""
+        return self._try_take(tokens)
+
+    def reset(self) -> None:
+        """Reset State (für Testing)"""
+        super().reset()
+        self.store.reset(self.name)
+
+
+class AsyncSharedRateLimiter(_SharedBucketMixin, AsyncRateLimiter):
+    """
+    Cross-Process Rate Limiter (Async), Drop-in für AsyncRateLimiter
+
+    Die SQLite-Transaktionen laufen per asyncio.to_thread außerhalb des Event
+    Loops (BEGIN IMMEDIATE kann bis busy_timeout auf andere Prozesse warten);
+    gewartet wird per asyncio.sleep. pause() wird synchron aus
+    raise_for_status_with_retry aufgerufen - der Store-Write läuft dann als
+    Task im Worker Thread, acquire() wartet vorher auf offene Pausen.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: float,
+        burst_size: Optional[int] = None,
+        daily_limit: Optional[int] = None,
+        state_file: Optional[Path] = None,
+        store: Optional[SharedBucketStore] = None,
+        **adaptive_kwargs
+    ):
+        """
+        Args:
+            name: Bucket Name (z.B. "openalex")
+            requests_per_second: Max Requests pro Sekunde
+            burst_size: Max Burst Size (default: requests_per_second, min. 1)
+            daily_limit: Optional tägliches Limit (prozessübergreifend)
+            state_file: State DB Pfad (default: ~/.cache/academic_agent/rate_limits.db)
+            store: Optional bestehender SharedBucketStore
+            **adaptive_kwargs: adaptive, min_rate, max_rate, ... (siehe AsyncRateLimiter)
+        """
+        super().__init__(requests_per_second, burst_size, daily_limit, **adaptive_kwargs)
+        self._init_shared(name, state_file, store)
+        self._pending_pauses: set = set()
+
+    def pause(self, seconds: float) -> None:
+        """Pause für alle Prozesse (im Event Loop ohne blockierende SQLite-Transaktion)"""
+        if seconds is None or seconds <= 0:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            super().pause(seconds)
+            return
+
+        self.paused_until = max(self.paused_until, time.time() + seconds)
+        task = loop.create_task(
+            asyncio.to_thread(self.store.pause, self.name, seconds, self.rate, self.burst_size)
+        )
+        self._pending_pauses.add(task)
+        task.add_done_callback(self._pause_done)
+        logger.info(f"Shared rate limiter '{self.name}' paused for {seconds:.1f}s")
+
+    def _pause_done(self, task: "asyncio.Task") -> None:
+        self._pending_pauses.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Shared rate limiter '{self.name}' pause not stored: {task.exception()}")
+
+    async def _await_pending_pauses(self) -> None:
+        """Wait until pauses requested in this loop are in the shared store"""
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._pending_pauses if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def acquire(self, tokens: int = 1, timeout: Optional[float] = None, priority: int = PRIORITY_DEFAULT) -> bool:
+        """
+        Acquire tokens (async, schläft exakt die Wartezeit)
+
+        priority wird für API-Kompatibilität akzeptiert (siehe SharedRateLimiter.acquire).
+
+        Returns:
+            True wenn erfolgreich, False bei Timeout
+
+        Raises:
+            ValueError: Wenn daily_limit erreicht
+        """
+        start_time = time.time()
+        await self._await_pending_pauses()
+
+        while True:
+            wait = await asyncio.to_thread(
+                self.store.take, self.name, tokens, self.rate, self.burst_size, self.daily_limit
+            )
+            if wait == 0.0:
+                return True
+
+            if timeout is not None and (time.time() - start_time) + wait > timeout:
+                return False
+
+            await asyncio.sleep(wait)
+
+    async def try_acquire(self, tokens: int = 1) -> bool:
+        """Non-blocking acquire (async, Store-Zugriff im Worker Thread)"""
+        await self._await_pending_pauses()
+        return await asyncio.to_thread(self._try_take, tokens)
+
+    def reset(self) -> None:
+        """Reset State (für Testing)"""
+        self.store.reset(self.name)
+
+
+# ============================================
+# Factory Functions
+# ============================================
+
+def default_state_file() -> Path:
+    """Default shared limiter state location"""
+    return Path.home() / ".cache" / "academic_agent" / "rate_limits.db"
+
+
+def share_client_rate_limiters(client, name: str, store: SharedBucketStore) -> None:
+    """
+    Ersetzt rate_limiter/async_rate_limiter eines API Clients durch Shared Limiter
+
+    Sync und Async Pfad des Clients nutzen danach denselben Bucket.
+
+    Args:
+        client: API Client mit rate_limiter (+ optional async_rate_limiter)
+        name: Bucket Name (Source)
+        store: SharedBucketStore
+    """
+    client.rate_limiter = SharedRateLimiter.from_limiter(name, client.rate_limiter, store=store)
+    if hasattr(client, "async_rate_limiter"):
+        client.async_rate_limiter = AsyncSharedRateLimiter.from_limiter(
+            name, client.async_rate_limiter, store=store
+        )
+
+
+def create_shared_bucket_store_from_config(shared_config) -> Optional[SharedBucketStore]:
+    """
+    Create SharedBucketStore from SharedRateLimitConfig
+
+    Args:
+        shared_config: SharedRateLimitConfig (api_config.shared_rate_limits)
+
+    Returns:
+        SharedBucketStore or None if disabled
+    """
+    if not shared_config or not shared_config.enabled:
+        return None
+
+    state_file = Path(shared_config.state_file).expanduser() if shared_config.state_file else None
+    return SharedBucketStore(state_file=state_file)
+
+
+# ============================================
+# CLI Test
+# ============================================
+
+if __name__ == "__main__":
+    """
+    Test SharedRateLimiter
+
+    Run:
+        python -m src.utils.shared_rate_limiter
+    """
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    print("Testing SharedRateLimiter...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = Path(tmp) / "rate_limits.db"
+
+        # 4 Prozesse teilen sich 20 req/s (Burst 1) → 40 Requests ≈ 2s
+        def _worker(n):
+            limiter = SharedRateLimiter("demo", requests_per_second=20, burst_size=1, state_file=state_file)
+            for _ in range(n):
+                limiter.acquire()
+
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_worker, [10] * 4))
+        elapsed = time.time() - start
+        print(f"  40 requests from 4 processes in {elapsed:.2f}s (expected ≈ 2.0s)")
+
+        limiter = SharedRateLimiter("quota", requests_per_second=100, daily_limit=3, state_file=state_file)
+        for _ in range(3):
+            limiter.acquire()
+        other = SharedRateLimiter("quota", requests_per_second=100, daily_limit=3, state_file=state_file)
+        assert not other.try_acquire()
+        print(f"  ✅ Daily limit shared: {other.daily_usage()}/3")
+
+    print("\n✅ All tests passed!")
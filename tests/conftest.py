@@ -356,3 +356,12 @@ def cleanup_test_files(temp_dir):
     """Automatically cleanup test files after each test"""
     yield
     # Cleanup is handled by temp_dir fixture
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Circuit breakers are process-wide per source - isolate tests"""
+    from src.utils.retry import reset_circuit_breakers as _reset
+    _reset()
+    yield
+    _reset()
@@ -0,0 +1,105 @@
+"""
+Unit Tests für src/ranking/bm25_scorer.py
+
+Run:
+    pytest tests/unit/test_bm25_scorer.py -v
+"""
+
+import pytest
+
+from src.ranking import bm25_scorer
+from src.ranking.bm25_scorer import BM25Scorer, bm25_relevance, tokenize
+from src.ranking.ranking_engine import RankingEngine
+from src.search.crossref_client import Paper
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture
+def papers():
+    return [
+        Paper(doi="10.1/governance", title="DevOps Governance Frameworks", authors=["A"],
+              abstract="We study governance of DevOps pipelines in regulated enterprises."),
+        Paper(doi="10.2/maintain", title="Maintaining Legacy Systems", authors=["B"],
+              abstract="Maintenance strategies and their maintainability trade-offs."),
+        Paper(doi="10.3/ai", title="AI for Code Review", authors=["C"],
+              abstract="Applying AI models to code review in DevOps teams."),
+        Paper(doi="10.4/none", title="Deep Learning for Images", authors=["D"]),
+    ]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run each test with the vectorized and the pure Python path"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(bm25_scorer, "np", None)
+    return request.param
+
+
+# ============================================
+# Tests
+# ============================================
+
+class TestTokenize:
+
+    def test_whole_words(self):
+        assert tokenize("AI-driven DevOps: Maintaining CI/CD") == [
+            "ai", "driven", "devops", "maintaining", "ci", "cd"
+        ]
+        assert tokenize(None) == []
+
+
+class TestBM25Scorer:
+    """Test BM25 relevance over title + abstract"""
+
+    def test_ranks_matching_papers_first(self, papers, backend):
+        relevance = bm25_relevance(papers, "DevOps Governance")
+
+        assert max(relevance, key=relevance.get) == "10.1/governance"
+        assert relevance["10.3/ai"] > relevance["10.2/maintain"] == 0.0
+        assert relevance["10.4/none"] == 0.0
+        assert all(0.0 <= value <= 1.0 for value in relevance.values())
+
+    def test_no_substring_matches(self, papers, backend):
+        """ai does not match maintain/maintainability"""
+        relevance = bm25_relevance(papers, "AI")
+
+        assert relevance["10.2/maintain"] == 0.0
+        assert relevance["10.3/ai"] > 0.0
+
+    def test_full_title_match_saturates(self, papers, backend):
+        relevance = BM25Scorer(title_weight=1.0, abstract_weight=0.0).score_papers(papers, "legacy systems")
+
+        assert relevance["10.2/maintain"] == pytest.approx(1.0)
+
+    def test_backends_agree(self, papers):
+        pytest.importorskip("numpy")
+        vectorized = BM25Scorer().fit([p.title for p in papers], [p.abstract for p in papers])
+        expected = vectorized.score("DevOps governance AI review")
+
+        bm25_scorer.np, numpy = None, bm25_scorer.np
+        try:
+            python = BM25Scorer().fit([p.title for p in papers], [p.abstract for p in papers])
+            assert python.score("DevOps governance AI review") == pytest.approx(expected)
+        finally:
+            bm25_scorer.np = numpy
+
+    def test_empty_query_is_neutral(self, papers):
+        assert BM25Scorer().fit([p.title for p in papers]).score("  ") == [0.5] * 4
+
+
+class TestRankingEngineDefault:
+    """BM25 is the default relevance provider of the RankingEngine"""
+
+    def test_llm_scores_take_precedence(self, papers):
+        engine = RankingEngine()
+
+        relevance = engine._relevance_scores(papers, "DevOps Governance", {"10.4/none": 0.9})
+
+        assert relevance["10.4/none"] == 0.9
+        assert relevance["10.1/governance"] > relevance["10.2/maintain"]
+        assert RankingEngine(lexical_relevance=False)._relevance_scores(papers, "q", None) is None
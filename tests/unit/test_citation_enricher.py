@@ -0,0 +1,151 @@
+"""
+Unit Tests für src/ranking/citation_enricher.py
+
+Run:
+    pytest tests/unit/test_citation_enricher.py -v
+"""
+
+import json
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from src.ranking.citation_enricher import CitationEnricher, enrich_citations
+from src.ranking import ranking_engine
+from src.ranking.ranking_engine import RankingEngine
+from src.search.crossref_client import Paper
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+def _client(counts, batch_size=2, failing=()):
+    """Mock client whose get_by_dois resolves DOIs from counts (failing DOIs are reported as failed)"""
+    def _get_by_dois(dois, failed=None):
+        if failed is not None:
+            failed.update(doi for doi in dois if doi in failing)
+        return {
+            doi: Paper(doi=doi, title="", authors=[], citations=counts[doi])
+            for doi in dois if doi in counts and doi not in failing
+        }
+
+    client = Mock()
+    client.DOI_BATCH_SIZE = batch_size
+    client.get_by_dois.side_effect = _get_by_dois
+    return client
+
+
+@pytest.fixture
+def clients():
+    s2 = _client({"10.1/a": 10, "10.1/b": 3})
+    openalex = _client({"10.1/a": 12, "10.1/b": 1})
+    return s2, openalex
+
+
+@pytest.fixture
+def enricher(temp_dir, clients):
+    s2, openalex = clients
+    return CitationEnricher(cache_file=temp_dir / "citations.db", s2_client=s2, openalex_client=openalex)
+
+
+# ============================================
+# Tests
+# ============================================
+
+class TestCitationEnricher:
+    """Test batched lookup, max across sources, cache and budget"""
+
+    def test_max_across_sources(self, enricher):
+        """Dicts and Papers get the highest count any source reports"""
+        papers = [
+            {"doi": "https://doi.org/10.1/A", "citations": None},
+            Paper(doi="10.1/b", title="B", authors=[], citations=None),
+            {"doi": "10.1/unknown", "citations": None},
+        ]
+
+        enrich_citations(papers, enricher)
+
+        assert papers[0]["citations"] == 12
+        assert papers[1].citations == 3
+        assert papers[2]["citations"] is None
+
+    def test_only_missing_by_default(self, enricher, clients):
+        """Papers that already have a count are not looked up"""
+        enricher.enrich([Paper(doi="10.1/a", title="A", authors=[], citations=5)])
+
+        assert clients[0].get_by_dois.call_count == 0
+
+    def test_cache_hits_skip_lookups(self, enricher, clients):
+        """Second run (incl. DOIs no source knows) is answered from cache"""
+        enricher.enrich([{"doi": "10.1/a", "citations": None}, {"doi": "10.1/unknown", "citations": None}])
+        papers = [{"doi": "10.1/a", "citations": None}, {"doi": "10.1/unknown", "citations": None}]
+        enricher.enrich(papers)
+
+        assert clients[0].get_by_dois.call_count == 1
+        assert papers[0]["citations"] == 12
+        assert enricher.get_stats()["cache_hits"] == 2
+
+    def test_request_budget(self, temp_dir):
+        """At most max_requests * batch size DOIs per source, skipped DOIs are not cached"""
+        s2 = _client({f"10.1/{i}": i for i in range(10)}, batch_size=2)
+        enricher = CitationEnricher(
+            sources=["semantic_scholar"], max_requests=2, cache_file=temp_dir / "c.db", s2_client=s2
+        )
+        papers = [{"doi": f"10.1/{i}", "citations": None} for i in range(10)]
+
+        enricher.enrich(papers)
+
+        assert s2.get_by_dois.call_args.args[0] == ["10.1/0", "10.1/1", "10.1/2", "10.1/3"]
+        assert [p["citations"] for p in papers[:5]] == [0, 1, 2, 3, None]
+
+    def test_source_failure_is_not_cached(self, enricher, clients):
+        """A failed source leaves the DOI uncached so the next run retries"""
+        clients[1].get_by_dois.side_effect = RuntimeError("down")
+        enricher.enrich([{"doi": "10.1/a", "citations": None}])
+
+        assert enricher.cache.get("citations:10.1/a") is None
+
+    def test_failed_batch_is_not_cached(self, temp_dir):
+        """DOIs of a failed batch stay uncached, answered DOIs are cached"""
+        s2 = _client({"10.1/a": 10, "10.1/b": 3}, failing={"10.1/b"})
+        openalex = _client({"10.1/a": 12})
+        enricher = CitationEnricher(cache_file=temp_dir / "c.db", s2_client=s2, openalex_client=openalex)
+        papers = [{"doi": "10.1/a", "citations": None}, {"doi": "10.1/b", "citations": None}]
+
+        enricher.enrich(papers)
+
+        assert enricher.cache.get("citations:10.1/a") == {"citations": 12}
+        assert enricher.cache.get("citations:10.1/b") is None
+        assert papers[1]["citations"] is None
+
+    def test_ranking_engine_enriches_before_scoring(self, enricher):
+        """RankingEngine fills missing counts before the quality score"""
+        papers = [Paper(doi="10.1/a", title="DevOps", authors=[], year=2020, citations=None)]
+
+        scored = RankingEngine(citation_enricher=enricher).rank_with_scores(papers, "devops")
+
+        assert papers[0].citations == 12
+        assert scored[0]["scores"]["quality"] > 0.1
+
+    def test_ranking_cli_builds_enricher_from_config(self, enricher, temp_dir, monkeypatch):
+        """ranking_engine CLI enriches papers without counts via api_config.citation_enricher"""
+        papers_file, output_file = temp_dir / "papers.json", temp_dir / "ranked.json"
+        papers_file.write_text(json.dumps([{"doi": "10.1/a", "title": "DevOps", "year": 2020}]))
+        configs = []
+
+        def _factory(config):
+            configs.append(config)
+            return enricher
+
+        monkeypatch.setattr(ranking_engine, "create_citation_enricher_from_config", _factory)
+        monkeypatch.setattr(sys, "argv", [
+            "ranking_engine", "--papers", str(papers_file), "--query", "devops", "--no-score-cache",
+            "--output", str(output_file)
+        ])
+
+        ranking_engine.main()
+
+        assert configs[0].enabled
+        assert json.loads(output_file.read_text())["papers"][0]["citations"] == 12
@@ -0,0 +1,178 @@
+"""
+Unit Tests für src/search/corpus_store.py + SearchEngine Source "corpus"
+
+Run:
+    pytest tests/unit/test_corpus_store.py -v
+"""
+
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.search.corpus_store import CorpusStore, create_corpus_store_from_config
+from src.search.crossref_client import Paper
+from src.search.search_engine import SearchEngine
+from src.utils.config import CorpusConfig
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture
+def corpus(temp_dir):
+    """CorpusStore backed by a temporary SQLite file"""
+    return CorpusStore(db_file=temp_dir / "corpus.db")
+
+
+def _paper(doi, title, **kwargs):
+    return Paper(doi=doi, title=title, authors=["A"], **kwargs)
+
+
+# ============================================
+# CorpusStore Tests
+# ============================================
+
+class TestCorpusStore:
+    """Test upsert, FTS search and DOI lookup"""
+
+    def test_upsert_merges_without_overwriting(self, corpus):
+        """Second upsert fills empty fields and keeps max citations"""
+        corpus.upsert([_paper("10.1/A", "DevOps Governance", venue="IEEE", citations=10)])
+        corpus.upsert([_paper("https://doi.org/10.1/a", "Other Title", abstract="Text", citations=3)])
+
+        paper = corpus.get_by_doi("10.1/a")
+        assert corpus.count() == 1
+        assert paper.title == "DevOps Governance"
+        assert paper.abstract == "Text"
+        assert paper.citations == 10
+
+    def test_search_ranks_title_and_abstract(self, corpus):
+        """FTS5 search matches all terms (stemmed) over title + abstract"""
+        corpus.upsert([
+            _paper("10.1/a", "Governance of DevOps Pipelines"),
+            _paper("10.1/b", "Ethics", abstract="Governance of machine learning pipelines"),
+            _paper("10.1/c", "Quantum Chemistry"),
+        ])
+
+        assert [p.doi for p in corpus.search("devops governance")] == ["10.1/a"]
+        assert sorted(p.doi for p in corpus.search("pipeline governance")) == ["10.1/a", "10.1/b"]
+
+    def test_search_repairs_malformed_boolean_syntax(self, corpus):
+        """Dangling operators/parentheses do not raise FTS5 syntax errors"""
+        corpus.upsert([_paper("10.1/a", "DevOps Governance")])
+        assert len(corpus.search('"DevOps" AND (governance OR)')) == 1
+        assert len(corpus.search("(DevOps OR) governance)")) == 1
+        assert corpus.search("!!!") == []
+
+    def test_search_honours_boolean_operators(self, corpus):
+        """OR groups and NOT from generated queries keep their meaning in FTS5"""
+        corpus.upsert([
+            _paper("10.1/a", "DevOps governance at scale"),
+            _paper("10.1/b", "DevOps compliance automation"),
+            _paper("10.1/c", "Compliance in banking"),
+        ])
+
+        query = '"DevOps" AND ("governance" OR "compliance")'
+        assert corpus._build_match_query(query) == '"devops" AND ("governance" OR "compliance")'
+        assert sorted(p.doi for p in corpus.search(query)) == ["10.1/a", "10.1/b"]
+        assert sorted(p.doi for p in corpus.search("DevOps AND (governance OR compliance)")) == ["10.1/a", "10.1/b"]
+        assert [p.doi for p in corpus.search("compliance NOT banking")] == ["10.1/b"]
+
+    def test_papers_without_doi_skipped(self, corpus):
+        """Upsert is keyed by DOI"""
+        assert corpus.upsert([_paper(None, "No DOI")]) == 0
+
+    def test_factory_respects_enabled(self, temp_dir):
+        """Disabled config returns None"""
+        assert create_corpus_store_from_config(CorpusConfig()) is None
+        store = create_corpus_store_from_config(
+            CorpusConfig(enabled=True, db_file=str(temp_dir / "c.db"))
+        )
+        assert store.db_file == temp_dir / "c.db"
+
+
+# ============================================
+# SearchEngine Integration Tests
+# ============================================
+
+class TestSearchEngineCorpus:
+    """Test corpus as local search source"""
+
+    def test_network_results_recorded_and_corpus_first(self, corpus):
+        """Network hits are upserted, corpus answers later searches"""
+        engine = SearchEngine(corpus_store=corpus, sources=["corpus", "crossref"])
+        engine.crossref_client.search = Mock(return_value=[_paper("10.1/a", "DevOps Governance")])
+
+        engine.search("devops governance", limit=10)
+        papers = engine.search("devops governance", limit=10, sources=["corpus"])
+
+        assert corpus.count() == 1
+        assert [(p.doi, p.source) for p in papers] == [("10.1/a", "corpus")]
+        engine.close()
+
+    def test_min_results_skips_network(self, corpus):
+        """Enough corpus hits → network sources are not queried"""
+        corpus.upsert([_paper("10.1/a", "DevOps Governance")])
+        engine = SearchEngine(corpus_store=corpus, corpus_min_results=1)
+        engine.crossref_client.search = Mock(return_value=[])
+
+        papers = engine.search("devops governance", limit=10)
+
+        assert engine.sources[0] == "corpus"
+        assert [p.source for p in papers] == ["corpus"]
+        engine.crossref_client.search.assert_not_called()
+        engine.close()
+
+    def test_search_parallel_records_and_uses_corpus(self, corpus):
+        """Parallel path prefetches from the corpus and upserts network hits"""
+        corpus.upsert([_paper("10.1/a", "DevOps Governance")])
+        engine = SearchEngine(corpus_store=corpus, sources=["corpus", "crossref"])
+        engine.crossref_client.search = Mock(return_value=[_paper("10.1/b", "DevOps Governance Pipelines")])
+
+        papers = engine.search_parallel("devops governance", limit=10)
+
+        assert corpus.count() == 2
+        assert sorted((p.doi, p.source) for p in papers) == [("10.1/a", "corpus"), ("10.1/b", "crossref")]
+        engine.close()
+
+    def test_search_parallel_min_results_skips_network(self, corpus):
+        """Enough corpus hits → parallel search queries no network source"""
+        corpus.upsert([_paper("10.1/a", "DevOps Governance")])
+        engine = SearchEngine(corpus_store=corpus, corpus_min_results=1)
+        engine.crossref_client.search = Mock(return_value=[])
+
+        papers = engine.search_parallel("devops governance", limit=10)
+
+        assert [p.source for p in papers] == ["corpus"]
+        engine.crossref_client.search.assert_not_called()
+        engine.close()
+
+    async def test_asearch_uses_corpus(self, corpus):
+        """Async path answers from the corpus as well"""
+        corpus.upsert([_paper("10.1/a", "DevOps Governance")])
+        engine = SearchEngine(corpus_store=corpus, corpus_min_results=1)
+
+        papers = await engine.asearch("devops governance", limit=10)
+
+        assert [p.doi for p in papers] == ["10.1/a"]
+        await engine.aclose()
+        engine.close()
+
+    async def test_async_paths_upsert_off_event_loop(self, corpus):
+        """asearch/asearch_many record network hits in worker threads"""
+        engine = SearchEngine(corpus_store=corpus, sources=["crossref"])
+        engine.crossref_client.asearch = AsyncMock(return_value=[_paper("10.1/a", "DevOps Governance")])
+        threads = []
+        upsert = corpus.upsert
+        corpus.upsert = lambda papers: threads.append(threading.get_ident()) or upsert(papers)
+
+        await engine.asearch("devops governance", limit=10)
+        await engine.asearch_many({"crossref": ["devops", "governance"]}, limit=10)
+
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+        assert corpus.count() == 1
+        await engine.aclose()
+        engine.close()
@@ -346,6 +346,30 @@ class TestPaper:
         assert d["year"] == 2024
         assert d["citations"] == 10
 
+    def test_paper_is_slotted_and_interned(self):
+        """No per-instance __dict__, venue strings are shared"""
+        venue = "".join(["Test ", "Journal"])  # not a compile-time constant
+        paper = Paper(doi="10.1234/a", title="A", authors=["John Doe"], venue=venue)
+        other = Paper(doi="10.1234/b", title="B", authors=["John Doe"], venue="Test Journal")
+
+        assert not hasattr(paper, "__dict__")
+        assert paper.venue is other.venue
+        assert paper.source is None and paper.source_type is None
+
+    def test_paper_raw_data_compressed_roundtrip(self):
+        """raw_data is stored compressed and empty unless given"""
+        raw = {"DOI": "10.1234/test", "title": ["Test Paper"]}
+        paper = Paper(doi="10.1234/test", title="Test Paper", authors=[], raw_data=raw)
+
+        assert isinstance(paper._raw_compressed, bytes)
+        assert paper.raw_data == raw
+        assert Paper(doi="10.1234/x", title="X", authors=[]).raw_data == {}
+
+    def test_client_drops_raw_data_by_default(self, mock_single_work):
+        """Parsed papers keep raw JSON only with keep_raw_data=True"""
+        assert CrossRefClient()._parse_work(mock_single_work).raw_data == {}
+        assert CrossRefClient(keep_raw_data=True)._parse_work(mock_single_work).raw_data == mock_single_work
+
 
 # ============================================
 # Convenience Function Tests
@@ -0,0 +1,231 @@
+"""
+Unit Tests für src/search/deduplicator.py
+
+Run:
+    pytest tests/unit/test_deduplicator.py -v
+"""
+
+import random
+
+from src.search.crossref_client import Paper
+from src.search.deduplicator import Deduplicator, IncrementalDeduplicator, _TitleIndex
+
+
+# ============================================
+# Helpers
+# ============================================
+
+def _paper(doi, title, source_api="crossref", **kwargs):
+    return Paper(doi=doi, title=title, authors=["A"], source_api=source_api, **kwargs)
+
+
+def _bruteforce_title_dedup(deduplicator, papers):
+    """Reference: pairwise comparison against every kept title (pre-index behaviour)"""
+    unique, seen = [], []
+    for paper in papers:
+        title = deduplicator._normalize_title(paper.title)
+        if not any(
+            deduplicator._title_similarity(title, other) >= deduplicator.title_similarity_threshold
+            for other in seen
+        ):
+            unique.append(paper)
+            seen.append(title)
+    return unique
+
+
+def _synthetic_papers(n, seed=42):
+    """Random titles plus perturbed copies (reorder, dropped word, typo, plural)"""
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10)))
+             for _ in range(800)]
+    bases = [[rng.choice(vocab) for _ in range(rng.randint(2, 10))] for _ in range(n * 2 // 3)]
+
+    titles = [" ".join(words).title() for words in bases]
+    while len(titles) < n:
+        words = list(rng.choice(bases))
+        op = rng.randrange(4)
+        if op == 0:
+            rng.shuffle(words)
+        elif op == 1 and len(words) > 2:
+            words.pop(rng.randrange(len(words)))
+        elif op == 2:
+            i = rng.randrange(len(words))
+            j = rng.randrange(len(words[i]))
+            words[i] = words[i][:j] + "x" + words[i][j + 1:]
+        else:
+            words = [word + "s" for word in words]
+        titles.append(" ".join(words) + rng.choice(["", ".", "?"]))
+
+    rng.shuffle(titles)
+    return [_paper(f"10.1/{i}", title) for i, title in enumerate(titles)]
+
+
+# ============================================
+# Deduplicator Tests
+# ============================================
+
+class TestDeduplicator:
+    """Test DOI + title deduplication"""
+
+    def test_doi_duplicates_merged(self):
+        """Same DOI (case/prefix) merges metadata"""
+        papers = [
+            _paper("10.1234/test", "Test", abstract=None),
+            _paper("https://doi.org/10.1234/TEST", "Test", source_api="openalex", abstract="Text"),
+        ]
+
+        unique = Deduplicator().deduplicate(papers)
+
+        assert len(unique) == 1
+        assert unique[0].abstract == "Text"
+
+    def test_title_duplicates_removed(self):
+        """Reordered title with different DOI is a duplicate"""
+        papers = [
+            _paper("10.1/a", "Machine Learning Ethics"),
+            _paper("10.1/b", "Ethics: Machine Learning", source_api="openalex"),
+            _paper("10.1/c", "Deep Learning Safety"),
+        ]
+
+        unique = Deduplicator().deduplicate(papers)
+
+        assert [p.doi for p in unique] == ["10.1/a", "10.1/c"]
+
+    def test_empty_titles_never_match(self):
+        """Papers without title are kept (similarity 0)"""
+        papers = [_paper("10.1/a", ""), _paper("10.1/b", ""), _paper("10.1/c", "!!!")]
+        assert len(Deduplicator()._deduplicate_by_title(papers)) == 3
+
+    def test_papers_without_doi_not_grouped(self):
+        """Papers without DOI are not merged into one '' group"""
+        papers = [_paper(None, "Quantum Chemistry"), _paper("", "Protein Folding")]
+        assert len(Deduplicator().deduplicate(papers)) == 2
+
+    def test_index_matches_bruteforce(self):
+        """Indexed title dedup keeps exactly the papers of the pairwise scan"""
+        deduplicator = Deduplicator()
+        papers = _synthetic_papers(400)
+
+        fast = deduplicator._deduplicate_by_title(papers)
+        reference = _bruteforce_title_dedup(deduplicator, papers)
+
+        assert [p.doi for p in fast] == [p.doi for p in reference]
+        assert len(fast) < len(papers)
+
+    def test_index_matches_bruteforce_randomized(self):
+        """Short random titles (few q-grams, many near misses) match the pairwise scan"""
+        rng = random.Random(11)
+        words = ["ai", "ml", "ops", "dev", "data", "a", "b", "go", "ethics", "x1"]
+
+        for threshold in (0.6, 0.75, 0.85, 0.95):
+            deduplicator = Deduplicator(title_similarity_threshold=threshold)
+            papers = [
+                _paper(f"10.9/{i}", " ".join(rng.choice(words) for _ in range(rng.randint(1, 4))))
+                for i in range(300)
+            ]
+
+            fast = deduplicator._deduplicate_by_title(papers)
+            reference = _bruteforce_title_dedup(deduplicator, papers)
+            assert [p.doi for p in fast] == [p.doi for p in reference], threshold
+
+    def test_first_match_matches_bruteforce(self):
+        """_find_title_duplicate returns the first similar title in insertion order"""
+        rng = random.Random(5)
+        deduplicator = Deduplicator(title_similarity_threshold=0.7)
+        index = _TitleIndex()
+        titles = []
+
+        for _ in range(200):
+            title = deduplicator._normalize_title(
+                " ".join(rng.choice(["devops", "dev", "ops", "governance", "gov"]) for _ in range(rng.randint(1, 3)))
+            )
+            expected = next(
+                (
+                    title_id for title_id, other in enumerate(titles)
+                    if deduplicator._title_similarity(title, other) >= deduplicator.title_similarity_threshold
+                ),
+                None
+            )
+            assert deduplicator._find_title_duplicate(index, title) == expected
+            if expected is None:
+                index.add(_TitleIndex.sort_title(title))
+                titles.append(title)
+
+
+class TestTitleIndex:
+    """Test q-gram index"""
+
+    def test_sort_title_matches_token_sort(self):
+        """Processed titles are the strings fuzz.token_sort_ratio compares"""
+        assert _TitleIndex.sort_title("Governance, DevOps & Compliance") == "compliance devops governance"
+
+    def test_candidates_share_query_pieces(self):
+        """Titles sharing no piece of the query are not candidates"""
+        index = _TitleIndex()
+        index.add(_TitleIndex.sort_title("devops governance frameworks"))
+        index.add(_TitleIndex.sort_title("quantum chemistry simulation"))
+
+        assert index.candidates(_TitleIndex.sort_title("governance frameworks devops"), 0.85) == [0]
+        assert index.candidates(_TitleIndex.sort_title("protein folding"), 0.85) == []
+
+    def test_short_query_falls_back_to_all_titles(self):
+        """Queries too short for q-gram pieces check every title (character bound only)"""
+        index = _TitleIndex()
+        index.add("ba")
+        index.add("xyz")
+        index.add("ab")
+
+        assert index.candidates("ab", 0.3) == [0, 2]
+
+
+# ============================================
+# IncrementalDeduplicator Tests
+# ============================================
+
+class TestIncrementalDeduplicator:
+    """Test add()/merged() streaming API"""
+
+    def test_add_returns_only_new_papers(self):
+        """Second source only yields papers not seen before"""
+        incremental = IncrementalDeduplicator()
+
+        first = incremental.add([_paper("10.1/a", "DevOps Governance", source_api="openalex")])
+        second = incremental.add([
+            _paper("10.1/A", "DevOps Governance", abstract="Text"),
+            _paper("10.1/b", "Governance DevOps", source_api="semantic_scholar"),
+            _paper("10.1/c", "Quantum Chemistry"),
+        ])
+
+        assert [p.doi for p in first] == ["10.1/a"]
+        assert [p.doi for p in second] == ["10.1/c"]
+
+    def test_doi_merge_prefers_source(self):
+        """Same DOI merges metadata, preferred source becomes representative"""
+        incremental = IncrementalDeduplicator()
+        incremental.add([_paper("10.1/a", "Title", source_api="openalex", abstract="Text", citations=9)])
+        incremental.add([_paper("10.1/a", "Title", source_api="crossref", citations=3)])
+
+        merged = incremental.merged()
+        assert len(merged) == 1
+        assert merged[0].source_api == "crossref"
+        assert merged[0].abstract == "Text"
+        assert merged[0].citations == 9
+
+    def test_title_duplicate_doi_becomes_alias(self):
+        """DOI of a title duplicate maps to the kept paper"""
+        incremental = IncrementalDeduplicator()
+        incremental.add([_paper("10.1/a", "Machine Learning Ethics")])
+        incremental.add([_paper("10.1/b", "Machine Learning Ethics", source_api="openalex")])
+        incremental.add([_paper("10.1/b", "Other", source_api="openalex", abstract="Text")])
+
+        merged = incremental.merged()
+        assert [p.doi for p in merged] == ["10.1/a"]
+        assert merged[0].abstract == "Text"
+
+    def test_matches_batch_for_single_add(self):
+        """One add() keeps the same papers as deduplicate()"""
+        papers = _synthetic_papers(300, seed=7)
+        incremental = IncrementalDeduplicator()
+        incremental.add(papers)
+
+        assert [p.doi for p in incremental.merged()] == [p.doi for p in Deduplicator().deduplicate(papers)]
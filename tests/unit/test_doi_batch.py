@@ -0,0 +1,179 @@
+"""
+Unit Tests für get_by_dois() (Batch DOI Lookup) der API Clients + SearchEngine
+
+Run:
+    pytest tests/unit/test_doi_batch.py -v
+"""
+
+import httpx
+import pytest
+from unittest.mock import Mock
+
+from src.search.crossref_client import CrossRefClient, Paper, normalize_doi
+from src.search.openalex_client import OpenAlexClient
+from src.search.semantic_scholar_client import SemanticScholarClient
+from src.search.search_engine import SearchEngine
+from src.utils.cache import ResponseCache
+
+
+# ============================================
+# Helpers
+# ============================================
+
+def _mock_response(payload):
+    response = Mock(spec=httpx.Response)
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+# ============================================
+# normalize_doi
+# ============================================
+
+def test_normalize_doi_strips_prefixes():
+    """Resolver prefixes and case are normalized"""
+    assert normalize_doi("https://doi.org/10.1000/ABC") == "10.1000/abc"
+    assert normalize_doi(" doi:10.1000/x ") == "10.1000/x"
+    assert normalize_doi(None) == ""
+
+
+# ============================================
+# Client Tests
+# ============================================
+
+@pytest.mark.parametrize("client_class, source, payload", [
+    (CrossRefClient, "crossref", {"message": {"DOI": "10.1/a", "title": ["A"]}}),
+    (OpenAlexClient, "openalex", {"doi": "https://doi.org/10.1/a", "title": "A"}),
+    (SemanticScholarClient, "semantic_scholar", {"paperId": "p1", "title": "A", "externalIds": {"DOI": "10.1/a"}}),
+])
+def test_get_by_doi_normalizes_like_batch(temp_dir, client_class, source, payload):
+    """Resolver URL and bare DOI share one request + cache key"""
+    client = client_class(cache=ResponseCache(source, cache_file=temp_dir / "api_cache.db"))
+    client.rate_limiter = Mock()
+    client.client = Mock()
+    client.client.get.return_value = _mock_response(payload)
+
+    assert client.get_by_doi("10.1/a").title == "A"
+    assert client.get_by_doi(" https://doi.org/10.1/A").title == "A"
+    assert client.client.get.call_count == 1
+
+
+class TestOpenAlexGetByDois:
+    """Test OpenAlex OR-filter batching"""
+
+    def test_batches_with_or_filter(self):
+        """DOIs are chunked into filter=doi:a|b requests"""
+        client = OpenAlexClient()
+        client.DOI_BATCH_SIZE = 2
+        client.rate_limiter = Mock()
+        client.client = Mock()
+        client.client.get.side_effect = [
+            _mock_response({"results": [
+                {"doi": "https://doi.org/10.1/a", "title": "A"},
+                {"doi": "https://doi.org/10.1/b", "title": "B"}]}),
+            _mock_response({"results": []}),
+        ]
+
+        papers = client.get_by_dois(["10.1/A", "https://doi.org/10.1/b", "10.1/c", "10.1/a"])
+
+        assert sorted(papers) == ["10.1/a", "10.1/b"]
+        filters = [call.kwargs["params"]["filter"] for call in client.client.get.call_args_list]
+        assert filters == ["doi:10.1/a|10.1/b", "doi:10.1/c"]
+
+    def test_cached_dois_skip_request(self, temp_dir):
+        """DOIs cached by get_by_doi are not fetched again"""
+        client = OpenAlexClient(cache=ResponseCache("openalex", cache_file=temp_dir / "api_cache.db"))
+        client.rate_limiter = Mock()
+        client.client = Mock()
+        client.client.get.return_value = _mock_response({"results": [
+            {"doi": "https://doi.org/10.1/a", "title": "A"}]})
+
+        client.get_by_dois(["10.1/a"])
+        papers = client.get_by_dois(["10.1/a"])
+
+        assert papers["10.1/a"].title == "A"
+        assert client.client.get.call_count == 1
+
+
+class TestSemanticScholarGetByDois:
+    """Test S2 POST /paper/batch"""
+
+    def test_posts_ids_and_skips_nulls(self):
+        """IDs are posted as DOI:..., null entries mean not found"""
+        client = SemanticScholarClient()
+        client.rate_limiter = Mock()
+        client.client = Mock()
+        client.client.post.return_value = _mock_response([
+            {"externalIds": {"DOI": "10.1/A"}, "title": "A", "abstract": "Text"},
+            None,
+        ])
+
+        papers = client.get_by_dois(["10.1/a", "10.1/missing"])
+
+        assert list(papers) == ["10.1/a"]
+        assert client.client.post.call_args.kwargs["json"] == {"ids": ["DOI:10.1/a", "DOI:10.1/missing"]}
+
+    def test_reports_failed_batches(self):
+        """DOIs of a failed batch are reported, resolved batches are kept"""
+        client = SemanticScholarClient()
+        client.DOI_BATCH_SIZE = 1
+        client.cache = None
+        client.rate_limiter = Mock()
+        client.client = Mock()
+        client.client.post.side_effect = [
+            _mock_response([{"externalIds": {"DOI": "10.1/a"}, "title": "A"}]),
+            httpx.ReadTimeout("timed out"),
+        ]
+
+        failed = set()
+        papers = client.get_by_dois(["10.1/a", "10.1/b"], failed=failed)
+
+        assert list(papers) == ["10.1/a"]
+        assert failed == {"10.1/b"}
+
+
+class TestCrossRefGetByDois:
+    """Test CrossRef doi filter batching"""
+
+    def test_uses_comma_separated_doi_filter(self):
+        """DOIs are combined as doi:a,doi:b"""
+        client = CrossRefClient()
+        client.rate_limiter = Mock()
+        client.client = Mock()
+        client.client.get.return_value = _mock_response({"message": {"items": [
+            {"DOI": "10.1/B", "title": ["B"]}]}})
+
+        papers = client.get_by_dois(["10.1/a", "10.1/b"])
+
+        assert list(papers) == ["10.1/b"]
+        assert client.client.get.call_args.kwargs["params"]["filter"] == "doi:10.1/a,doi:10.1/b"
+
+
+# ============================================
+# SearchEngine Tests
+# ============================================
+
+class TestSearchEngineGetByDois:
+    """Test cross-source DOI resolution"""
+
+    def test_fills_missing_from_later_sources(self):
+        """Later sources only get unresolved or abstract-less DOIs"""
+        engine = SearchEngine()
+        engine.openalex_client.get_by_dois = Mock(return_value={
+            "10.1/a": Paper(doi="10.1/a", title="A", authors=[], abstract="", citations=5),
+        })
+        engine.s2_client.get_by_dois = Mock(return_value={
+            "10.1/a": Paper(doi="10.1/a", title="A", authors=[], abstract="Filled", citations=8),
+            "10.1/b": Paper(doi="10.1/b", title="B", authors=[], abstract="B text"),
+        })
+        engine.crossref_client.get_by_dois = Mock(return_value={})
+
+        papers = engine.get_by_dois(["10.1/A", "10.1/b"])
+
+        assert papers["10.1/a"].abstract == "Filled"
+        assert papers["10.1/a"].citations == 8
+        assert papers["10.1/a"].source == "openalex"
+        engine.s2_client.get_by_dois.assert_called_once_with(["10.1/a", "10.1/b"])
+        engine.crossref_client.get_by_dois.assert_not_called()
+        engine.close()
@@ -0,0 +1,197 @@
+"""
+Unit Tests für src/ranking/embedding_scorer.py
+
+Run:
+    pytest tests/unit/test_embedding_scorer.py -v
+"""
+
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.ranking.embedding_scorer import EmbeddingCache, EmbeddingScorer, HashingEmbedder
+from src.ranking import ranking_engine
+from src.ranking.ranking_engine import RankingEngine
+from src.search.crossref_client import Paper
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture
+def papers():
+    return [
+        Paper(doi="10.1/GOV", title="Governing DevOps Pipelines", authors=["A"],
+              abstract="Governance and compliance for continuous delivery."),
+        Paper(doi="10.2/img", title="Deep Learning for Medical Images", authors=["B"],
+              abstract="Convolutional networks for radiology."),
+        Paper(doi="", title="DevSecOps Governance Practices", authors=["C"]),
+    ]
+
+
+@pytest.fixture
+def cache_file(temp_dir):
+    return temp_dir / "embeddings.f32"
+
+
+def _add_many(args):
+    """Worker: add n DOIs one by one, vector value = DOI number (runs in a subprocess)"""
+    cache_file, offset, n = args
+    cache = EmbeddingCache(cache_file, dim=8, signature="a")
+    cache.GROWTH_ROWS = 2
+    for i in range(offset, offset + n):
+        cache.add([f"10.1/{i}"], ["d"], np.full((1, 8), i, dtype=np.float32))
+    cache.close()
+    return n
+
+
+# ============================================
+# Tests
+# ============================================
+
+class TestHashingEmbedder:
+
+    def test_normalized_and_deterministic(self):
+        embedder = HashingEmbedder(dim=64)
+        vectors = embedder.embed(["DevOps governance", "", None])
+
+        assert vectors.shape == (3, 64) and vectors.dtype == np.float32
+        assert np.linalg.norm(vectors[0]) == pytest.approx(1.0, abs=1e-6)
+        assert not vectors[1].any() and not vectors[2].any()
+        assert np.array_equal(vectors[0], HashingEmbedder(dim=64).embed(["devops  GOVERNANCE"])[0])
+
+    def test_chunked_expansion_matches(self, papers):
+        """Blocks of a few features give the same vectors as one block"""
+        texts = [p.abstract or p.title for p in papers] * 3
+        chunked = HashingEmbedder(dim=64)
+        chunked.CHUNK_FEATURES = 7
+
+        assert np.allclose(chunked.embed(texts), HashingEmbedder(dim=64).embed(texts), atol=1e-6)
+
+
+class TestEmbeddingScorer:
+    """Test cosine relevance + per-DOI vector cache"""
+
+    def test_related_wording_scores_higher(self, papers, cache_file):
+        scorer = EmbeddingScorer(cache_file=cache_file)
+
+        scores = scorer.score(papers, "DevOps governance")
+
+        assert scores[0] > scores[1]
+        assert scores[2] > scores[1]  # "DevSecOps" shares n-grams with "DevOps"
+        assert all(0.0 <= value <= 1.0 for value in scores)
+        assert set(scorer.score_papers(papers, "DevOps governance")) == {"10.1/GOV", "10.2/img"}
+
+    def test_vectors_persist_across_runs(self, papers, cache_file):
+        """Papers seen in an earlier run are not embedded again"""
+        with EmbeddingScorer(cache_file=cache_file) as first:
+            expected = first.score(papers, "DevOps governance")
+            assert first.get_stats()["cached_vectors"] == 2
+
+        with EmbeddingScorer(cache_file=cache_file) as second:
+            assert second.score(papers, "DevOps governance") == pytest.approx(expected)
+            stats = second.get_stats()
+
+        assert stats["cache_hits"] == 2
+        assert stats["embedded"] == 1  # only the paper without DOI
+
+    def test_changed_content_is_embedded_again(self, cache_file):
+        """A DOI hydrated with an abstract does not keep its title-only vector"""
+        bare = Paper(doi="10.1/x", title="DevOps governance", authors=[], year=2023)
+        hydrated = Paper(
+            doi="10.1/x", title="DevOps governance", authors=[], year=2023,
+            abstract="Compliance controls for continuous delivery pipelines"
+        )
+
+        with EmbeddingScorer(cache_file=cache_file) as scorer:
+            before = scorer.paper_vectors([bare])
+            after = scorer.paper_vectors([hydrated])
+            again = scorer.paper_vectors([hydrated])
+            stats = scorer.get_stats()
+
+        assert not np.allclose(before, after)
+        assert np.array_equal(after, again)
+        assert stats["embedded"] == 2
+        assert stats["cache_hits"] == 1
+        assert stats["cached_vectors"] == 1
+
+    def test_cache_grows_and_rejects_other_embedder(self, cache_file):
+        cache = EmbeddingCache(cache_file, dim=8, signature="a")
+        cache.GROWTH_ROWS = 2
+        dois = [f"10.1/{i}" for i in range(5)]
+        for i, doi in enumerate(dois):
+            cache.add([doi], ["d"], np.full((1, 8), i, dtype=np.float32))
+        cache.close()
+
+        reopened = EmbeddingCache(cache_file, dim=8, signature="a")
+        assert reopened.vectors(reopened.rows(dois, ["d"] * 5))[:, 0].tolist() == [0, 1, 2, 3, 4]
+        assert reopened.rows(dois[:1], ["other"]) == [None]
+        reopened.close()
+
+        assert len(EmbeddingCache(cache_file, dim=8, signature="b")) == 0
+
+    def test_concurrent_caches_do_not_share_rows(self, cache_file):
+        """Two runs on the same file append behind each other instead of reusing a row"""
+        first = EmbeddingCache(cache_file, dim=8, signature="a")
+        second = EmbeddingCache(cache_file, dim=8, signature="a")
+        second.GROWTH_ROWS = 1
+
+        first.add(["10.1/x"], ["dx"], np.full((1, 8), 1, dtype=np.float32))
+        second.add(["10.1/y"], ["dy"], np.full((1, 8), 2, dtype=np.float32))
+        first.add(["10.1/z"], ["dz"], np.full((1, 8), 3, dtype=np.float32))
+        first.close()
+        second.close()
+
+        reopened = EmbeddingCache(cache_file, dim=8, signature="a")
+        dois = ["10.1/x", "10.1/y", "10.1/z"]
+        rows = reopened.rows(dois, ["dx", "dy", "dz"])
+        assert sorted(rows) == [0, 1, 2]
+        assert reopened.vectors(rows)[:, 0].tolist() == [1, 2, 3]
+        reopened.close()
+
+    def test_processes_keep_doi_vector_pairs(self, cache_file):
+        """4 processes adding concurrently → every DOI still maps to its own vector"""
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            assert sum(pool.map(_add_many, [(cache_file, k * 25, 25) for k in range(4)])) == 100
+
+        cache = EmbeddingCache(cache_file, dim=8, signature="a")
+        dois = [f"10.1/{i}" for i in range(100)]
+        assert len(cache) == 100
+        assert cache.vectors(cache.rows(dois, ["d"] * 100))[:, 0].tolist() == list(range(100))
+        cache.close()
+
+    def test_ranking_engine_backend(self, papers, cache_file):
+        engine = RankingEngine(relevance_scorer=EmbeddingScorer(cache_file=cache_file))
+
+        ranked = engine.rank(papers[:2], "DevOps governance")
+
+        assert ranked[0].doi == "10.1/GOV"
+
+    def test_ranking_cli_builds_scorer_from_config(self, cache_file, temp_dir, monkeypatch):
+        """--relevance embedding uses api_config.embedding_relevance and closes the scorer"""
+        papers_file, output_file = temp_dir / "papers.json", temp_dir / "ranked.json"
+        papers_file.write_text(json.dumps([{"doi": "10.1/a", "title": "DevOps", "year": 2020, "citations": 1}]))
+        configs, scorers = [], []
+
+        def _factory(config):
+            configs.append(config)
+            scorer = EmbeddingScorer(embedder=HashingEmbedder(dim=config.dim), cache_file=cache_file)
+            scorer.close = lambda: scorers.append(scorer) or EmbeddingScorer.close(scorer)
+            return scorer
+
+        monkeypatch.setattr(ranking_engine, "create_embedding_scorer_from_config", _factory)
+        monkeypatch.setattr(sys, "argv", [
+            "ranking_engine", "--papers", str(papers_file), "--query", "devops", "--relevance", "embedding",
+            "--no-enrich", "--no-score-cache", "--output", str(output_file)
+        ])
+
+        ranking_engine.main()
+
+        assert configs[0].enabled
+        assert len(scorers) == 1 and scorers[0].embedded == 1
+        assert json.loads(output_file.read_text())["papers"][0]["doi"] == "10.1/a"
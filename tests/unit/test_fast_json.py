@@ -0,0 +1,85 @@
+"""
+Unit Tests für src/utils/fast_json.py + OpenAlex Abstract Rebuild
+
+Run:
+    pytest tests/unit/test_fast_json.py -v
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.search.openalex_client import rebuild_inverted_index
+from src.utils import fast_json
+
+
+def _rebuild_sorted(inverted_index):
+    """Reference: previous sort-based reconstruction"""
+    pairs = sorted(((pos, word) for word, positions in inverted_index.items() for pos in positions),
+                   key=lambda x: x[0])
+    return " ".join(word for _, word in pairs)
+
+
+# ============================================
+# loads / dumps / response_json
+# ============================================
+
+class TestFastJson:
+    """Test decode/encode helpers"""
+
+    def test_round_trip(self):
+        value = {"title": "Übersicht", "authors": ["A", "B"], "year": 2024, "score": 0.5, "x": None}
+
+        assert fast_json.loads(fast_json.dumps(value)) == value
+        assert fast_json.loads(fast_json.dumps(value).encode("utf-8")) == value
+
+    def test_dumps_falls_back_for_unsupported_values(self):
+        """Values orjson rejects (int keys, big ints) still encode"""
+        assert json.loads(fast_json.dumps({1: 2 ** 70})) == {"1": 2 ** 70}
+
+    def test_invalid_json_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            fast_json.loads(b"{not json")
+
+    def test_response_json_decodes_content(self):
+        response = Mock()
+        response.content = b'{"message": {"items": []}}'
+
+        assert fast_json.response_json(response) == {"message": {"items": []}}
+        response.json.assert_not_called()
+
+    def test_response_json_falls_back_to_json_method(self):
+        """Mocks without bytes content (and undecodable bodies) use response.json()"""
+        response = Mock()
+        response.json.return_value = {"results": []}
+        assert fast_json.response_json(response) == {"results": []}
+
+        response.content = b"\xff\xfe invalid"
+        assert fast_json.response_json(response) == {"results": []}
+
+
+# ============================================
+# rebuild_inverted_index
+# ============================================
+
+class TestRebuildInvertedIndex:
+    """Linear rebuild matches the sort-based reconstruction"""
+
+    @pytest.mark.parametrize("index", [
+        {"This": [0], "is": [1, 3], "abstract": [2]},   # dense, repeated word
+        {"a": [0], "b": [5], "c": [100]},                # sparse positions
+        {"a": [0, 1], "b": [1]},                         # duplicate position
+        {"a": [-1], "b": [0]},                           # negative position
+        {},
+    ])
+    def test_matches_sorted_reference(self, index):
+        assert rebuild_inverted_index(index) == _rebuild_sorted(index)
+
+    def test_dense_abstract(self):
+        words = "we study devops governance and devops compliance".split()
+        index = {}
+        for pos, word in enumerate(words):
+            index.setdefault(word, []).append(pos)
+
+        assert rebuild_inverted_index(index) == " ".join(words)
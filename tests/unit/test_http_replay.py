@@ -0,0 +1,124 @@
+"""
+Unit Tests für src/utils/http_replay.py
+
+Run:
+    pytest tests/unit/test_http_replay.py -v
+"""
+
+import httpx
+import pytest
+
+from src.search.crossref_client import CrossRefClient
+from src.search.search_engine import SearchEngine
+from src.utils.http_replay import (
+    Cassette, CassetteMiss, RecordingTransport, ReplayTransport,
+    install_transport, rebase_urls, request_key
+)
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+def _upstream(request: httpx.Request) -> httpx.Response:
+    """Fake API: echoes the query into a CrossRef-shaped page"""
+    query = request.url.params.get("query", "")
+    return httpx.Response(200, headers={"X-Rate-Limit-Limit": "50", "Set-Cookie": "x=1"}, json={
+        "message": {"items": [{"DOI": f"10.1/{query}", "title": [query.title()]}]}
+    })
+
+
+@pytest.fixture
+def cassette_file(temp_dir):
+    return temp_dir / "cassette.jsonl"
+
+
+# ============================================
+# Tests
+# ============================================
+
+class TestRequestKey:
+    """Test canonical request keys"""
+
+    def test_query_order_and_body(self):
+        key = request_key("get", "https://api.crossref.org/works?rows=20&query=devops")
+
+        assert key == "GET api.crossref.org/works?query=devops&rows=20"
+        assert key == request_key("GET", "https://api.crossref.org/works?query=devops&rows=20")
+        assert request_key("POST", "https://x.org/batch", b'{"ids": [1]}') != \
+            request_key("POST", "https://x.org/batch", b'{"ids": [2]}')
+
+
+class TestRecordReplay:
+    """Test recording through a transport and replaying offline"""
+
+    def test_round_trip_sync(self, cassette_file):
+        """Recorded responses replay from file; only selected headers are kept"""
+        recorder = RecordingTransport(Cassette(cassette_file), transport=httpx.MockTransport(_upstream))
+        with httpx.Client(transport=recorder) as client:
+            recorded = client.get("https://api.crossref.org/works", params={"query": "devops"}).json()
+
+        with httpx.Client(transport=ReplayTransport(cassette_file)) as client:
+            response = client.get("https://api.crossref.org/works?query=devops")
+
+        assert response.json() == recorded
+        assert response.headers["x-rate-limit-limit"] == "50"
+        assert "set-cookie" not in response.headers
+
+    async def test_round_trip_async(self, cassette_file):
+        recorder = RecordingTransport(Cassette(cassette_file), async_transport=httpx.MockTransport(_upstream))
+        async with httpx.AsyncClient(transport=recorder) as client:
+            await client.get("https://api.crossref.org/works", params={"query": "ai"})
+
+        async with httpx.AsyncClient(transport=ReplayTransport(cassette_file)) as client:
+            response = await client.get("https://api.crossref.org/works", params={"query": "ai"})
+
+        assert response.json()["message"]["items"][0]["DOI"] == "10.1/ai"
+
+    def test_repeated_requests_replay_in_order(self):
+        """Multiple recordings of one request are served in order, the last repeats"""
+        cassette = Cassette()
+        key = request_key("GET", "https://api.openalex.org/works")
+        cassette.add(key, 429, {"Retry-After": "1"}, b"{}")
+        cassette.add(key, 200, {}, b'{"results": []}')
+
+        with httpx.Client(transport=ReplayTransport(cassette)) as client:
+            statuses = [client.get("https://api.openalex.org/works").status_code for _ in range(3)]
+
+        assert statuses == [429, 200, 200]
+
+    def test_strict_miss(self):
+        with httpx.Client(transport=ReplayTransport(Cassette())) as client:
+            with pytest.raises(CassetteMiss):
+                client.get("https://api.crossref.org/works")
+
+        with httpx.Client(transport=ReplayTransport(Cassette(), strict=False)) as client:
+            assert client.get("https://api.crossref.org/works").status_code == 404
+
+
+class TestClientHelpers:
+    """Test install_transport / rebase_urls on API clients"""
+
+    def test_install_transport_replays_client_search(self, cassette_file):
+        """A CrossRefClient search is answered from the cassette"""
+        client = CrossRefClient()
+        install_transport(client, RecordingTransport(Cassette(cassette_file),
+                                                     transport=httpx.MockTransport(_upstream)))
+        recorded = client.search("devops", limit=5, use_cache=False)
+        client.close()
+
+        client = CrossRefClient()
+        install_transport(client, ReplayTransport(cassette_file))
+        replayed = client.search("devops", limit=5, use_cache=False)
+
+        assert [p.doi for p in replayed] == [p.doi for p in recorded] == ["10.1/devops"]
+        client.close()
+
+    def test_rebase_urls_covers_engine_clients(self):
+        engine = SearchEngine(sources=["crossref"])
+        rebase_urls(engine, "http://127.0.0.1:8765/")
+
+        assert engine.crossref_client.BASE_URL == "http://127.0.0.1:8765/api.crossref.org"
+        assert engine.s2_client.BASE_URL == "http://127.0.0.1:8765/api.semanticscholar.org/graph/v1"
+        assert CrossRefClient.BASE_URL == "https://api.crossref.org"
+        engine.close()
@@ -217,6 +217,38 @@ def test_all_strategies_fail_skip(temp_output_dir, session_id):
         assert mock_core.called
 
 
+def test_open_circuit_skips_strategy(temp_output_dir, session_id):
+    """Unpaywall 5xx errors trip its circuit breaker → CORE is tried directly"""
+    from src.utils.retry import get_circuit_breaker
+
+    with patch.object(UnpaywallClient, 'fetch') as mock_unpaywall, \
+         patch.object(COREClient, 'fetch') as mock_core:
+
+        mock_unpaywall.return_value = UnpaywallResult(
+            success=False, doi="10.1109/FAIL.2024", error="HTTP 503: Service Unavailable"
+        )
+        mock_core.return_value = COREResult(
+            success=False, doi="10.1109/FAIL.2024", error="Not found"
+        )
+
+        fetcher = PDFFetcher(
+            output_dir=temp_output_dir,
+            fallback_chain=["unpaywall", "core"],
+            core_api_key="test_key"
+        )
+
+        min_calls = get_circuit_breaker("unpaywall").min_calls
+        for _ in range(min_calls):
+            fetcher.fetch_single("10.1109/FAIL.2024", session_id)
+
+        result = fetcher.fetch_single("10.1109/FAIL.2024", session_id)
+
+        assert mock_unpaywall.call_count == min_calls
+        assert mock_core.call_count == min_calls + 1
+        assert result.attempts == 1
+        assert get_circuit_breaker("core").state == "closed"  # "Not found" is no API failure
+
+
 # ============================================
 # Test Batch Processing
 # ============================================
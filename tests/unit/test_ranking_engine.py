@@ -365,5 +365,66 @@ class TestIntegrationWithFiveDScorer:
             assert 0.0 <= value <= 1.0
 
 
+
+class TestCascadeMode:
+    """Tests für Cascade Ranking (günstiger Scorer + LLM nur für das Band)"""
+
+    @staticmethod
+    def _papers(n=30):
+        # Absteigende Keyword-Relevanz: "devops governance" nur in den ersten Titeln
+        return [
+            Paper(doi=f"10.{i}", title="DevOps Governance" if i < 5 else f"Topic {i}",
+                  authors=["A"], year=2020, citations=10)
+            for i in range(n)
+        ]
+
+    def test_only_band_is_sent_to_llm(self):
+        """Test: Nur Ränge [start, end) gehen an den LLM Scorer, alle Kandidaten werden gerankt"""
+        llm = Mock(side_effect=lambda query, papers: {p.doi: 0.0 for p in papers})
+        engine = RankingEngine(llm_scorer=llm, cascade=True, cascade_band=(3, 10))
+        papers = self._papers()
+
+        result = engine.rank(papers, "DevOps Governance")
+
+        sent = llm.call_args[0][1]
+        cheap = RankingEngine().rank(papers, "DevOps Governance")
+        assert [p.doi for p in sent] == [p.doi for p in cheap[3:10]]
+        assert [p.doi for p in result[:3]] == [p.doi for p in cheap[:3]]
+        assert [p.doi for p in result[10:]] == [p.doi for p in cheap[10:]]
+        assert len(result) == 30
+        assert engine.cascade_stats == {"candidates": 30, "band": 7, "sent_to_llm": 7}
+
+    def test_llm_scores_reorder_band(self):
+        """Test: LLM Scores ordnen das Band neu"""
+        engine = RankingEngine(
+            llm_scorer=lambda query, papers: {"10.29": 1.0},
+            cascade=True,
+            cascade_band=(0, 30)
+        )
+
+        result = engine.rank(self._papers(), "DevOps Governance", top_n=5)
+
+        assert result[0].doi == "10.29"
+        assert len(result) == 5
+
+    def test_llm_failure_keeps_cheap_ranking(self):
+        """Test: LLM Fehler → günstiges Ranking bleibt"""
+        engine = RankingEngine(llm_scorer=Mock(side_effect=RuntimeError("rate limited")), cascade=True)
+        papers = self._papers()
+
+        result = engine.rank(papers, "DevOps Governance")
+
+        assert [p.doi for p in result] == [p.doi for p in RankingEngine().rank(papers, "DevOps Governance")]
+
+    def test_given_llm_scores_are_not_resent(self):
+        """Test: Bereits vorhandene LLM Scores werden nicht erneut angefragt"""
+        llm = Mock(return_value={})
+        engine = RankingEngine(llm_scorer=llm, cascade=True, cascade_band=(0, 5))
+        papers = self._papers(5)
+
+        engine.rank(papers, "DevOps Governance", llm_scores={p.doi: 0.5 for p in papers})
+
+        llm.assert_not_called()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,6 +4,8 @@ Unit Tests für src/ranking/five_d_scorer.py
 Tests against real production code
 """
 
+import random
+
 import pytest
 from datetime import datetime
 from src.ranking.five_d_scorer import FiveDScorer, score_papers
@@ -218,6 +220,14 @@ class TestRelevanceScoring:
 
         assert score == 0.0
 
+    def test_matches_whole_words_only(self):
+        """Test: ai matcht nicht in maintain (ganze Wörter)"""
+        scorer = FiveDScorer()
+        paper = Paper(doi="10.1", title="Maintaining Legacy Systems", authors=["A"])
+
+        assert scorer._score_relevance(paper, "AI", None) == 0.0
+        assert scorer._score_relevance(paper, "legacy", None) == pytest.approx(0.7)
+
     def test_precomputed_relevance_is_used(self):
         """Test: Pre-computed Scores haben Vorrang"""
         scorer = FiveDScorer()
@@ -276,6 +286,75 @@ class TestFullScoring:
         assert result == []
 
 
+class TestVectorizedScoring:
+    """Tests für spaltenweises (NumPy) Scoring"""
+
+    @staticmethod
+    def _candidates():
+        venues = ["IEEE Transactions", "ACM Journal", None, "Workshop"]
+        return [
+            Paper(doi=f"10.{i}", title="DevOps Governance" if i % 3 else "Other Topic",
+                  authors=["A"], year=[None, 2010, 2020, 2024][i % 4],
+                  citations=[None, 0, 10, 500][i % 4 if i % 2 else (i // 2) % 4],
+                  venue=venues[(i // 4) % 4])
+            for i in range(40)
+        ]
+
+    @staticmethod
+    def _scorers():
+        loop, vectorized = FiveDScorer(), FiveDScorer()
+        loop.VECTORIZE_MIN_PAPERS = 10 ** 9
+        vectorized.VECTORIZE_MIN_PAPERS = 0
+        return loop, vectorized
+
+    def test_matches_loop_scoring(self):
+        """Test: Gleiche Scores und Reihenfolge wie der Per-Paper Loop"""
+        pytest.importorskip("numpy")
+        loop, vectorized = self._scorers()
+        papers = self._candidates()
+        relevance = {p.doi: 0.5 for p in papers[::2]}  # Rest: Keyword-Fallback
+
+        expected = loop.score(papers, "DevOps Governance", relevance)
+        actual = vectorized.score(papers, "DevOps Governance", relevance)
+
+        assert [r["paper"].doi for r in actual] == [r["paper"].doi for r in expected]
+        assert [r["scores"] for r in actual] == [r["scores"] for r in expected]
+
+    def test_bit_identical_for_many_years_and_counts(self):
+        """Test: Scores bitgenau wie der Loop (sonst kippen Fast-Gleichstände)"""
+        pytest.importorskip("numpy")
+        rng = random.Random(3)
+        loop, vectorized = self._scorers()
+        papers = [
+            Paper(doi=f"10.{i}", title="T", authors=["A"], year=rng.choice([None, rng.randint(1950, 2026)]),
+                  citations=rng.choice([None, rng.randint(0, 100000)]))
+            for i in range(2000)
+        ]
+        relevance = {p.doi: rng.random() for p in papers}
+
+        expected = loop.score(papers, "q", relevance)
+        actual = vectorized.score(papers, "q", relevance)
+
+        assert [r["paper"].doi for r in actual] == [r["paper"].doi for r in expected]
+        assert [r["scores"] for r in actual] == [r["scores"] for r in expected]
+
+    def test_top_n_keeps_input_order_for_ties(self):
+        """Test: Top-N entspricht dem Anfang der vollen Rangliste (auch bei Gleichstand)"""
+        pytest.importorskip("numpy")
+        loop, vectorized = self._scorers()
+        papers = self._candidates()
+
+        expected = [r["paper"].doi for r in loop.score(papers, "DevOps Governance")]
+        for top_n in (1, 7, 40, 100):
+            result = vectorized.score(papers, "DevOps Governance", top_n=top_n)
+            assert [r["paper"].doi for r in result] == expected[:top_n]
+
+    def test_top_n_zero_returns_empty(self):
+        """Test: top_n=0 liefert [] in beiden Pfaden (kein IndexError beim Logging)"""
+        for scorer in self._scorers():
+            assert scorer.score(self._candidates(), "DevOps Governance", top_n=0) == []
+
+
 class TestConvenienceFunction:
     """Tests für score_papers() Convenience Function"""
 
@@ -0,0 +1,220 @@
+"""
+Unit Tests für src/utils/rate_limiter.py
+
+Run:
+    pytest tests/unit/test_rate_limiter.py -v
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.rate_limiter import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    AsyncRateLimiter,
+    RateLimiter,
+)
+
+
+# ============================================
+# Token Bucket Tests
+# ============================================
+
+class TestRateLimiter:
+    """Test basic token bucket behaviour"""
+
+    def test_burst_then_wait(self):
+        """Burst tokens are available immediately, then the rate applies"""
+        limiter = RateLimiter(requests_per_second=10, burst_size=2)
+
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.get_wait_time() == pytest.approx(0.1, abs=0.02)
+
+    def test_fractional_rate_has_one_token_burst(self):
+        """< 1 req/s (S2 anonymous) still allows a first request"""
+        limiter = RateLimiter(requests_per_second=0.33)
+        assert limiter.try_acquire()
+
+
+# ============================================
+# Adaptive Mode Tests
+# ============================================
+
+class TestAdaptiveRateLimiter:
+    """Test AIMD feedback and server-requested pauses"""
+
+    def test_aimd_decrease_and_increase(self):
+        """429 halves the rate, successes climb back to max_rate"""
+        limiter = RateLimiter(requests_per_second=10, adaptive=True)
+
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter.rate == 2.5
+
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.rate == 10
+
+    def test_rate_bounded_by_min_rate(self):
+        """Decrease stops at min_rate"""
+        limiter = RateLimiter(requests_per_second=10, adaptive=True, min_rate=4)
+        for _ in range(5):
+            limiter.on_throttle()
+        assert limiter.rate == 4
+
+    def test_non_adaptive_keeps_rate_but_honours_pause(self):
+        """Without adaptive the rate is static, Retry-After still pauses"""
+        limiter = RateLimiter(requests_per_second=10)
+
+        limiter.on_throttle(retry_after=0.2)
+
+        assert limiter.rate == 10
+        assert not limiter.try_acquire()
+        start = time.time()
+        limiter.acquire()
+        assert time.time() - start == pytest.approx(0.2, abs=0.05)
+
+    def test_header_budget_caps_rate(self):
+        """Remaining/Reset budget lowers the rate until the window resets"""
+        limiter = RateLimiter(requests_per_second=10, adaptive=True)
+
+        limiter.update_from_headers({"remaining": 20, "reset_after": 10})
+        assert limiter.rate == 2.0
+
+        for _ in range(50):
+            limiter.on_success()
+        assert limiter.rate == 2.0
+
+    def test_exhausted_budget_pauses_until_reset(self):
+        """remaining == 0 → no tokens before reset"""
+        limiter = RateLimiter(requests_per_second=10, adaptive=True)
+
+        limiter.update_from_headers({"remaining": 0, "reset_after": 5})
+
+        assert limiter.get_wait_time() == pytest.approx(5.0, abs=0.05)
+
+    def test_search_engine_applies_config(self):
+        """adaptive/max_requests_per_second from api_config reach the client limiters"""
+        from src.search.search_engine import SearchEngine
+        from src.utils.config import load_config
+
+        api_config, _ = load_config(use_env=False)
+        api_config.corpus.enabled = False
+        api_config.offline.enabled = False
+        api_config.rate_limits["crossref"].adaptive = False
+        api_config.rate_limits["openalex"].max_requests_per_second = 5
+
+        engine = SearchEngine(api_config=api_config, use_cache=False)
+
+        assert engine.crossref_client.rate_limiter.adaptive is False
+        assert engine.crossref_client.async_rate_limiter.adaptive is False
+        assert engine.openalex_client.rate_limiter.adaptive is True
+        assert engine.openalex_client.async_rate_limiter.max_rate == 5
+        engine.close()
+
+    async def test_async_limiter_pause(self):
+        """AsyncRateLimiter shares the feedback API"""
+        limiter = AsyncRateLimiter(requests_per_second=20, adaptive=True)
+
+        limiter.on_throttle(retry_after=0.1)
+        start = time.time()
+        await limiter.acquire()
+
+        assert limiter.rate == 10
+        assert time.time() - start == pytest.approx(0.1, abs=0.05)
+
+
+# ============================================
+# Scheduling Tests
+# ============================================
+
+class TestWaiterQueue:
+    """Test FIFO + priority scheduling without polling"""
+
+    def test_sync_fifo_and_priority(self):
+        """Interactive waiters overtake queued bulk waiters, FIFO within a class"""
+        limiter = RateLimiter(requests_per_second=20, burst_size=1)
+        limiter.acquire()
+        order = []
+
+        def _worker(name, priority):
+            limiter.acquire(priority=priority)
+            order.append(name)
+
+        threads = []
+        for name, priority in [("bulk-1", PRIORITY_BULK), ("bulk-2", PRIORITY_BULK),
+                               ("interactive", PRIORITY_INTERACTIVE)]:
+            thread = threading.Thread(target=_worker, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.005)
+        for thread in threads:
+            thread.join()
+
+        assert order == ["interactive", "bulk-1", "bulk-2"]
+
+    def test_sync_rate_is_exact(self):
+        """10 queued waiters at 50 req/s are served in ≈ 0.2s"""
+        limiter = RateLimiter(requests_per_second=50, burst_size=1)
+        limiter.acquire()
+
+        start = time.time()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.time() - start == pytest.approx(0.2, abs=0.05)
+
+    def test_sync_timeout_leaves_queue(self):
+        """Timed-out waiter is removed and does not block later waiters"""
+        limiter = RateLimiter(requests_per_second=10, burst_size=1)
+        limiter.acquire()
+
+        assert limiter.acquire(timeout=0.01) is False
+        assert limiter._waiters == []
+        assert limiter.acquire(timeout=1) is True
+
+    def test_try_acquire_does_not_overtake(self):
+        """try_acquire fails while others are queued"""
+        limiter = RateLimiter(requests_per_second=10, burst_size=2)
+        limiter.acquire(tokens=2)
+        thread = threading.Thread(target=limiter.acquire, kwargs={"tokens": 2})
+        thread.start()
+
+        time.sleep(0.12)  # one token refilled, but the queued thread needs two
+        assert not limiter.try_acquire()
+        thread.join()
+
+    async def test_async_priority_order(self):
+        """Async waiters are served by priority, then arrival"""
+        limiter = AsyncRateLimiter(requests_per_second=50, burst_size=1)
+        await limiter.acquire()
+        order = []
+
+        async def _worker(name, priority):
+            await limiter.acquire(priority=priority)
+            order.append(name)
+
+        tasks = [asyncio.create_task(_worker("bulk", PRIORITY_BULK))]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(_worker(f"interactive-{i}", PRIORITY_INTERACTIVE)) for i in range(2)]
+        await asyncio.gather(*tasks)
+
+        assert order == ["interactive-0", "interactive-1", "bulk"]
+
+    async def test_async_timeout_and_daily_limit(self):
+        """Timeouts return False, daily limit surfaces as ValueError for queued waiters"""
+        limiter = AsyncRateLimiter(requests_per_second=10, burst_size=1, daily_limit=2)
+        await limiter.acquire()
+
+        assert await limiter.acquire(timeout=0.01) is False
+        assert await limiter.acquire() is True
+        with pytest.raises(ValueError):
+            await limiter.acquire()
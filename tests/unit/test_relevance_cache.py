@@ -0,0 +1,145 @@
+"""
+Unit Tests für src/ranking/relevance_cache.py
+
+Run:
+    pytest tests/unit/test_relevance_cache.py -v
+"""
+
+import json
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from src.agents.agent_factory import AgentFactory
+from src.ranking import ranking_engine
+from src.ranking.ranking_engine import RankingEngine
+from src.ranking.relevance_cache import RelevanceScoreCache, normalize_query, query_hash
+from src.search.crossref_client import Paper
+from src.utils.cache import Cache
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture
+def shared_cache(temp_dir):
+    return Cache(cache_file=temp_dir / "relevance.db", ttl_hours=1)
+
+
+@pytest.fixture
+def papers():
+    return [
+        Paper(doi=f"10.1/{i}", title="DevOps Governance" if i % 2 else f"Topic {i}", authors=["A"])
+        for i in range(6)
+    ]
+
+
+def _llm(query, papers):
+    return {paper.doi: 0.9 if "Governance" in paper.title else 0.1 for paper in papers}
+
+
+# ============================================
+# Tests
+# ============================================
+
+class TestRelevanceScoreCache:
+    """Test keying by (query, DOI, model, prompt version)"""
+
+    def test_query_normalization(self):
+        assert normalize_query("  DevOps-Governance? ") == "devops governance"
+        assert query_hash("DevOps  governance") == query_hash("devops governance!")
+        assert query_hash("devops governance") != query_hash("devops security")
+
+    def test_model_and_prompt_version_are_part_of_key(self, shared_cache):
+        RelevanceScoreCache(model="haiku", cache=shared_cache).set_many("q", {"10.1/A": 0.8})
+
+        assert RelevanceScoreCache(model="haiku", cache=shared_cache).get_many("Q", ["10.1/a"]) == {"10.1/a": 0.8}
+        assert RelevanceScoreCache(model="sonnet", cache=shared_cache).get_many("q", ["10.1/a"]) == {}
+        assert RelevanceScoreCache(model="haiku", prompt_version="v2", cache=shared_cache).get_many(
+            "q", ["10.1/a"]) == {}
+
+
+class TestRankingEngineCache:
+    """RankingEngine consults the cache, only misses go to the LLM"""
+
+    def test_rerun_sends_only_misses(self, papers, shared_cache):
+        llm = Mock(side_effect=_llm)
+        first = RankingEngine(llm_scorer=llm, relevance_cache=RelevanceScoreCache(cache=shared_cache))
+        expected = first.rank(papers[:4], "DevOps Governance")
+
+        second = RankingEngine(llm_scorer=llm, relevance_cache=RelevanceScoreCache(cache=shared_cache))
+        ranked = second.rank(papers, "devops governance")
+
+        assert [p.doi for p in llm.call_args_list[1][0][1]] == ["10.1/4", "10.1/5"]
+        assert [p.doi for p in ranked][:2] == [p.doi for p in expected][:2]
+        assert second.relevance_cache.get_stats()["hits"] == 4
+
+    def test_given_llm_scores_are_stored(self, papers, shared_cache):
+        """Scores from the llm_relevance_scorer agent are reused in later runs"""
+        RankingEngine(relevance_cache=RelevanceScoreCache(cache=shared_cache)).rank(
+            papers, "DevOps Governance", llm_scores={"10.1/0": 1.0}
+        )
+
+        engine = RankingEngine(relevance_cache=RelevanceScoreCache(cache=shared_cache))
+        result = engine.rank_with_scores(papers, "DevOps Governance")
+
+        assert result[0]["paper"].doi == "10.1/0"
+        assert result[0]["scores"]["relevance"] == 1.0
+
+    def test_cascade_band_uses_cache(self, papers, shared_cache):
+        llm = Mock(side_effect=_llm)
+        cache = RelevanceScoreCache(cache=shared_cache)
+
+        for _ in range(2):
+            RankingEngine(llm_scorer=llm, cascade=True, cascade_band=(0, 6),
+                          relevance_cache=cache).rank(papers, "DevOps Governance")
+
+        assert llm.call_count == 1
+
+    def test_bm25_fallback_is_not_cached(self, papers, shared_cache):
+        """Unparsable LLM output falls back to BM25 - those scores are no LLM scores"""
+        factory = AgentFactory()
+        factory._spawn_agent = Mock(side_effect=[
+            '{"scores": [{"paper_index": 0, "relevance_score": 0.7, "reasoning": "ok"}]}', "no json"
+        ])
+
+        assert factory.score_papers("DevOps Governance", papers[:4], max_papers=2) == {"10.1/0": 0.7}
+
+        factory._spawn_agent = Mock(return_value="no json")
+        assert factory.score_relevance("DevOps Governance", [{"title": "DevOps"}])[0]["fallback"] is True
+
+        cache = RelevanceScoreCache(cache=shared_cache)
+        ranked = RankingEngine(llm_scorer=factory.score_papers, relevance_cache=cache).rank(
+            papers, "DevOps Governance"
+        )
+
+        assert len(ranked) == len(papers)
+        assert ranked[0].title == "DevOps Governance"
+        assert cache.get_stats()["stored"] == 0
+        assert cache.get_many("DevOps Governance", [p.doi for p in papers]) == {}
+
+    def test_ranking_cli_builds_cache_from_config(self, shared_cache, temp_dir, monkeypatch):
+        """ranking_engine CLI stores --llm-scores via api_config.relevance_cache (opt-out: --no-score-cache)"""
+        papers_file, scores_file = temp_dir / "papers.json", temp_dir / "scores.json"
+        papers_file.write_text(json.dumps([{"doi": "10.1/a", "title": "DevOps", "citations": 1}]))
+        scores_file.write_text(json.dumps({"scores": [{"doi": "10.1/a", "relevance_score": 0.8}]}))
+        calls = []
+
+        def _factory(config, model="haiku"):
+            calls.append((config, model))
+            return RelevanceScoreCache(model=model, cache=shared_cache)
+
+        monkeypatch.setattr(ranking_engine, "create_relevance_cache_from_config", _factory)
+        argv = ["ranking_engine", "--papers", str(papers_file), "--query", "devops", "--llm-scores",
+                str(scores_file), "--model", "sonnet", "--no-enrich", "--output", str(temp_dir / "ranked.json")]
+
+        monkeypatch.setattr(sys, "argv", argv)
+        ranking_engine.main()
+        monkeypatch.setattr(sys, "argv", argv + ["--no-score-cache"])
+        ranking_engine.main()
+
+        assert len(calls) == 1
+        assert calls[0][0].enabled and calls[0][1] == "sonnet"
+        assert RelevanceScoreCache(model="sonnet", cache=shared_cache).get_many("devops", ["10.1/a"]) == {"10.1/a": 0.8}
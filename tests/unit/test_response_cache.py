@@ -0,0 +1,130 @@
+"""
+Unit Tests für src/utils/cache.py ResponseCache + Client-Integration
+
+Run:
+    pytest tests/unit/test_response_cache.py -v
+"""
+
+import httpx
+import pytest
+from unittest.mock import Mock
+
+from src.search.crossref_client import CrossRefClient
+from src.search.openalex_client import OpenAlexClient
+from src.utils.cache import ResponseCache, create_response_cache_from_config
+from src.utils.config import CacheConfig
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture
+def response_cache(temp_dir):
+    """ResponseCache backed by a temporary SQLite file"""
+    return ResponseCache("crossref", ttl_hours=1, cache_file=temp_dir / "api_cache.db")
+
+
+@pytest.fixture
+def crossref_payload():
+    """Minimal CrossRef /works response"""
+    return {"message": {"items": [
+        {"DOI": "10.1000/a", "title": ["Cached Paper"], "is-referenced-by-count": 1}
+    ]}}
+
+
+def _mock_response(payload, status_code=200):
+    response = Mock(spec=httpx.Response)
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+# ============================================
+# ResponseCache Tests
+# ============================================
+
+class TestResponseCache:
+    """Test key normalization and get/set"""
+
+    def test_key_ignores_param_order_and_whitespace(self, response_cache):
+        """Equivalent params produce the same key"""
+        key1 = response_cache.make_key("/works", {"query": "DevOps  Governance ", "rows": 20})
+        key2 = response_cache.make_key("/works/", {"rows": 20, "query": "DevOps Governance"})
+        assert key1 == key2
+
+    def test_key_differs_by_source_and_params(self, temp_dir, response_cache):
+        """Different sources or params produce different keys"""
+        other = ResponseCache("openalex", cache_file=temp_dir / "api_cache.db")
+        params = {"query": "DevOps"}
+        assert response_cache.make_key("/works", params) != other.make_key("/works", params)
+        assert response_cache.make_key("/works", params) != response_cache.make_key("/works", {"query": "ML"})
+
+    def test_set_get_roundtrip_counts_hits(self, response_cache):
+        """Stored values are returned and hits/misses counted"""
+        assert response_cache.get("/works", {"query": "x"}) is None
+        response_cache.set("/works", {"query": "x"}, {"ok": True})
+        assert response_cache.get("/works", {"query": "x"}) == {"ok": True}
+        assert (response_cache.hits, response_cache.misses) == (1, 1)
+
+    def test_factory_uses_per_source_ttl(self, temp_dir):
+        """TTL per source overrides the default, disabled config returns None"""
+        config = CacheConfig(
+            ttl_hours=24,
+            ttl_hours_per_source={"crossref": 168},
+            cache_file=str(temp_dir / "api_cache.db")
+        )
+        assert create_response_cache_from_config(config, "crossref").cache.ttl_seconds == 168 * 3600
+        assert create_response_cache_from_config(config, "openalex").cache.ttl_seconds == 24 * 3600
+
+        config.enabled = False
+        assert create_response_cache_from_config(config, "crossref") is None
+
+
+# ============================================
+# Client Integration Tests
+# ============================================
+
+class TestClientCaching:
+    """Test transparent caching in API clients"""
+
+    def test_search_second_call_served_from_cache(self, response_cache, crossref_payload):
+        """Repeated search does not hit the network"""
+        client = CrossRefClient(cache=response_cache)
+        client.client = Mock()
+        client.client.get.return_value = _mock_response(crossref_payload)
+
+        first = client.search("DevOps", limit=5)
+        second = client.search("DevOps", limit=5)
+
+        assert client.client.get.call_count == 1
+        assert [p.doi for p in first] == [p.doi for p in second] == ["10.1000/a"]
+
+    def test_search_bypass_flag_refreshes(self, response_cache, crossref_payload):
+        """use_cache=False always hits the network"""
+        client = CrossRefClient(cache=response_cache)
+        client.client = Mock()
+        client.client.get.return_value = _mock_response(crossref_payload)
+
+        client.search("DevOps", limit=5)
+        client.search("DevOps", limit=5, use_cache=False)
+
+        assert client.client.get.call_count == 2
+
+    def test_get_by_doi_cached(self, temp_dir):
+        """get_by_doi caches the work JSON, 404s are not cached"""
+        cache = ResponseCache("openalex", cache_file=temp_dir / "api_cache.db")
+        client = OpenAlexClient(cache=cache)
+        client.client = Mock()
+        client.client.get.return_value = _mock_response(
+            {"doi": "https://doi.org/10.1000/a", "title": "Cached Work"}
+        )
+
+        assert client.get_by_doi("10.1000/A").title == "Cached Work"
+        assert client.get_by_doi("10.1000/a").title == "Cached Work"
+        assert client.client.get.call_count == 1
+
+        client.client.get.return_value = _mock_response({}, status_code=404)
+        assert client.get_by_doi("10.1000/missing") is None
+        assert client.get_by_doi("10.1000/missing") is None
+        assert client.client.get.call_count == 3
@@ -0,0 +1,145 @@
+"""
+Unit Tests für src/search/result_cache.py + SearchEngine Result Cache
+
+Run:
+    pytest tests/unit/test_result_cache.py -v
+"""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.search.crossref_client import Paper
+from src.search.result_cache import QueryResultCache
+from src.search.search_engine import SearchEngine
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+def _paper(doi: str, citations: int = 0) -> Paper:
+    return Paper(doi=doi, title=f"Paper {doi}", authors=["A"], citations=citations)
+
+
+@pytest.fixture
+def result_cache(temp_dir):
+    """Result cache that is stale immediately (soft TTL 0)"""
+    return QueryResultCache(soft_ttl_minutes=0, cache_file=temp_dir / "results.db")
+
+
+@pytest.fixture
+def engine(result_cache):
+    """CrossRef-only SearchEngine with mocked client and result cache"""
+    engine = SearchEngine(sources=["crossref"], result_cache=result_cache)
+    engine.crossref_client.search = Mock(return_value=[_paper("10.1/a", 5)])
+    yield engine
+    engine.close()
+
+
+# ============================================
+# QueryResultCache Tests
+# ============================================
+
+class TestQueryResultCache:
+    """Test key normalization and round trip"""
+
+    def test_key_normalization(self, result_cache):
+        """Whitespace/case/source order are normalized, operators and filters are not"""
+        key = result_cache.make_key("DevOps  Governance", ["openalex", "crossref"], 20)
+
+        assert key == result_cache.make_key(" devops governance", ["crossref", "openalex"], 20)
+        assert key != result_cache.make_key("devops governance", ["crossref"], 20)
+        assert key != result_cache.make_key("devops governance", ["crossref", "openalex"], 10)
+        assert key != result_cache.make_key("devops governance", ["crossref", "openalex"], 20,
+                                            field_filter="primary_topic.field.id:17")
+        assert (result_cache.make_key("devops AND governance", ["crossref"], 20)
+                != result_cache.make_key("devops and governance", ["crossref"], 20))
+
+    def test_round_trip_and_staleness(self, temp_dir):
+        """Papers keep source annotation, staleness follows the soft TTL"""
+        cache = QueryResultCache(soft_ttl_minutes=60, cache_file=temp_dir / "results.db")
+        paper = _paper("10.1/a", 3)
+        paper.source, paper.source_type = "crossref", "api"
+
+        cache.set("k", [paper])
+        entry = cache.get("k")
+
+        assert not entry.stale
+        assert [(p.doi, p.citations, p.source, p.source_type) for p in entry.papers] == [
+            ("10.1/a", 3, "crossref", "api")
+        ]
+        assert cache.get("missing") is None
+        assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+
+
+# ============================================
+# SearchEngine Integration Tests
+# ============================================
+
+class TestSearchEngineResultCache:
+    """Test stale-while-revalidate in SearchEngine"""
+
+    def test_fresh_hit_skips_sources(self, temp_dir):
+        """A fresh entry is served without touching the API clients"""
+        engine = SearchEngine(
+            sources=["crossref"],
+            result_cache=QueryResultCache(soft_ttl_minutes=60, cache_file=temp_dir / "results.db")
+        )
+        engine.crossref_client.search = Mock(return_value=[_paper("10.1/a", 5)])
+
+        first = engine.search("devops governance", limit=10)
+        second = engine.search("DevOps  Governance", limit=10)
+
+        assert [p.doi for p in second] == [p.doi for p in first] == ["10.1/a"]
+        assert engine.crossref_client.search.call_count == 1
+        engine.close()
+
+    def test_stale_hit_refreshes_in_background(self, engine):
+        """Stale entries are returned immediately and revalidated in the background"""
+        engine.search("devops", limit=10)
+
+        release = threading.Event()
+
+        def _slow_search(*args, **kwargs):
+            release.wait(5)
+            return [_paper("10.1/b", 9)]
+
+        engine.crossref_client.search = Mock(side_effect=_slow_search)
+
+        stale = engine.search("devops", limit=10)
+        assert [p.doi for p in stale] == ["10.1/a"]  # served while refresh is blocked
+
+        release.set()
+        engine._refresh_executor.shutdown(wait=True)
+        engine._refresh_executor = None
+
+        refreshed = engine.search("devops", limit=10)
+        assert [p.doi for p in refreshed] == ["10.1/b"]
+
+    def test_filters_are_part_of_key_and_passed_through(self, engine):
+        """Different filters miss the cache and reach the client"""
+        engine.search("devops", limit=10)
+        engine.search("devops", limit=10, filters={"crossref": {"filter": "from-pub-date:2020"}})
+
+        calls = engine.crossref_client.search.call_args_list
+        assert len(calls) == 2
+        assert calls[1].kwargs["filters"] == {"filter": "from-pub-date:2020"}
+
+    async def test_asearch_stale_hit_refreshes_as_task(self, engine):
+        """asearch serves the stale entry and refreshes on the event loop"""
+        async def _asearch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return [_paper("10.1/c", 1)]
+
+        engine.crossref_client.asearch = _asearch
+        engine.search("devops", limit=10)
+
+        stale = await engine.asearch("devops", limit=10)
+        assert [p.doi for p in stale] == ["10.1/a"]
+        assert len(engine._refresh_tasks) == 1
+
+        await engine.aclose()  # waits for the refresh
+        assert [p.doi for p in await engine.asearch("devops", limit=10)] == ["10.1/c"]
@@ -381,5 +381,140 @@ class TestIntegrationWithAPIs:
         assert result == {"status": "ok"}
 
 
+class TestRateLimitHeaders:
+    """Tests für Retry-After / X-RateLimit-* Auswertung"""
+
+    def test_parse_retry_after_seconds_and_date(self):
+        """Retry-After als Sekunden und als HTTP-Date"""
+        from src.utils.retry import parse_retry_after
+
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Thu, 01 Jan 1970 00:01:40 GMT", now=40.0) == 60.0
+        assert parse_retry_after("garbage") is None
+        assert parse_retry_after(None) is None
+
+    def test_parse_rate_limit_headers(self):
+        """Reset als Delta oder Unix-Timestamp, CrossRef Interval-Format"""
+        import httpx
+        from src.utils.retry import parse_rate_limit_headers
+
+        info = parse_rate_limit_headers(httpx.Headers({
+            "x-ratelimit-remaining": "5",
+            "X-RateLimit-Reset": "2000000010",
+            "X-Rate-Limit-Limit": "50",
+            "X-Rate-Limit-Interval": "1s",
+        }), now=2000000000.0)
+
+        assert info == {"remaining": 5.0, "reset_after": 10.0, "limit": 50.0, "interval": 1.0}
+
+    def test_raise_for_status_feeds_limiter(self):
+        """429 → RateLimitError mit retry_after, Limiter gedrosselt und pausiert"""
+        import httpx
+        from src.utils.rate_limiter import RateLimiter
+        from src.utils.retry import RateLimitError, raise_for_status_with_retry
+
+        limiter = RateLimiter(requests_per_second=10, adaptive=True)
+        request = httpx.Request("GET", "https://api.example.org")
+        response = httpx.Response(429, headers={"Retry-After": "2"}, request=request)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            raise_for_status_with_retry(response, limiter)
+
+        assert exc_info.value.retry_after == 2.0
+        assert limiter.rate == 5.0
+        assert limiter.get_wait_time() == pytest.approx(2.0, abs=0.05)
+
+    def test_wait_retry_after_overrides_backoff(self):
+        """Tenacity wartet Retry-After statt exponential backoff"""
+        from tenacity import Retrying
+        from src.utils.retry import RateLimitError, wait_retry_after
+
+        waits = []
+        retrying = Retrying(
+            stop=stop_after_attempt(3),
+            wait=wait_retry_after(wait_exponential(multiplier=10, min=10)),
+            sleep=waits.append,
+            reraise=True
+        )
+        calls = iter([RateLimitError("429", retry_after=0.5), RateLimitError("429")])
+
+        def _call():
+            error = next(calls, None)
+            if error:
+                raise error
+            return "ok"
+
+        assert retrying(_call) == "ok"
+        assert waits == [0.5, 20.0]
+
+
+class TestCircuitBreaker:
+    """Tests für CircuitBreaker und Retry Budget"""
+
+    def test_opens_after_failure_threshold(self):
+        """Ab min_calls und Fehlerquote >= threshold → fail fast"""
+        from src.utils.retry import CircuitBreaker, CircuitOpenError
+
+        breaker = CircuitBreaker("test", failure_threshold=0.5, min_calls=4, cooldown=30)
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED  # only 3 calls
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert 29 < exc_info.value.retry_after <= 30
+
+    def test_half_open_probe(self):
+        """Nach Cool-Down genau ein Probe-Call, Erfolg schließt den Circuit"""
+        from src.utils.retry import CircuitBreaker
+
+        breaker = CircuitBreaker("test", min_calls=1, cooldown=0.05)
+        breaker.record_failure()
+        assert not breaker.allow_request()
+
+        time.sleep(0.06)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # probe in flight
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self):
+        """Fehlgeschlagener Probe-Call öffnet den Circuit erneut"""
+        from src.utils.retry import CircuitBreaker
+
+        breaker = CircuitBreaker("test", min_calls=1, cooldown=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_retry_budget(self):
+        """Retries verbrauchen Tokens, jeder Call zahlt retry_ratio ein"""
+        from src.utils.retry import CircuitBreaker
+
+        breaker = CircuitBreaker("test", min_calls=100, retry_ratio=0.5, max_retry_tokens=1)
+        assert breaker.allow_retry()
+        assert not breaker.allow_retry()
+
+        breaker.record_success()
+        breaker.record_success()
+        assert breaker.allow_retry()
+
+    def test_registry_shares_breakers(self):
+        """get_circuit_breaker liefert pro Source dieselbe Instanz"""
+        from src.utils.retry import get_circuit_breaker
+
+        assert get_circuit_breaker("crossref") is get_circuit_breaker("crossref")
+        assert get_circuit_breaker("crossref") is not get_circuit_breaker("openalex")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
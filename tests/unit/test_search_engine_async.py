@@ -0,0 +1,283 @@
+"""
+Unit Tests für den async Pfad von SearchEngine + API Clients
+
+Run:
+    pytest tests/unit/test_search_engine_async.py -v
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from src.search.search_engine import SearchEngine
+from src.utils.http_pool import AsyncClientPool
+from src.utils.rate_limiter import AsyncRateLimiter, RateLimiter
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+def _mock_handler(request: httpx.Request) -> httpx.Response:
+    """Route mock requests by host"""
+    host = request.url.host
+
+    if host == "api.crossref.org":
+        if request.url.path.startswith("/works/"):
+            return httpx.Response(200, json={"message": {
+                "DOI": "10.1000/shared", "title": ["Shared Paper"], "is-referenced-by-count": 7
+            }})
+        return httpx.Response(200, json={"message": {"items": [
+            {"DOI": "10.1000/shared", "title": ["Shared Paper"], "is-referenced-by-count": 7},
+            {"DOI": "10.1000/cr-only", "title": ["CrossRef Only Paper"], "is-referenced-by-count": 3},
+        ]}})
+
+    if host == "api.openalex.org":
+        return httpx.Response(200, json={"results": [
+            {"doi": "https://doi.org/10.1000/shared", "title": "Shared Paper", "cited_by_count": 9},
+        ]})
+
+    if host == "api.semanticscholar.org":
+        return httpx.Response(503, text="unavailable")
+
+    return httpx.Response(404)
+
+
+@pytest.fixture
+def engine():
+    """SearchEngine with all async pools routed to a MockTransport"""
+    engine = SearchEngine()
+    transport = httpx.MockTransport(_mock_handler)
+    for client in (engine.crossref_client, engine.openalex_client, engine.s2_client):
+        client._async_pool.transport = transport
+    yield engine
+    engine.close()
+
+
+# ============================================
+# AsyncClientPool Tests
+# ============================================
+
+class TestAsyncClientPool:
+    """Test AsyncClientPool"""
+
+    async def test_reuses_client_within_loop(self):
+        """Same loop → same AsyncClient (keep-alive pool)"""
+        pool = AsyncClientPool(http2=False)
+        assert pool.get() is pool.get()
+        await pool.aclose()
+
+    def test_recreates_client_for_new_loop(self):
+        """New event loop → new AsyncClient"""
+        pool = AsyncClientPool(http2=False)
+
+        async def _get():
+            return pool.get()
+
+        first = asyncio.run(_get())
+        second = asyncio.run(_get())
+        assert first is not second
+
+
+# ============================================
+# Async Client Tests
+# ============================================
+
+class TestAsyncClients:
+    """Test asearch/aget_by_doi on API clients"""
+
+    async def test_crossref_asearch(self, engine):
+        """CrossRef asearch parses results like search()"""
+        papers = await engine.crossref_client.asearch("test", limit=10)
+        assert [p.doi for p in papers] == ["10.1000/shared", "10.1000/cr-only"]
+        await engine.aclose()
+
+    async def test_crossref_aget_by_doi(self, engine):
+        """CrossRef aget_by_doi returns single paper"""
+        paper = await engine.crossref_client.aget_by_doi("10.1000/shared")
+        assert paper is not None
+        assert paper.title == "Shared Paper"
+        await engine.aclose()
+
+    async def test_response_cache_runs_off_event_loop(self, engine):
+        """asearch/aget_by_doi do their SQLite cache I/O in worker threads"""
+        loop_thread = threading.get_ident()
+        threads = []
+
+        class _RecordingCache:
+            def get(self, endpoint, params=None):
+                threads.append(threading.get_ident())
+                return None
+
+            def set(self, endpoint, params, value):
+                threads.append(threading.get_ident())
+
+        for client in (engine.crossref_client, engine.openalex_client):
+            client.cache = _RecordingCache()
+            await client.asearch("test", limit=10)
+            await client.aget_by_doi("10.1000/shared")
+
+        assert len(threads) == 8
+        assert loop_thread not in threads
+        await engine.aclose()
+
+
+# ============================================
+# SearchEngine.asearch Tests
+# ============================================
+
+class TestSearchEngineAsync:
+    """Test SearchEngine.asearch"""
+
+    async def test_asearch_merges_and_deduplicates(self, engine):
+        """Results from all sources are merged, deduplicated and sorted"""
+        papers = await engine.asearch("test", limit=10, sources=["crossref", "openalex"])
+
+        dois = [p.doi for p in papers]
+        assert sorted(dois) == ["10.1000/cr-only", "10.1000/shared"]
+        assert dois[0] == "10.1000/shared"  # highest citations first
+        assert papers[0].citations == 9
+        assert all(p.source_type == "api" for p in papers)
+        await engine.aclose()
+
+    async def test_asearch_survives_failing_source(self, engine, monkeypatch):
+        """A failing source does not break the whole search"""
+        async def _failing(*args, **kwargs):
+            raise RuntimeError("S2 down")
+
+        monkeypatch.setattr(engine.s2_client, "asearch", _failing)
+
+        papers = await engine.asearch("test", limit=10)
+        assert len(papers) == 2
+        await engine.aclose()
+
+    async def test_asearch_skips_source_with_open_circuit(self, engine):
+        """Repeated transport failures trip the breaker, the source is skipped afterwards"""
+        calls = []
+
+        async def _failing(*args, **kwargs):
+            calls.append(1)
+            raise httpx.ConnectError("S2 unreachable")
+
+        engine.s2_client.asearch = _failing
+        for _ in range(engine.s2_client.circuit_breaker.min_calls):
+            await engine.asearch("test", limit=10)
+
+        assert engine.s2_client.circuit_breaker.state == "open"
+        papers = await engine.asearch("test", limit=10)
+
+        assert len(papers) == 2
+        assert len(calls) == engine.s2_client.circuit_breaker.min_calls
+        await engine.aclose()
+
+    async def test_asearch_stream_yields_new_papers_per_source(self, engine):
+        """Each source is folded in on completion, only unseen papers are yielded"""
+        dedup = engine.create_incremental_deduplicator()
+
+        yielded = {}
+        async for source, papers in engine.asearch_stream(
+            "test", limit=10, sources=["crossref", "openalex"], deduplicator=dedup
+        ):
+            yielded[source] = [p.doi for p in papers]
+
+        assert sum(len(dois) for dois in yielded.values()) == 2
+        assert sorted(p.doi for p in dedup.merged()) == ["10.1000/cr-only", "10.1000/shared"]
+        await engine.aclose()
+
+
+# ============================================
+# Timeout → Circuit Breaker Tests
+# ============================================
+
+def _timeout_handler(request: httpx.Request) -> httpx.Response:
+    raise httpx.ReadTimeout("timed out", request=request)
+
+
+@pytest.fixture
+def timeout_engine():
+    """SearchEngine whose S2 client times out on every request (no rate limiting)"""
+    engine = SearchEngine()
+    s2 = engine.s2_client
+    s2.client = httpx.Client(transport=httpx.MockTransport(_timeout_handler))
+    s2._async_pool.transport = httpx.MockTransport(_timeout_handler)
+    s2.rate_limiter = RateLimiter(requests_per_second=1000)
+    s2.async_rate_limiter = AsyncRateLimiter(requests_per_second=1000)
+    s2.cache = None
+    yield engine
+    engine.close()
+
+
+class TestTimeoutsOpenCircuit:
+    """Timeouts swallowed by the clients still count against the breaker"""
+
+    def test_search_timeouts_open_circuit(self, timeout_engine):
+        """Consecutive S2 timeouts through SearchEngine.search open the circuit"""
+        breaker = timeout_engine.s2_client.circuit_breaker
+        for i in range(breaker.min_calls):
+            assert timeout_engine.search(f"test {i}", limit=10, sources=["semantic_scholar"]) == []
+
+        assert breaker.state == "open"
+
+    async def test_aget_by_doi_returns_none_when_open(self, timeout_engine):
+        """DOI lookups time out → circuit opens → further lookups return None instead of raising"""
+        s2 = timeout_engine.s2_client
+        for _ in range(s2.circuit_breaker.min_calls):
+            assert await s2.aget_by_doi("10.1000/x", use_cache=False) is None
+
+        assert s2.circuit_breaker.state == "open"
+        assert await s2.aget_by_doi("10.1000/x", use_cache=False) is None
+        assert s2.get_by_doi("10.1000/x", use_cache=False) is None
+        await timeout_engine.aclose()
+
+
+# ============================================
+# SearchEngine.search_many Tests
+# ============================================
+
+class TestSearchMany:
+    """Test multi-query batch search"""
+
+    def test_expand_query_pairs(self, engine):
+        """Strings and lists are expanded, blanks and repeats dropped"""
+        pairs = engine._expand_query_pairs({
+            "crossref": ["q1", "q2", "q1", ""],
+            "openalex": "q3",
+        })
+        assert pairs == [("crossref", "q1"), ("crossref", "q2"), ("openalex", "q3")]
+
+    def test_search_many_runs_all_pairs_and_dedupes_once(self, engine, monkeypatch):
+        """Every (query, source) pair is searched, union deduplicated once"""
+        calls = []
+        original = engine._asearch_source
+
+        async def _tracking(source, query, limit):
+            calls.append((source, query))
+            return await original(source, query, limit)
+
+        dedup_calls = []
+        original_dedup = engine.deduplicator.deduplicate
+
+        def _tracking_dedup(papers):
+            dedup_calls.append(len(papers))
+            return original_dedup(papers)
+
+        monkeypatch.setattr(engine, "_asearch_source", _tracking)
+        monkeypatch.setattr(engine.deduplicator, "deduplicate", _tracking_dedup)
+
+        papers = engine.search_many({
+            "crossref": ["governance", "compliance"],
+            "openalex": "governance",
+        }, limit=10)
+
+        assert sorted(calls) == [
+            ("crossref", "compliance"), ("crossref", "governance"), ("openalex", "governance")
+        ]
+        assert dedup_calls == [5]  # 2 + 2 CrossRef + 1 OpenAlex, one dedup pass
+        assert sorted(p.doi for p in papers) == ["10.1000/cr-only", "10.1000/shared"]
+
+    def test_search_many_respects_max_results(self, engine):
+        """max_results caps the merged list"""
+        papers = engine.search_many({"crossref": "governance"}, limit=10, max_results=1)
+        assert len(papers) == 1
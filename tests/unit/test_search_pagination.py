@@ -0,0 +1,232 @@
+"""
+Unit Tests für search_iter() (Deep Pagination) der API Clients
++ Semantic Scholar Bulk Search (/paper/search/bulk)
+
+Run:
+    pytest tests/unit/test_search_pagination.py -v
+"""
+
+import threading
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.search.crossref_client import CrossRefClient
+from src.search.openalex_client import OpenAlexClient
+from src.search.semantic_scholar_client import SemanticScholarClient, to_bulk_query
+from src.search.search_engine import SearchEngine
+from src.utils.cache import ResponseCache
+from src.utils.config import S2BulkSearchConfig
+
+
+# ============================================
+# Helpers
+# ============================================
+
+def _mock_response(payload):
+    response = Mock(spec=httpx.Response)
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+def _mock_http(client, pages):
+    """Replace client.client with a Mock returning pages in order (copying params)"""
+    seen_params = []
+
+    def _get(url, params=None):
+        seen_params.append(dict(params or {}))
+        return _mock_response(pages[len(seen_params) - 1])
+
+    client.client = Mock()
+    client.client.get.side_effect = _get
+    client.rate_limiter = Mock()
+    return seen_params
+
+
+# ============================================
+# CrossRef
+# ============================================
+
+class TestCrossRefSearchIter:
+    """Test CrossRef cursor pagination"""
+
+    def test_follows_next_cursor(self):
+        """Pages are requested with cursor=* then next-cursor"""
+        client = CrossRefClient()
+        seen = _mock_http(client, [
+            {"message": {"next-cursor": "c1", "items": [
+                {"DOI": "10.1/a", "title": ["A"]}, {"DOI": "10.1/b", "title": ["B"]}]}},
+            {"message": {"next-cursor": "c2", "items": [{"DOI": "10.1/c", "title": ["C"]}]}},
+        ])
+
+        papers = list(client.search_iter("q", max_results=10, page_size=2))
+
+        assert [p.doi for p in papers] == ["10.1/a", "10.1/b", "10.1/c"]
+        assert [params["cursor"] for params in seen] == ["*", "c1"]
+
+    def test_stops_at_max_results(self):
+        """No further pages once max_results is reached"""
+        client = CrossRefClient()
+        seen = _mock_http(client, [
+            {"message": {"next-cursor": "c1", "items": [
+                {"DOI": "10.1/a", "title": ["A"]}, {"DOI": "10.1/b", "title": ["B"]}]}},
+        ])
+
+        papers = list(client.search_iter("q", max_results=2, page_size=2))
+
+        assert len(papers) == 2
+        assert len(seen) == 1
+
+    def test_is_lazy(self):
+        """Nothing is fetched before the generator is consumed"""
+        client = CrossRefClient()
+        seen = _mock_http(client, [])
+
+        client.search_iter("q")
+        assert seen == []
+
+
+# ============================================
+# OpenAlex
+# ============================================
+
+class TestOpenAlexSearchIter:
+    """Test OpenAlex cursor pagination"""
+
+    def test_follows_meta_next_cursor(self):
+        """Pages follow meta.next_cursor, papers without DOI are skipped"""
+        client = OpenAlexClient()
+        seen = _mock_http(client, [
+            {"meta": {"next_cursor": "n1"}, "results": [
+                {"doi": "https://doi.org/10.1/a", "title": "A"}, {"doi": None, "title": "No DOI"}]},
+            {"meta": {"next_cursor": None}, "results": [
+                {"doi": "https://doi.org/10.1/b", "title": "B"}]},
+        ])
+
+        papers = list(client.search_iter("q", max_results=10, page_size=2))
+
+        assert [p.doi for p in papers] == ["10.1/a", "10.1/b"]
+        assert [params["cursor"] for params in seen] == ["*", "n1"]
+        assert all("type:article" in params["filter"] for params in seen)
+
+
+# ============================================
+# Semantic Scholar
+# ============================================
+
+class TestSemanticScholarSearchIter:
+    """Test S2 offset pagination"""
+
+    def test_follows_next_offset(self):
+        """Pages follow the 'next' offset until it is missing"""
+        client = SemanticScholarClient()
+        seen = _mock_http(client, [
+            {"next": 2, "data": [
+                {"externalIds": {"DOI": "10.1/a"}, "title": "A"},
+                {"externalIds": {"DOI": "10.1/b"}, "title": "B"}]},
+            {"data": [{"externalIds": {"DOI": "10.1/c"}, "title": "C"}]},
+        ])
+
+        papers = list(client.search_iter("q", max_results=10, page_size=2))
+
+        assert [p.doi for p in papers] == ["10.1/a", "10.1/b", "10.1/c"]
+        assert [params["offset"] for params in seen] == [0, 2]
+
+    def test_respects_offset_window(self):
+        """Last page is shrunk so offset + limit stays within the search window"""
+        client = SemanticScholarClient()
+        client.MAX_SEARCH_OFFSET = 3
+        seen = _mock_http(client, [
+            {"next": 2, "data": [
+                {"externalIds": {"DOI": "10.1/a"}, "title": "A"},
+                {"externalIds": {"DOI": "10.1/b"}, "title": "B"}]},
+            {"next": 3, "data": [{"externalIds": {"DOI": "10.1/c"}, "title": "C"}]},
+        ])
+
+        papers = list(client.search_iter("q", max_results=100, page_size=2))
+
+        assert len(papers) == 3
+        assert [(params["offset"], params["limit"]) for params in seen] == [(0, 2), (2, 1)]
+
+
+class TestSemanticScholarBulkSearch:
+    """Test /paper/search/bulk continuation tokens + SearchEngine deep mode"""
+
+    def test_follows_continuation_token(self):
+        """Pages follow 'token' until it is missing, filters/sort are sent"""
+        client = SemanticScholarClient()
+        seen = _mock_http(client, [
+            {"token": "t1", "data": [
+                {"externalIds": {"DOI": "10.1/a"}, "title": "A"},
+                {"externalIds": {}, "title": "No DOI"}]},
+            {"data": [{"externalIds": {"DOI": "10.1/b"}, "title": "B"}]},
+        ])
+
+        papers = client.search_bulk(
+            "devops AND governance", limit=10, year="2019-", sort="citationCount:desc",
+            filters={"publicationTypes": ["JournalArticle", "Conference"]}
+        )
+
+        assert [p.doi for p in papers] == ["10.1/a", "10.1/b"]
+        assert [params.get("token") for params in seen] == [None, "t1"]
+        assert client.client.get.call_args.args[0].endswith("/paper/search/bulk")
+        assert seen[0]["query"] == "devops + governance"
+        assert seen[0]["year"] == "2019-" and seen[0]["sort"] == "citationCount:desc"
+        assert seen[0]["publicationTypes"] == "JournalArticle,Conference"
+        assert "limit" not in seen[0]
+
+    def test_stops_at_limit(self):
+        """No further pages once the limit is reached"""
+        client = SemanticScholarClient()
+        seen = _mock_http(client, [
+            {"token": "t1", "data": [{"externalIds": {"DOI": f"10.1/{i}"}, "title": "P"} for i in range(3)]},
+        ])
+
+        assert len(client.search_bulk("q", limit=2)) == 2
+        assert len(seen) == 1
+
+    async def test_async_pages_cached_off_event_loop(self, temp_dir):
+        """asearch_bulk reads/writes the page cache in worker threads, second run is served from it"""
+        client = SemanticScholarClient(cache=ResponseCache("semantic_scholar", cache_file=temp_dir / "api_cache.db"))
+        client._afetch_page = AsyncMock(side_effect=[
+            {"token": "t1", "data": [{"externalIds": {"DOI": "10.1/a"}, "title": "A"}]},
+            {"data": [{"externalIds": {"DOI": "10.1/b"}, "title": "B"}]},
+        ])
+        threads = []
+        get, set_ = client.cache.get, client.cache.set
+        client.cache.get = lambda *args: threads.append(threading.get_ident()) or get(*args)
+        client.cache.set = lambda *args: threads.append(threading.get_ident()) or set_(*args)
+
+        assert [p.doi for p in await client.asearch_bulk("q", limit=10)] == ["10.1/a", "10.1/b"]
+        assert [p.doi for p in await client.asearch_bulk("q", limit=10)] == ["10.1/a", "10.1/b"]
+
+        assert client._afetch_page.await_count == 2
+        assert len(threads) == 6
+        assert threading.get_ident() not in threads
+        await client.aclose()
+
+    def test_invalid_sort(self):
+        with pytest.raises(ValueError):
+            SemanticScholarClient().search_bulk("q", sort="relevance")
+
+    def test_to_bulk_query(self):
+        assert to_bulk_query("DevOps AND (governance OR compliance) NOT survey") == \
+            "DevOps + (governance | compliance) -survey"
+
+    def test_engine_uses_bulk_above_min_limit(self):
+        """Large S2 limits go to bulk search with S2 filters and default sort"""
+        engine = SearchEngine(sources=["semantic_scholar"],
+                              s2_bulk_search=S2BulkSearchConfig(min_limit=100))
+        engine.s2_client.search = Mock(return_value=[])
+        engine.s2_client.search_bulk = Mock(return_value=[])
+
+        engine.search("devops", limit=50)
+        engine.search("devops", limit=500, filters={"semantic_scholar": {"year": "2020-"}})
+
+        engine.s2_client.search.assert_called_once()
+        kwargs = engine.s2_client.search_bulk.call_args.kwargs
+        assert kwargs["limit"] == 500
+        assert kwargs["filters"] == {"year": "2020-"} and kwargs["sort"] == "citationCount:desc"
+        engine.close()
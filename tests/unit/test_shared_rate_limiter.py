@@ -0,0 +1,156 @@
+"""
+Unit Tests für src/utils/shared_rate_limiter.py
+
+Run:
+    pytest tests/unit/test_shared_rate_limiter.py -v
+"""
+
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.utils.rate_limiter import RateLimiter
+from src.utils.shared_rate_limiter import (
+    AsyncSharedRateLimiter,
+    SharedBucketStore,
+    SharedRateLimiter,
+)
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+@pytest.fixture
+def store(temp_dir):
+    """SharedBucketStore backed by a temporary SQLite file"""
+    return SharedBucketStore(state_file=temp_dir / "rate_limits.db")
+
+
+def _acquire_many(args):
+    """Worker: acquire n tokens from the shared bucket (runs in a subprocess)"""
+    state_file, n = args
+    limiter = SharedRateLimiter("proc", requests_per_second=20, burst_size=1, state_file=state_file)
+    for _ in range(n):
+        limiter.acquire()
+    return n
+
+
+# ============================================
+# SharedRateLimiter Tests
+# ============================================
+
+class TestSharedRateLimiter:
+    """Test bucket and quota sharing"""
+
+    def test_instances_share_bucket(self, store):
+        """Second limiter sees the tokens taken by the first"""
+        first = SharedRateLimiter("crossref", requests_per_second=1, burst_size=2, store=store)
+        second = SharedRateLimiter("crossref", requests_per_second=1, burst_size=2, store=store)
+
+        assert first.try_acquire()
+        assert first.try_acquire()
+        assert not second.try_acquire()
+        assert second.get_wait_time() == pytest.approx(1.0, abs=0.05)
+
+    def test_daily_limit_shared(self, store):
+        """Daily quota counts requests of all instances"""
+        first = SharedRateLimiter("openalex", requests_per_second=100, daily_limit=2, store=store)
+        second = SharedRateLimiter("openalex", requests_per_second=100, daily_limit=2, store=store)
+
+        first.acquire()
+        second.acquire()
+
+        assert second.daily_usage() == 2
+        with pytest.raises(ValueError):
+            first.acquire()
+
+    def test_timeout_returns_false(self, store):
+        """Wait longer than timeout → False without sleeping"""
+        limiter = SharedRateLimiter("s2", requests_per_second=0.1, store=store)
+        limiter.acquire()
+
+        start = time.time()
+        assert limiter.acquire(timeout=0.5) is False
+        assert time.time() - start < 0.1
+
+    def test_pause_applies_to_all_instances(self, store):
+        """Retry-After from one instance pauses the others"""
+        first = SharedRateLimiter("s2", requests_per_second=10, store=store)
+        second = SharedRateLimiter("s2", requests_per_second=10, store=store)
+
+        first.on_throttle(retry_after=2)
+
+        assert second.get_wait_time() == pytest.approx(2.0, abs=0.05)
+
+    def test_from_limiter_copies_settings(self, store):
+        """Drop-in replacement keeps rate, burst, daily limit and adaptive mode"""
+        shared = SharedRateLimiter.from_limiter(
+            "openalex", RateLimiter(requests_per_second=1, daily_limit=100, adaptive=True), store=store
+        )
+        assert (shared.rate, shared.burst_size, shared.daily_limit, shared.adaptive) == (1, 1, 100, True)
+
+    async def test_async_shares_bucket_with_sync(self, store):
+        """Sync and async limiters of one source use the same bucket"""
+        sync = SharedRateLimiter("crossref", requests_per_second=1, store=store)
+        async_limiter = AsyncSharedRateLimiter("crossref", requests_per_second=1, store=store)
+
+        assert sync.try_acquire()
+        assert not await async_limiter.try_acquire()
+
+    async def test_async_acquire_does_not_block_event_loop(self, store):
+        """Waiting for another process's write lock keeps the event loop running"""
+        limiter = AsyncSharedRateLimiter("crossref", requests_per_second=1, store=store)
+        blocker = sqlite3.connect(str(store.state_file), isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+
+        ticks = 0
+
+        async def _tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(_tick())
+        acquire = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.2)
+        blocker.execute("COMMIT")
+        blocker.close()
+
+        assert await acquire
+        ticker.cancel()
+        assert ticks >= 10
+
+    async def test_async_pause_does_not_block_event_loop(self, store):
+        """Retry-After pause inside the loop is stored off-loop and still honoured"""
+        limiter = AsyncSharedRateLimiter("crossref", requests_per_second=10, store=store)
+        blocker = sqlite3.connect(str(store.state_file), isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+
+        start = time.time()
+        limiter.pause(0.3)
+        assert time.time() - start < 0.05
+
+        await asyncio.sleep(0.1)
+        blocker.execute("COMMIT")
+        blocker.close()
+
+        assert await limiter.acquire()
+        assert time.time() - start >= 0.25
+        assert store.wait_time("crossref", 1, limiter.rate, limiter.burst_size) > 0
+
+    def test_processes_respect_combined_rate(self, temp_dir):
+        """4 processes × 5 requests at 20 req/s take ≈ 1s in total"""
+        state_file = temp_dir / "rate_limits.db"
+        SharedBucketStore(state_file=state_file)
+
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            assert sum(pool.map(_acquire_many, [(state_file, 5)] * 4)) == 20
+        elapsed = time.time() - start
+
+        assert elapsed >= 0.9
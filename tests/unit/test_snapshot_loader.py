@@ -0,0 +1,110 @@
+"""
+Unit Tests für src/search/snapshot_loader.py + SearchEngine Source "offline"
+
+Run:
+    pytest tests/unit/test_snapshot_loader.py -v
+"""
+
+import gzip
+import json
+
+import pytest
+
+from src.search.corpus_store import CorpusStore
+from src.search.search_engine import SearchEngine
+from src.search.snapshot_loader import SnapshotLoader, iter_snapshot_works
+
+
+# ============================================
+# Fixtures
+# ============================================
+
+def _write_shard(path, lines):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for line in lines:
+            f.write(json.dumps(line) + "\n")
+    return path
+
+
+@pytest.fixture
+def openalex_shards(temp_dir):
+    """Two OpenAlex works shards (one duplicate DOI, one work without DOI)"""
+    return [
+        _write_shard(temp_dir / "part_000.gz", [
+            {"doi": "https://doi.org/10.1/a", "title": "DevOps Governance", "publication_year": 2022,
+             "abstract_inverted_index": {"Governance": [0], "matters": [1]}, "cited_by_count": 4},
+            {"doi": None, "title": "No DOI"},
+        ]),
+        _write_shard(temp_dir / "part_001.gz", [
+            {"doi": "https://doi.org/10.1/b", "title": "Quantum Chemistry", "cited_by_count": 1},
+            {"doi": "https://doi.org/10.1/A", "title": "DevOps Governance", "cited_by_count": 9},
+        ]),
+    ]
+
+
+# ============================================
+# Reading Tests
+# ============================================
+
+class TestIterSnapshotWorks:
+    """Test streaming shard reader"""
+
+    def test_unpacks_crossref_items(self, temp_dir):
+        """{"items": [...]} containers yield their items, bad lines are skipped"""
+        shard = temp_dir / "crossref.json.gz"
+        with gzip.open(shard, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"items": [{"DOI": "10.1/a"}, {"DOI": "10.1/b"}]}) + "\n")
+            f.write("{not json\n")
+            f.write(json.dumps({"DOI": "10.1/c"}) + "\n")
+
+        assert [w["DOI"] for w in iter_snapshot_works(shard)] == ["10.1/a", "10.1/b", "10.1/c"]
+
+
+# ============================================
+# SnapshotLoader Tests
+# ============================================
+
+class TestSnapshotLoader:
+    """Test ingestion into the offline index"""
+
+    def test_ingest_parses_like_api_client(self, temp_dir, openalex_shards):
+        """Works are parsed by OpenAlexClient._parse_work and upserted per DOI"""
+        loader = SnapshotLoader("openalex", index_file=temp_dir / "offline.db", batch_size=1, max_workers=1)
+
+        totals = loader.ingest(openalex_shards)
+
+        index = CorpusStore(db_file=temp_dir / "offline.db")
+        paper = index.get_by_doi("10.1/a")
+        assert totals["works"] == 4 and totals["skipped"] == 1
+        assert index.count() == 2
+        assert paper.abstract == "Governance matters"
+        assert paper.citations == 9
+
+    def test_ingest_parallel(self, temp_dir, openalex_shards):
+        """Shards ingested by worker processes end up in the same index"""
+        loader = SnapshotLoader("openalex", index_file=temp_dir / "offline.db", max_workers=2)
+
+        totals = loader.ingest(openalex_shards)
+
+        assert totals["failed"] == 0
+        assert CorpusStore(db_file=temp_dir / "offline.db").count() == 2
+
+    def test_unknown_format_rejected(self):
+        """Only openalex/crossref are supported"""
+        with pytest.raises(ValueError):
+            SnapshotLoader("pubmed")
+
+
+# ============================================
+# SearchEngine Integration Tests
+# ============================================
+
+def test_search_engine_offline_source(temp_dir, openalex_shards):
+    """Source "offline" answers from the snapshot index"""
+    SnapshotLoader("openalex", index_file=temp_dir / "offline.db", max_workers=1).ingest(openalex_shards)
+    engine = SearchEngine(offline_index=CorpusStore(db_file=temp_dir / "offline.db"), sources=["offline"])
+
+    papers = engine.search("devops governance", limit=10)
+
+    assert [(p.doi, p.source) for p in papers] == [("10.1/a", "offline")]
+    engine.close()
@@ -0,0 +1,111 @@
+"""
+Unit Tests für Two-Phase Search (metadata_only + SearchEngine.hydrate)
+
+Run:
+    pytest tests/unit/test_two_phase_search.py -v
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.search.crossref_client import CrossRefClient, Paper
+from src.search.openalex_client import OpenAlexClient
+from src.search.semantic_scholar_client import SemanticScholarClient
+from src.search.search_engine import SearchEngine
+
+
+# ============================================
+# Client Tests
+# ============================================
+
+class TestMetadataOnlyParams:
+    """metadata_only drops abstract/author fields from the search request"""
+
+    def test_crossref_select(self):
+        client = CrossRefClient()
+        params = client._build_search_params("devops", 20, metadata_only=True)
+
+        assert params["select"] == client.METADATA_FIELDS
+        assert "abstract" not in params["select"] and "author" not in params["select"]
+        assert "abstract" in client._build_search_params("devops", 20)["select"]
+        client.close()
+
+    def test_openalex_select(self):
+        client = OpenAlexClient()
+        params = client._build_search_params("devops", 20, metadata_only=True)
+
+        assert "abstract_inverted_index" not in params["select"]
+        assert "authorships" not in params["select"]
+        assert params["filter"] == "type:article"
+        client.close()
+
+    def test_s2_fields(self):
+        client = SemanticScholarClient()
+        params = client._build_search_params("devops", 20, metadata_only=True)
+
+        assert "abstract" not in params["fields"].split(",")
+        assert "externalIds" in params["fields"].split(",")
+        # Explicit fields still win
+        assert client._build_search_params("devops", 20, ["title"], True)["fields"] == "title"
+        client.close()
+
+    def test_parse_without_abstract(self):
+        """Metadata-only works parse into Papers without abstract/authors"""
+        client = OpenAlexClient()
+        paper = client._parse_work({"doi": "https://doi.org/10.1/a", "title": "A", "cited_by_count": 3})
+
+        assert paper.abstract is None and paper.authors == []
+        assert paper.citations == 3
+        client.close()
+
+
+# ============================================
+# SearchEngine Tests
+# ============================================
+
+class TestSearchEngineTwoPhase:
+    """Test metadata-only search + hydration of the top-K"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = SearchEngine(sources=["crossref"])
+        yield engine
+        engine.close()
+
+    def test_metadata_only_is_passed_to_client(self, engine):
+        engine.crossref_client.search = Mock(return_value=[])
+
+        engine.search("devops", limit=10, metadata_only=True)
+
+        assert engine.crossref_client.search.call_args.kwargs["metadata_only"] is True
+
+    def test_hydrate_top_k_only(self, engine, monkeypatch):
+        """Only the first top_k papers are looked up, fields are filled in place"""
+        papers = [Paper(doi=f"10.1/{i}", title=f"P{i}", authors=[], citations=i) for i in range(4)]
+        lookups = []
+
+        def _get_by_dois(dois, sources=None):
+            lookups.append(list(dois))
+            return {doi: Paper(doi=doi, title="", authors=["A"], abstract=f"Abstract {doi}",
+                               citations=10) for doi in dois}
+
+        monkeypatch.setattr(engine, "get_by_dois", _get_by_dois)
+
+        result = engine.hydrate(papers, top_k=2)
+
+        assert result is papers
+        assert lookups == [["10.1/0", "10.1/1"]]
+        assert papers[0].abstract == "Abstract 10.1/0" and papers[0].authors == ["A"]
+        assert papers[0].title == "P0"  # present fields are kept
+        assert papers[1].citations == 10  # max across sources
+        assert papers[2].abstract is None
+
+    def test_hydrate_skips_complete_papers(self, engine, monkeypatch):
+        """Papers that already have abstract and authors need no lookup"""
+        lookup = Mock(return_value={})
+        monkeypatch.setattr(engine, "get_by_dois", lookup)
+
+        engine.hydrate([Paper(doi="10.1/a", title="A", authors=["X"], abstract="done")])
+
+        lookup.assert_not_called()